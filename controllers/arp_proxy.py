@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ARP Proxy - Controller tarafında ARP cevaplayıcı
+Gözlenen trafikten IP -> MAC eşlemelerini öğrenir; bilinen hedefler için
+ARP isteklerini yayına çıkarmadan doğrudan PacketOut ile cevaplar
+"""
+
+import socket
+import struct
+import time
+
+from packet_view import ARP_REPLY, ETH_TYPE_ARP
+
+_ARP_FRAME = struct.Struct('!6s6sHHHBBH6s4s6s4s')
+
+
+def _mac_bytes(mac):
+    return bytes.fromhex(mac.replace(':', ''))
+
+
+def arp_reply_frame(src_mac, src_ip, dst_mac, dst_ip):
+    """src_ip'nin src_mac'te olduğunu bildiren ARP reply frame'i"""
+    return _ARP_FRAME.pack(_mac_bytes(dst_mac), _mac_bytes(src_mac), ETH_TYPE_ARP,
+                           1, 0x0800, 6, 4, ARP_REPLY,
+                           _mac_bytes(src_mac), socket.inet_aton(src_ip),
+                           _mac_bytes(dst_mac), socket.inet_aton(dst_ip))
+
+
+class ArpProxy:
+    """
+    IP -> MAC tablosu ve ARP isteği cevaplama
+
+    Eşlemeler ARP gönderici alanlarından ve edge portlarda görülen IPv4
+    kaynak adreslerinden öğrenilir; timeout süresince tazelenmeyen
+    eşlemeyle cevap verilmez.
+    """
+
+    def __init__(self, timeout=300):
+        self.timeout = timeout
+        self.bindings = {}  # ip -> (mac, öğrenilme zamanı)
+
+        # İstatistikler
+        self.requests = 0
+        self.replies = 0
+        self.misses = 0
+        self.moves = 0
+
+    def __len__(self):
+        return len(self.bindings)
+
+    def learn(self, ip, mac, now=None):
+        """IP -> MAC eşlemesini kaydet veya tazele"""
+        if not ip or ip == '0.0.0.0':
+            return
+        now = time.time() if now is None else now
+        old = self.bindings.get(ip)
+        if old is not None and old[0] != mac:
+            self.moves += 1
+        self.bindings[ip] = (mac, now)
+
+    def lookup(self, ip, now=None):
+        binding = self.bindings.get(ip)
+        if binding is None:
+            return None
+        now = time.time() if now is None else now
+        if now - binding[1] > self.timeout:
+            del self.bindings[ip]
+            return None
+        return binding[0]
+
+    def forget_macs(self, macs):
+        """
+        Ağdan ayrılan MAC'lere ait tüm eşlemeleri sil
+
+        Host yeniden görülene kadar istekler yayına çıkar; eski eşlemeyle
+        kopuk host adına cevap verilmez.
+        """
+        macs = set(macs)
+        if not macs:
+            return
+        for ip in [ip for ip, binding in self.bindings.items() if binding[0] in macs]:
+            del self.bindings[ip]
+
+    def reply_for(self, pkt):
+        """
+        ARP isteğine (pkt: PacketView) cevap frame'i üret
+
+        Returns:
+            bytes: Cevap frame'i veya hedef bilinmiyorsa None
+        """
+        self.requests += 1
+        target_ip = pkt.arp_dst_ip
+        if target_ip == pkt.arp_src_ip:
+            # Gratuitous ARP: cevap beklenmez, diğer host'lara iletilir
+            return None
+
+        target_mac = self.lookup(target_ip)
+        if target_mac is None:
+            self.misses += 1
+            return None
+
+        self.replies += 1
+        return arp_reply_frame(target_mac, target_ip, pkt.arp_src_mac, pkt.arp_src_ip)
+
+    def get_statistics(self):
+        return {
+            'arp_requests': self.requests,
+            'arp_proxy_replies': self.replies,
+            'arp_misses': self.misses,
+            'arp_bindings': len(self.bindings),
+            'arp_binding_moves': self.moves
+        }
@@ -0,0 +1,993 @@
+#!/usr/bin/env python3
+"""
+Routing Controller - Ortak Packet-In hattı
+MAC öğrenme, topoloji takibi, toplu flow kurulumu, fast-failover ve
+yeniden yönlendirme tüm controller'lar için burada tek kez uygulanır;
+yol seçimi STRATEGY sınıfına (strategies.py) bırakılır
+"""
+
+from ryu.base import app_manager
+from ryu.controller import ofp_event
+from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+from ryu.ofproto import ofproto_v1_3
+from ryu.lib import hub
+from ryu.lib.packet import ether_types
+from ryu.topology import event
+from ryu.topology.api import get_switch, get_link
+import networkx as nx
+import os
+import sys
+import time
+
+from arp_proxy import ArpProxy
+from broadcast_tree import BroadcastTree
+from fast_failover import FailoverGroupTable, backup_paths
+from flow_programmer import FlowBatch, FlowProgrammer
+from flow_registry import FlowRegistry
+from host_tracker import HostLocationIndex
+from label_table import EgressLabelTable
+from link_table import LinkTable
+from packet_in_guard import PacketInGuard, ADMIT, BLOCK
+from packet_view import PacketView, ARP_REQUEST
+from path_workers import PathComputePool
+from proactive_routes import ProactiveRoutes
+from route_registry import RouteRegistry
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.append(os.path.join(PROJECT_DIR, 'utils'))
+from metrics_collector import MetricsCollector  # noqa: E402
+
+
+class RoutingController(app_manager.RyuApp):
+    """
+    Strateji tabanlı controller için temel uygulama
+    
+    Alt sınıflar yalnızca STRATEGY (PathStrategy alt sınıfı) belirler.
+    """
+    OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
+    STRATEGY = None
+    STORM_PRIORITY = 100  # Engellenen kaynak kuralları yol kurallarının üstünde
+    STORM_METER_ID = 1
+    # Proaktif kurallar reaktif yol kurallarıyla (öncelik 1-2, aynı eth_dst match'i) çakışmaz;
+    # reaktif kurulum zaman aşımlı kopyasını proaktif kuralın üzerine yazamaz. Elephant,
+    # detour ve fırtına kuralları proaktif kuralların üstünde kalır
+    PROACTIVE_PRIORITY = 5
+    PROACTIVE_COOKIE = 1 << 63  # Proaktif kurallar yol cookie'lerinden ayrılır
+    DETOUR_PRIORITY = 50  # Yedek kesim (detour etiketi) kuralları yol ve elephant kurallarının üstünde
+    
+    def __init__(self, *args, **kwargs):
+        super(RoutingController, self).__init__(*args, **kwargs)
+        self.host_index = HostLocationIndex()  # mac -> (dpid, port)
+        self.topology_api_app = self
+        self.net = nx.DiGraph()
+        self.datapath_list = {}
+        self.switch_ports = {}  # dpid -> {port_no}
+        self.broadcast_tree = BroadcastTree(self.net)  # OFPP_FLOOD yerine yayın ağacı
+        self.arp_proxy = ArpProxy()  # IP -> MAC, ARP istekleri controller'da cevaplanır
+        self.arp_proxy_enabled = True
+        self.route_registry = RouteRegistry()  # Kurulu yollar (yeniden yönlendirme için)
+        
+        # forwarding_mode: 'mac' (her hop'ta hedef MAC kuralı) veya 'label' (ingress'te
+        # egress switch'in VLAN etiketi basılır, transit switch'ler etikete göre iletir)
+        self.forwarding_mode = 'mac'
+        self.egress_labels = EgressLabelTable()
+        # Link portları ve metrikleri grafla eşitlenen dizi tabanlı tabloda
+        self.links = LinkTable()
+        self.strategy = self.STRATEGY(self.net, self.logger, self.links)
+        
+        # Proaktif mod: topoloji proactive_settle_time boyunca değişmezse bilinen tüm
+        # host çiftleri için kurallar toplu kurulur (ilk paket Packet-In beklemez)
+        self.proactive = False
+        self.proactive_settle_time = 2.0
+        self.proactive_routes = ProactiveRoutes()
+        # Durulma clock ile ölçülür (simülatör sanal saatini verir); topology_version
+        # aynı saat değerinde gelen değişiklikleri de ayırır
+        self.clock = time.time
+        self.topology_version = 0
+        self.topology_changed_at = self.clock()
+        self.proactive_synced_version = None
+        self.proactive_thread = hub.spawn(self._proactive)
+        
+        # Asenkron yol hesabı: True ise Packet-In yolu worker havuzuna ister ve hemen
+        # döner; yol kurulumu sonuç geldiğinde _path_results döngüsünde yapılır.
+        # Havuz ve döngü ilk asenkron istekte kurulur (start_path_pool)
+        self.async_paths = False
+        self.path_workers = 2
+        self.path_pool = None
+        self.path_results_thread = None
+        
+        # Fast-failover: True ise yollar OFPGT_FF grupları ve yedek next hop ile kurulur;
+        # yedek kesimler egress etiketleriyle çakışmayan detour etiketleriyle ayrılır
+        self.fast_failover = False
+        self.failover_groups = FailoverGroupTable(self.egress_labels)
+        self.flow_programmer = FlowProgrammer()  # Toplu FlowMod + barrier takibi
+        # Switch'lerde kurulu yol kuralları (FlowRemoved ile eşitlenir); biten yolun grupları bırakılır
+        self.flow_registry = FlowRegistry(on_path_end=self.path_ended)
+        self.metrics = MetricsCollector(self.strategy.name, output_dir=os.path.join(PROJECT_DIR, 'results'))
+        
+        # Packet-In fırtınalarına karşı token bucket + kurulum tekrarı ayıklama
+        # storm_action: 'drop' (aksiyonsuz kural) veya 'meter' (switch'te hız sınırı)
+        self.packet_guard = PacketInGuard(inflight_timeout=self.flow_programmer.timeout)
+        self.storm_action = 'drop'
+        
+        # Performans metrikleri
+        self.packet_count = 0
+        self.flow_install_count = 0
+        self.reroute_count = 0
+        self.last_reroute_time = None
+        self.last_link_down_time = None
+        self.flood_count = 0
+        self.flood_suppressed = 0
+        self.edge_flood_count = 0
+        self.start_time = time.time()
+    
+    @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
+    def switch_features_handler(self, ev):
+        """Switch bağlandığında tablo temizleme ve table-miss kuralı ekle"""
+        datapath = ev.msg.datapath
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        self.datapath_list[datapath.id] = datapath
+        
+        if self.fast_failover:
+            self.failover_groups.reset(datapath)
+        
+        if self.storm_action == 'meter':
+            self.install_storm_meter(datapath)
+        
+        # Table-miss flow entry yükle
+        match = parser.OFPMatch()
+        actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER,
+                                        ofproto.OFPCML_NO_BUFFER)]
+        self.add_flow(datapath, 0, match, actions)
+        
+        self.logger.info(f"Switch {datapath.id} connected")
+    
+    def install_storm_meter(self, datapath):
+        """Engellenen kaynakların Packet-In'lerini sınırlayan meter'ı kur"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        datapath.send_msg(parser.OFPMeterMod(datapath, command=ofproto.OFPMC_DELETE,
+                                             flags=0, meter_id=ofproto.OFPM_ALL))
+        bands = [parser.OFPMeterBandDrop(rate=self.packet_guard.source_rate,
+                                         burst_size=self.packet_guard.source_burst)]
+        datapath.send_msg(parser.OFPMeterMod(datapath, command=ofproto.OFPMC_ADD,
+                                             flags=ofproto.OFPMF_PKTPS | ofproto.OFPMF_BURST,
+                                             meter_id=self.STORM_METER_ID, bands=bands))
+    
+    def block_source(self, datapath, in_port, src):
+        """Kötüye kullanan kaynak için switch'e geçici drop veya meter kuralı kur"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        match = parser.OFPMatch(in_port=in_port, eth_src=src)
+        if self.storm_action == 'meter':
+            # Kaynağın Packet-In'leri switch'te source_rate ile sınırlanır
+            actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER, ofproto.OFPCML_NO_BUFFER)]
+            inst = [parser.OFPInstructionMeter(self.STORM_METER_ID),
+                    parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
+        else:
+            inst = []  # Aksiyonsuz kural: paketler switch'te düşer
+        
+        mod = parser.OFPFlowMod(datapath=datapath, priority=self.STORM_PRIORITY,
+                                match=match, instructions=inst,
+                                hard_timeout=self.packet_guard.block_time)
+        datapath.send_msg(mod)
+        self.logger.warning(f"Packet-In storm from {src} on switch {datapath.id} port {in_port}: "
+                            f"{self.storm_action} rule installed for {self.packet_guard.block_time}s")
+    
+    def add_flow(self, datapath, priority, match, actions, buffer_id=None, idle_timeout=0, hard_timeout=0,
+                 batch=None, cookie=0):
+        """
+        Flow entry ekle (batch verilirse gönderim FlowProgrammer'a bırakılır)
+        
+        cookie verilen kurallar OFPFF_SEND_FLOW_REM ile kurulur ve flow_registry'ye kaydedilir
+        """
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
+        flags = ofproto.OFPFF_SEND_FLOW_REM if cookie else 0
+        
+        if buffer_id:
+            mod = parser.OFPFlowMod(datapath=datapath, buffer_id=buffer_id,
+                                    priority=priority, match=match,
+                                    instructions=inst,
+                                    idle_timeout=idle_timeout,
+                                    hard_timeout=hard_timeout,
+                                    cookie=cookie, flags=flags)
+        else:
+            mod = parser.OFPFlowMod(datapath=datapath, priority=priority,
+                                    match=match, instructions=inst,
+                                    idle_timeout=idle_timeout,
+                                    hard_timeout=hard_timeout,
+                                    cookie=cookie, flags=flags)
+        if batch is not None:
+            batch.add(datapath, mod)
+        else:
+            datapath.send_msg(mod)
+        self.flow_install_count += 1
+        
+        if cookie:
+            if self.flow_registry.add(datapath.id, priority, match, cookie):
+                self.metrics.record_flow()
+            if self.flow_registry.near_full(datapath.id):
+                self.logger.warning(f"Flow table of switch {datapath.id} is "
+                                    f"{self.flow_registry.occupancy(datapath.id):.0%} full")
+    
+    @set_ev_cls(ofp_event.EventOFPFlowRemoved, MAIN_DISPATCHER)
+    def flow_removed_handler(self, ev):
+        """Zaman aşımı/silme ile kalkan kuralı kayıttan düş; ingress kuralıysa yol biter"""
+        msg = ev.msg
+        ofproto = msg.datapath.ofproto
+        reasons = {
+            ofproto.OFPRR_IDLE_TIMEOUT: 'idle',
+            ofproto.OFPRR_HARD_TIMEOUT: 'hard',
+            ofproto.OFPRR_DELETE: 'delete',
+            ofproto.OFPRR_GROUP_DELETE: 'group_delete'
+        }
+        removed, route = self.flow_registry.flow_removed(msg.datapath.id, msg.priority, msg.match,
+                                                         msg.cookie, reasons.get(msg.reason, 'other'))
+        if not removed:
+            return
+        self.metrics.record_flow_removal()
+        
+        if msg.cookie == self.PROACTIVE_COOKIE:
+            self.restore_proactive_rule(msg.datapath, msg.match)
+        elif route is not None:
+            key = route['info']['route_key']
+            current = self.route_registry.get(key)
+            if current is not None and current.get('cookie') == msg.cookie:
+                self.route_registry.remove(key)
+            self.strategy.path_removed(route['path'], route['info']['flow'])
+    
+    def restore_proactive_rule(self, datapath, match):
+        """Tablodan beklenmedik şekilde kalkan (tahliye, dış silme) proaktif kuralı yeniden kur"""
+        dst_mac = match.get('eth_dst')
+        rule = self.proactive_routes.lost_rule(datapath.id, dst_mac)
+        if rule is None or datapath.id not in self.datapath_list:
+            # Kuralı controller sildi (yol değişti veya hedef gitti)
+            return
+        kind, target = rule
+        port = target if kind == 'host' else self.links.port(datapath.id, target)
+        parser = datapath.ofproto_parser
+        self.add_flow(datapath, self.PROACTIVE_PRIORITY, parser.OFPMatch(eth_dst=dst_mac),
+                      [parser.OFPActionOutput(port)], cookie=self.PROACTIVE_COOKIE)
+        self.logger.info(f"Proactive rule for {dst_mac} restored on switch {datapath.id}")
+    
+    def path_ended(self, cookie):
+        """
+        Yol bitti (ingress kuralı silindi, yerine yeni yol kuruldu veya ingress switch'i koptu)
+        
+        Yolun kullandığı FF grupları bırakılır; kullanan yolu kalmayan grup
+        switch'ten silinir ve detour etiketinin kuralları etiket yeniden
+        ayrılmadan önce kaldırılır.
+        """
+        for label, switches in self.failover_groups.release(cookie, self.datapath_list):
+            for dpid in switches:
+                datapath = self.datapath_list.get(dpid)
+                if datapath is None:
+                    continue
+                ofproto = datapath.ofproto
+                parser = datapath.ofproto_parser
+                match = parser.OFPMatch(vlan_vid=ofproto.OFPVID_PRESENT | label)
+                datapath.send_msg(parser.OFPFlowMod(datapath=datapath, command=ofproto.OFPFC_DELETE,
+                                                    match=match, out_port=ofproto.OFPP_ANY,
+                                                    out_group=ofproto.OFPG_ANY))
+    
+    @set_ev_cls(ofp_event.EventOFPBarrierReply, MAIN_DISPATCHER)
+    def barrier_reply_handler(self, ev):
+        """Barrier cevabı: ilgili yol kurulumunun bu switch'teki kısmı tamam"""
+        msg = ev.msg
+        self.flow_programmer.barrier_reply(msg.datapath.id, msg.xid)
+    
+    @set_ev_cls(event.EventSwitchEnter)
+    def get_topology_data(self, ev):
+        """Switch topolojiye katıldığında node ekle (linkler EventLinkAdd ile gelir)"""
+        dpid = ev.switch.dp.id
+        if dpid not in self.net:
+            self.net.add_node(dpid)
+        self.switch_ports[dpid] = {port.port_no for port in ev.switch.ports}
+        self.topology_changed()
+        
+        self.logger.info(f"Topology updated: switch {dpid} entered, "
+                         f"{self.net.number_of_nodes()} switches, {self.net.number_of_edges()} links")
+    
+    @set_ev_cls(event.EventPortAdd)
+    def port_add_handler(self, ev):
+        """Yeni port yayın portlarına eklenir"""
+        self.switch_ports.setdefault(ev.port.dpid, set()).add(ev.port.port_no)
+    
+    @set_ev_cls(event.EventPortDelete)
+    def port_delete_handler(self, ev):
+        ports = self.switch_ports.get(ev.port.dpid)
+        if ports is not None:
+            ports.discard(ev.port.port_no)
+        self.host_port_down(ev.port.dpid, ev.port.port_no)
+    
+    @set_ev_cls(ofp_event.EventOFPPortStatus, MAIN_DISPATCHER)
+    def port_status_handler(self, ev):
+        """Silinen veya linki düşen porttaki host kayıtlarını sil"""
+        msg = ev.msg
+        ofproto = msg.datapath.ofproto
+        if msg.reason == ofproto.OFPPR_DELETE or msg.desc.state & ofproto.OFPPS_LINK_DOWN:
+            self.host_port_down(msg.datapath.id, msg.desc.port_no)
+    
+    def host_port_down(self, dpid, port_no):
+        """Edge port kapandı: bağlı host'lar (ve ARP eşlemeleri) tekrar görülene kadar bilinmiyor sayılır"""
+        macs = self.host_index.remove_port(dpid, port_no)
+        self.arp_proxy.forget_macs(macs)
+        if macs:
+            self.logger.info(f"Port {port_no} of switch {dpid} down, {len(macs)} hosts forgotten")
+        return macs
+    
+    @set_ev_cls(event.EventSwitchLeave)
+    def switch_leave_handler(self, ev):
+        """Switch ayrıldığında node'u, linklerini ve bağlı host'ları sil"""
+        dpid = ev.switch.dp.id
+        if dpid not in self.net:
+            return
+        
+        affected = self.route_registry.routes_on_node(dpid)
+        removed_links = list(self.net.in_edges(dpid)) + list(self.net.out_edges(dpid))
+        
+        self.net.remove_node(dpid)
+        self.links.remove_node(dpid)
+        for src, dst in removed_links:
+            self.strategy.link_removed(src, dst)
+        self.strategy.switch_removed(dpid)
+        self.broadcast_tree.switch_removed(dpid)
+        
+        self.datapath_list.pop(dpid, None)
+        self.switch_ports.pop(dpid, None)
+        self.arp_proxy.forget_macs(self.host_index.remove_switch(dpid))
+        self.failover_groups.remove_switch(dpid)
+        self.flow_programmer.remove_switch(dpid)
+        self.packet_guard.remove_switch(dpid)
+        self.egress_labels.remove_switch(dpid)
+        for _ in range(self.flow_registry.remove_switch(dpid)):
+            self.metrics.record_flow_removal()
+        synced = self.proactive_synced_version == self.topology_version
+        self.topology_changed()
+        
+        self.logger.info(f"Switch {dpid} left, {len(affected)} routes affected")
+        self.reroute_flows(affected)
+        
+        proactive_affected, stale = self.proactive_routes.remove_switch(dpid)
+        if self.proactive:
+            self.reroute_proactive(proactive_affected, stale, synced)
+    
+    @set_ev_cls(event.EventLinkAdd)
+    def link_add_handler(self, ev):
+        """Yeni linki grafa ekle"""
+        link = ev.link
+        src, dst = link.src.dpid, link.dst.dpid
+        
+        # Switch'ler arası portlar host konum indeksinde edge port sayılmaz
+        self.host_index.add_link_port(src, link.src.port_no)
+        self.host_index.add_link_port(dst, link.dst.port_no)
+        
+        if self.net.has_edge(src, dst):
+            self.net[src][dst]['port'] = link.src.port_no
+            self.links.set(src, dst, port=link.src.port_no)
+            return
+        
+        self.net.add_edge(src, dst, port=link.src.port_no)
+        self.links.add_link(src, dst, port=link.src.port_no)
+        self.strategy.link_added(src, dst)
+        self.broadcast_tree.link_added(src, dst)
+        self.topology_changed()
+        
+        self.logger.info(f"Link added: {src} -> {dst}")
+    
+    @set_ev_cls(event.EventLinkDelete)
+    def link_delete_handler(self, ev):
+        """Kopan linki sil ve üzerinden geçen akışları yeniden yönlendir"""
+        seen_ns = time.time_ns()
+        link = ev.link
+        src, dst = link.src.dpid, link.dst.dpid
+        
+        self.host_index.remove_link_port(src, link.src.port_no)
+        if not self.net.has_edge(src, dst):
+            return
+        flow_mods = self.flow_programmer.flow_mods
+        
+        self.net.remove_edge(src, dst)
+        self.links.remove_link(src, dst)
+        self.strategy.link_removed(src, dst)
+        self.broadcast_tree.link_removed(src, dst)
+        
+        affected = self.route_registry.routes_on_link(src, dst)
+        self.last_link_down_time = time.time()
+        synced = self.proactive_synced_version == self.topology_version
+        self.topology_changed()
+        self.logger.info(f"Link deleted: {src} -> {dst}, {len(affected)} routes affected")
+        
+        if self.fast_failover:
+            # Veri düzlemi yedek porta geçti; yol onarımı asenkron yapılır
+            hub.spawn(self.reroute_flows, affected)
+        else:
+            self.reroute_flows(affected)
+        
+        if self.proactive:
+            # Sadece kopan linki kullanan (switch, hedef) çiftleri yeniden hesaplanır
+            self.reroute_proactive(self.proactive_routes.affected_by_link(src, dst), synced=synced)
+        
+        # Convergence ölçümü için: olayın görüldüğü ve senkron onarımın gönderildiği an
+        self.metrics.record_timed_event('link_down', time_ns=seen_ns, handled_ns=time.time_ns(),
+                                        src=src, dst=dst, routes=len(affected),
+                                        flow_mods=self.flow_programmer.flow_mods - flow_mods)
+    
+    def reroute_flows(self, routes):
+        """Etkilenen akışlar için yeni yol hesapla ve kur"""
+        started_ns = time.time_ns()
+        flow_mods = self.flow_programmer.flow_mods
+        # Tüm yeni yolların barrier'ları onaylandığında 'reroute_installed' kaydedilir
+        progress = {'routes': 0, 'acked': 0, 'sent': False}
+        
+        def on_installed():
+            progress['acked'] += 1
+            if progress['sent'] and progress['acked'] == progress['routes']:
+                self.metrics.record_timed_event('reroute_installed', routes=progress['routes'])
+        
+        for key, route in routes:
+            ingress, in_port, dst_mac = key[:3]
+            location = self.host_index.lookup(dst_mac)
+            if ingress not in self.net or location is None or location[0] not in self.net:
+                # Kaynak veya hedef switch artık yok
+                self.route_registry.remove(key)
+                continue
+            
+            dst_dpid, dst_port = location
+            path = self.strategy.select_path(ingress, dst_dpid, route['flow'])
+            self.route_registry.remove(key)
+            if not path:
+                self.logger.warning(f"No alternative path for {dst_mac} from switch {ingress}")
+                continue
+            
+            progress['routes'] += 1
+            self.install_path(path, route['src_mac'], dst_mac, in_port, dst_port, route['flow'],
+                              on_installed=on_installed)
+            self.reroute_count += 1
+        
+        if routes:
+            self.last_reroute_time = time.time()
+        if progress['routes']:
+            progress['sent'] = True
+            self.metrics.record_timed_event('reroute_sent', time_ns=started_ns, sent_ns=time.time_ns(),
+                                            routes=progress['routes'],
+                                            flow_mods=self.flow_programmer.flow_mods - flow_mods)
+            if progress['acked'] == progress['routes']:
+                self.metrics.record_timed_event('reroute_installed', routes=progress['routes'])
+    
+    def topology_changed(self):
+        """Topoloji değişikliğini işaretle (proaktif durulma ve yol havuzu snapshot'ları için)"""
+        self.topology_version += 1
+        self.topology_changed_at = self.clock()
+    
+    def _proactive(self):
+        """Topoloji durulduğunda bilinen host'lar için proaktif kuralları eşitle"""
+        while True:
+            hub.sleep(1)
+            if self.proactive and self.clock() - self.topology_changed_at >= self.proactive_settle_time:
+                self.install_proactive_routes()
+    
+    def install_proactive_routes(self):
+        """
+        Yeni (veya yer değiştiren) host'lar için tüm switch'lerden kural kur
+        
+        Son eşitlemeden sonra topoloji değiştiyse tüm hedefler yeniden
+        hesaplanır; sadece next hop'u değişen kurallar gönderilir.
+        """
+        hosts = {mac: location for mac, location in self.host_index.hosts.items()
+                 if location[0] in self.datapath_list and location[0] in self.net}
+        full = self.topology_version != self.proactive_synced_version
+        batch = FlowBatch()
+        
+        for mac, location in list(self.proactive_routes.hosts.items()):
+            if hosts.get(mac) != location:
+                for dpid in self.proactive_routes.remove_host(mac):
+                    self.delete_proactive_rule(dpid, mac, batch)
+        
+        for mac, location in hosts.items():
+            if full or mac not in self.proactive_routes.hosts:
+                sources = [dpid for dpid in self.net.nodes() if dpid != location[0]]
+                self.program_destination(mac, location, sources, batch)
+        
+        if len(batch):
+            self.flow_programmer.commit(batch)
+            self.logger.info(f"Proactive routes synced: {len(hosts)} hosts, {len(batch)} rules")
+        self.proactive_synced_version = self.topology_version
+    
+    def reroute_proactive(self, affected, stale=(), synced=False):
+        """
+        Topoloji olayından etkilenen (kaynak switch, hedef) çiftlerini yeniden kur
+        
+        Kopan link/switch'i kullanmayan yollar değişmediğinden, olaydan önce
+        eşitlenmiş (synced) tablo bu onarımdan sonra da eşit sayılır ve
+        durulma sonrası tam yeniden hesaplama yapılmaz.
+        """
+        batch = FlowBatch()
+        for dpid, mac in stale:
+            self.delete_proactive_rule(dpid, mac, batch)
+        for mac, sources in affected.items():
+            location = self.proactive_routes.hosts.get(mac)
+            if location is not None:
+                self.program_destination(mac, location, [s for s in sources if s in self.net], batch)
+        if len(batch):
+            self.flow_programmer.commit(batch)
+        if synced:
+            self.proactive_synced_version = self.topology_version
+    
+    def program_destination(self, dst_mac, location, sources, batch):
+        """sources switch'lerinden dst_mac'e yol hesapla, değişen kuralları batch'e ekle"""
+        dst_dpid, dst_port = location
+        flow = {'priority': self.PROACTIVE_PRIORITY, 'proactive': True}
+        first = self.proactive_routes.hosts.get(dst_mac) != location
+        
+        paths = {src: self.strategy.select_path(src, dst_dpid, flow) for src in sources}
+        changed, removed = self.proactive_routes.set_paths(dst_mac, location, paths)
+        
+        parser = self.datapath_list[dst_dpid].ofproto_parser
+        match = parser.OFPMatch(eth_dst=dst_mac)
+        if first:
+            self.add_flow(self.datapath_list[dst_dpid], self.PROACTIVE_PRIORITY, match,
+                          [parser.OFPActionOutput(dst_port)], batch=batch, cookie=self.PROACTIVE_COOKIE)
+        for dpid, next_hop in changed.items():
+            actions = [parser.OFPActionOutput(self.links.port(dpid, next_hop))]
+            self.add_flow(self.datapath_list[dpid], self.PROACTIVE_PRIORITY, match, actions,
+                          batch=batch, cookie=self.PROACTIVE_COOKIE)
+        for dpid in removed:
+            self.delete_proactive_rule(dpid, dst_mac, batch)
+    
+    def delete_proactive_rule(self, dpid, dst_mac, batch):
+        datapath = self.datapath_list.get(dpid)
+        if datapath is None:
+            return
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        mod = parser.OFPFlowMod(datapath=datapath, command=ofproto.OFPFC_DELETE_STRICT,
+                                priority=self.PROACTIVE_PRIORITY, match=parser.OFPMatch(eth_dst=dst_mac),
+                                out_port=ofproto.OFPP_ANY, out_group=ofproto.OFPG_ANY)
+        batch.add(datapath, mod)
+    
+    def install_path(self, path, src_mac, dst_mac, in_port, out_port, flow=None, on_installed=None,
+                     labelled=False):
+        """
+        Hesaplanan yol üzerindeki tüm switch'lere flow rule yükle
+        
+        labelled: Etiket modunda paket path[0]'a zaten etiketli geldi (ilk switch de transit)
+        """
+        if len(path) < 2:
+            return
+        
+        flow = flow or {'priority': 1}
+        priority = flow['priority']
+        idle_timeout = self.strategy.idle_timeout
+        hard_timeout = self.strategy.hard_timeout
+        
+        # Fast-failover modunda her hop için link-disjoint yedek next hop
+        backups = backup_paths(self.net, path) if self.fast_failover else {}
+        
+        batch = FlowBatch()
+        ofproto = self.datapath_list[path[0]].ofproto
+        parser = self.datapath_list[path[0]].ofproto_parser
+        
+        # Etiket modunda transit kurallar hedef MAC yerine egress switch'in etiketiyle
+        # eşleşir; etiket kalmadıysa yol MAC kurallarıyla kurulur
+        label = self.egress_labels.label_for(path[-1]) if self.forwarding_mode == 'label' else None
+        push_actions = []
+        if label is None:
+            group_key = dst_mac
+            transit_match = egress_match = parser.OFPMatch(eth_dst=dst_mac)
+            # flow['match'] (örn. 5-tuple) sadece ingress kuralını daraltır: akış başına
+            # sayaç tutulur, transit kurallar hedef başına paylaşılmaya devam eder
+            ingress_match = parser.OFPMatch(in_port=in_port, eth_dst=dst_mac, **flow.get('match', {}))
+            egress_actions = [parser.OFPActionOutput(out_port)]
+            restore_actions = [parser.OFPActionPopVlan()]  # Detour etiketi sökülür
+        else:
+            vlan_vid = ofproto.OFPVID_PRESENT | label
+            group_key = ('label', label)
+            transit_match = parser.OFPMatch(vlan_vid=vlan_vid)
+            egress_match = parser.OFPMatch(vlan_vid=vlan_vid, eth_dst=dst_mac)
+            egress_actions = [parser.OFPActionPopVlan(), parser.OFPActionOutput(out_port)]
+            restore_actions = [parser.OFPActionSetField(vlan_vid=vlan_vid)]  # Detour -> egress etiketi
+            if labelled:
+                ingress_match = transit_match
+            else:
+                # Ingress kuralı kaynak portundan bağımsızdır (hedef başına tek kural) ve
+                # sadece etiketsiz paketlerle eşleşir: aynı switch bu etiketin transit'i de
+                # olabilir, etiketli paket ikinci kez etiketlenmeden transit kuralına düşer
+                ingress_match = parser.OFPMatch(vlan_vid=ofproto.OFPVID_NONE, eth_dst=dst_mac)
+                push_actions = [parser.OFPActionPushVlan(ether_types.ETH_TYPE_8021Q),
+                                parser.OFPActionSetField(vlan_vid=vlan_vid)]
+        
+        # Yolun tüm kuralları tek cookie ile kurulur; ingress kuralı silinince yol biter
+        route_key = self.route_key(path[0], in_port, dst_mac, flow)
+        cookie = self.flow_registry.new_path(path, path[0], priority, ingress_match,
+                                             route_key=route_key, flow=flow)
+        
+        # Kurallar egress'ten ingress'e doğru yüklenir; böylece ilk paket
+        # downstream kurallar hazır olmadan ilerleyip yeni Packet-In üretmez
+        
+        # Son switch için
+        datapath = self.datapath_list[path[-1]]
+        self.add_flow(datapath, priority, egress_match, egress_actions, idle_timeout=idle_timeout,
+                      hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        
+        # Ara switch'ler için (ters sırada); hop'un yedek kesimi FF grubundan önce kurulur
+        hop_actions = {len(path) - 1: egress_actions}
+        for i in range(len(path) - 2, -1, -1):
+            datapath = self.datapath_list[path[i]]
+            hop_actions[i] = self.forward_actions(datapath, path, i, group_key, backups,
+                                                  tagged=label is not None, cookie=cookie)
+            self.install_detour(path, i, backups.get(i), group_key, dst_mac, hop_actions,
+                                restore_actions, batch, hard_timeout=hard_timeout, cookie=cookie)
+            if i > 0:
+                self.add_flow(datapath, priority, transit_match, hop_actions[i], idle_timeout=idle_timeout,
+                              hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        
+        # İlk switch için
+        datapath = self.datapath_list[path[0]]
+        actions = push_actions + hop_actions[0]
+        self.add_flow(datapath, priority, ingress_match, actions, idle_timeout=idle_timeout,
+                      hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        
+        # Datapath başına toplu gönderim + barrier ile tamamlanma takibi
+        self.flow_programmer.commit(batch, on_installed)
+        self.strategy.path_installed(path, flow)
+        
+        if not labelled:
+            self.route_registry.add(route_key, path, ttl=hard_timeout,
+                                    src_mac=src_mac, out_port=out_port, flow=flow, cookie=cookie)
+        self.logger.info(f"Path installed ({self.strategy.name}): {' -> '.join(map(str, path))}")
+    
+    @staticmethod
+    def route_key(ingress, in_port, dst_mac, flow):
+        """route_registry anahtarı (ingress kuralı flow['match'] ile daraltıldıysa akış başına)"""
+        key = (ingress, in_port, dst_mac)
+        if flow.get('match'):
+            key += (flow['priority'], tuple(sorted(flow['match'].items())))
+        return key
+    
+    def forward_actions(self, datapath, path, i, group_key, backups, tagged=False, cookie=0):
+        """
+        Hop i için çıkış aksiyonları (fast-failover modunda hedefin FF grubu)
+        
+        Hedefin switch'teki ingress ve transit kuralları aynı gruba gider. Yedek bucket paketi grubun detour etiketiyle işaretler: tagged ise (etiket
+        modu) egress etiketi detour etiketiyle değiştirilir, değilse etiket basılır.
+        Grup yolun cookie'siyle kullanımda sayılır (yol bitince path_ended bırakır).
+        """
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        out_port = self.links.port(path[i], path[i+1])
+        if not self.fast_failover:
+            return [parser.OFPActionOutput(out_port)]
+        
+        backup = backups.get(i)
+        detour = self.failover_groups.detour_label(path[i], group_key) if backup else None
+        if detour is None:
+            # Yedeksiz hop mevcut grubun yedeğini korur; grup yoksa tek bucket'la kurulur
+            return (self.failover_groups.existing(datapath, group_key, out_port, cookie=cookie) or
+                    self.failover_groups.actions_for(datapath, group_key, out_port, cookie=cookie))
+        
+        backup_actions = [parser.OFPActionSetField(vlan_vid=ofproto.OFPVID_PRESENT | detour)]
+        if not tagged:
+            backup_actions.insert(0, parser.OFPActionPushVlan(ether_types.ETH_TYPE_8021Q))
+        backup_port = self.links.port(backup[0], backup[1])
+        return self.failover_groups.actions_for(datapath, group_key, out_port, backup_port,
+                                                backup_actions, cookie=cookie)
+    
+    def install_detour(self, path, i, backup, group_key, dst_mac, hop_actions, restore_actions, batch,
+                       hard_timeout=0, cookie=0):
+        """
+        Hop i'nin yedek kesim kurallarını kur (kesimin sonundan başına doğru)
+        
+        Kesimdeki switch'ler sadece grubun detour etiketiyle eşleşir; diğer yolların
+        hedef başına kurallarını ezmez ve onların trafiğini yakalamaz. Yedeğin
+        birincil yola döndüğü switch etiketi geri alır (restore_actions) ve o hop'un
+        aksiyonlarıyla devam eder; yedek path[:i]'ye uğramadığından döngü oluşmaz.
+        Kurallar sadece arızada kullanılır, bu yüzden idle timeout ile kalkmaz.
+        """
+        detour = self.failover_groups.detour_label(path[i], group_key) if backup else None
+        if detour is None:
+            return
+        self.failover_groups.add_detour(path[i], group_key, backup[1:])
+        
+        datapath = self.datapath_list[backup[-1]]
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        vlan_vid = ofproto.OFPVID_PRESENT | detour
+        
+        rejoin = path.index(backup[-1])
+        if rejoin == len(path) - 1:
+            # Etiket modunda detour etiketi egress'teki tüm hedefler için ortak
+            match = parser.OFPMatch(vlan_vid=vlan_vid, eth_dst=dst_mac)
+        else:
+            match = parser.OFPMatch(vlan_vid=vlan_vid)
+        self.add_flow(datapath, self.DETOUR_PRIORITY, match, restore_actions + hop_actions[rejoin],
+                      hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        
+        for j in range(len(backup) - 2, 0, -1):
+            datapath = self.datapath_list[backup[j]]
+            actions = [parser.OFPActionOutput(self.links.port(backup[j], backup[j+1]))]
+            self.add_flow(datapath, self.DETOUR_PRIORITY, parser.OFPMatch(vlan_vid=vlan_vid), actions,
+                          hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+    
+    @set_ev_cls(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
+    def packet_in_handler(self, ev):
+        """Packet-In mesajlarını işle"""
+        msg = ev.msg
+        datapath = msg.datapath
+        ofproto = datapath.ofproto
+        in_port = msg.match['in_port']
+        
+        # Başlıklar ihtiyaç oldukça msg.data üzerinden kopyasız okunur
+        pkt = PacketView(msg.data)
+        
+        if pkt.ethertype is None or pkt.ethertype == ether_types.ETH_TYPE_LLDP:
+            return
+        
+        dst = pkt.eth_dst
+        src = pkt.eth_src
+        dpid = datapath.id
+        
+        self.packet_count += 1
+        
+        # Admission control (switch ve kaynak MAC başına token bucket)
+        verdict = self.packet_guard.admit(dpid, src)
+        if verdict != ADMIT:
+            if verdict == BLOCK:
+                self.block_source(datapath, in_port, src)
+            return
+        
+        # MAC öğrenme (transit portlar bağlantı noktasını ezmez)
+        moved = self.host_index.learn(src, dpid, in_port)
+        
+        if self.arp_proxy_enabled:
+            if pkt.ethertype == ether_types.ETH_TYPE_ARP:
+                if self.handle_arp(datapath, in_port, pkt, msg):
+                    return
+            elif moved and pkt.ethertype == ether_types.ETH_TYPE_IP:
+                # Yeni görülen host'un IP adresi de öğrenilir
+                self.arp_proxy.learn(pkt.ipv4_src, src)
+        
+        # Akış sınıfı (öncelik ve stratejiye özel gereksinimler)
+        flow = self.strategy.classify(pkt)
+        
+        # Hedef MAC biliniyorsa ve topoloji varsa yönlendirme yap
+        out_port = ofproto.OFPP_FLOOD
+        dst_location = self.host_index.lookup(dst)
+        if dst_location:
+            # Hedef switch O(1) indeksten bulunur
+            dst_dpid, dst_port = dst_location
+            
+            if dst_dpid and dpid in self.net and dst_dpid in self.net:
+                # Aynı yol (route key) kuruluyorsa tekrar hesaplama/kurulum yapma;
+                # paket kurulum bitince ilk paketle aynı porttan gönderilir
+                if self.packet_guard.is_duplicate(self.inflight_key(msg, dst, flow), msg):
+                    return
+                
+                # Etiket modunda ilk paket de ingress kuralından geçer (etiket basılır);
+                # transit switch'e etiketli gelen paket süresi dolan kuralın onarımıdır
+                labelled = (self.forwarding_mode == 'label' and pkt.vlan_id is not None and
+                            self.egress_labels.egress_of(pkt.vlan_id) in self.net and
+                            not self.host_index.is_edge_port(dpid, in_port))
+                
+                if self.async_paths:
+                    # Yol worker'da hesaplanır; bu arada aynı yolun Packet-In'leri bekletilir
+                    self.packet_guard.install_started(self.inflight_key(msg, dst, flow))
+                    self.start_path_pool().submit(
+                        self.strategy, self.topology_version, dpid, dst_dpid, flow,
+                        lambda path: self.path_ready(path, msg, src, dst, flow, labelled))
+                    return
+                
+                path = self.strategy.select_path(dpid, dst_dpid, flow)
+                if path and self.route_packet(path, msg, src, dst, dst_port, flow, labelled):
+                    return
+                if path:
+                    out_port = dst_port
+        
+        self.send_packet_out(datapath, msg, in_port, out_port)
+    
+    def route_packet(self, path, msg, src, dst, dst_port, flow, labelled=False):
+        """
+        Yolu kur; ilk paket (ve kurulum sürerken bekletilen tekrarları) tüm
+        switch'ler kuralları onayladıktan sonra gönderilir
+        
+        Returns:
+            bool: Kurulum başladıysa True (tek switch'lik yolda False)
+        """
+        if len(path) < 2:
+            return False
+        datapath = msg.datapath
+        in_port = msg.match['in_port']
+        if self.forwarding_mode == 'label':
+            out_port = datapath.ofproto.OFPP_TABLE
+        else:
+            out_port = self.links.port(path[0], path[1])
+        
+        key = self.inflight_key(msg, dst, flow)
+        
+        def on_installed():
+            for packet in [msg] + self.packet_guard.install_finished(key):
+                self.send_packet_out(datapath, packet, in_port, out_port)
+        
+        self.packet_guard.install_started(key)
+        self.install_path(path, src, dst, in_port, dst_port, flow,
+                          on_installed=on_installed, labelled=labelled)
+        return True
+    
+    def path_ready(self, path, msg, src, dst, flow, labelled):
+        """
+        Worker'dan gelen yol: topoloji hâlâ uygunsa kur, değilse senkron hesapla
+        
+        Hedefin konumu hesap sürerken değişmiş olabilir; teslimde yeniden okunur.
+        """
+        datapath = msg.datapath
+        dpid = datapath.id
+        location = self.host_index.lookup(dst)
+        if location is None or location[0] not in self.net or dpid not in self.net:
+            # Hedef (veya switch) hesap sürerken koptu
+            path = None
+        elif path and (path[-1] != location[0] or
+                       not all(self.net.has_edge(path[i], path[i+1]) for i in range(len(path) - 1))):
+            # Snapshot alındıktan sonra hedef taşındı veya yolun bir linki koptu
+            path = self.strategy.select_path(dpid, location[0], flow)
+        
+        if path and dpid in self.datapath_list and self.route_packet(path, msg, src, dst, location[1],
+                                                                     flow, labelled):
+            return
+        
+        out_port = location[1] if path else datapath.ofproto.OFPP_FLOOD
+        for packet in [msg] + self.packet_guard.install_finished(self.inflight_key(msg, dst, flow)):
+            self.send_packet_out(datapath, packet, msg.match['in_port'], out_port)
+    
+    def inflight_key(self, msg, dst, flow):
+        """Packet-In'in kuracağı yolun route key'i (kurulum tekrarı ayıklama anahtarı)"""
+        return self.route_key(msg.datapath.id, msg.match['in_port'], dst, flow)
+    
+    def start_path_pool(self):
+        """Worker havuzunu ve sonuç döngüsünü (gerekirse) kur"""
+        if self.path_pool is None:
+            self.path_pool = PathComputePool(workers=self.path_workers)
+            self.path_results_thread = hub.spawn(self._path_results)
+        return self.path_pool
+    
+    def _path_results(self):
+        """Tamamlanan asenkron yol hesaplarını controller döngüsünde teslim et"""
+        while True:
+            self.path_pool.poll()
+            hub.sleep(0.001 if len(self.path_pool) else 0.01)
+    
+    def handle_arp(self, datapath, in_port, pkt, msg):
+        """
+        ARP proxy: bilinen hedefe controller cevap verir, bilinmeyen hedef
+        için istek sadece host edge portlarına gönderilir
+        
+        Returns:
+            bool: Paket işlendiyse True (normal hatta devam edilmez)
+        """
+        dpid = datapath.id
+        if pkt.arp_opcode is None or not self.host_index.is_edge_port(dpid, in_port):
+            return False
+        
+        self.arp_proxy.learn(pkt.arp_src_ip, pkt.arp_src_mac)
+        if pkt.arp_opcode != ARP_REQUEST:
+            # Cevaplar hedef MAC'e normal yol kurulumu ile gider
+            return False
+        
+        reply = self.arp_proxy.reply_for(pkt)
+        if reply is not None:
+            self.send_frame(datapath, in_port, reply)
+            return True
+        return self.flood_to_edges(msg.data, dpid, in_port)
+    
+    def send_frame(self, datapath, port, data):
+        """Controller'da üretilen frame'i port'tan gönder"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        out = parser.OFPPacketOut(datapath=datapath, buffer_id=ofproto.OFP_NO_BUFFER,
+                                  in_port=ofproto.OFPP_CONTROLLER,
+                                  actions=[parser.OFPActionOutput(port)], data=data)
+        datapath.send_msg(out)
+    
+    def flood_to_edges(self, data, src_dpid, src_port):
+        """
+        Frame'i tüm switch'lerin host edge portlarına doğrudan gönder
+        
+        Switch'ler arası linklerden kopya geçmediği için yeni Packet-In
+        oluşmaz. Port bilgisi eksik switch varsa False döner.
+        """
+        if any(dpid not in self.switch_ports for dpid in self.datapath_list):
+            return False
+        
+        for dpid, datapath in self.datapath_list.items():
+            ofproto = datapath.ofproto
+            parser = datapath.ofproto_parser
+            actions = [parser.OFPActionOutput(port) for port in sorted(self.switch_ports[dpid])
+                       if self.host_index.is_edge_port(dpid, port)
+                       and (dpid, port) != (src_dpid, src_port)]
+            if not actions:
+                continue
+            out = parser.OFPPacketOut(datapath=datapath, buffer_id=ofproto.OFP_NO_BUFFER,
+                                      in_port=ofproto.OFPP_CONTROLLER, actions=actions, data=data)
+            datapath.send_msg(out)
+        self.edge_flood_count += 1
+        return True
+    
+    def send_packet_out(self, datapath, msg, in_port, out_port):
+        """Packet-In ile gelen paketi out_port'tan gönder (OFPP_FLOOD: yayın ağacı)"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        if out_port == ofproto.OFPP_FLOOD:
+            actions = self.flood_actions(datapath, in_port)
+            if not actions:
+                return
+        else:
+            actions = [parser.OFPActionOutput(out_port)]
+        data = None
+        if msg.buffer_id == ofproto.OFP_NO_BUFFER:
+            data = msg.data
+        
+        out = parser.OFPPacketOut(datapath=datapath, buffer_id=msg.buffer_id,
+                                  in_port=in_port, actions=actions, data=data)
+        datapath.send_msg(out)
+    
+    def flood_actions(self, datapath, in_port):
+        """Yayın aksiyonları: ağaç portları + host edge portları (in_port hariç)"""
+        dpid = datapath.id
+        parser = datapath.ofproto_parser
+        
+        ports = self.switch_ports.get(dpid)
+        if ports is None:
+            # Switch port bilgisi yok; switch'in kendi flood'una bırak
+            self.flood_count += 1
+            return [parser.OFPActionOutput(datapath.ofproto.OFPP_FLOOD)]
+        
+        tree_ports = self.broadcast_tree.tree_ports(dpid)
+        if not self.host_index.is_edge_port(dpid, in_port) and in_port not in tree_ports:
+            # Ağaç dışı linkten gelen kopya: döngü burada kesilir
+            self.flood_suppressed += 1
+            return []
+        
+        out_ports = tree_ports | {port for port in ports if self.host_index.is_edge_port(dpid, port)}
+        out_ports.discard(in_port)
+        self.flood_count += 1
+        return [parser.OFPActionOutput(port) for port in sorted(out_ports)]
+    
+    def get_statistics(self):
+        """Performans istatistiklerini döndür"""
+        elapsed_time = time.time() - self.start_time
+        install_stats = self.flow_programmer.get_statistics()
+        stats = {
+            'strategy': self.strategy.name,
+            'packets_processed': self.packet_count,
+            'flows_installed': self.flow_install_count,
+            'packets_per_second': self.packet_count / elapsed_time if elapsed_time > 0 else 0,
+            'elapsed_time': elapsed_time,
+            'reroutes': self.reroute_count,
+            'floods': self.flood_count,
+            'floods_suppressed': self.flood_suppressed,
+            'edge_floods': self.edge_flood_count,
+            'broadcast_tree_links': len(self.broadcast_tree),
+            'broadcast_tree_repairs': self.broadcast_tree.repairs,
+            'forwarding_mode': self.forwarding_mode,
+            'egress_labels': len(self.egress_labels),
+            'install_latency_avg_ms': install_stats['install_latency_avg_ms'],
+            'install_latency_p95_ms': install_stats['install_latency_p95_ms'],
+            'pending_installs': install_stats['pending_installs']
+        }
+        stats.update(self.flow_registry.get_statistics())
+        stats.update(self.proactive_routes.get_statistics())
+        if self.path_pool is not None:
+            stats.update(self.path_pool.get_statistics())
+        stats.update(self.packet_guard.get_statistics())
+        stats.update(self.arp_proxy.get_statistics())
+        stats.update(self.strategy.get_statistics())
+        return stats
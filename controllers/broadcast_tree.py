@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Broadcast Tree - Yayın trafiği için spanning tree
+Döngülü topolojilerde OFPP_FLOOD yerine sadece ağaç linklerinden ve
+host portlarından yayın yapılır; ağaç link olaylarında artımlı güncellenir
+"""
+
+from collections import defaultdict, deque
+
+
+class BroadcastTree:
+    """
+    Switch grafı üzerinde spanning forest
+
+    Bir link ancak iki yönü de grafta olduğunda ağaca alınır. Ağaç dışı
+    link eklenmesi ağacı değiştirmez; ağaç linki koptuğunda iki parçayı
+    birleştiren ilk yedek link aranır, tüm ağaç yeniden hesaplanmaz.
+    """
+
+    def __init__(self, net):
+        self.net = net
+        self.adj = defaultdict(set)  # dpid -> ağaçtaki komşu dpid'ler
+        self.repairs = 0
+        self.rebuilds = 0
+
+    def __len__(self):
+        """Ağaçtaki (çift yönlü) link sayısı"""
+        return sum(len(nbrs) for nbrs in self.adj.values()) // 2
+
+    def is_tree_link(self, u, v):
+        return v in self.adj.get(u, ())
+
+    def tree_ports(self, dpid):
+        """dpid'nin ağaç komşularına bakan portlar"""
+        return {self.net[dpid][nbr]['port'] for nbr in self.adj.get(dpid, ())}
+
+    def link_added(self, u, v):
+        """Yeni link iki ayrı ağaç parçasını birleştiriyorsa ağaca ekle"""
+        if self.is_tree_link(u, v) or not self._bidirectional(u, v):
+            return False
+        if v in self._component(u):
+            return False
+        self._add(u, v)
+        return True
+
+    def link_removed(self, u, v):
+        """Kopan ağaç linkinin yerine iki parçayı birleştiren link bul"""
+        if not self.is_tree_link(u, v):
+            return False
+        self._remove(u, v)
+
+        # Küçük parçanın dışa bakan linkleri taranır
+        side_u, side_v = self._component(u), self._component(v)
+        side = side_u if len(side_u) <= len(side_v) else side_v
+        for a in side:
+            for b in self.net[a]:
+                if b not in side and self._bidirectional(a, b):
+                    self._add(a, b)
+                    self.repairs += 1
+                    return True
+        return True
+
+    def switch_removed(self, dpid):
+        """Switch silindiğinde ağacı yeniden hesapla"""
+        if dpid in self.adj:
+            self.rebuild()
+
+    def rebuild(self):
+        """Tüm grafı BFS ile yeniden kapsa"""
+        self.adj.clear()
+        seen = set()
+        for root in self.net.nodes():
+            if root in seen:
+                continue
+            seen.add(root)
+            queue = deque([root])
+            while queue:
+                node = queue.popleft()
+                for nbr in self.net[node]:
+                    if nbr not in seen and self._bidirectional(node, nbr):
+                        seen.add(nbr)
+                        self._add(node, nbr)
+                        queue.append(nbr)
+        self.rebuilds += 1
+
+    def _bidirectional(self, u, v):
+        return self.net.has_edge(u, v) and self.net.has_edge(v, u)
+
+    def _component(self, node):
+        """Ağaç linkleri üzerinden node'un bulunduğu parça"""
+        seen = {node}
+        stack = [node]
+        while stack:
+            for nbr in self.adj.get(stack.pop(), ()):
+                if nbr not in seen:
+                    seen.add(nbr)
+                    stack.append(nbr)
+        return seen
+
+    def _add(self, u, v):
+        self.adj[u].add(v)
+        self.adj[v].add(u)
+
+    def _remove(self, u, v):
+        for a, b in ((u, v), (v, u)):
+            nbrs = self.adj.get(a)
+            if nbrs is not None:
+                nbrs.discard(b)
+                if not nbrs:
+                    del self.adj[a]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Elephant Detector - Flow sayaçlarından büyük akış (elephant) tespiti
+Ingress switch'teki 5-tuple kurallarının byte sayaçları periyodik flow stats
+cevaplarından okunur; hızlar numpy ile toplu hesaplanır ve sadece eşiği
+geçen/eşiğin altına düşen akışlar controller'a bildirilir
+"""
+
+import time
+
+import numpy as np
+
+from packet_view import ETH_TYPE_IP, IPPROTO_TCP, IPPROTO_UDP
+
+_PORT_FIELDS = {IPPROTO_TCP: ('tcp_src', 'tcp_dst'), IPPROTO_UDP: ('udp_src', 'udp_dst')}
+
+
+def five_tuple_match(pkt):
+    """
+    TCP/UDP paketinin 5-tuple OFPMatch alanları (pkt: PacketView)
+
+    Returns:
+        dict: OFPMatch kwargs veya 5-tuple'ı olmayan paketler için None
+    """
+    fields = _PORT_FIELDS.get(pkt.ip_proto)
+    if fields is None or pkt.src_port is None:
+        return None
+    return {
+        'eth_type': ETH_TYPE_IP, 'ip_proto': pkt.ip_proto,
+        'ipv4_src': pkt.ipv4_src, 'ipv4_dst': pkt.ipv4_dst,
+        fields[0]: pkt.src_port, fields[1]: pkt.dst_port
+    }
+
+
+class ElephantDetector:
+    """
+    (dpid, flow key) başına byte sayacı, hız ve elephant durumu
+
+    Akışlar büyüyen numpy dizilerinde satır olarak tutulur; her flow
+    stats cevabında satırlar tek seferde güncellenir. Hız threshold_mbps'i
+    geçen akış elephant olur, threshold_mbps * release_ratio altına düşünce
+    (veya kuralı silinince) elephant olmaktan çıkar.
+    """
+
+    def __init__(self, threshold_mbps=10.0, release_ratio=0.5, capacity=1024):
+        self.threshold = threshold_mbps * 1e6  # bit/s
+        self.release = threshold_mbps * release_ratio * 1e6
+
+        self.rows = {}  # dpid -> {flow key: satır}
+        self.keys = [None] * capacity  # satır -> (dpid, flow key)
+        self.free = list(range(capacity - 1, -1, -1))
+        self.byte_count = np.zeros(capacity)
+        self.sampled_at = np.zeros(capacity)
+        self.rate = np.zeros(capacity)  # bit/s
+        self.elephant = np.zeros(capacity, dtype=bool)
+
+        # İstatistikler
+        self.updates = 0
+        self.detected = 0
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.rows.values())
+
+    def update(self, dpid, stats, now=None):
+        """
+        Switch'in flow sayaçlarını işle
+
+        Args:
+            stats: [(flow key, byte_count)] (cevapta olmayan flow'lar silinmiş sayılır)
+
+        Returns:
+            tuple: (yeni elephant'lar [(flow key, Mbps)], biten elephant'lar [flow key])
+        """
+        now = time.time() if now is None else now
+        self.updates += 1
+        rows = self.rows.setdefault(dpid, {})
+
+        # Cevapta olmayan flow'ların satırları boşaltılır
+        ended = []
+        for key in rows.keys() - {key for key, _ in stats}:
+            row = rows.pop(key)
+            if self.elephant[row]:
+                ended.append(key)
+            self._release(row)
+        if not stats:
+            return [], ended
+
+        index = np.fromiter((self._row(dpid, rows, key) for key, _ in stats), dtype=np.intp,
+                            count=len(stats))
+        counts = np.fromiter((count for _, count in stats), dtype=float, count=len(stats))
+        previous = self.byte_count[index]
+        elapsed = now - self.sampled_at[index]
+
+        # Sayacı ilerlemeyen flow'ların hızı 0'dır; sadece ilk örneği olan veya
+        # sayacı sıfırlanan flow'lar için hız hesaplanmaz
+        valid = (self.sampled_at[index] > 0) & (counts >= previous) & (elapsed > 0)
+        rate = np.zeros(len(stats))
+        np.divide((counts - previous) * 8, elapsed, out=rate, where=valid)
+        self.rate[index] = np.where(valid, rate, self.rate[index])
+        self.byte_count[index] = counts
+        self.sampled_at[index] = now
+
+        # Sadece durumu değişen satırlar Python'a döner
+        current = self.elephant[index]
+        started = valid & ~current & (rate >= self.threshold)
+        stopped = valid & current & (rate < self.release)
+        self.elephant[index[started]] = True
+        self.elephant[index[stopped]] = False
+        self.detected += int(started.sum())
+
+        new = [(stats[i][0], float(rate[i]) / 1e6) for i in np.flatnonzero(started)]
+        ended.extend(stats[i][0] for i in np.flatnonzero(stopped))
+        return new, ended
+
+    def remove_switch(self, dpid):
+        for row in self.rows.pop(dpid, {}).values():
+            self._release(row)
+
+    def elephants(self):
+        """Mevcut elephant'lar: [(dpid, flow key, Mbps)]"""
+        return [self.keys[row] + (float(self.rate[row]) / 1e6,) for row in np.flatnonzero(self.elephant)]
+
+    def get_statistics(self):
+        return {
+            'elephant_flows': int(self.elephant.sum()),
+            'elephant_detections': self.detected,
+            'elephant_tracked_flows': len(self)
+        }
+
+    def _row(self, dpid, rows, key):
+        row = rows.get(key)
+        if row is None:
+            if not self.free:
+                self._grow()
+            row = rows[key] = self.free.pop()
+            self.keys[row] = (dpid, key)
+        return row
+
+    def _release(self, row):
+        self.keys[row] = None
+        self.byte_count[row] = self.sampled_at[row] = self.rate[row] = 0
+        self.elephant[row] = False
+        self.free.append(row)
+
+    def _grow(self):
+        size = len(self.keys)
+        self.keys.extend([None] * size)
+        self.free.extend(range(2 * size - 1, size - 1, -1))
+        self.byte_count = np.concatenate([self.byte_count, np.zeros(size)])
+        self.sampled_at = np.concatenate([self.sampled_at, np.zeros(size)])
+        self.rate = np.concatenate([self.rate, np.zeros(size)])
+        self.elephant = np.concatenate([self.elephant, np.zeros(size, dtype=bool)])
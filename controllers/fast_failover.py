@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Fast Failover - OpenFlow fast-failover grupları ile yedek yollar
+Link koptuğunda switch, controller'a gitmeden yedek porta geçer
+"""
+
+from collections import defaultdict
+
+import networkx as nx
+
+
+def backup_paths(net, path):
+    """
+    Yol üzerindeki her hop için link-disjoint yedek yol hesapla
+
+    Hop i'nin yedeği path[i] -> path[i+1] linkini kullanmaz ve döngü
+    oluşmaması için path[:i] (upstream) switch'lerinden geçmez. Yedek yol
+    birincil yolun downstream bir switch'ine ulaştığı yerde kesilir;
+    oradan sonrası birincil kurallarla devam eder.
+
+    Returns:
+        dict: hop indeksi -> yedek yol (dpid listesi)
+    """
+    backups = {}
+    dst = path[-1]
+
+    for i in range(len(path) - 1):
+        upstream = set(path[:i])
+        failed = (path[i], path[i+1])
+        view = nx.subgraph_view(
+            net,
+            filter_node=lambda n, upstream=upstream: n not in upstream,
+            filter_edge=lambda u, v, failed=failed: (u, v) != failed)
+        try:
+            backup = nx.shortest_path(view, path[i], dst)
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            continue
+
+        downstream = set(path[i+1:])
+        for j in range(1, len(backup)):
+            if backup[j] in downstream:
+                backup = backup[:j+1]
+                break
+        backups[i] = backup
+
+    return backups
+
+
+class FailoverGroupTable:
+    """
+    (dpid, hedef) başına OFPGT_FF grubu
+
+    Birinci bucket birincil portu, ikinci bucket yedek portu izler;
+    switch canlı olan ilk bucket'ı kullanır. Hedefin switch'teki tüm kuralları
+    aynı gruba gittiğinden switch'in hedef için tek çıkış portu vardır.
+
+    labels verilirse her grup için bir yedek kesim (detour) etiketi ayrılır:
+    yedek bucket paketi bu etiketle işaretler, yedek yoldaki kurallar sadece
+    bu etiketle eşleşir.
+
+    Grubu kullanan yollar cookie ile sayılır; son yol bittiğinde grup
+    switch'ten silinir ve detour etiketi boşa çıkar.
+    """
+
+    def __init__(self, labels=None):
+        self.groups = {}  # (dpid, dst_mac) -> group_id
+        self.ports = {}  # (dpid, dst_mac) -> (birincil port, yedek port veya None)
+        self.next_group_id = defaultdict(lambda: 1)  # dpid -> sonraki boş group_id
+        self.group_mods = 0
+        self.labels = labels  # EgressLabelTable (detour etiketleri)
+        self.users = defaultdict(set)  # (dpid, dst_mac) -> grubu kullanan yol cookie'leri
+        self.used_by = defaultdict(set)  # cookie -> {(dpid, dst_mac)}
+        self.detours = defaultdict(set)  # (dpid, dst_mac) -> detour kurallarının kurulduğu switch'ler
+        self.released = 0
+
+    def __len__(self):
+        return len(self.groups)
+
+    def detour_label(self, dpid, dst_mac):
+        """Grubun yedek kesim etiketi (labels yoksa veya etiket kalmadıysa None)"""
+        if self.labels is None:
+            return None
+        return self.labels.label_for(('detour', dpid, dst_mac))
+
+    def existing(self, datapath, dst_mac, primary_port, cookie=0):
+        """
+        Aynı birincil porta sahip kurulu grubun aksiyonu (yoksa None)
+
+        Yedeği olmayan hop grubu tek bucket'a indirip diğer yolların
+        korumasını kaldırmak yerine mevcut grubu kullanır.
+        """
+        key = (datapath.id, dst_mac)
+        if key not in self.groups or self.ports[key][0] != primary_port:
+            return None
+        self._use(key, cookie)
+        return [datapath.ofproto_parser.OFPActionGroup(self.groups[key])]
+
+    def actions_for(self, datapath, dst_mac, primary_port, backup_port=None, backup_actions=(), cookie=0):
+        """
+        FF grubunu kur veya güncelle, flow için group aksiyonunu döndür
+
+        backup_port None ise grup sadece birincil bucket'la kurulur.
+        backup_actions: yedek bucket'ta çıkıştan önce uygulanacak aksiyonlar
+        (örn. detour etiketinin basılması)
+        cookie: grubu kullanan yolun cookie'si (yol bitince release ile bırakılır)
+        """
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        key = (datapath.id, dst_mac)
+
+        group_id = self.groups.get(key)
+        if group_id is None:
+            group_id = self.next_group_id[datapath.id]
+            self.next_group_id[datapath.id] += 1
+            self.groups[key] = group_id
+            command = ofproto.OFPGC_ADD
+        else:
+            command = ofproto.OFPGC_MODIFY
+        self.ports[key] = (primary_port, backup_port)
+
+        buckets = [
+            parser.OFPBucket(watch_port=primary_port,
+                             actions=[parser.OFPActionOutput(primary_port)]),
+        ]
+        if backup_port is not None:
+            buckets.append(parser.OFPBucket(watch_port=backup_port,
+                                            actions=list(backup_actions) + [parser.OFPActionOutput(backup_port)]))
+        datapath.send_msg(parser.OFPGroupMod(datapath, command, ofproto.OFPGT_FF,
+                                             group_id, buckets))
+        self.group_mods += 1
+        self._use(key, cookie)
+
+        return [parser.OFPActionGroup(group_id)]
+
+    def add_detour(self, dpid, dst_mac, switches):
+        """Grubun detour kurallarının kurulduğu switch'leri kaydet (etiket boşalınca silinir)"""
+        self.detours[(dpid, dst_mac)].update(switches)
+
+    def release(self, cookie, datapaths):
+        """
+        Biten yolun grup kullanımlarını bırak; kullanan yolu kalmayan grubu sil
+
+        Args:
+            datapaths: dpid -> datapath (kopmuş switch'lere mesaj gönderilmez)
+
+        Returns:
+            list: Boşalan detour etiketleri [(etiket, detour kurallarının switch'leri)]
+        """
+        freed = []
+        for key in self.used_by.pop(cookie, ()):
+            users = self.users.get(key)
+            if users is None:
+                continue
+            users.discard(cookie)
+            if users:
+                continue
+            del self.users[key]
+            datapath = datapaths.get(key[0])
+            if datapath is not None:
+                ofproto = datapath.ofproto
+                datapath.send_msg(datapath.ofproto_parser.OFPGroupMod(datapath, ofproto.OFPGC_DELETE,
+                                                                      ofproto.OFPGT_FF, self.groups[key]))
+                self.group_mods += 1
+            self.released += 1
+            switches = self.detours.pop(key, set())
+            label = self._forget(key)
+            if label is not None:
+                freed.append((label, switches))
+        return freed
+
+    def reset(self, datapath):
+        """Switch (yeniden) bağlandığında eski grupları sil"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        datapath.send_msg(parser.OFPGroupMod(datapath, ofproto.OFPGC_DELETE, 0,
+                                             ofproto.OFPG_ALL))
+        self.remove_switch(datapath.id)
+
+    def remove_switch(self, dpid):
+        """Switch'e ait grup kayıtlarını ve detour etiketlerini sil"""
+        for key in [k for k in self.groups if k[0] == dpid]:
+            self.users.pop(key, None)
+            self.detours.pop(key, None)
+            self._forget(key)
+        self.next_group_id.pop(dpid, None)
+
+    def _use(self, key, cookie):
+        if cookie:
+            self.users[key].add(cookie)
+            self.used_by[cookie].add(key)
+
+    def _forget(self, key):
+        """Grup kaydını sil; boşalan detour etiketini döndür"""
+        del self.groups[key]
+        del self.ports[key]
+        if self.labels is None:
+            return None
+        return self.labels.release(('detour',) + key)
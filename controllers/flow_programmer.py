@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Flow Programmer - Toplu flow kurulumu ve barrier tabanlı onay
+Bir yolun FlowMod'ları datapath başına toplanır, her datapath'e tek seferde
+gönderilir ve OFPBarrierRequest ile kurulumun tamamlandığı doğrulanır
+"""
+
+import time
+from collections import OrderedDict, deque
+
+
+class FlowBatch:
+    """Bir yol kurulumunda datapath başına biriken mesajlar (gönderim sırasıyla)"""
+
+    def __init__(self):
+        self.messages = OrderedDict()  # dpid -> (datapath, [msg])
+
+    def __len__(self):
+        return sum(len(msgs) for _, msgs in self.messages.values())
+
+    def add(self, datapath, msg):
+        self.messages.setdefault(datapath.id, (datapath, []))[1].append(msg)
+
+
+class FlowProgrammer:
+    """
+    FlowBatch'leri gönderir ve barrier cevaplarını takip eder
+
+    OpenFlow 1.3'te standart bundle olmadığından her datapath'in mesajları
+    art arda gönderilip arkasından bir barrier istenir. Tüm datapath'lerden
+    barrier cevabı geldiğinde kurulum tamamlanmış sayılır ve callback
+    çalıştırılır (örn. ilk paketin PacketOut ile gönderilmesi).
+    """
+
+    def __init__(self, timeout=2.0, history=1000):
+        self.timeout = timeout
+        self.pending = {}  # install_id -> {'start', 'waiting', 'callback'}
+        self.barriers = {}  # (dpid, xid) -> install_id
+        self.latencies = deque(maxlen=history)  # Tamamlanan kurulum süreleri (s)
+        self.next_install_id = 1
+
+        # İstatistikler
+        self.batches = 0
+        self.flow_mods = 0
+        self.barrier_requests = 0
+        self.timeouts = 0
+
+    def commit(self, batch, callback=None):
+        """
+        Batch'i gönder ve her datapath için barrier iste
+
+        Returns:
+            int: Kurulum kimliği
+        """
+        self._expire()
+
+        install_id = self.next_install_id
+        self.next_install_id += 1
+        waiting = set()
+
+        for dpid, (datapath, msgs) in batch.messages.items():
+            for msg in msgs:
+                datapath.send_msg(msg)
+            barrier = datapath.ofproto_parser.OFPBarrierRequest(datapath)
+            datapath.set_xid(barrier)
+            datapath.send_msg(barrier)
+            self.barriers[(dpid, barrier.xid)] = install_id
+            waiting.add((dpid, barrier.xid))
+
+            self.flow_mods += len(msgs)
+            self.barrier_requests += 1
+
+        self.batches += 1
+        self.pending[install_id] = {
+            'start': time.time(),
+            'waiting': waiting,
+            'callback': callback
+        }
+        if not waiting:
+            self._complete(install_id)
+        return install_id
+
+    def barrier_reply(self, dpid, xid):
+        """Barrier cevabını işle; kurulum tamamlandıysa callback'i çalıştır"""
+        install_id = self.barriers.pop((dpid, xid), None)
+        if install_id is None:
+            return False
+
+        install = self.pending.get(install_id)
+        if install is None:
+            return False
+
+        install['waiting'].discard((dpid, xid))
+        if not install['waiting']:
+            self._complete(install_id)
+        return True
+
+    def remove_switch(self, dpid):
+        """Kopan switch'in bekleyen barrier'larını tamamlanmış say"""
+        for key in [k for k in self.barriers if k[0] == dpid]:
+            self.barrier_reply(*key)
+
+    def get_statistics(self):
+        """Kurulum gecikmesi ve gönderim istatistiklerini döndür"""
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            'batches': self.batches,
+            'flow_mods': self.flow_mods,
+            'barrier_requests': self.barrier_requests,
+            'pending_installs': len(self.pending),
+            'install_timeouts': self.timeouts,
+            'install_latency_avg_ms': sum(latencies) / count * 1000 if count else 0,
+            'install_latency_p95_ms': latencies[min(count - 1, int(count * 0.95))] * 1000 if count else 0,
+            'install_latency_max_ms': latencies[-1] * 1000 if count else 0
+        }
+
+    def _complete(self, install_id):
+        install = self.pending.pop(install_id)
+        self.latencies.append(time.time() - install['start'])
+        if install['callback'] is not None:
+            install['callback']()
+
+    def _expire(self):
+        """timeout süresinde cevap gelmeyen kurulumları düşür"""
+        now = time.time()
+        expired = [i for i, inst in self.pending.items() if now - inst['start'] > self.timeout]
+        for install_id in expired:
+            for key in self.pending.pop(install_id)['waiting']:
+                self.barriers.pop(key, None)
+            self.timeouts += 1
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Flow Registry - Switch'lerde kurulu kuralların kaydı
+Controller'ın kurduğu yol kuralları OFPFF_SEND_FLOW_REM ile kurulur;
+EventOFPFlowRemoved geldikçe kayıt switch'in tablosuyla eşitlenir ve
+switch başına tablo doluluğu takip edilir
+"""
+
+import time
+from collections import defaultdict
+
+
+def match_key(match):
+    """OFPMatch'ten sıralı, hashlenebilir anahtar"""
+    return tuple(sorted(match.items()))
+
+
+class FlowRegistry:
+    """
+    (dpid, priority, match) -> kural kaydı
+
+    Her yol kurulumu tek bir cookie alır; yolun tüm kuralları bu cookie
+    ile kurulur. Aynı match'e yeni kural yazıldığında switch eski kuralı
+    FlowRemoved göndermeden değiştirdiğinden kayıt da yeni cookie'ye
+    geçer. Yolun ingress kuralı silindiğinde, aynı ingress kuralıyla yeni
+    yol kurulduğunda veya ingress switch'i koptuğunda yol bitmiş sayılır ve
+    on_path_end(cookie) çağrılır (yolun grup/etiket kaynakları bırakılır).
+    """
+
+    def __init__(self, table_capacity=1000, warn_ratio=0.8, on_path_end=None):
+        self.table_capacity = table_capacity
+        self.warn_ratio = warn_ratio
+        self.on_path_end = on_path_end
+
+        self.rules = {}  # (dpid, priority, match) -> {'cookie', 'installed_at'}
+        self.per_switch = defaultdict(set)  # dpid -> {(dpid, priority, match)}
+        self.paths = {}  # cookie -> {'path', 'ingress', 'info', 'installed_at'}
+        self.peak = defaultdict(int)  # dpid -> en yüksek kural sayısı
+        self.warned = set()  # Doluluk uyarısı verilmiş switch'ler
+        self.next_cookie = 1
+
+        # İstatistikler
+        self.removed = defaultdict(int)  # reason -> sayı
+
+    def __len__(self):
+        return len(self.rules)
+
+    def new_path(self, path, ingress_dpid, priority, ingress_match, **info):
+        """Yol kurulumu için cookie ayır (yol, ingress kuralı silinince biter)"""
+        cookie = self.next_cookie
+        self.next_cookie = (self.next_cookie + 1) & 0xffffffffffffffff or 1
+        self.paths[cookie] = {'path': list(path), 'info': info, 'installed_at': time.time(),
+                              'ingress': (ingress_dpid, priority, match_key(ingress_match))}
+        return cookie
+
+    def add(self, dpid, priority, match, cookie):
+        """
+        Kuralı kaydet
+
+        Returns:
+            bool: Yeni kural ise True (aynı match'in üzerine yazıldıysa False)
+        """
+        key = (dpid, priority, match_key(match))
+        old = self.rules.get(key)
+        if old is not None and old['cookie'] != cookie:
+            # Aynı ingress kuralıyla yeniden kurulan yol eskisinin yerini alır
+            replaced = self.paths.get(old['cookie'])
+            if replaced is not None and replaced['ingress'] == key:
+                self._end_path(old['cookie'])
+        self.rules[key] = {'cookie': cookie, 'installed_at': time.time()}
+        self.per_switch[dpid].add(key)
+        self.peak[dpid] = max(self.peak[dpid], len(self.per_switch[dpid]))
+        return old is None
+
+    def flow_removed(self, dpid, priority, match, cookie, reason):
+        """
+        Switch'ten gelen FlowRemoved'u işle
+
+        Returns:
+            tuple: (kural kayıttan silindi mi, yol bittiyse yol kaydı veya None)
+        """
+        key = (dpid, priority, match_key(match))
+        rule = self.rules.get(key)
+        if rule is None or rule['cookie'] != cookie:
+            # Bilinmeyen veya daha yeni kuralla değiştirilmiş eski kural
+            return False, None
+
+        del self.rules[key]
+        self._discard_switch(dpid, key)
+        self.removed[reason] += 1
+
+        route = self.paths.get(cookie)
+        if route is not None and route['ingress'] == key:
+            return True, self._end_path(cookie)
+        return True, None
+
+    def remove_switch(self, dpid):
+        """Kopan switch'in kurallarını unut (switch yeniden bağlanınca tablo boştur)"""
+        keys = self.per_switch.pop(dpid, set())
+        for key in keys:
+            del self.rules[key]
+        self.warned.discard(dpid)
+        for cookie in [c for c, route in self.paths.items() if route['ingress'][0] == dpid]:
+            self._end_path(cookie)
+        return len(keys)
+
+    def occupancy(self, dpid):
+        """Switch'in kayıtlı kural sayısı / tablo kapasitesi"""
+        return len(self.per_switch.get(dpid, ())) / self.table_capacity
+
+    def near_full(self, dpid):
+        """Doluluk warn_ratio'yu ilk kez geçtiyse True (switch başına bir kez)"""
+        if self.occupancy(dpid) < self.warn_ratio:
+            self.warned.discard(dpid)
+            return False
+        if dpid in self.warned:
+            return False
+        self.warned.add(dpid)
+        return True
+
+    def table_occupancy(self):
+        """dpid -> (kural sayısı, en yüksek kural sayısı, doluluk oranı)"""
+        return {dpid: (len(keys), self.peak[dpid], len(keys) / self.table_capacity)
+                for dpid, keys in self.per_switch.items()}
+
+    def get_statistics(self):
+        counts = [len(keys) for keys in self.per_switch.values()]
+        return {
+            'active_rules': len(self.rules),
+            'active_paths': len(self.paths),
+            'max_table_occupancy': max(counts) / self.table_capacity if counts else 0,
+            'rules_removed_idle': self.removed['idle'],
+            'rules_removed_hard': self.removed['hard'],
+            'rules_removed_other': sum(n for r, n in self.removed.items() if r not in ('idle', 'hard'))
+        }
+
+    def _end_path(self, cookie):
+        route = self.paths.pop(cookie)
+        if self.on_path_end is not None:
+            self.on_path_end(cookie)
+        return route
+
+    def _discard_switch(self, dpid, key):
+        keys = self.per_switch.get(dpid)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.per_switch[dpid]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Host Tracker - Global host konum indeksi
+MAC adresinden host'un bağlı olduğu (dpid, port) noktasına O(1) erişim sağlar
+"""
+
+from collections import defaultdict
+
+
+class HostLocationIndex:
+    """
+    MAC -> (dpid, port) bağlantı noktası indeksi
+
+    Switch'ler arası (transit) portlarda görülen MAC'ler gerçek bağlantı
+    noktasını ezmez; sadece edge portlarda yapılan öğrenme kaydedilir.
+    """
+
+    def __init__(self):
+        self.hosts = {}  # mac -> (dpid, port)
+        self.port_hosts = defaultdict(set)  # (dpid, port) -> {mac}
+        self.link_ports = set()  # Switch'ler arası portlar {(dpid, port)}
+        self.moves = 0
+
+    def __len__(self):
+        return len(self.hosts)
+
+    def __contains__(self, mac):
+        return mac in self.hosts
+
+    def is_edge_port(self, dpid, port):
+        """Port bir host'a mı bakıyor (switch'ler arası link değil)"""
+        return (dpid, port) not in self.link_ports
+
+    def learn(self, mac, dpid, port):
+        """
+        MAC adresini öğren
+
+        Returns:
+            bool: Host konumu değiştiyse True
+        """
+        location = (dpid, port)
+        if location in self.link_ports:
+            # Transit görülme, gerçek bağlantı noktası değil
+            return False
+
+        old = self.hosts.get(mac)
+        if old == location:
+            return False
+
+        if old is not None:
+            self._discard(mac, old)
+            self.moves += 1
+
+        self.hosts[mac] = location
+        self.port_hosts[location].add(mac)
+        return True
+
+    def lookup(self, mac):
+        """Host'un bağlı olduğu (dpid, port) değerini döndür, yoksa None"""
+        return self.hosts.get(mac)
+
+    def forget(self, mac):
+        """Host kaydını sil"""
+        location = self.hosts.pop(mac, None)
+        if location is not None:
+            self._discard(mac, location, remove_host=False)
+
+    def add_link_port(self, dpid, port):
+        """
+        Switch'ler arası portu işaretle
+
+        Link keşfinden önce bu port üzerinden yanlışlıkla öğrenilen
+        host'lar indeksten çıkarılır.
+        """
+        location = (dpid, port)
+        self.link_ports.add(location)
+        for mac in self.port_hosts.pop(location, ()):
+            self.hosts.pop(mac, None)
+
+    def remove_link_port(self, dpid, port):
+        """Port tekrar edge port olarak kabul edilir"""
+        self.link_ports.discard((dpid, port))
+
+    def remove_port(self, dpid, port):
+        """
+        Kapanan edge porttaki host'ları sil
+
+        Returns:
+            list: Silinen MAC'ler
+        """
+        macs = list(self.port_hosts.get((dpid, port), ()))
+        for mac in macs:
+            self.forget(mac)
+        return macs
+
+    def remove_switch(self, dpid):
+        """
+        Switch ayrıldığında ona bağlı host'ları ve link portlarını sil
+
+        Returns:
+            list: Silinen MAC'ler
+        """
+        removed = []
+        for location in [loc for loc in self.port_hosts if loc[0] == dpid]:
+            for mac in self.port_hosts.pop(location):
+                self.hosts.pop(mac, None)
+                removed.append(mac)
+        self.link_ports = {loc for loc in self.link_ports if loc[0] != dpid}
+        return removed
+
+    def _discard(self, mac, location, remove_host=True):
+        macs = self.port_hosts.get(location)
+        if macs is not None:
+            macs.discard(mac)
+            if not macs:
+                del self.port_hosts[location]
+        if remove_host:
+            self.hosts.pop(mac, None)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Label Table - Egress switch başına VLAN etiketi
+Etiket modunda ingress switch hedefin egress switch'ine ait VLAN etiketini
+basar, transit switch'ler sadece etikete göre iletir ve egress switch etiketi
+söker; transit tablo boyutu host sayısıyla değil switch sayısıyla büyür.
+Fast-failover yedek kesimlerinin (detour) etiketleri de aynı tablodan
+ayrılır; böylece iki tür etiket çakışmaz
+"""
+
+VLAN_ID_MIN = 1
+VLAN_ID_MAX = 4094
+
+
+class EgressLabelTable:
+    """
+    egress dpid <-> VLAN id eşlemesi (silinen switch'in etiketi yeniden kullanılır)
+
+    Anahtar dpid dışında herhangi bir hashable olabilir (örn. yedek kesim
+    anahtarı); egress_of bu durumda o anahtarı döndürür.
+    """
+
+    def __init__(self, first=VLAN_ID_MIN, last=VLAN_ID_MAX):
+        self.first = first
+        self.last = last
+        self.labels = {}  # dpid -> vlan id
+        self.egress = {}  # vlan id -> dpid
+        self.free = []  # Silinen switch'lerden boşalan etiketler
+        self.next_label = first
+
+    def __len__(self):
+        return len(self.labels)
+
+    def label_for(self, dpid):
+        """dpid'nin etiketi (gerekirse ayrılır; etiket kalmadıysa None)"""
+        label = self.labels.get(dpid)
+        if label is not None:
+            return label
+        if self.free:
+            label = self.free.pop()
+        elif self.next_label <= self.last:
+            label = self.next_label
+            self.next_label += 1
+        else:
+            return None
+        self.labels[dpid] = label
+        self.egress[label] = dpid
+        return label
+
+    def egress_of(self, label):
+        return self.egress.get(label)
+
+    def release(self, key):
+        """Anahtarın etiketini boş listeye geri ver (boşalan etiketi döndürür)"""
+        label = self.labels.pop(key, None)
+        if label is not None:
+            del self.egress[label]
+            self.free.append(label)
+        return label
+
+    def remove_switch(self, dpid):
+        self.release(dpid)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Link Prober - Aktif link gecikme ve kayıp ölçümü
+Controller'ın switch'ler arası linklerden gönderdiği zaman damgalı probe
+frame'leri ve OpenFlow echo RTT'leri ile tek yön link gecikmesini,
+dönmeyen probe'lardan da link kaybını hesaplar
+"""
+
+import struct
+import time
+from collections import deque
+
+from packet_in_guard import TokenBucket
+
+# IEEE 802 local experimental ethertype (LLDP kuralına takılmaz)
+ETH_TYPE_PROBE = 0x88B5
+PROBE_DST_MAC = '02:00:00:00:00:01'
+
+_PROBE = struct.Struct('!6s6sHQQId')  # eth dst, eth src, ethertype, src dpid, dst dpid, seq, zaman
+_ECHO = struct.Struct('!d')
+
+
+class LinkProber:
+    """
+    Probe bütçeli link gecikme/kayıp takibi
+
+    Toplam probe hızı budget probe/s ile sınırlıdır; linkler sırayla
+    probe'lanır ve bir link en fazla link_interval saniyede bir denenir.
+    Gecikme (varış - gönderim) - (RTT_src + RTT_dst) / 2 ile bulunur ve
+    EWMA ile yumuşatılır. timeout içinde dönmeyen probe kayıp sayılır;
+    kayıp oranı son window probe üzerinden hesaplanır.
+    """
+
+    def __init__(self, budget=20, link_interval=1.0, timeout=1.0, window=100, alpha=0.3):
+        self.link_interval = link_interval
+        self.timeout = timeout
+        self.window = window
+        self.alpha = alpha
+        self.bucket = TokenBucket(budget, budget, time.monotonic())
+
+        self.links = deque()  # probe sırası: (src_dpid, dst_dpid)
+        self.next_probe = {}  # (src, dst) -> sonraki probe zamanı
+        self.outcomes = {}  # (src, dst) -> son probe sonuçları (1 = kayıp)
+        self.pending = {}  # (src, dst, seq) -> gönderim zamanı
+        self.delays = {}  # (src, dst) -> EWMA tek yön gecikme (ms)
+        self.echo_rtt = {}  # dpid -> EWMA controller-switch RTT (s)
+        self.seq = 0
+
+        # İstatistikler
+        self.probes_sent = 0
+        self.probes_received = 0
+        self.probes_lost = 0
+        self.echo_requests = 0
+
+    def add_link(self, src, dst, now=None):
+        if (src, dst) in self.next_probe:
+            return
+        self.links.append((src, dst))
+        self.next_probe[(src, dst)] = time.monotonic() if now is None else now
+        self.outcomes[(src, dst)] = deque(maxlen=self.window)
+
+    def remove_link(self, src, dst):
+        if self.next_probe.pop((src, dst), None) is None:
+            return
+        self.links.remove((src, dst))
+        self.outcomes.pop((src, dst), None)
+        self.delays.pop((src, dst), None)
+        for key in [k for k in self.pending if k[:2] == (src, dst)]:
+            del self.pending[key]
+
+    def remove_switch(self, dpid):
+        for link in [l for l in self.links if dpid in l]:
+            self.remove_link(*link)
+        self.echo_rtt.pop(dpid, None)
+
+    def next_probes(self, now=None):
+        """
+        Bütçe dahilinde zamanı gelen linkler için probe üret
+
+        Returns:
+            list: [(src_dpid, dst_dpid, frame)]
+        """
+        now = time.monotonic() if now is None else now
+        probes = []
+        for _ in range(len(self.links)):
+            link = self.links[0]
+            if self.next_probe[link] > now:
+                self.links.rotate(-1)
+                continue
+            if not self.bucket.consume(now):
+                break
+            self.links.rotate(-1)
+            self.seq = (self.seq + 1) & 0xffffffff
+            self.pending[link + (self.seq,)] = now
+            self.next_probe[link] = now + self.link_interval
+            self.probes_sent += 1
+            probes.append(link + (self.probe_frame(link[0], link[1], self.seq, now),))
+        return probes
+
+    @staticmethod
+    def probe_frame(src, dst, seq, now):
+        mac = bytes.fromhex(PROBE_DST_MAC.replace(':', ''))
+        return _PROBE.pack(mac, mac, ETH_TYPE_PROBE, src, dst, seq, now)
+
+    def probe_received(self, dpid, data, now=None):
+        """
+        Switch'ten Packet-In ile dönen probe'u işle
+
+        Returns:
+            tuple: (src, dst, gecikme ms) veya probe geçersiz/geç ise None
+        """
+        now = time.monotonic() if now is None else now
+        if len(data) < _PROBE.size:
+            return None
+        _, _, _, src, dst, seq, sent = _PROBE.unpack_from(data)
+        if dst != dpid or self.pending.pop((src, dst, seq), None) is None:
+            return None
+
+        self.probes_received += 1
+        self.outcomes[(src, dst)].append(0)
+
+        # Controller-switch yolu çıkarılır; echo RTT yoksa ölçüm yapılmaz
+        if src not in self.echo_rtt or dst not in self.echo_rtt:
+            return None
+        sample = max(0.0, (now - sent) - (self.echo_rtt[src] + self.echo_rtt[dst]) / 2) * 1000
+        old = self.delays.get((src, dst))
+        delay = sample if old is None else self.alpha * sample + (1 - self.alpha) * old
+        self.delays[(src, dst)] = delay
+        return src, dst, delay
+
+    def expire(self, now=None):
+        """
+        Zaman aşımına uğrayan probe'ları kayıp say
+
+        Returns:
+            set: Kayıp oranı değişen linkler
+        """
+        now = time.monotonic() if now is None else now
+        changed = set()
+        for key in [k for k, sent in self.pending.items() if now - sent > self.timeout]:
+            del self.pending[key]
+            link = key[:2]
+            self.outcomes[link].append(1)
+            self.probes_lost += 1
+            changed.add(link)
+        return changed
+
+    def loss(self, src, dst):
+        """Son window probe içindeki kayıp yüzdesi (ölçüm yoksa None)"""
+        outcomes = self.outcomes.get((src, dst))
+        if not outcomes:
+            return None
+        return 100.0 * sum(outcomes) / len(outcomes)
+
+    def echo_data(self, now=None):
+        """Echo request'e konacak zaman damgası"""
+        self.echo_requests += 1
+        return _ECHO.pack(time.monotonic() if now is None else now)
+
+    def echo_reply(self, dpid, data, now=None):
+        if len(data) != _ECHO.size:
+            return
+        now = time.monotonic() if now is None else now
+        sample = now - _ECHO.unpack(data)[0]
+        old = self.echo_rtt.get(dpid)
+        self.echo_rtt[dpid] = sample if old is None else self.alpha * sample + (1 - self.alpha) * old
+
+    def get_statistics(self):
+        delays = list(self.delays.values())
+        return {
+            'probes_sent': self.probes_sent,
+            'probes_received': self.probes_received,
+            'probes_lost': self.probes_lost,
+            'probes_pending': len(self.pending),
+            'probed_links': len(self.links),
+            'measured_delay_avg_ms': sum(delays) / len(delays) if delays else 0
+        }
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Link Table - Dizi tabanlı link tablosu (CSR komşuluk + NumPy metrik dizileri)
+Her link sabit bir slot alır; port, weight, delay, bandwidth, loss, load,
+capacity ve reserved değerleri slot'a göre NumPy dizilerinde tutulur. Komşuluk CSR
+(indptr/indices) olarak yapısal değişimde tembel yeniden kurulur; yol
+hesabı ve yol skorlaması iç içe dict yerine bu diziler üzerinden yapılır
+"""
+
+import heapq
+
+import numpy as np
+
+# Metrik -> (dtype, varsayılan); varsayılanlar stratejilerin eski .get() değerleriyle aynı
+METRICS = {
+    'port': (np.int64, 0),
+    'weight': (np.float64, 1.0),
+    'delay': (np.float64, 10.0),  # ms
+    'bandwidth': (np.float64, 100.0),  # Mbps
+    'loss': (np.float64, 0.1),  # %
+    'load': (np.float64, 0.0),  # Mbps
+    'capacity': (np.float64, 100.0),  # Mbps
+    'reserved': (np.float64, 0.0),  # Mbps, kurulan ama henüz ölçüme girmemiş akışların beklenen hızı
+}
+
+
+class LinkTable:
+    """
+    dpid -> node index, (src, dst) -> slot eşlemesi ve slot başına metrikler
+
+    Silinen linklerin slot'ları yeniden kullanılır; diziler dolunca iki
+    katına büyür. Yapısal her değişim version'ı artırır. Sütunların liste
+    kopyaları (Dijkstra'nın skaler okumaları için) sütuna yazılana kadar
+    önbellekte tutulur; metrik yazımları bu yüzden set()/MetricView'dan geçer.
+    """
+
+    def __init__(self, capacity=64):
+        self.nodes = {}  # dpid -> node index
+        self.dpids = []  # node index -> dpid (silinmişse None)
+        self.free_nodes = []
+        self.edges = {}  # (src, dst) -> slot
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.edge_src = np.full(capacity, -1, dtype=np.int64)  # slot -> src node index
+        self.edge_dst = np.full(capacity, -1, dtype=np.int64)
+        self.columns = {name: np.full(capacity, default, dtype=dtype)
+                        for name, (dtype, default) in METRICS.items()}
+        self.version = 0
+        self._csr = None
+        self._lists = {}  # metrik -> sütunun liste kopyası (yazımda düşer)
+
+    def __len__(self):
+        return len(self.edges)
+
+    def __contains__(self, link):
+        return link in self.edges
+
+    @classmethod
+    def from_graph(cls, net):
+        """Mevcut graftan tablo (edge öznitelikleri metrik sütunlarına kopyalanır)"""
+        table = cls(capacity=max(64, net.number_of_edges()))
+        for src, dst, data in net.edges(data=True):
+            table.add_link(src, dst, **{name: data[name] for name in METRICS if name in data})
+        return table
+
+    # Yapı
+
+    def add_link(self, src, dst, **values):
+        """Linki ekle (varsa sadece verilen metrikler güncellenir)"""
+        slot = self.edges.get((src, dst))
+        if slot is None:
+            if not self.free_slots:
+                self._grow()
+            slot = self.free_slots.pop()
+            self.edges[(src, dst)] = slot
+            self.edge_src[slot] = self._node(src)
+            self.edge_dst[slot] = self._node(dst)
+            for name, (_, default) in METRICS.items():
+                self.columns[name][slot] = default
+            self._lists.clear()
+            self._changed()
+        for name, value in values.items():
+            self.columns[name][slot] = value
+            self._lists.pop(name, None)
+        return slot
+
+    def remove_link(self, src, dst):
+        slot = self.edges.pop((src, dst), None)
+        if slot is None:
+            return False
+        self.edge_src[slot] = self.edge_dst[slot] = -1
+        self.free_slots.append(slot)
+        self._changed()
+        return True
+
+    def remove_node(self, dpid):
+        """Switch'i ve bağlı tüm linklerini sil"""
+        index = self.nodes.pop(dpid, None)
+        if index is None:
+            return
+        for link in [l for l in self.edges if dpid in l]:
+            self.remove_link(*link)
+        self.dpids[index] = None
+        self.free_nodes.append(index)
+        self._changed()
+
+    # Metrikler
+
+    def get(self, src, dst, name, default=None):
+        slot = self.edges.get((src, dst))
+        if slot is None:
+            return default
+        return self.columns[name][slot].item()
+
+    def set(self, src, dst, **values):
+        slot = self.edges.get((src, dst))
+        if slot is None:
+            return False
+        for name, value in values.items():
+            self.columns[name][slot] = value
+            self._lists.pop(name, None)
+        return True
+
+    def port(self, src, dst):
+        return int(self.columns['port'][self.edges[(src, dst)]])
+
+    def path_slots(self, path):
+        edges = self.edges
+        return [edges[(path[i], path[i+1])] for i in range(len(path) - 1)]
+
+    def path_ports(self, path):
+        """Yolun her hop'unun çıkış portu (tek dizi indekslemesi)"""
+        return self.columns['port'][self.path_slots(path)].tolist()
+
+    def path_metrics(self, path):
+        """
+        Yolun toplam gecikmesi, darboğaz bant genişliği ve toplam kaybı
+
+        Birkaç hop'luk yollarda NumPy indeksleme/indirgeme çağrı maliyeti
+        hesaptan büyük olduğundan değerler ndarray.item ile okunur.
+        """
+        slots = self.path_slots(path)
+        if not slots:
+            return {'delay': 0, 'bandwidth': float('inf'), 'loss': 0}
+        columns = self.columns
+        return {
+            'delay': sum(map(columns['delay'].item, slots)),
+            'bandwidth': min(map(columns['bandwidth'].item, slots)),
+            'loss': sum(map(columns['loss'].item, slots))
+        }
+
+    def values(self, name):
+        """Sütunun liste kopyası (slot -> değer); sütuna yazılana kadar önbellekten"""
+        values = self._lists.get(name)
+        if values is None:
+            values = self._lists[name] = self.columns[name].tolist()
+        return values
+
+    def cost_function(self, name):
+        """RoutingEngine için (u, v, data) -> metrik (değerler çağrı anındaki kopyadan okunur)"""
+        values = self.values(name)
+        edges = self.edges
+        return lambda u, v, data: values[edges[(u, v)]]
+
+    def metric_view(self, name):
+        """Metrik sütununu (src, dst) -> değer sözlüğü gibi gösteren görünüm"""
+        return MetricView(self, name)
+
+    # Komşuluk ve yol hesabı
+
+    def csr(self):
+        """
+        CSR komşuluk (yapı değişmedikçe önbellekten)
+
+        Returns:
+            tuple: (indptr, indices, slots) listeleri; node i'nin linkleri
+                   indptr[i]:indptr[i+1] aralığındadır
+        """
+        if self._csr is None:
+            active = np.flatnonzero(self.edge_src >= 0)
+            order = active[np.argsort(self.edge_src[active], kind='stable')]
+            counts = np.bincount(self.edge_src[order], minlength=len(self.dpids))
+            indptr = np.concatenate([[0], np.cumsum(counts)])
+            self._csr = (indptr.tolist(), self.edge_dst[order].tolist(), order.tolist())
+        return self._csr
+
+    def shortest_path(self, src, dst, weight='weight'):
+        """
+        (maliyet, hop) sıralı Dijkstra (RoutingEngine.dijkstra_path ile aynı sıralama)
+
+        Returns:
+            tuple: (yol veya None, yolun hop sayısı)
+        """
+        if src not in self.nodes or dst not in self.nodes:
+            return None, 0
+        indptr, indices, slots = self.csr()
+        costs = self.values(weight)
+        start, target = self.nodes[src], self.nodes[dst]
+
+        best = {start: (0, 0)}
+        parent = {start: -1}
+        heap = [(0, 0, start)]
+        done = set()
+        while heap:
+            cost, hops, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            if node == target:
+                break
+            for k in range(indptr[node], indptr[node + 1]):
+                nbr = indices[k]
+                if nbr in done:
+                    continue
+                label = (cost + costs[slots[k]], hops + 1)
+                if nbr not in best or label < best[nbr]:
+                    best[nbr] = label
+                    parent[nbr] = node
+                    heapq.heappush(heap, (label[0], label[1], nbr))
+
+        if target not in done:
+            return None, 0
+        path = []
+        node = target
+        while node != -1:
+            path.append(self.dpids[node])
+            node = parent[node]
+        path.reverse()
+        return path, best[target][1]
+
+    def memory_bytes(self):
+        """Dizilerin bellek kullanımı (eşleme sözlükleri hariç)"""
+        return (sum(column.nbytes for column in self.columns.values())
+                + self.edge_src.nbytes + self.edge_dst.nbytes)
+
+    def _node(self, dpid):
+        index = self.nodes.get(dpid)
+        if index is None:
+            if self.free_nodes:
+                index = self.free_nodes.pop()
+                self.dpids[index] = dpid
+            else:
+                index = len(self.dpids)
+                self.dpids.append(dpid)
+            self.nodes[dpid] = index
+        return index
+
+    def _changed(self):
+        self.version += 1
+        self._csr = None
+
+    def _grow(self):
+        size = len(self.edge_src)
+        self.free_slots.extend(range(2 * size - 1, size - 1, -1))
+        self.edge_src = np.concatenate([self.edge_src, np.full(size, -1, dtype=np.int64)])
+        self.edge_dst = np.concatenate([self.edge_dst, np.full(size, -1, dtype=np.int64)])
+        for name, (dtype, default) in METRICS.items():
+            self.columns[name] = np.concatenate([self.columns[name], np.full(size, default, dtype=dtype)])
+        self._lists.clear()
+
+
+class MetricView:
+    """
+    LinkTable sütununun (src, dst) -> değer görünümü
+
+    Stratejilerin link_load/link_delay gibi sözlükleri bu görünümlerdir;
+    böylece metrikler tek yerde (tablonun dizilerinde) tutulur. Tabloda
+    olmayan (silinmiş) linke yazılan değer yok sayılır, pop() metriği
+    varsayılana döndürür.
+    """
+
+    def __init__(self, table, name):
+        self.table = table
+        self.name = name
+        self.default = METRICS[name][1]
+
+    def __len__(self):
+        return len(self.table.edges)
+
+    def __contains__(self, link):
+        return link in self.table.edges
+
+    def __iter__(self):
+        return iter(list(self.table.edges))
+
+    def __getitem__(self, link):
+        slot = self.table.edges.get(link)
+        if slot is None:
+            # link_load eskiden defaultdict(int) idi; okuma KeyError vermez
+            return self.default
+        return self.table.columns[self.name][slot].item()
+
+    def __setitem__(self, link, value):
+        self.table.set(link[0], link[1], **{self.name: value})
+
+    def get(self, link, default=None):
+        return self.table.get(link[0], link[1], self.name, default)
+
+    def pop(self, link, default=None):
+        slot = self.table.edges.get(link)
+        if slot is None:
+            return default
+        value = self.table.columns[self.name][slot].item()
+        self.table.set(link[0], link[1], **{self.name: self.default})
+        return value
+
+    def items(self):
+        column = self.table.columns[self.name]
+        return [(link, column[slot].item()) for link, slot in self.table.edges.items()]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def keys(self):
+        return list(self.table.edges)
@@ -5,250 +5,346 @@ Yük dengeleme tabanlı dinamik yönlendirme yapan SDN controller
 Trafik yükünü dengeleyerek optimal yol seçer
 """
 
-from ryu.base import app_manager
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
-from ryu.ofproto import ofproto_v1_3
-from ryu.lib.packet import packet, ethernet, ether_types
+from ryu.lib import hub
 from ryu.topology import event
-from ryu.topology.api import get_switch, get_link
-import networkx as nx
-import time
-from collections import defaultdict
 
+from base_controller import RoutingController
+from elephant_detector import ElephantDetector
+from flow_programmer import FlowBatch
+from multipath import SelectGroupTable, bucket_weights
+from strategies import LoadBalancingStrategy
+from traffic_monitor import TrafficMonitor
 
-class LoadBalancingController(app_manager.RyuApp):
-    OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
+
+class LoadBalancingController(RoutingController):
+    STRATEGY = LoadBalancingStrategy
+    ELEPHANT_PRIORITY = 10  # Elephant 5-tuple kuralları varsayılan yolların üstünde
     
     def __init__(self, *args, **kwargs):
         super(LoadBalancingController, self).__init__(*args, **kwargs)
-        self.mac_to_port = {}
-        self.topology_api_app = self
-        self.net = nx.DiGraph()
-        self.datapath_list = {}
-        
-        # Yük takibi için
-        self.link_load = defaultdict(int)  # (src_dpid, dst_dpid) -> load
-        self.link_capacity = {}  # (src_dpid, dst_dpid) -> capacity
-        
-        # Performans metrikleri
-        self.packet_count = 0
-        self.flow_install_count = 0
-        self.path_calculations = 0
-        self.load_balanced_paths = 0
-        self.start_time = time.time()
+        
+        # Yük takibi strateji ile paylaşılır
+        self.link_load = self.strategy.link_load  # (src_dpid, dst_dpid) -> load (Mbps)
+        self.link_capacity = self.strategy.link_capacity  # (src_dpid, dst_dpid) -> capacity (Mbps)
+        
+        # Port/flow stats ile gerçek link yükü ölçümü
+        self.monitor = TrafficMonitor(interval=2.0, min_interval=1.0, max_interval=10.0)
+        self.port_speed = {}  # (dpid, port) -> switch'in bildirdiği hız (Mbps)
+        self.flow_stats_parts = {}  # dpid -> çok parçalı flow stats cevabı
+        self.monitor_thread = hub.spawn(self._monitor)
+        
+        # Multipath: True ise eşit/yakın maliyetli next hop'lar OFPGT_SELECT grubuyla
+        # bölünür; bucket ağırlıkları ölçülen boş kapasiteyle güncellenir
+        self.multipath = False
+        self.select_groups = SelectGroupTable()
+        
+        # Elephant tespiti: True ise TCP/UDP akışlarının ingress kuralları 5-tuple başına
+        # kurulur; eşiği geçen akışlar daha yüksek öncelikli 5-tuple kurallarıyla en az
+        # yüklü yola taşınır, mouse akışları varsayılan yolda kalır; değer stratejinin
+        # per_flow_ingress alanında tutulur (ayar ilk Packet-In'den itibaren geçerli)
+        self.elephant_detection = False
+        self.elephant_detector = ElephantDetector(threshold_mbps=10.0)
+        self.elephant_reroutes = 0
         
         self.logger.info("Load Balancing Controller initialized")
     
+    @property
+    def elephant_detection(self):
+        return self.strategy.per_flow_ingress
+    
+    @elephant_detection.setter
+    def elephant_detection(self, enabled):
+        # Strateji hemen güncellenir: ilk monitor turundan önceki akışlar da 5-tuple başına kurulur
+        self.strategy.per_flow_ingress = enabled
+    
+    def update_link_weight(self, src, dst, load):
+        """Link ağırlığını yüke göre güncelle"""
+        self.strategy.update_link_weight(src, dst, load)
+    
+    def get_least_loaded_path(self, src, dst):
+        """En az yüklü yolu hesapla (yük ağırlıklı Dijkstra)"""
+        return self.strategy.get_least_loaded_path(src, dst)
+    
+    def get_alternative_paths(self, src, dst, k=3):
+        """En az yüklü k alternatif yolu döndür (Yen algoritması)"""
+        return self.strategy.get_alternative_paths(src, dst, k)
+    
     @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
     def switch_features_handler(self, ev):
-        """Switch bağlandığında tablo temizleme ve table-miss kuralı ekle"""
-        datapath = ev.msg.datapath
-        ofproto = datapath.ofproto
-        parser = datapath.ofproto_parser
+        super(LoadBalancingController, self).switch_features_handler(ev)
+        if self.multipath:
+            self.select_groups.reset(ev.msg.datapath)
+    
+    @set_ev_cls(event.EventLinkAdd)
+    def link_add_handler(self, ev):
+        """Port hızı ölçülmüşse yeniden eklenen link kapasitesini varsayılana düşürmez"""
+        super(LoadBalancingController, self).link_add_handler(ev)
+        src, port_no = ev.link.src.dpid, ev.link.src.port_no
+        speed = self.port_speed.get((src, port_no))
+        dst = ev.link.dst.dpid
+        if speed and self.net.has_edge(src, dst):
+            self.link_capacity[(src, dst)] = speed
+            self.update_link_weight(src, dst, self.link_load[(src, dst)])
+    
+    @set_ev_cls(event.EventSwitchLeave)
+    def switch_leave_handler(self, ev):
+        super(LoadBalancingController, self).switch_leave_handler(ev)
+        self.select_groups.remove_switch(ev.switch.dp.id)
+        self.elephant_detector.remove_switch(ev.switch.dp.id)
+    
+    def install_path(self, path, src_mac, dst_mac, in_port, out_port, flow=None, on_installed=None,
+                     labelled=False):
+        """Multipath modunda yol yerine next hop DAG'ı kurulur"""
+        dag = None
+        if self.multipath and self.forwarding_mode == 'mac' and not self.fast_failover and len(path) > 1:
+            dag = self.strategy.get_multipath(path[0], path[-1])
+        if not dag or all(len(next_hops) == 1 for next_hops in dag.values()):
+            return super(LoadBalancingController, self).install_path(
+                path, src_mac, dst_mac, in_port, out_port, flow, on_installed, labelled)
+        
+        flow = flow or {'priority': 1}
+        priority = flow['priority']
+        idle_timeout = self.strategy.idle_timeout
+        hard_timeout = self.strategy.hard_timeout
+        
+        batch = FlowBatch()
+        parser = self.datapath_list[path[0]].ofproto_parser
+        match = parser.OFPMatch(eth_dst=dst_mac)
+        ingress_match = parser.OFPMatch(in_port=in_port, eth_dst=dst_mac, **flow.get('match', {}))
+        route_key = self.route_key(path[0], in_port, dst_mac, flow)
+        cookie = self.flow_registry.new_path(path, path[0], priority, ingress_match,
+                                             route_key=route_key, flow=flow)
         
-        self.datapath_list[datapath.id] = datapath
+        # Egress, sonra hedefe yakından uzağa DAG switch'leri, en son ingress
+        self.add_flow(self.datapath_list[path[-1]], priority, match, [parser.OFPActionOutput(out_port)],
+                      idle_timeout=idle_timeout, hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        for node, next_hops in dag.items():
+            datapath = self.datapath_list[node]
+            actions = self.next_hop_actions(datapath, dst_mac, next_hops, cookie)
+            self.add_flow(datapath, priority, ingress_match if node == path[0] else match, actions,
+                          idle_timeout=idle_timeout, hard_timeout=hard_timeout, batch=batch, cookie=cookie)
         
-        # Table-miss flow entry yükle
-        match = parser.OFPMatch()
-        actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER,
-                                        ofproto.OFPCML_NO_BUFFER)]
-        self.add_flow(datapath, 0, match, actions)
+        self.flow_programmer.commit(batch, on_installed)
+        self.strategy.path_installed(path, flow)
         
-        self.logger.info(f"Switch {datapath.id} connected")
+        links = [(node, next_hop) for node, next_hops in dag.items() for next_hop in next_hops]
+        self.route_registry.add(route_key, path, ttl=hard_timeout, links=links,
+                                src_mac=src_mac, out_port=out_port, flow=flow, cookie=cookie)
+        self.logger.info(f"Multipath installed: {path[0]} -> {path[-1]}, "
+                         f"{sum(len(n) > 1 for n in dag.values())} split points")
     
-    def add_flow(self, datapath, priority, match, actions, buffer_id=None, idle_timeout=0, hard_timeout=0):
-        """Flow entry ekle"""
-        ofproto = datapath.ofproto
+    def next_hop_actions(self, datapath, dst_mac, next_hops, cookie=0):
+        """Tek next hop: output; birden fazla: boş kapasiteyle ağırlıklı select grubu"""
         parser = datapath.ofproto_parser
+        dpid = datapath.id
+        if len(next_hops) == 1:
+            return [parser.OFPActionOutput(self.links.port(dpid, next_hops[0]))]
         
-        inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
-        
-        if buffer_id:
-            mod = parser.OFPFlowMod(datapath=datapath, buffer_id=buffer_id,
-                                    priority=priority, match=match,
-                                    instructions=inst,
-                                    idle_timeout=idle_timeout,
-                                    hard_timeout=hard_timeout)
-        else:
-            mod = parser.OFPFlowMod(datapath=datapath, priority=priority,
-                                    match=match, instructions=inst,
-                                    idle_timeout=idle_timeout,
-                                    hard_timeout=hard_timeout)
-        datapath.send_msg(mod)
-        self.flow_install_count += 1
-    
-    @set_ev_cls(event.EventSwitchEnter)
-    def get_topology_data(self, ev):
-        """Topoloji bilgisini güncelle"""
-        switch_list = get_switch(self.topology_api_app, None)
-        switches = [switch.dp.id for switch in switch_list]
-        self.net.add_nodes_from(switches)
-        
-        links_list = get_link(self.topology_api_app, None)
-        
-        # Link'leri ekle ve kapasitelerini ayarla
-        for link in links_list:
-            src_dpid = link.src.dpid
-            dst_dpid = link.dst.dpid
-            port = link.src.port_no
-            
-            # Link ekle (ağırlık = mevcut yük)
-            self.net.add_edge(src_dpid, dst_dpid, port=port, weight=0)
-            
-            # Varsayılan kapasite (Mbps cinsinden)
-            self.link_capacity[(src_dpid, dst_dpid)] = 100
-        
-        self.logger.info(f"Topology updated: {len(switches)} switches, {len(links_list)} links")
+        headroom = {self.links.port(dpid, nh): self.strategy.link_headroom(dpid, nh) for nh in next_hops}
+        return self.select_groups.actions_for(datapath, dst_mac, bucket_weights(headroom), cookie)
     
-    def update_link_weight(self, src, dst, load):
-        """Link ağırlığını yüke göre güncelle"""
-        if self.net.has_edge(src, dst):
-            capacity = self.link_capacity.get((src, dst), 100)
-            # Yük oranına göre ağırlık (0-1 arası normalize)
-            utilization = min(load / capacity, 1.0)
-            # Yüksek yük = yüksek ağırlık (maliyet)
-            weight = 1 + (utilization * 10)  # 1-11 arası değer
-            self.net[src][dst]['weight'] = weight
-            self.link_load[(src, dst)] = load
+    def path_ended(self, cookie):
+        """Biten yolun select gruplarını da bırak (kullanan yolu kalmayan grup silinir)"""
+        super(LoadBalancingController, self).path_ended(cookie)
+        self.select_groups.release(cookie, self.datapath_list)
     
-    def get_least_loaded_path(self, src, dst):
-        """En az yüklü yolu hesapla (ağırlıklı shortest path)"""
-        try:
-            self.path_calculations += 1
-            
-            # Tüm olası yolları bul
-            all_paths = list(nx.all_simple_paths(self.net, src, dst, cutoff=5))
-            
-            if not all_paths:
-                return None
-            
-            # Her yolun toplam yükünü hesapla
-            path_loads = []
-            for path in all_paths:
-                total_load = 0
-                for i in range(len(path) - 1):
-                    load = self.link_load.get((path[i], path[i+1]), 0)
-                    total_load += load
-                path_loads.append((path, total_load))
-            
-            # En az yüklü yolu seç
-            best_path = min(path_loads, key=lambda x: x[1])
-            
-            if best_path[1] < min(path_loads, key=lambda x: x[1])[1] * 1.5:
-                self.load_balanced_paths += 1
-            
-            return best_path[0]
-        except:
-            # Hata durumunda basit shortest path
-            try:
-                return nx.shortest_path(self.net, src, dst)
-            except:
-                return None
-    
-    def install_path(self, path, src_mac, dst_mac, in_port, out_port):
-        """Hesaplanan yol üzerindeki tüm switch'lere flow rule yükle"""
-        if len(path) < 2:
+    def rebalance_groups(self, dpid):
+        """Switch'in select grup ağırlıklarını ölçülen boş kapasiteye göre güncelle"""
+        datapath = self.datapath_list.get(dpid)
+        if datapath is None or dpid not in self.net:
             return
+        peers = {data['port']: dst for dst, data in self.net[dpid].items()}
+        for dst_mac, weights in self.select_groups.groups_at(dpid):
+            if not all(port in peers for port in weights):
+                continue
+            headroom = {port: self.strategy.link_headroom(dpid, peers[port]) for port in weights}
+            self.select_groups.reweight(datapath, dst_mac, bucket_weights(headroom))
+    
+    def reroute_elephant(self, dpid, flow_key, rate):
+        """Varsayılan yoldaki elephant akışı 5-tuple kurallarıyla en az yüklü yola taşı"""
+        priority, items = flow_key
+        fields = dict(items)
+        in_port = fields.pop('in_port', None)
+        dst_mac = fields.get('eth_dst')
+        location = self.host_index.lookup(dst_mac)
+        if priority == self.ELEPHANT_PRIORITY or in_port is None or location is None:
+            return False
         
-        # Yol üzerindeki linklerin yükünü artır
-        for i in range(len(path) - 1):
-            self.link_load[(path[i], path[i+1])] += 1
-            self.update_link_weight(path[i], path[i+1], self.link_load[(path[i], path[i+1])])
+        fields.pop('eth_dst')
+        flow = {'priority': self.ELEPHANT_PRIORITY, 'match': fields, 'elephant': True, 'rate': rate}
+        route_key = self.route_key(dpid, in_port, dst_mac, flow)
+        if route_key in self.route_registry.routes or location[0] not in self.net:
+            return False
         
-        # İlk switch için
-        datapath = self.datapath_list[path[0]]
-        ofproto = datapath.ofproto
-        parser = datapath.ofproto_parser
+        current = self.route_registry.get(self.route_key(dpid, in_port, dst_mac,
+                                                         {'priority': priority, 'match': fields}))
+        path = self.strategy.get_least_loaded_path(dpid, location[0])
+        if not path or len(path) < 2 or (current is not None and current['path'] == path):
+            # Akış zaten en az yüklü yolda
+            return False
         
-        match = parser.OFPMatch(in_port=in_port, eth_dst=dst_mac)
-        actions = [parser.OFPActionOutput(self.net[path[0]][path[1]]['port'])]
-        self.add_flow(datapath, 1, match, actions, idle_timeout=10, hard_timeout=30)
+        self.install_elephant_path(path, dst_mac, in_port, location[1], flow, route_key)
+        self.elephant_reroutes += 1
+        self.logger.info(f"Elephant flow {fields} ({rate:.1f} Mbps) rerouted: "
+                         f"{' -> '.join(map(str, path))}")
+        return True
+    
+    def install_elephant_path(self, path, dst_mac, in_port, out_port, flow, route_key):
+        """Yol boyunca akışa özel (eth_dst + 5-tuple) kuralları egress'ten ingress'e kur"""
+        priority = flow['priority']
+        idle_timeout = self.strategy.idle_timeout
+        hard_timeout = self.strategy.hard_timeout
         
-        # Ara switch'ler için
-        for i in range(1, len(path) - 1):
-            datapath = self.datapath_list[path[i]]
-            match = parser.OFPMatch(eth_dst=dst_mac)
-            actions = [parser.OFPActionOutput(self.net[path[i]][path[i+1]]['port'])]
-            self.add_flow(datapath, 1, match, actions, idle_timeout=10, hard_timeout=30)
+        batch = FlowBatch()
+        parser = self.datapath_list[path[0]].ofproto_parser
+        match = parser.OFPMatch(eth_dst=dst_mac, **flow['match'])
+        ingress_match = parser.OFPMatch(in_port=in_port, eth_dst=dst_mac, **flow['match'])
+        cookie = self.flow_registry.new_path(path, path[0], priority, ingress_match,
+                                             route_key=route_key, flow=flow)
         
-        # Son switch için
-        datapath = self.datapath_list[path[-1]]
-        match = parser.OFPMatch(eth_dst=dst_mac)
-        actions = [parser.OFPActionOutput(out_port)]
-        self.add_flow(datapath, 1, match, actions, idle_timeout=10, hard_timeout=30)
+        self.add_flow(self.datapath_list[path[-1]], priority, match, [parser.OFPActionOutput(out_port)],
+                      idle_timeout=idle_timeout, hard_timeout=hard_timeout, batch=batch, cookie=cookie)
+        for i in range(len(path) - 2, -1, -1):
+            actions = [parser.OFPActionOutput(self.links.port(path[i], path[i+1]))]
+            self.add_flow(self.datapath_list[path[i]], priority, ingress_match if i == 0 else match,
+                          actions, idle_timeout=idle_timeout, hard_timeout=hard_timeout, batch=batch,
+                          cookie=cookie)
         
-        self.logger.info(f"Load-balanced path installed: {' -> '.join(map(str, path))}")
+        self.flow_programmer.commit(batch)
+        self.strategy.path_installed(path, flow)
+        self.route_registry.add(route_key, path, ttl=hard_timeout, out_port=out_port, flow=flow,
+                                cookie=cookie)
     
-    @set_ev_cls(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
-    def packet_in_handler(self, ev):
-        """Packet-In mesajlarını işle"""
-        msg = ev.msg
-        datapath = msg.datapath
+    def reroute_flows(self, routes):
+        """Elephant yolları yeniden kurulmaz; ingress kuralı silinir ve akış varsayılan yoluna döner"""
+        elephants = [(key, route) for key, route in routes if route['flow'].get('elephant')]
+        for key, route in elephants:
+            self.route_registry.remove(key)
+            self.delete_elephant_rule(key, route)
+        super(LoadBalancingController, self).reroute_flows(
+            [(key, route) for key, route in routes if not route['flow'].get('elephant')])
+    
+    def delete_elephant_rule(self, key, route):
+        ingress, in_port, dst_mac = key[:3]
+        datapath = self.datapath_list.get(ingress)
+        if datapath is None:
+            return
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        match = parser.OFPMatch(in_port=in_port, eth_dst=dst_mac, **route['flow']['match'])
+        datapath.send_msg(parser.OFPFlowMod(datapath=datapath, command=ofproto.OFPFC_DELETE_STRICT,
+                                            priority=self.ELEPHANT_PRIORITY, match=match,
+                                            out_port=ofproto.OFPP_ANY, out_group=ofproto.OFPG_ANY))
+    
+    def _monitor(self):
+        """Zamanı gelen switch'lerden port/flow istatistiklerini iste"""
+        while True:
+            if self.elephant_detection:
+                # Elephant tespiti her turda flow sayaçlarına ihtiyaç duyar
+                self.monitor.flow_stats_every = 1
+            
+            for dpid in [d for d in self.monitor.intervals if d not in self.datapath_list]:
+                self.monitor.remove_switch(dpid)
+            for dpid, datapath in list(self.datapath_list.items()):
+                if dpid not in self.monitor.intervals:
+                    self.monitor.add_switch(dpid)
+                    self.request_port_desc(datapath)
+            
+            for dpid, with_flows in self.monitor.due():
+                datapath = self.datapath_list.get(dpid)
+                if datapath is not None:
+                    self.request_stats(datapath, with_flows)
+            
+            hub.sleep(self.monitor.min_interval / 2)
+    
+    def request_port_desc(self, datapath):
+        """Port hızlarını (link kapasitesi) iste"""
+        parser = datapath.ofproto_parser
+        datapath.send_msg(parser.OFPPortDescStatsRequest(datapath, 0))
+    
+    def request_stats(self, datapath, with_flows=False):
+        """Switch'in tüm portları için tek port stats isteği (gerekirse flow stats)"""
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
-        in_port = msg.match['in_port']
-        
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocols(ethernet.ethernet)[0]
         
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        datapath.send_msg(parser.OFPPortStatsRequest(datapath, 0, ofproto.OFPP_ANY))
+        if with_flows:
+            datapath.send_msg(parser.OFPFlowStatsRequest(datapath))
+    
+    @set_ev_cls(ofp_event.EventOFPPortDescStatsReply, MAIN_DISPATCHER)
+    def port_desc_stats_reply_handler(self, ev):
+        dpid = ev.msg.datapath.id
+        for port in ev.msg.body:
+            if port.curr_speed:
+                self.port_speed[(dpid, port.port_no)] = port.curr_speed / 1000  # kbps -> Mbps
+    
+    @set_ev_cls(ofp_event.EventOFPPortStatsReply, MAIN_DISPATCHER)
+    def port_stats_reply_handler(self, ev):
+        """Ölçülen link hızlarından link ağırlıklarını güncelle"""
+        dpid = ev.msg.datapath.id
+        if dpid not in self.net:
             return
         
-        dst = eth.dst
-        src = eth.src
-        dpid = datapath.id
+        # Port -> karşı switch (sadece switch'ler arası linkler)
+        peers = {data['port']: dst for dst, data in self.net[dpid].items()}
         
-        self.packet_count += 1
-        
-        # MAC öğrenme
-        self.mac_to_port.setdefault(dpid, {})
-        self.mac_to_port[dpid][src] = in_port
-        
-        # Hedef MAC biliniyorsa ve topoloji varsa yönlendirme yap
-        if dst in [mac for switch in self.mac_to_port.values() for mac in switch]:
-            dst_dpid = None
-            dst_port = None
-            for switch_id, mac_table in self.mac_to_port.items():
-                if dst in mac_table:
-                    dst_dpid = switch_id
-                    dst_port = mac_table[dst]
-                    break
-            
-            if dst_dpid and dpid in self.net and dst_dpid in self.net:
-                # En az yüklü yolu hesapla
-                path = self.get_least_loaded_path(dpid, dst_dpid)
-                
-                if path:
-                    self.install_path(path, src, dst, in_port, dst_port)
-                    out_port = self.net[dpid][path[1]]['port'] if len(path) > 1 else dst_port
-                else:
-                    out_port = ofproto.OFPP_FLOOD
-            else:
-                out_port = ofproto.OFPP_FLOOD
-        else:
-            out_port = ofproto.OFPP_FLOOD
-        
-        # Paketi gönder
-        actions = [parser.OFPActionOutput(out_port)]
-        data = None
-        if msg.buffer_id == ofproto.OFP_NO_BUFFER:
-            data = msg.data
-        
-        out = parser.OFPPacketOut(datapath=datapath, buffer_id=msg.buffer_id,
-                                  in_port=in_port, actions=actions, data=data)
-        datapath.send_msg(out)
+        def capacity_of(port_no):
+            peer = peers.get(port_no)
+            return self.port_speed.get((dpid, port_no)) or self.link_capacity.get((dpid, peer))
+        
+        stats = [(stat.port_no, stat.tx_bytes) for stat in ev.msg.body]
+        rates = self.monitor.port_stats_reply(dpid, stats, capacity_of)
+        
+        for port_no, rate in rates.items():
+            dst = peers.get(port_no)
+            if dst is None:
+                continue
+            speed = self.port_speed.get((dpid, port_no))
+            if speed:
+                self.link_capacity[(dpid, dst)] = speed
+            self.strategy.link_measured(dpid, dst, rate)
+        
+        if self.multipath:
+            self.rebalance_groups(dpid)
+    
+    @set_ev_cls(ofp_event.EventOFPFlowStatsReply, MAIN_DISPATCHER)
+    def flow_stats_reply_handler(self, ev):
+        """Flow bazlı hızlar (çok parçalı cevap birleştirilerek işlenir)"""
+        msg = ev.msg
+        dpid = msg.datapath.id
+        parts = self.flow_stats_parts.setdefault(dpid, [])
+        parts.extend(((stat.priority, tuple(sorted(stat.match.items()))), stat.byte_count)
+                     for stat in msg.body if stat.priority > 0)
+        if msg.flags & msg.datapath.ofproto.OFPMPF_REPLY_MORE:
+            return
+        
+        stats = self.flow_stats_parts.pop(dpid)
+        self.monitor.flow_stats_reply(dpid, stats)
+        if self.elephant_detection:
+            self.detect_elephants(dpid, stats)
+    
+    def detect_elephants(self, dpid, stats):
+        """Ingress 5-tuple kurallarından elephant'ları bul, yenilerini yeniden yönlendir"""
+        flows = []
+        for key, byte_count in stats:
+            if key[0] in (1, self.ELEPHANT_PRIORITY):
+                fields = dict(key[1])
+                if 'in_port' in fields and 'ip_proto' in fields:
+                    flows.append((key, byte_count))
+        new, _ = self.elephant_detector.update(dpid, flows)
+        for flow_key, rate in new:
+            self.reroute_elephant(dpid, flow_key, rate)
     
     def get_statistics(self):
         """Performans istatistiklerini döndür"""
-        elapsed_time = time.time() - self.start_time
-        return {
-            'packets_processed': self.packet_count,
-            'flows_installed': self.flow_install_count,
-            'path_calculations': self.path_calculations,
-            'load_balanced_paths': self.load_balanced_paths,
-            'packets_per_second': self.packet_count / elapsed_time if elapsed_time > 0 else 0,
-            'elapsed_time': elapsed_time,
-            'average_link_load': sum(self.link_load.values()) / len(self.link_load) if self.link_load else 0
-        }
+        stats = super(LoadBalancingController, self).get_statistics()
+        stats.update(self.monitor.get_statistics())
+        stats['select_groups'] = len(self.select_groups)
+        stats['select_group_mods'] = self.select_groups.group_mods
+        stats['select_groups_released'] = self.select_groups.released
+        stats.update(self.elephant_detector.get_statistics())
+        stats['elephant_reroutes'] = self.elephant_reroutes
+        return stats
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Multipath - ECMP next hop DAG'ı ve OFPGT_SELECT grupları
+Hedefe eşit (veya yakın) maliyetli tüm next hop'lar bulunur; birden fazla
+next hop'u olan switch'lerde trafik, bucket ağırlıkları link boş
+kapasitesiyle orantılı select grubuyla bölünür
+"""
+
+from collections import OrderedDict, defaultdict
+
+import networkx as nx
+
+BUCKET_WEIGHT_TOTAL = 100
+
+
+def multipath_dag(net, src, dst, cost, slack=0.0):
+    """
+    src'den dst'ye eşit/yakın maliyetli next hop DAG'ı
+
+    u -> v ancak v hedefe u'dan kesin daha yakınsa ve cost(u, v) + d(v)
+    en fazla d(u) + slack ise kullanılır; mesafe her adımda azaldığından
+    DAG döngüsüzdür.
+
+    Args:
+        cost: callable(u, v, data) -> link maliyeti (pozitif)
+
+    Returns:
+        OrderedDict: node -> [next hop'lar] (hedefe yakından uzağa sıralı,
+                     dst hariç) veya yol yoksa None
+    """
+    if src not in net or dst not in net:
+        return None
+    dist = nx.single_source_dijkstra_path_length(
+        net.reverse(copy=False), dst, weight=lambda a, b, data: cost(b, a, data))
+    if src not in dist:
+        return None
+
+    next_hops = {}
+    stack = [src]
+    while stack:
+        node = stack.pop()
+        if node == dst or node in next_hops:
+            continue
+        hops = sorted((v for v, data in net[node].items()
+                       if v in dist and dist[v] < dist[node] and
+                       cost(node, v, data) + dist[v] <= dist[node] + slack),
+                      key=lambda v: cost(node, v, net[node][v]) + dist[v])
+        next_hops[node] = hops
+        stack.extend(hops)
+
+    return OrderedDict(sorted(next_hops.items(), key=lambda item: dist[item[0]]))
+
+
+def bucket_weights(headroom):
+    """
+    Boş kapasiteye orantılı tamsayı bucket ağırlıkları
+
+    Args:
+        headroom: {port: boş kapasite}
+
+    Returns:
+        dict: port -> ağırlık (toplam ~BUCKET_WEIGHT_TOTAL, her biri en az 1)
+    """
+    total = sum(max(h, 0) for h in headroom.values())
+    if total <= 0:
+        return {port: 1 for port in headroom}
+    return {port: max(1, round(BUCKET_WEIGHT_TOTAL * max(h, 0) / total))
+            for port, h in headroom.items()}
+
+
+class SelectGroupTable:
+    """
+    (dpid, dst_mac) başına OFPGT_SELECT grubu
+
+    Grup numaraları fast-failover gruplarıyla çakışmamak için
+    GROUP_ID_BASE'den başlar. Ağırlıklar değişmedikçe GroupMod gönderilmez.
+    Grubu kullanan yollar cookie'leriyle tutulur; son kullanan yol bitince
+    grup switch'ten silinir.
+    """
+
+    GROUP_ID_BASE = 1 << 16
+
+    def __init__(self, min_change=5):
+        self.min_change = min_change  # Yeniden ağırlıklandırma eşiği (ağırlık puanı)
+        self.groups = {}  # (dpid, dst_mac) -> [group_id, {port: weight}]
+        self.next_group_id = {}  # dpid -> sonraki boş group_id
+        self.users = defaultdict(set)  # (dpid, dst_mac) -> {grubu kullanan yol cookie'si}
+        self.used_by = defaultdict(set)  # cookie -> {(dpid, dst_mac)}
+        self.group_mods = 0
+        self.released = 0
+
+    def __len__(self):
+        return len(self.groups)
+
+    def actions_for(self, datapath, dst_mac, weights, cookie=0):
+        """
+        Select grubunu kur veya güncelle, flow için group aksiyonunu döndür
+
+        cookie: grubu kullanan yolun cookie'si (yol bitince release ile bırakılır)
+        """
+        key = (datapath.id, dst_mac)
+        if cookie:
+            self.users[key].add(cookie)
+            self.used_by[cookie].add(key)
+        group = self.groups.get(key)
+        if group is None:
+            group_id = self.next_group_id.get(datapath.id, self.GROUP_ID_BASE)
+            self.next_group_id[datapath.id] = group_id + 1
+            self.groups[key] = [group_id, dict(weights)]
+            self._send(datapath, datapath.ofproto.OFPGC_ADD, group_id, weights)
+        else:
+            group_id = group[0]
+            if set(group[1]) != set(weights) or self._changed(group[1], weights):
+                group[1] = dict(weights)
+                self._send(datapath, datapath.ofproto.OFPGC_MODIFY, group_id, weights)
+        return [datapath.ofproto_parser.OFPActionGroup(group_id)]
+
+    def reweight(self, datapath, dst_mac, weights):
+        """Mevcut grubun ağırlıklarını güncelle (eşik altındaki değişim gönderilmez)"""
+        group = self.groups.get((datapath.id, dst_mac))
+        if group is None or set(group[1]) != set(weights) or not self._changed(group[1], weights):
+            return False
+        group[1] = dict(weights)
+        self._send(datapath, datapath.ofproto.OFPGC_MODIFY, group[0], weights)
+        return True
+
+    def groups_at(self, dpid):
+        """Switch'in grupları: [(dst_mac, {port: weight})]"""
+        return [(key[1], group[1]) for key, group in self.groups.items() if key[0] == dpid]
+
+    def reset(self, datapath):
+        """Switch (yeniden) bağlandığında eski grupları sil"""
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        datapath.send_msg(parser.OFPGroupMod(datapath, ofproto.OFPGC_DELETE, 0,
+                                             ofproto.OFPG_ALL))
+        self.remove_switch(datapath.id)
+
+    def release(self, cookie, datapaths):
+        """
+        Biten yolun grup kullanımlarını bırak; kullanan yolu kalmayan grubu sil
+
+        Args:
+            datapaths: dpid -> datapath (kopmuş switch'lere mesaj gönderilmez)
+
+        Returns:
+            int: Silinen grup sayısı
+        """
+        released = 0
+        for key in self.used_by.pop(cookie, ()):
+            users = self.users.get(key)
+            if users is None:
+                continue
+            users.discard(cookie)
+            if users:
+                continue
+            del self.users[key]
+            group_id = self.groups.pop(key)[0]
+            datapath = datapaths.get(key[0])
+            if datapath is not None:
+                ofproto = datapath.ofproto
+                datapath.send_msg(datapath.ofproto_parser.OFPGroupMod(datapath, ofproto.OFPGC_DELETE,
+                                                                      ofproto.OFPGT_SELECT, group_id))
+                self.group_mods += 1
+            released += 1
+        self.released += released
+        return released
+
+    def remove_switch(self, dpid):
+        for key in [k for k in self.groups if k[0] == dpid]:
+            del self.groups[key]
+            self.users.pop(key, None)
+        self.next_group_id.pop(dpid, None)
+
+    def _changed(self, old, new):
+        return any(abs(old[port] - new[port]) >= self.min_change for port in new)
+
+    def _send(self, datapath, command, group_id, weights):
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        buckets = [parser.OFPBucket(weight=weight, watch_port=ofproto.OFPP_ANY,
+                                    watch_group=ofproto.OFPG_ANY,
+                                    actions=[parser.OFPActionOutput(port)])
+                   for port, weight in sorted(weights.items())]
+        datapath.send_msg(parser.OFPGroupMod(datapath, command, ofproto.OFPGT_SELECT,
+                                             group_id, buckets))
+        self.group_mods += 1
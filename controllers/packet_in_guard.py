@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Packet-In Guard - Packet-In admission control
+Switch ve kaynak MAC başına token bucket ile Packet-In fırtınalarını
+sınırlar, kötüye kullanan kaynakları engeller ve kurulumu süren
+(src, dst) çiftleri için tekrar gelen Packet-In'leri ayıklar
+"""
+
+import time
+from collections import OrderedDict
+
+ADMIT = 'admit'
+DROP = 'drop'
+BLOCK = 'block'
+
+
+class TokenBucket:
+    """rate token/s dolan, en fazla burst token tutan kova"""
+
+    __slots__ = ('rate', 'burst', 'tokens', 'last')
+
+    def __init__(self, rate, burst, now):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = now
+
+    def consume(self, now, tokens=1):
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+
+class PacketInGuard:
+    """
+    Packet-In hattının girişindeki admission control
+
+    admit() ADMIT, DROP veya BLOCK döndürür. BLOCK, kaynağın block_window
+    içinde block_after kez reddedildiği anlamına gelir; controller bu
+    durumda switch'e geçici drop/meter kuralı kurar. Engelli kaynaktan
+    kural devreye girene kadar gelen paketler sessizce düşürülür.
+
+    Kurulumu süren yolun (route key) tekrar Packet-In'leri yeniden
+    hesaplanmaz; en fazla max_held tanesi bekletilir ve kurulum bitince
+    install_finished ile PacketOut için geri verilir.
+    """
+
+    def __init__(self, switch_rate=1000, switch_burst=2000,
+                 source_rate=100, source_burst=200,
+                 block_after=100, block_window=1.0, block_time=10,
+                 inflight_timeout=2.0, max_sources=4096, max_held=64):
+        self.switch_rate = switch_rate
+        self.switch_burst = switch_burst
+        self.source_rate = source_rate
+        self.source_burst = source_burst
+        self.block_after = block_after
+        self.block_window = block_window
+        self.block_time = block_time
+        self.inflight_timeout = inflight_timeout
+        self.max_sources = max_sources
+        self.max_held = max_held
+
+        self.switch_buckets = {}  # dpid -> TokenBucket
+        self.sources = OrderedDict()  # (dpid, mac) -> [TokenBucket, denied, denied_since] (LRU)
+        self.blocked = {}  # (dpid, mac) -> engel bitiş zamanı
+        self.inflight = {}  # route key -> [kurulum başlangıcı, bekletilen Packet-In'ler]
+
+        # İstatistikler
+        self.admitted = 0
+        self.dropped_switch = 0
+        self.dropped_source = 0
+        self.dropped_blocked = 0
+        self.deduplicated = 0
+        self.dropped_held = 0
+        self.released = 0
+        self.blocks = 0
+
+    def admit(self, dpid, src_mac, now=None):
+        """Packet-In'i kabul et, düşür veya kaynağı engelle"""
+        now = time.monotonic() if now is None else now
+        key = (dpid, src_mac)
+
+        until = self.blocked.get(key)
+        if until is not None:
+            if now < until:
+                self.dropped_blocked += 1
+                return DROP
+            del self.blocked[key]
+
+        bucket = self.switch_buckets.get(dpid)
+        if bucket is None:
+            bucket = self.switch_buckets[dpid] = TokenBucket(self.switch_rate, self.switch_burst, now)
+        if not bucket.consume(now):
+            self.dropped_switch += 1
+            return DROP
+
+        source = self.sources.get(key)
+        if source is None:
+            source = self.sources[key] = [TokenBucket(self.source_rate, self.source_burst, now), 0, now]
+            if len(self.sources) > self.max_sources:
+                self.sources.popitem(last=False)
+        else:
+            self.sources.move_to_end(key)
+
+        if source[0].consume(now):
+            self.admitted += 1
+            return ADMIT
+
+        self.dropped_source += 1
+        if now - source[2] > self.block_window:
+            source[1], source[2] = 0, now
+        source[1] += 1
+        if source[1] >= self.block_after:
+            source[1] = 0
+            self.blocked[key] = now + self.block_time
+            self.blocks += 1
+            return BLOCK
+        return DROP
+
+    def is_duplicate(self, key, packet=None, now=None):
+        """
+        key yolunun kurulumu sürüyorsa True; packet kurulum bitene kadar bekletilir
+
+        Returns:
+            bool: True ise Packet-In tekrar sayılır (yeniden hesaplanmaz)
+        """
+        entry = self.inflight.get(key)
+        if entry is None:
+            return False
+        now = time.monotonic() if now is None else now
+        if now - entry[0] > self.inflight_timeout:
+            # Barrier cevabı gelmedi; kurulum tekrar denenebilir, bekleyenler düşer
+            del self.inflight[key]
+            self.dropped_held += len(entry[1])
+            return False
+        self.deduplicated += 1
+        if packet is not None:
+            if len(entry[1]) < self.max_held:
+                entry[1].append(packet)
+            else:
+                self.dropped_held += 1
+        return True
+
+    def install_started(self, key, now=None):
+        """Kurulum başladı (asenkron hesaptan sonraki kurulum bekleyenleri korur)"""
+        now = time.monotonic() if now is None else now
+        entry = self.inflight.get(key)
+        if entry is None:
+            self.inflight[key] = [now, []]
+        else:
+            entry[0] = now
+
+    def install_finished(self, key):
+        """Kurulum bitti; bekletilen Packet-In'leri (geliş sırasıyla) döndür"""
+        entry = self.inflight.pop(key, None)
+        if entry is None:
+            return []
+        self.released += len(entry[1])
+        return entry[1]
+
+    def remove_switch(self, dpid):
+        """Kopan switch'in kova ve engel kayıtlarını sil"""
+        self.switch_buckets.pop(dpid, None)
+        for key in [k for k in self.sources if k[0] == dpid]:
+            del self.sources[key]
+        for key in [k for k in self.blocked if k[0] == dpid]:
+            del self.blocked[key]
+
+    def get_statistics(self):
+        now = time.monotonic()
+        return {
+            'packet_in_admitted': self.admitted,
+            'packet_in_dropped': self.dropped_switch + self.dropped_source + self.dropped_blocked,
+            'packet_in_dropped_switch': self.dropped_switch,
+            'packet_in_dropped_source': self.dropped_source,
+            'packet_in_dropped_blocked': self.dropped_blocked,
+            'packet_in_deduplicated': self.deduplicated,
+            'packet_in_held_released': self.released,
+            'packet_in_held_dropped': self.dropped_held,
+            'source_blocks': self.blocks,
+            'blocked_sources': sum(1 for until in self.blocked.values() if until > now),
+            'installs_in_flight': len(self.inflight)
+        }
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Packet View - Packet-In için tembel, kopyasız başlık okuyucu
+ryu packet.Packet tüm katmanları baştan çözer; PacketView ise msg.data
+üzerindeki memoryview'dan yalnızca istenen alanları, istendiği anda okur
+"""
+
+import struct
+
+ETH_TYPE_IP = 0x0800
+ETH_TYPE_ARP = 0x0806
+ETH_TYPE_8021Q = 0x8100
+ETH_TYPE_8021AD = 0x88a8
+
+ARP_REQUEST = 1
+ARP_REPLY = 2
+
+IPPROTO_TCP = 6
+IPPROTO_UDP = 17
+IPPROTO_SCTP = 132
+
+_VLAN_TYPES = (ETH_TYPE_8021Q, ETH_TYPE_8021AD)
+_PORT_PROTOS = (IPPROTO_TCP, IPPROTO_UDP, IPPROTO_SCTP)
+
+_unpack_h = struct.Struct('!H').unpack_from
+_unpack_hh = struct.Struct('!HH').unpack_from
+
+_UNSET = object()
+
+
+def _mac_str(buf):
+    return buf.hex(':')
+
+
+def _ip_str(buf):
+    return '%d.%d.%d.%d' % tuple(buf)
+
+
+class PacketView:
+    """
+    Ethernet/VLAN/ARP/IPv4/L4 başlık alanlarına tembel erişim
+
+    Her katman ilk erişimde bir kez çözülür ve sonucu saklanır; eksik
+    veya kesik başlıklarda ilgili alanlar None döner. ethertype VLAN
+    etiketlerinin arkasındaki asıl protokoldür.
+    """
+
+    __slots__ = ('data', '_eth_dst', '_eth_src', '_ethertype', '_vlan_tci',
+                 '_l3', '_ip_proto', '_ip_dscp', '_l4', '_ports')
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self._eth_dst = None
+        self._eth_src = None
+        self._ethertype = _UNSET
+        self._vlan_tci = None
+        self._l3 = None
+        self._ip_proto = _UNSET
+        self._ip_dscp = None
+        self._l4 = None
+        self._ports = _UNSET
+
+    # Ethernet
+
+    @property
+    def eth_dst(self):
+        if self._eth_dst is None and len(self.data) >= 6:
+            self._eth_dst = _mac_str(self.data[0:6])
+        return self._eth_dst
+
+    @property
+    def eth_src(self):
+        if self._eth_src is None and len(self.data) >= 12:
+            self._eth_src = _mac_str(self.data[6:12])
+        return self._eth_src
+
+    @property
+    def ethertype(self):
+        if self._ethertype is _UNSET:
+            self._parse_l2()
+        return self._ethertype
+
+    @property
+    def vlan_id(self):
+        """Dış VLAN etiketinin VID değeri (etiket yoksa None)"""
+        if self._ethertype is _UNSET:
+            self._parse_l2()
+        return self._vlan_tci & 0x0fff if self._vlan_tci is not None else None
+
+    @property
+    def vlan_pcp(self):
+        if self._ethertype is _UNSET:
+            self._parse_l2()
+        return self._vlan_tci >> 13 if self._vlan_tci is not None else None
+
+    @property
+    def l3_offset(self):
+        """L3 başlığının frame içindeki başlangıcı (L2 çözülemezse None)"""
+        if self._ethertype is _UNSET:
+            self._parse_l2()
+        return self._l3
+
+    # ARP (Ethernet/IPv4)
+
+    @property
+    def arp_opcode(self):
+        arp = self._arp_offset()
+        return _unpack_h(self.data, arp + 6)[0] if arp is not None else None
+
+    @property
+    def arp_src_mac(self):
+        arp = self._arp_offset()
+        return _mac_str(self.data[arp + 8:arp + 14]) if arp is not None else None
+
+    @property
+    def arp_src_ip(self):
+        arp = self._arp_offset()
+        return _ip_str(self.data[arp + 14:arp + 18]) if arp is not None else None
+
+    @property
+    def arp_dst_mac(self):
+        arp = self._arp_offset()
+        return _mac_str(self.data[arp + 18:arp + 24]) if arp is not None else None
+
+    @property
+    def arp_dst_ip(self):
+        arp = self._arp_offset()
+        return _ip_str(self.data[arp + 24:arp + 28]) if arp is not None else None
+
+    # IPv4
+
+    @property
+    def ip_proto(self):
+        if self._ip_proto is _UNSET:
+            self._parse_ipv4()
+        return self._ip_proto
+
+    @property
+    def ip_dscp(self):
+        if self._ip_proto is _UNSET:
+            self._parse_ipv4()
+        return self._ip_dscp
+
+    @property
+    def ipv4_src(self):
+        if self.ip_proto is None:
+            return None
+        return _ip_str(self.data[self._l3 + 12:self._l3 + 16])
+
+    @property
+    def ipv4_dst(self):
+        if self.ip_proto is None:
+            return None
+        return _ip_str(self.data[self._l3 + 16:self._l3 + 20])
+
+    # TCP/UDP/SCTP
+
+    @property
+    def src_port(self):
+        ports = self._l4_ports()
+        return ports[0] if ports else None
+
+    @property
+    def dst_port(self):
+        ports = self._l4_ports()
+        return ports[1] if ports else None
+
+    def _parse_l2(self):
+        data = self.data
+        if len(data) < 14:
+            self._ethertype = None
+            return
+        ethertype = _unpack_h(data, 12)[0]
+        offset = 14
+        while ethertype in _VLAN_TYPES and len(data) >= offset + 4:
+            if self._vlan_tci is None:
+                self._vlan_tci = _unpack_h(data, offset)[0]
+            ethertype = _unpack_h(data, offset + 2)[0]
+            offset += 4
+        self._ethertype = ethertype
+        self._l3 = offset
+
+    def _arp_offset(self):
+        """Geçerli bir Ethernet/IPv4 ARP başlığının başlangıcı, yoksa None"""
+        if self.ethertype != ETH_TYPE_ARP:
+            return None
+        l3 = self._l3
+        data = self.data
+        if len(data) < l3 + 28 or data[l3 + 4] != 6 or data[l3 + 5] != 4:
+            return None
+        return l3
+
+    def _parse_ipv4(self):
+        self._ip_proto = None
+        if self.ethertype != ETH_TYPE_IP:
+            return
+        data = self.data
+        l3 = self._l3
+        if len(data) < l3 + 20 or data[l3] >> 4 != 4:
+            return
+        self._ip_proto = data[l3 + 9]
+        self._ip_dscp = data[l3 + 1] >> 2
+        # Sadece ilk fragment L4 başlığı taşır
+        if _unpack_h(data, l3 + 6)[0] & 0x1fff == 0:
+            self._l4 = l3 + (data[l3] & 0x0f) * 4
+
+    def _l4_ports(self):
+        if self._ports is _UNSET:
+            self._ports = None
+            if self.ip_proto in _PORT_PROTOS and self._l4 is not None \
+                    and len(self.data) >= self._l4 + 4:
+                self._ports = _unpack_hh(self.data, self._l4)
+        return self._ports
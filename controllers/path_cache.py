@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Path Cache - Topoloji versiyonlu yol önbelleği
+(src_dpid, dst_dpid) -> yol eşlemesini LRU sırasıyla saklar
+"""
+
+from collections import OrderedDict, defaultdict
+
+
+class PathCache:
+    """
+    Sınırlı boyutlu, LRU tahliyeli yol önbelleği
+
+    Her kayıt eklendiği andaki topoloji versiyonu ile damgalanır.
+    Silinen link/node'lar sadece onları kullanan yolları tahliye eder;
+    yeni link eklenmesi ise herhangi bir yolu kısaltabileceği için
+    eski versiyonlu kayıtları geçersiz sayar.
+    """
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # (src, dst) -> (path, version)
+        self.link_index = defaultdict(set)  # (u, v) -> {(src, dst)}
+        self.node_index = defaultdict(set)  # dpid -> {(src, dst)}
+
+        self.version = 0
+        self.valid_since = 0  # Bu versiyondan eski kayıtlar geçersiz
+
+        # İstatistikler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, src, dst):
+        """Önbellekteki yolu döndür, yoksa veya eskimişse None"""
+        key = (src, dst)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        path, version = entry
+        if version < self.valid_since:
+            self._remove(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return path
+
+    def put(self, src, dst, path):
+        """Yolu mevcut topoloji versiyonu ile önbelleğe ekle"""
+        key = (src, dst)
+        if key in self.entries:
+            self._remove(key)
+
+        self.entries[key] = (path, self.version)
+        for i in range(len(path) - 1):
+            self.link_index[(path[i], path[i+1])].add(key)
+        for node in path:
+            self.node_index[node].add(key)
+
+        while len(self.entries) > self.max_size:
+            oldest = next(iter(self.entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def topology_changed(self, added_links=(), removed_links=(), removed_nodes=()):
+        """
+        Topoloji değişikliğini uygula ve versiyonu artır
+
+        Args:
+            added_links: iterable - Eklenen (u, v) linkleri
+            removed_links: iterable - Silinen (u, v) linkleri
+            removed_nodes: iterable - Silinen dpid'ler
+        """
+        self.version += 1
+
+        for link in removed_links:
+            self._invalidate(self.link_index.get(link, ()))
+        for node in removed_nodes:
+            self._invalidate(self.node_index.get(node, ()))
+
+        if added_links:
+            # Yeni link her yolu kısaltabilir; eski kayıtlar ilk erişimde düşer
+            self.valid_since = self.version
+
+        return self.version
+
+    def get_statistics(self):
+        """Önbellek istatistiklerini döndür"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'topology_version': self.version
+        }
+
+    def _invalidate(self, keys):
+        for key in list(keys):
+            self._remove(key)
+            self.invalidations += 1
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        path = entry[0]
+        for i in range(len(path) - 1):
+            link = (path[i], path[i+1])
+            keys = self.link_index.get(link)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.link_index[link]
+        for node in path:
+            keys = self.node_index.get(node)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.node_index[node]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Path Workers - Packet-In döngüsü dışında yol hesaplama
+Yol hesapları, stratejinin değişmez bir kopyası (topoloji + link metrikleri)
+üzerinde process havuzunda yapılır; aynı (src, dst, akış sınıfı) için bekleyen
+istekler tek hesaba bağlanır ve sonuçlar controller döngüsünde teslim edilir
+
+Eventlet notu: ryu-manager hub.patch(thread=False) ile başlar, threading
+yamalanmaz; executor'ın yönetici ve worker thread'leri gerçek OS
+thread'leridir. Hub thread'i executor'a sadece bloklamayan submit() ile
+iş verir ve poll() yalnızca done() olan future'ları okur, bu yüzden hub
+worker beklerken durmaz ve tpool gerekmez. drain() bekler; sadece
+simülatör ve testler içindir.
+"""
+
+import atexit
+import os
+import pickle
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import networkx as nx
+
+# Worker başına son açılan snapshot (sürüm başına bir kez dosyadan okunur); thread
+# havuzunda her worker thread'i kendi kopyasını tutar, stratejinin önbellek ve
+# sayaçları thread'ler arasında paylaşılmaz
+_worker = threading.local()
+
+
+def _select_path(version, source, src, dst, flow):
+    """
+    Worker'da çalışır: snapshot stratejisiyle yol seç
+
+    Returns:
+        tuple: (yol, bu hesapta artan strateji sayaçları)
+    """
+    if getattr(_worker, 'version', None) != version:
+        _worker.strategy = load_snapshot(source)
+        _worker.version = version
+    strategy = _worker.strategy
+    before = strategy.read_counters()
+    path = strategy.select_path(src, dst, flow)
+    after = strategy.read_counters()
+    return path, {name: after[name] - before[name] for name in after if after[name] != before[name]}
+
+
+def dump_snapshot(strategy, directory=None):
+    """
+    Stratejiyi (graf + metrik tabloları) bir dosyaya pickle'la
+
+    Pickle zaten bağımsız bir kopya üretir; ayrıca deepcopy yapılmaz.
+    Worker'lara her istekte sadece dosya yolu gider.
+    """
+    fd, source = tempfile.mkstemp(prefix='path-snapshot-', suffix='.pickle', dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        pickle.dump(strategy, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return source
+
+
+def load_snapshot(source):
+    """Snapshot dosyasını aç; graf dondurulur (RoutingEngine gibi grafı paylaşan nesneler aynı grafı gösterir)"""
+    with open(source, 'rb') as f:
+        strategy = pickle.load(f)
+    nx.freeze(strategy.net)
+    return strategy
+
+
+def flow_key(flow):
+    """Akış sınıfının hashlenebilir anahtarı (ingress'e özel 'match' yol seçimini etkilemez)"""
+    return tuple(sorted((k, v) for k, v in flow.items() if k != 'match'))
+
+
+class PathComputePool:
+    """
+    Asenkron yol hesaplama havuzu
+
+    submit() hemen döner; sonuç hazır olduğunda poll() bekleyen tüm
+    callback'leri controller döngüsünde çağırır (worker thread'leri
+    controller durumuna dokunmaz). Snapshot sadece topoloji sürümü
+    değiştiğinde (veya invalidate() sonrası) yeni bir dosyaya yazılır;
+    pickle controller döngüsünde yapıldığından periyodik alınmaz. Worker'lar
+    sürüm başına dosyayı bir kez okur. Worker'da artan strateji sayaçları
+    (path_calculations, önbellek isabetleri) sonuçla birlikte döner ve
+    controller'ın stratejisine eklenir.
+    """
+
+    def __init__(self, workers=2, processes=True):
+        self.workers = workers
+        self.processes = processes
+        self.executor = None
+
+        self.version = 0
+        self.topology_version = None
+        self.sources = {}  # sürüm -> snapshot dosyası (bekleyen hesabı kalmayanlar silinir)
+        self.pending = {}  # (src, dst, flow key) -> (future, strateji, [callback])
+
+        # İstatistikler
+        self.requests = 0
+        self.computations = 0
+        self.deduplicated = 0
+        self.snapshots = 0
+        self.latencies = []  # Son hesap süreleri (s)
+        atexit.register(self.shutdown)
+
+    def __len__(self):
+        return len(self.pending)
+
+    def submit(self, strategy, topology_version, src, dst, flow, callback):
+        """
+        src -> dst yolunu iste; callback(path) sonuç gelince çağrılır
+
+        Returns:
+            bool: Yeni hesap başlatıldıysa True (bekleyen isteğe eklendiyse False)
+        """
+        self.requests += 1
+        key = (src, dst, flow_key(flow))
+        entry = self.pending.get(key)
+        if entry is not None:
+            entry[2].append(callback)
+            self.deduplicated += 1
+            return False
+
+        self._refresh(strategy, topology_version)
+        future = self._executor().submit(_select_path, self.version, self.sources[self.version],
+                                         src, dst, flow)
+        future.submitted_at = time.monotonic()
+        future.version = self.version
+        self.pending[key] = (future, strategy, [callback])
+        self.computations += 1
+        return True
+
+    def poll(self):
+        """
+        Tamamlanan hesapların callback'lerini çağır
+
+        Returns:
+            int: Teslim edilen istek sayısı
+        """
+        delivered = 0
+        for key in [k for k, entry in self.pending.items() if entry[0].done()]:
+            future, strategy, callbacks = self.pending.pop(key)
+            try:
+                path, counters = future.result()
+                strategy.add_counters(counters)
+            except Exception:
+                path = None
+            self.latencies = self.latencies[-999:] + [time.monotonic() - future.submitted_at]
+            for callback in callbacks:
+                callback(path)
+            delivered += len(callbacks)
+        self._remove_stale()
+        return delivered
+
+    def drain(self, timeout=None):
+        """
+        Bekleyen tüm hesapların bitmesini bekleyip teslim et (simülatör/testler için)
+
+        Returns:
+            int: Teslim edilen istek sayısı
+        """
+        delivered = 0
+        while self.pending:
+            wait([entry[0] for entry in self.pending.values()], timeout)
+            count = self.poll()
+            if not count and timeout is not None:
+                break
+            delivered += count
+        return delivered
+
+    def invalidate(self):
+        """Bir sonraki istekte snapshot yeniden alınsın"""
+        self.topology_version = None
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        for source in self.sources.values():
+            os.unlink(source)
+        self.sources.clear()
+
+    def get_statistics(self):
+        latencies = sorted(self.latencies)
+        return {
+            'async_path_requests': self.requests,
+            'async_path_computations': self.computations,
+            'async_path_deduplicated': self.deduplicated,
+            'async_path_pending': len(self.pending),
+            'async_path_snapshots': self.snapshots,
+            'async_path_p50_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0
+        }
+
+    def _refresh(self, strategy, topology_version):
+        if self.topology_version == topology_version:
+            return
+        self.version += 1
+        self.topology_version = topology_version
+        self.sources[self.version] = dump_snapshot(strategy)
+        self.snapshots += 1
+        self._remove_stale()
+
+    def _remove_stale(self):
+        """Güncel olmayan ve bekleyen hesabı kalmayan sürümlerin dosyalarını sil"""
+        in_use = {entry[0].version for entry in self.pending.values()} | {self.version}
+        for version in [v for v in self.sources if v not in in_use]:
+            os.unlink(self.sources.pop(version))
+
+    def _executor(self):
+        if self.executor is None:
+            pool = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+            self.executor = pool(max_workers=self.workers)
+        return self.executor
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Proactive Routes - Hedef host başına önceden kurulan next-hop tablosu
+Proaktif modda her switch'te her hedef MAC için tek kural (eth_dst -> next
+hop) bulunur; topoloji değişiminde sadece etkilenen (switch, hedef) çiftleri
+yeniden hesaplanır ve sadece değişen kurallar gönderilir
+"""
+
+from collections import defaultdict
+
+from route_registry import RouteRegistry
+
+
+class ProactiveRoutes:
+    """
+    (kaynak switch, hedef MAC) -> yol ve switch kurallarının next hop'ları
+
+    Kurallar in_port'a bakmadığından bir switch'in kuralı o hedefe giden
+    tüm yollarca paylaşılır; aynı switch'ten geçen yollardan sonra
+    yazılanın next hop'u geçerlidir. Her yol kaynağından hedefe kadar
+    eksiksiz yazıldığından son yazan kazansa da döngü oluşmaz.
+    """
+
+    def __init__(self):
+        self.paths = RouteRegistry()  # (src dpid, dst_mac) -> yol
+        self.next_hops = {}  # (dpid, dst_mac) -> switch'teki kuralın next hop'u
+        self.rule_links = defaultdict(set)  # (dpid, next hop) -> {dst_mac}
+        self.hosts = {}  # dst_mac -> (dpid, port) kuralları kurulu hedefler
+
+        # İstatistikler
+        self.path_computations = 0
+        self.rule_updates = 0
+        self.rules_restored = 0
+
+    def __len__(self):
+        return len(self.next_hops)
+
+    def set_paths(self, dst_mac, location, paths):
+        """
+        Hedefin yollarını kaydet
+
+        Args:
+            location: Hedef host'un (dpid, port) noktası
+            paths: {kaynak dpid: yol veya None (erişilemez)}
+
+        Returns:
+            tuple: (kuralı değişen switch'ler {dpid: next hop},
+                    kuralı silinecek switch'ler [dpid])
+        """
+        self.hosts[dst_mac] = location
+        changed = {}
+        unreachable = []
+        for src, path in paths.items():
+            self.path_computations += 1
+            if not path:
+                self.paths.remove((src, dst_mac))
+                unreachable.append(src)
+                continue
+            self.paths.add((src, dst_mac), path)
+            for i in range(len(path) - 1):
+                if self._set_next_hop(path[i], dst_mac, path[i+1]):
+                    changed[path[i]] = path[i+1]
+
+        removed = [src for src in unreachable if self._set_next_hop(src, dst_mac, None)]
+        self.rule_updates += len(changed) + len(removed)
+        return changed, removed
+
+    def affected_by_link(self, src, dst):
+        """src -> dst linkine bağlı yollar ve kurallar: {dst_mac: {kaynak dpid}}"""
+        affected = defaultdict(set)
+        for (path_src, dst_mac), _ in self.paths.routes_on_link(src, dst):
+            affected[dst_mac].add(path_src)
+        for dst_mac in self.rule_links.get((src, dst), ()):
+            affected[dst_mac].add(src)
+        return affected
+
+    def remove_switch(self, dpid):
+        """
+        Switch'e ait kayıtları sil
+
+        Returns:
+            tuple: (yeniden hesaplanacak kaynaklar {dst_mac: {dpid}},
+                    switch'e bağlı host'lar için silinecek kurallar [(dpid, dst_mac)])
+        """
+        affected = defaultdict(set)
+        stale = []
+        for (path_src, dst_mac), _ in self.paths.routes_on_node(dpid):
+            self.paths.remove((path_src, dst_mac))
+            if path_src != dpid:
+                affected[dst_mac].add(path_src)
+        for (src, next_hop), dst_macs in self.rule_links.items():
+            if next_hop == dpid:
+                for dst_mac in dst_macs:
+                    affected[dst_mac].add(src)
+        for key in [k for k in self.next_hops if k[0] == dpid]:
+            self._set_next_hop(key[0], key[1], None)
+        for dst_mac in [m for m, location in self.hosts.items() if location[0] == dpid]:
+            stale.extend((node, dst_mac) for node in self.remove_host(dst_mac) if node != dpid)
+            affected.pop(dst_mac, None)
+        return affected, stale
+
+    def remove_host(self, dst_mac):
+        """
+        Hedefin tüm kayıtlarını sil
+
+        Returns:
+            list: Kuralı silinecek switch'ler (egress switch dahil)
+        """
+        location = self.hosts.pop(dst_mac, None)
+        if location is None:
+            return []
+        for key in [k for k in self.paths.routes if k[1] == dst_mac]:
+            self.paths.remove(key)
+        nodes = [k[0] for k in self.next_hops if k[1] == dst_mac]
+        for dpid in nodes:
+            self._set_next_hop(dpid, dst_mac, None)
+        return nodes + [location[0]]
+
+    def lost_rule(self, dpid, dst_mac):
+        """
+        Switch'ten kalkan kuralın (FlowRemoved) tabloda hâlâ olması gereken hali
+
+        Returns:
+            tuple: Egress kuralı ise ('host', port), transit kuralı ise
+                   ('switch', next hop); kural artık istenmiyorsa None
+        """
+        location = self.hosts.get(dst_mac)
+        if location is None:
+            return None
+        if location[0] == dpid:
+            rule = ('host', location[1])
+        elif (dpid, dst_mac) in self.next_hops:
+            rule = ('switch', self.next_hops[(dpid, dst_mac)])
+        else:
+            return None
+        self.rules_restored += 1
+        return rule
+
+    def get_statistics(self):
+        return {
+            'proactive_hosts': len(self.hosts),
+            'proactive_rules': len(self.next_hops) + len(self.hosts),
+            'proactive_path_computations': self.path_computations,
+            'proactive_rule_updates': self.rule_updates,
+            'proactive_rules_restored': self.rules_restored
+        }
+
+    def _set_next_hop(self, dpid, dst_mac, next_hop):
+        """Kuralın next hop'unu değiştir (değiştiyse True)"""
+        old = self.next_hops.get((dpid, dst_mac))
+        if old == next_hop:
+            return False
+        if old is not None:
+            links = self.rule_links[(dpid, old)]
+            links.discard(dst_mac)
+            if not links:
+                del self.rule_links[(dpid, old)]
+        if next_hop is None:
+            del self.next_hops[(dpid, dst_mac)]
+        else:
+            self.next_hops[(dpid, dst_mac)] = next_hop
+            self.rule_links[(dpid, next_hop)].add(dst_mac)
+        return True
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Route Registry - Kurulu yolların kaydı
+Link veya switch kesintisinde hangi yolların etkilendiğini O(1) bulur
+"""
+
+import time
+from collections import defaultdict
+
+
+class RouteRegistry:
+    """
+    (ingress dpid, in_port, dst_mac) -> kurulu yol eşlemesi
+
+    Her yol kullandığı link ve switch'ler üzerinden indekslenir.
+    hard_timeout süresi dolan yollar switch'ten zaten silinmiş
+    olduğundan sorgularda atlanır ve temizlenir.
+    """
+
+    def __init__(self):
+        self.routes = {}  # key -> route dict
+        self.link_index = defaultdict(set)  # (u, v) -> {key}
+        self.node_index = defaultdict(set)  # dpid -> {key}
+
+    def __len__(self):
+        return len(self.routes)
+
+    def add(self, key, path, ttl=None, links=None, **info):
+        """
+        Yolu kaydet (aynı anahtarlı eski kayıt değiştirilir)
+
+        links verilirse (örn. multipath DAG linkleri) yol linkleri yerine bunlar indekslenir
+        """
+        self.remove(key)
+        now = time.time()
+        if links is None:
+            links = [(path[i], path[i+1]) for i in range(len(path) - 1)]
+        route = dict(info, path=list(path), links=list(links), installed_at=now,
+                     expires_at=now + ttl if ttl else None)
+        self.routes[key] = route
+        for link in route['links']:
+            self.link_index[link].add(key)
+        for node in {node for link in route['links'] for node in link} | set(path):
+            self.node_index[node].add(key)
+        return route
+
+    def get(self, key):
+        return self.routes.get(key)
+
+    def remove(self, key):
+        """Yol kaydını sil"""
+        route = self.routes.pop(key, None)
+        if route is None:
+            return None
+        for link in route['links']:
+            self._discard(self.link_index, link, key)
+        for node in {node for link in route['links'] for node in link} | set(route['path']):
+            self._discard(self.node_index, node, key)
+        return route
+
+    def routes_on_link(self, src, dst):
+        """src -> dst linkini kullanan aktif yollar [(key, route)]"""
+        return self._active(self.link_index.get((src, dst), ()))
+
+    def routes_on_node(self, dpid):
+        """Switch'ten geçen aktif yollar [(key, route)]"""
+        return self._active(self.node_index.get(dpid, ()))
+
+    def _active(self, keys):
+        now = time.time()
+        active = []
+        for key in list(keys):
+            route = self.routes[key]
+            if route['expires_at'] is not None and route['expires_at'] <= now:
+                self.remove(key)
+            else:
+                active.append((key, route))
+        return active
+
+    @staticmethod
+    def _discard(index, item, key):
+        keys = index.get(item)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[item]
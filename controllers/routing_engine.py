@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Routing Engine - Yol hesaplama algoritmaları
+Tüm basit yolları listelemeden en iyi yolu doğrudan bulur:
+- Dijkstra (yük ağırlıklı, en az yüklü yol)
+- Widest path (en yüksek darboğaz bant genişliği)
+- Kısıtlı en kısa yol (hop limiti ve minimum bant genişliği)
+- Çok kriterli etiket araması (dengeli QoS skoru)
+- Yen k-shortest paths (alternatif yollar)
+"""
+
+import heapq
+from collections import deque
+from itertools import islice
+
+import networkx as nx
+
+
+def _weight_function(weight):
+    """Öznitelik adı veya fonksiyondan (u, v, data) -> maliyet fonksiyonu üret"""
+    if callable(weight):
+        return weight
+    return lambda u, v, data: data.get(weight, 1)
+
+
+class RoutingEngine:
+    """
+    Controller grafiği üzerinde yol hesaplama motoru
+
+    Tüm yöntemler max_hops (eski all_simple_paths cutoff değeri) sınırına
+    uyar; eşit maliyetli yollar arasında daha az hop'lu olan seçilir.
+    links (LinkTable) verilirse metrik adıyla verilen ağırlıklar tablonun
+    dizilerinden okunur ve Dijkstra CSR komşuluk üzerinde çalışır.
+    """
+
+    def __init__(self, net, max_hops=5, links=None):
+        self.net = net
+        self.max_hops = max_hops
+        self.links = links
+
+    def dijkstra_path(self, src, dst, weight='weight'):
+        """
+        (maliyet, hop) sıralı Dijkstra; hop limiti aşılırsa kısıtlı
+        Bellman-Ford'a düşer
+
+        Returns:
+            list: Yol (dpid listesi) veya None
+        """
+        if src not in self.net or dst not in self.net:
+            return None
+        if src == dst:
+            return [src]
+
+        if self._in_table(weight):
+            path, hops = self.links.shortest_path(src, dst, weight)
+            if path and self.max_hops is not None and hops > self.max_hops:
+                return self.hop_bounded_path(src, dst, weight)
+            return path
+
+        cost_of = self._weight_function(weight)
+        best = {src: (0, 0)}
+        parent = {src: None}
+        heap = [(0, 0, src)]
+        done = set()
+
+        while heap:
+            cost, hops, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            if node == dst:
+                break
+            for nbr, data in self.net[node].items():
+                if nbr in done:
+                    continue
+                label = (cost + cost_of(node, nbr, data), hops + 1)
+                if nbr not in best or label < best[nbr]:
+                    best[nbr] = label
+                    parent[nbr] = node
+                    heapq.heappush(heap, (label[0], label[1], nbr))
+
+        if dst not in done:
+            return None
+        if self.max_hops is not None and best[dst][1] > self.max_hops:
+            return self.hop_bounded_path(src, dst, weight)
+        return self._build_path(parent, dst)
+
+    def hop_bounded_path(self, src, dst, weight='weight', max_hops=None):
+        """
+        En fazla max_hops hop'lu en düşük maliyetli yol (Bellman-Ford katmanları)
+        """
+        max_hops = max_hops or self.max_hops
+        if src not in self.net or dst not in self.net:
+            return None
+        if src == dst:
+            return [src]
+
+        cost_of = self._weight_function(weight)
+        dist = {src: 0}
+        parents = []  # Her katman için v -> u (sadece iyileşen node'lar)
+        frontier = {src}
+
+        for _ in range(max_hops):
+            updated = {}
+            for u in frontier:
+                for v, data in self.net[u].items():
+                    cost = dist[u] + cost_of(u, v, data)
+                    if cost < updated.get(v, (dist.get(v, float('inf')), None))[0]:
+                        updated[v] = (cost, u)
+            if not updated:
+                break
+            layer = {}
+            for v, (cost, u) in updated.items():
+                dist[v] = cost
+                layer[v] = u
+            parents.append(layer)
+            frontier = set(updated)
+
+        if dst not in dist:
+            return None
+
+        # Katmanlardan geriye doğru yolu kur
+        path = [dst]
+        node = dst
+        k = len(parents) - 1
+        while node != src:
+            while node not in parents[k]:
+                k -= 1
+            node = parents[k][node]
+            path.append(node)
+            k -= 1
+        path.reverse()
+        return path
+
+    def widest_path(self, src, dst, bandwidth='bandwidth'):
+        """
+        Darboğaz bant genişliği en yüksek yol (hop limiti dahilinde)
+
+        Hedefe ulaşılabilen en büyük eşik ikili arama ile bulunur,
+        o eşiğin üstündeki linklerle en az hop'lu yol döndürülür.
+        """
+        if src not in self.net or dst not in self.net:
+            return None
+        if src == dst:
+            return [src]
+
+        bw_of = self._weight_function(bandwidth)
+        thresholds = sorted({bw_of(u, v, d) for u, v, d in self.net.edges(data=True)},
+                            reverse=True)
+
+        lo, hi = 0, len(thresholds) - 1
+        best = None
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            path = self._bfs_path(src, dst, lambda u, v, d, t=thresholds[mid]: bw_of(u, v, d) >= t)
+            if path:
+                best = path
+                hi = mid - 1
+            else:
+                lo = mid + 1
+        return best
+
+    def constrained_shortest_path(self, src, dst, weight='delay',
+                                  min_bandwidth=None, bandwidth='bandwidth'):
+        """
+        Kısıtlı en kısa yol: hop limiti ve isteğe bağlı minimum bant genişliği
+
+        Bant genişliği kısıtını sağlamayan linkler sonsuz maliyetli sayılır.
+        """
+        if min_bandwidth is None:
+            return self.dijkstra_path(src, dst, weight)
+
+        cost_of = self._weight_function(weight)
+        bw_of = self._weight_function(bandwidth)
+        graph = nx.subgraph_view(
+            self.net, filter_edge=lambda u, v: bw_of(u, v, self.net[u][v]) >= min_bandwidth)
+        return RoutingEngine(graph, self.max_hops).dijkstra_path(src, dst, cost_of)
+
+    def k_shortest_paths(self, src, dst, k, weight='weight'):
+        """Yen algoritması ile en kısa k yol (hop limitini aşanlar atlanır)"""
+        return list(islice(self._simple_paths(src, dst, weight), k))
+
+    def best_scored_path(self, src, dst, score, additive=None, bottleneck=None):
+        """
+        Toplamsal olmayan skorlar için çok kriterli etiket araması
+
+        Her node'da (toplamsal metrikler, darboğaz metrikleri, hop) için
+        Pareto-optimal etiketler tutulur. Skor toplamsal metriklerde azalan,
+        darboğaz metriklerinde artan olduğu sürece baskın etiketlerin
+        budanması en iyi yolu kaybetmez.
+
+        Args:
+            score: callable(dict) -> float - Metrik sözlüğünden skor (büyük olan iyi)
+            additive: dict - metrik adı -> weight (yol boyunca toplanır)
+            bottleneck: dict - metrik adı -> weight (yol boyunca minimumu alınır)
+        """
+        if src not in self.net or dst not in self.net:
+            return None
+        if src == dst:
+            return [src]
+
+        add_names = list(additive or {})
+        add_fns = [self._weight_function(additive[n]) for n in add_names]
+        bott_names = list(bottleneck or {})
+        bott_fns = [self._weight_function(bottleneck[n]) for n in bott_names]
+
+        start = _Label(src, (0,) * len(add_fns), (float('inf'),) * len(bott_fns), 0, None)
+        labels = {src: [start]}
+        frontier = [start]
+
+        for _ in range(self.max_hops or len(self.net)):
+            next_frontier = []
+            for label in frontier:
+                if not label.alive:
+                    continue
+                for nbr, data in self.net[label.node].items():
+                    if label.visits(nbr):
+                        continue
+                    u = label.node
+                    new = _Label(
+                        nbr,
+                        tuple(a + f(u, nbr, data) for a, f in zip(label.additive, add_fns)),
+                        tuple(min(b, f(u, nbr, data)) for b, f in zip(label.bottleneck, bott_fns)),
+                        label.hops + 1, label)
+                    existing = labels.setdefault(nbr, [])
+                    if any(old.dominates(new) for old in existing):
+                        continue
+                    for old in existing:
+                        if new.dominates(old):
+                            old.alive = False
+                    existing[:] = [old for old in existing if old.alive]
+                    existing.append(new)
+                    if nbr != dst:
+                        next_frontier.append(new)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        best_path, best_score = None, None
+        for label in labels.get(dst, ()):
+            metrics = dict(zip(add_names, label.additive))
+            metrics.update(zip(bott_names, label.bottleneck))
+            value = score(metrics)
+            if best_score is None or value > best_score:
+                best_path, best_score = label.path(), value
+        return best_path
+
+    def _in_table(self, weight):
+        return self.links is not None and isinstance(weight, str) and weight in self.links.columns
+
+    def _weight_function(self, weight):
+        """Metrik adı tablodaysa dizi okuyan, değilse edge özniteliği okuyan fonksiyon"""
+        if self._in_table(weight):
+            return self.links.cost_function(weight)
+        return _weight_function(weight)
+
+    def _simple_paths(self, src, dst, weight):
+        if src not in self.net or dst not in self.net:
+            return
+        cost_of = self._weight_function(weight)
+        try:
+            for path in nx.shortest_simple_paths(
+                    self.net, src, dst,
+                    weight=lambda u, v, data: cost_of(u, v, data)):
+                if self.max_hops is None or len(path) - 1 <= self.max_hops:
+                    yield path
+        except nx.NetworkXNoPath:
+            return
+
+    def _bfs_path(self, src, dst, allowed):
+        """allowed(u, v, data) linkleri üzerinden hop limitli BFS"""
+        parent = {src: None}
+        queue = deque([(src, 0)])
+        while queue:
+            node, hops = queue.popleft()
+            if self.max_hops is not None and hops >= self.max_hops:
+                continue
+            for nbr, data in self.net[node].items():
+                if nbr in parent or not allowed(node, nbr, data):
+                    continue
+                parent[nbr] = node
+                if nbr == dst:
+                    return self._build_path(parent, dst)
+                queue.append((nbr, hops + 1))
+        return None
+
+    @staticmethod
+    def _build_path(parent, dst):
+        path = []
+        node = dst
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+        return path
+
+
+class _Label:
+    """best_scored_path için kısmi yol etiketi"""
+    __slots__ = ('node', 'additive', 'bottleneck', 'hops', 'parent', 'alive')
+
+    def __init__(self, node, additive, bottleneck, hops, parent):
+        self.node = node
+        self.additive = additive
+        self.bottleneck = bottleneck
+        self.hops = hops
+        self.parent = parent
+        self.alive = True
+
+    def dominates(self, other):
+        return (self.hops <= other.hops
+                and all(a <= b for a, b in zip(self.additive, other.additive))
+                and all(a >= b for a, b in zip(self.bottleneck, other.bottleneck)))
+
+    def visits(self, node):
+        label = self
+        while label is not None:
+            if label.node == node:
+                return True
+            label = label.parent
+        return False
+
+    def path(self):
+        nodes = []
+        label = self
+        while label is not None:
+            nodes.append(label.node)
+            label = label.parent
+        nodes.reverse()
+        return nodes
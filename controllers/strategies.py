@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Path Selection Strategies - RoutingController için yol seçim stratejileri
+Packet-In hattı (MAC öğrenme, toplu kurulum, yeniden yönlendirme) ortaktır;
+controller'lar yalnızca burada tanımlı yol seçim stratejisinde ayrışır
+"""
+
+import logging
+from operator import attrgetter
+
+import networkx as nx
+
+from elephant_detector import five_tuple_match
+from link_table import LinkTable
+from multipath import multipath_dag
+from packet_view import IPPROTO_TCP, IPPROTO_UDP
+from path_cache import PathCache
+from routing_engine import RoutingEngine
+
+
+class PathStrategy:
+    """
+    Yol seçim stratejisi arayüzü
+
+    RoutingController topoloji olaylarını ve yol kurulumlarını bu
+    metodlara bildirir; link metrikleri controller'ın grafla eşitlediği
+    LinkTable'da tutulur (verilmezse graftan oluşturulur).
+    """
+
+    name = 'base'
+    idle_timeout = 10
+    hard_timeout = 30
+    counters = ()  # select_path'in artırdığı sayaçlar ('path_cache.hits' gibi iç içe olabilir)
+
+    def __init__(self, net, logger=None, links=None):
+        self.net = net
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.links = links if links is not None else LinkTable.from_graph(net)
+
+    def classify(self, pkt):
+        """
+        Paketin akış sınıfını belirle (pkt: PacketView)
+
+        Returns:
+            dict: 'priority' (flow önceliği) ve stratejiye özel alanlar
+        """
+        return {'priority': 1}
+
+    def select_path(self, src, dst, flow):
+        """src -> dst switch'leri arasında yol (dpid listesi) veya None"""
+        raise NotImplementedError
+
+    def link_added(self, src, dst):
+        """Grafa yeni link eklendi"""
+
+    def link_removed(self, src, dst):
+        """Link graftan silindi"""
+
+    def switch_removed(self, dpid):
+        """Switch graftan silindi (linkleri link_removed ile bildirilir)"""
+
+    def path_installed(self, path, flow):
+        """Yol switch'lere kuruldu"""
+
+    def path_removed(self, path, flow):
+        """Yolun ingress kuralı switch'ten silindi (akış bitti)"""
+
+    def read_counters(self):
+        """select_path sayaçlarının anlık değerleri (asenkron hesapta worker'dan fark olarak döner)"""
+        return {name: attrgetter(name)(self) for name in self.counters}
+
+    def add_counters(self, delta):
+        """Worker'da artan sayaçları bu stratejiye ekle"""
+        for name, value in delta.items():
+            owner, _, attr = name.rpartition('.')
+            target = attrgetter(owner)(self) if owner else self
+            setattr(target, attr, getattr(target, attr) + value)
+
+    def get_statistics(self):
+        return {}
+
+
+class ShortestPathStrategy(PathStrategy):
+    """Hop sayısına göre en kısa yol (sürümlü LRU önbellekli)"""
+
+    name = 'shortest_path'
+    counters = ('path_cache.hits', 'path_cache.misses')
+
+    def __init__(self, net, logger=None, links=None):
+        super().__init__(net, logger, links)
+        self.path_cache = PathCache(max_size=4096)
+
+    def select_path(self, src, dst, flow):
+        return self.get_shortest_path(src, dst)
+
+    def get_shortest_path(self, src, dst):
+        """Dijkstra algoritması ile en kısa yolu hesapla (önbellekli)"""
+        path = self.path_cache.get(src, dst)
+        if path is not None:
+            return path
+
+        try:
+            path = nx.shortest_path(self.net, src, dst, weight=None)
+        except (nx.NetworkXNoPath, nx.NodeNotFound, KeyError):
+            return None
+
+        self.path_cache.put(src, dst, path)
+        return path
+
+    def link_added(self, src, dst):
+        self.path_cache.topology_changed(added_links=[(src, dst)])
+
+    def link_removed(self, src, dst):
+        self.path_cache.topology_changed(removed_links=[(src, dst)])
+
+    def switch_removed(self, dpid):
+        self.path_cache.topology_changed(removed_nodes=[dpid])
+
+    def get_statistics(self):
+        cache_stats = self.path_cache.get_statistics()
+        return {
+            'path_cache_hits': cache_stats['hits'],
+            'path_cache_misses': cache_stats['misses'],
+            'path_cache_hit_rate': cache_stats['hit_rate'],
+            'path_cache_size': cache_stats['size'],
+            'topology_version': cache_stats['topology_version']
+        }
+
+
+class LoadBalancingStrategy(PathStrategy):
+    """Link yüküne göre en az yüklü yol"""
+
+    name = 'load_balancing'
+    counters = ('path_calculations', 'load_balanced_paths')
+    multipath_slack = 0.5  # Maliyeti en iyiden bu kadar fazla olan next hop'lar da kullanılır
+    per_flow_ingress = False  # True ise TCP/UDP ingress kuralları 5-tuple başına kurulur (elephant tespiti)
+    flow_rate = 1.0  # Hızı bilinmeyen yeni akışa ölçüm gelene kadar ayrılan hız (Mbps)
+
+    def __init__(self, net, logger=None, links=None):
+        super().__init__(net, logger, links)
+        self.routing = RoutingEngine(net, max_hops=5, links=self.links)
+        self.link_load = self.links.metric_view('load')  # (src_dpid, dst_dpid) -> load (Mbps)
+        self.link_capacity = self.links.metric_view('capacity')  # (src_dpid, dst_dpid) -> capacity (Mbps)
+        self.link_reserved = self.links.metric_view('reserved')  # (src_dpid, dst_dpid) -> ölçülmemiş akışlar (Mbps)
+        self.path_calculations = 0
+        self.load_balanced_paths = 0
+        self.active_flows = 0
+
+    def classify(self, pkt):
+        flow = {'priority': 1}
+        if self.per_flow_ingress:
+            match = five_tuple_match(pkt)
+            if match:
+                flow['match'] = match
+        return flow
+
+    def select_path(self, src, dst, flow):
+        return self.get_least_loaded_path(src, dst)
+
+    def link_added(self, src, dst):
+        # Bilinen kapasite korunur (yeni slot'ta sütun varsayılanı); ağırlık yükle aynı ölçekte
+        self.update_link_weight(src, dst, self.link_load[(src, dst)])
+
+    def link_removed(self, src, dst):
+        self.link_load.pop((src, dst), None)
+        self.link_capacity.pop((src, dst), None)
+
+    def path_installed(self, path, flow):
+        # Akışın beklenen hızı (flow['rate'], yoksa flow_rate) ölçüm gelene kadar
+        # 'reserved' sütununda ayrıca tutulur ve link yüküne eklenir
+        rate = flow.get('rate', self.flow_rate)
+        for link in zip(path, path[1:]):
+            self.link_reserved[link] += rate
+            self.update_link_weight(link[0], link[1], self.link_load[link] + rate)
+        self.active_flows += 1
+
+    def path_removed(self, path, flow):
+        # Sadece ölçüme girmemiş rezervasyon geri alınır; ölçülen yük bir sonraki ölçümle düşer
+        rate = flow.get('rate', self.flow_rate)
+        for link in zip(path, path[1:]):
+            released = min(self.link_reserved.get(link, 0), rate)
+            if released > 0:
+                self.link_reserved[link] -= released
+                self.update_link_weight(link[0], link[1], max(0, self.link_load[link] - released))
+        self.active_flows = max(0, self.active_flows - 1)
+
+    def link_measured(self, src, dst, rate):
+        """Ölçülen link hızı (Mbps): kurulu akışlar artık ölçümde, rezervasyonlar düşer"""
+        self.link_reserved[(src, dst)] = 0
+        self.update_link_weight(src, dst, rate)
+
+    def update_link_weight(self, src, dst, load):
+        """Link ağırlığını yüke göre güncelle"""
+        if self.net.has_edge(src, dst):
+            capacity = self.link_capacity.get((src, dst), 100)
+            # Yük oranına göre ağırlık (0-1 arası normalize)
+            utilization = min(load / capacity, 1.0)
+            # Yüksek yük = yüksek ağırlık (maliyet)
+            weight = 1 + (utilization * 10)  # 1-11 arası değer
+            self.net[src][dst]['weight'] = weight
+            self.links.set(src, dst, weight=weight, load=load)
+
+    def get_least_loaded_path(self, src, dst):
+        """En az yüklü yolu hesapla (yük ağırlıklı Dijkstra)"""
+        try:
+            self.path_calculations += 1
+
+            # Link yükü kenar maliyeti olarak kullanılır (en fazla 5 hop)
+            best_path = self.routing.dijkstra_path(src, dst, 'load')
+
+            if not best_path:
+                return None
+
+            total_load = sum(self.link_load.get((best_path[i], best_path[i+1]), 0)
+                             for i in range(len(best_path) - 1))
+            if total_load > 0:
+                self.load_balanced_paths += 1
+
+            return best_path
+        except (nx.NetworkXNoPath, nx.NodeNotFound, KeyError):
+            # Hata durumunda basit shortest path
+            try:
+                return nx.shortest_path(self.net, src, dst)
+            except (nx.NetworkXNoPath, nx.NodeNotFound, KeyError):
+                return None
+
+    def get_alternative_paths(self, src, dst, k=3):
+        """En az yüklü k alternatif yolu döndür (Yen algoritması)"""
+        return self.routing.k_shortest_paths(src, dst, k, 'load')
+
+    def link_cost(self, src, dst):
+        """Hop + yük cezası (update_link_weight ile aynı ölçek: 1-11)"""
+        capacity = self.link_capacity.get((src, dst), 100)
+        return 1 + min(self.link_load.get((src, dst), 0) / capacity, 1.0) * 10
+
+    def link_headroom(self, src, dst):
+        """Linkin boş kapasitesi (Mbps)"""
+        return max(self.link_capacity.get((src, dst), 100) - self.link_load.get((src, dst), 0), 0)
+
+    def get_multipath(self, src, dst):
+        """Eşit/yakın maliyetli next hop DAG'ı (multipath.multipath_dag)"""
+        self.path_calculations += 1
+        load = self.links.cost_function('load')
+        capacity = self.links.cost_function('capacity')
+        return multipath_dag(self.net, src, dst,
+                             lambda u, v, data: 1 + min(load(u, v, data) / capacity(u, v, data), 1.0) * 10,
+                             self.multipath_slack)
+
+    def get_statistics(self):
+        return {
+            'path_calculations': self.path_calculations,
+            'load_balanced_paths': self.load_balanced_paths,
+            'active_flows': self.active_flows,
+            'average_link_load': sum(self.link_load.values()) / len(self.link_load) if self.link_load else 0
+        }
+
+
+class QoSStrategy(PathStrategy):
+    """Gecikme, bant genişliği ve kayıp bazlı QoS yönlendirme"""
+
+    name = 'qos'
+    counters = ('qos_violations',)
+    idle_timeout = 15
+    hard_timeout = 45
+
+    def __init__(self, net, logger=None, links=None):
+        super().__init__(net, logger, links)
+        self.routing = RoutingEngine(net, max_hops=5, links=self.links)
+
+        # QoS metrikleri (LinkTable sütunları)
+        self.link_delay = self.links.metric_view('delay')  # (src_dpid, dst_dpid) -> delay (ms)
+        self.link_bandwidth = self.links.metric_view('bandwidth')  # (src_dpid, dst_dpid) -> bandwidth (Mbps)
+        self.link_loss = self.links.metric_view('loss')  # (src_dpid, dst_dpid) -> packet loss (%)
+
+        self.qos_violations = 0
+        self.high_priority_flows = 0
+
+    def classify(self, pkt):
+        qos_requirement = self.determine_flow_priority(pkt)
+        priority = 2 if qos_requirement in ['low_latency', 'high_bandwidth'] else 1
+        if priority > 1:
+            self.high_priority_flows += 1
+        return {'priority': priority, 'qos_requirement': qos_requirement}
+
+    def select_path(self, src, dst, flow):
+        return self.get_qos_path(src, dst, flow.get('qos_requirement', 'balanced'))
+
+    def link_added(self, src, dst):
+        # Varsayılan QoS değerleri (ölçüm gelince update_link_metrics ile güncellenir)
+        delay = 10  # ms (varsayılan)
+        bandwidth = 100  # Mbps (varsayılan)
+        loss = 0.1  # % (varsayılan)
+
+        self.net[src][dst].update(delay=delay, bandwidth=bandwidth, loss=loss)
+
+        # QoS metriklerini sakla
+        self.link_delay[(src, dst)] = delay
+        self.link_bandwidth[(src, dst)] = bandwidth
+        self.link_loss[(src, dst)] = loss
+
+    def link_removed(self, src, dst):
+        self.link_delay.pop((src, dst), None)
+        self.link_bandwidth.pop((src, dst), None)
+        self.link_loss.pop((src, dst), None)
+
+    def update_link_metrics(self, src, dst, delay=None, loss=None):
+        """Ölçülen gecikme (ms) / kayıp (%) değerlerini link'e yaz"""
+        if not self.net.has_edge(src, dst):
+            return
+        if delay is not None:
+            self.link_delay[(src, dst)] = delay
+            self.net[src][dst]['delay'] = delay
+        if loss is not None:
+            self.link_loss[(src, dst)] = loss
+            self.net[src][dst]['loss'] = loss
+
+    def calculate_path_qos(self, path):
+        """Bir yolun QoS metriklerini hesapla (delay/loss toplamı, bandwidth minimumu)"""
+        return self.links.path_metrics(path)
+
+    def calculate_qos_score(self, qos):
+        """Dengeli skor: düşük gecikme + yüksek bant genişliği + düşük kayıp"""
+        # Her metriği normalize et (0-1 arası)
+        delay_score = 1 / (1 + qos['delay'] / 100)  # Düşük gecikme = yüksek skor
+        bandwidth_score = qos['bandwidth'] / 100  # Yüksek BW = yüksek skor
+        loss_score = 1 / (1 + qos['loss'])  # Düşük kayıp = yüksek skor
+
+        # Toplam skor (eşit ağırlık)
+        return (delay_score + bandwidth_score + loss_score) / 3
+
+    def get_qos_path(self, src, dst, qos_requirement='balanced'):
+        """
+        QoS gereksinimlerine göre yol hesapla
+        qos_requirement: 'low_latency', 'high_bandwidth', 'balanced'
+        """
+        try:
+            # Metrikler LinkTable sütun adlarıyla verilir
+            delay, bandwidth = 'delay', 'bandwidth'
+
+            # QoS gereksinimlerine göre en iyi yolu seç (maksimum 5 hop)
+            if qos_requirement == 'low_latency':
+                # En düşük gecikme: kısıtlı en kısa yol
+                path = self.routing.constrained_shortest_path(src, dst, delay)
+                if not path:
+                    return None
+                qos = self.calculate_path_qos(path)
+                self.logger.info(f"Selected low-latency path with {qos['delay']}ms delay")
+
+            elif qos_requirement == 'high_bandwidth':
+                # En yüksek bant genişliği: widest path
+                path = self.routing.widest_path(src, dst, bandwidth)
+                if not path:
+                    return None
+                qos = self.calculate_path_qos(path)
+                self.logger.info(f"Selected high-bandwidth path with {qos['bandwidth']}Mbps")
+
+            else:  # balanced
+                # Gecikme/kayıp/bant genişliği için Pareto etiket araması
+                path = self.routing.best_scored_path(
+                    src, dst, self.calculate_qos_score,
+                    additive={'delay': delay, 'loss': 'loss'},
+                    bottleneck={'bandwidth': bandwidth})
+                if not path:
+                    return None
+                qos = self.calculate_path_qos(path)
+                self.logger.info(f"Selected balanced path with score {self.calculate_qos_score(qos):.2f}")
+
+            # QoS gereksinimleri karşılanıyor mu kontrol et
+            if qos['delay'] > 100:  # 100ms üzeri
+                self.qos_violations += 1
+                self.logger.warning(f"QoS violation: High delay {qos['delay']}ms")
+
+            return path
+
+        except Exception as e:
+            self.logger.error(f"Error calculating QoS path: {e}")
+            # Hata durumunda basit shortest path
+            try:
+                return nx.shortest_path(self.net, src, dst)
+            except (nx.NetworkXNoPath, nx.NodeNotFound, KeyError):
+                return None
+
+    def determine_flow_priority(self, pkt):
+        """Paket tipine göre öncelik belirle"""
+        # IP paketi kontrolü (sadece IPv4 protokol baytı okunur)
+        ip_proto = pkt.ip_proto
+        if ip_proto is not None:
+            # DSCP (DiffServ) veya port bazlı önceliklendirme
+            # Gerçek uygulamada daha detaylı kontrol yapılır
+            if ip_proto == IPPROTO_TCP:
+                # Yüksek öncelikli (örn: SSH, HTTP)
+                return 'high_bandwidth'
+            elif ip_proto == IPPROTO_UDP:
+                # Düşük gecikme (örn: VoIP, gaming)
+                return 'low_latency'
+
+        return 'balanced'
+
+    def get_statistics(self):
+        return {
+            'qos_violations': self.qos_violations,
+            'high_priority_flows': self.high_priority_flows
+        }
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Traffic Monitor - Port ve flow istatistiklerinden trafik hızı ölçümü
+Periyodik OFPPortStatsRequest/OFPFlowStatsRequest cevaplarından EWMA ile
+yumuşatılmış bit hızlarını hesaplar; switch başına sorgu aralığını
+trafiğin değişkenliğine göre uyarlar
+"""
+
+import time
+
+
+class TrafficMonitor:
+    """
+    Switch başına adaptif aralıklı istatistik takibi
+
+    Her switch tek bir port stats isteği (OFPP_ANY) ile sorgulanır;
+    flow stats her flow_stats_every turda bir istenir. Kullanımı hızla
+    değişen veya busy_threshold üzerindeki switch'ler min_interval ile,
+    sakin switch'ler aralık max_interval'e kadar büyütülerek sorgulanır.
+    """
+
+    def __init__(self, interval=2.0, min_interval=1.0, max_interval=10.0, alpha=0.3,
+                 change_threshold=0.1, busy_threshold=0.7, flow_stats_every=3):
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.alpha = alpha
+        self.change_threshold = change_threshold
+        self.busy_threshold = busy_threshold
+        self.flow_stats_every = flow_stats_every
+
+        self.intervals = {}  # dpid -> mevcut sorgu aralığı
+        self.next_poll = {}  # dpid -> sonraki sorgu zamanı
+        self.polls = {}  # dpid -> sorgu sayısı
+        self.port_counters = {}  # (dpid, port) -> (tx_bytes, zaman)
+        self.port_rates = {}  # (dpid, port) -> EWMA bit/s
+        self.flow_counters = {}  # (dpid, flow key) -> (byte_count, zaman)
+        self.flow_rates = {}  # (dpid, flow key) -> EWMA bit/s
+
+        # İstatistikler
+        self.port_requests = 0
+        self.flow_requests = 0
+        self.replies = 0
+
+    def add_switch(self, dpid, now=None):
+        now = time.time() if now is None else now
+        self.intervals[dpid] = self.interval
+        self.next_poll[dpid] = now
+        self.polls[dpid] = 0
+
+    def remove_switch(self, dpid):
+        for table in (self.intervals, self.next_poll, self.polls):
+            table.pop(dpid, None)
+        for table in (self.port_counters, self.port_rates, self.flow_counters, self.flow_rates):
+            for key in [k for k in table if k[0] == dpid]:
+                del table[key]
+
+    def due(self, now=None):
+        """
+        Sorgu zamanı gelen switch'ler
+
+        Returns:
+            list: [(dpid, flow stats da istensin mi)]
+        """
+        now = time.time() if now is None else now
+        polls = []
+        for dpid, next_poll in self.next_poll.items():
+            if next_poll > now:
+                continue
+            self.polls[dpid] += 1
+            with_flows = bool(self.flow_stats_every) and self.polls[dpid] % self.flow_stats_every == 0
+            self.next_poll[dpid] = now + self.intervals[dpid]
+            self.port_requests += 1
+            self.flow_requests += with_flows
+            polls.append((dpid, with_flows))
+        return polls
+
+    def port_stats_reply(self, dpid, stats, capacity_of, now=None):
+        """
+        Port sayaçlarını işle
+
+        Args:
+            stats: [(port_no, tx_bytes)]
+            capacity_of: callable(port_no) -> kapasite (Mbps) veya None
+
+        Returns:
+            dict: port_no -> EWMA hız (Mbps), sadece iki örneği olan portlar
+        """
+        now = time.time() if now is None else now
+        self.replies += 1
+        rates = {}
+        max_change = max_utilization = 0
+
+        for port_no, tx_bytes in stats:
+            key = (dpid, port_no)
+            sample = self._sample(self.port_counters, key, tx_bytes, now)
+            if sample is None:
+                continue
+            old = self.port_rates.get(key)
+            rate = sample if old is None else self.alpha * sample + (1 - self.alpha) * old
+            self.port_rates[key] = rate
+            rates[port_no] = rate / 1e6
+
+            capacity = capacity_of(port_no)
+            if capacity:
+                max_utilization = max(max_utilization, rate / 1e6 / capacity)
+                max_change = max(max_change, abs(sample - (old or 0)) / 1e6 / capacity)
+
+        self._adapt(dpid, max_change, max_utilization, now)
+        return rates
+
+    def flow_stats_reply(self, dpid, stats, now=None):
+        """
+        Flow sayaçlarını işle; cevapta olmayan (silinmiş) flow'lar unutulur
+
+        Args:
+            stats: [(flow key, byte_count)]
+        """
+        now = time.time() if now is None else now
+        self.replies += 1
+        seen = set()
+        for flow_key, byte_count in stats:
+            key = (dpid, flow_key)
+            seen.add(key)
+            sample = self._sample(self.flow_counters, key, byte_count, now)
+            if sample is None:
+                continue
+            old = self.flow_rates.get(key)
+            self.flow_rates[key] = sample if old is None else self.alpha * sample + (1 - self.alpha) * old
+
+        for table in (self.flow_counters, self.flow_rates):
+            for key in [k for k in table if k[0] == dpid and k not in seen]:
+                del table[key]
+
+    def get_statistics(self):
+        intervals = list(self.intervals.values())
+        return {
+            'stats_port_requests': self.port_requests,
+            'stats_flow_requests': self.flow_requests,
+            'stats_replies': self.replies,
+            'stats_poll_interval_avg': sum(intervals) / len(intervals) if intervals else 0,
+            'monitored_flows': len(self.flow_rates)
+        }
+
+    @staticmethod
+    def _sample(counters, key, value, now):
+        """Önceki sayaçla farktan bit/s örneği (sayaç sıfırlandıysa None)"""
+        previous = counters.get(key)
+        counters[key] = (value, now)
+        if previous is None or value < previous[0] or now <= previous[1]:
+            return None
+        return (value - previous[0]) * 8 / (now - previous[1])
+
+    def _adapt(self, dpid, max_change, max_utilization, now):
+        if dpid not in self.intervals:
+            return
+        if max_change > self.change_threshold or max_utilization > self.busy_threshold:
+            interval = self.min_interval
+        else:
+            interval = min(self.max_interval, self.intervals[dpid] * 1.5)
+        if interval < self.intervals[dpid]:
+            # Trafik değişti: sonraki sorgu öne çekilir
+            self.next_poll[dpid] = min(self.next_poll[dpid], now + interval)
+        self.intervals[dpid] = interval
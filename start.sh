@@ -127,7 +127,7 @@ echo ""
 
 # Controller'ı arka planda başlat
 echo "Starting controller in background..."
-ryu-manager $CONTROLLER > logs/controller.log 2>&1 &
+ryu-manager --observe-links $CONTROLLER > logs/controller.log 2>&1 &
 CONTROLLER_PID=$!
 echo "Controller PID: $CONTROLLER_PID"
 
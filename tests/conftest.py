@@ -0,0 +1,30 @@
+"""
+pytest ortak fixture'ları: controller'lar ryu yerine geçen modüllerle
+Simulator üzerinden sahte switch'lere bağlanır
+"""
+
+import os
+
+import pytest
+
+from controller_simulator import DataPlane, SimTopology, Simulator, load_controller
+
+
+@pytest.fixture
+def simulate(tmp_path):
+    """
+    Simulator fabrikası: simulate(controller, links, **settings)
+
+    Tüm mesajlar saklanır (DataPlane için), olay kayıtları tmp_path'e
+    yazılır ve her host bir ARP isteğiyle konumunu öğretir.
+    """
+    def build(controller, links, learn=True, **settings):
+        topology = SimTopology(links, name='test')
+        simulator = Simulator(load_controller(controller), topology, keep_messages=True, **settings)
+        metrics = simulator.app.metrics
+        metrics.event_log = os.path.join(tmp_path, os.path.basename(metrics.event_log))
+        if learn:
+            simulator.learn_hosts()
+        simulator.data_plane = DataPlane(simulator)
+        return simulator
+    return build
@@ -0,0 +1,891 @@
+#!/usr/bin/env python3
+"""
+Controller Benchmark - Controller hot-path mikro benchmarkları
+Mininet/Ryu gerektirmeden controller veri yapılarının maliyetini ölçer
+"""
+
+import os
+import random
+import struct
+import sys
+import time
+import tracemalloc
+
+import networkx as nx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'controllers'))
+
+from arp_proxy import ArpProxy
+from broadcast_tree import BroadcastTree
+from elephant_detector import ElephantDetector
+from host_tracker import HostLocationIndex
+from link_table import LinkTable
+from multipath import bucket_weights
+from packet_view import PacketView
+from path_cache import PathCache
+from path_workers import PathComputePool
+from proactive_routes import ProactiveRoutes
+from routing_engine import RoutingEngine
+from strategies import LoadBalancingStrategy, QoSStrategy
+from traffic_monitor import TrafficMonitor
+
+from fixtures import (COMPLEX_LINKS, ROUTING_MODES, SIMPLE_LINKS, brute_force_path, build_graph, engine_path,
+                      fat_tree_links, mesh_links, path_objective, read_pcap)
+
+
+def _mac(i):
+    """Sıra numarasından MAC adresi üret"""
+    return ':'.join(f'{b:02x}' for b in i.to_bytes(6, 'big'))
+
+
+def sample_frames(count=1000, seed=5):
+    """
+    Packet-In karışımını temsil eden frame'ler: ARP, ICMP, TCP, UDP
+    ve VLAN etiketli UDP (pingall/iperf testlerindeki dağılıma yakın)
+    """
+    rng = random.Random(seed)
+    frames = []
+    for i in range(count):
+        src, dst = rng.sample(range(1, 9), 2)
+        eth = bytes.fromhex(_mac(dst).replace(':', '')) + bytes.fromhex(_mac(src).replace(':', ''))
+        ip_src, ip_dst = bytes([10, 0, 0, src]), bytes([10, 0, 0, dst])
+        kind = rng.choice(('arp', 'icmp', 'tcp', 'udp', 'vlan'))
+        if kind == 'arp':
+            frames.append(eth + struct.pack('!HHHBBH', 0x0806, 1, 0x0800, 6, 4, 1)
+                          + eth[6:12] + ip_src + bytes(6) + ip_dst + bytes(18))
+            continue
+        proto, l4 = {
+            'icmp': (1, struct.pack('!BBHHH', 8, 0, 0, 1, i & 0xffff) + bytes(56)),
+            'tcp': (6, struct.pack('!HHIIBBHHH', rng.randint(1024, 65535), 5001, i, 0,
+                                   0x50, 0x02, 65535, 0, 0)),
+            'udp': (17, struct.pack('!HHHH', rng.randint(1024, 65535), 5001, 8 + 64, 0) + bytes(64)),
+            'vlan': (17, struct.pack('!HHHH', rng.randint(1024, 65535), 5060, 8 + 160, 0) + bytes(160)),
+        }[kind]
+        ip = struct.pack('!BBHHHBBH4s4s', 0x45, 0xb8 if kind == 'vlan' else 0, 20 + len(l4),
+                         i & 0xffff, 0, 64, proto, 0, ip_src, ip_dst)
+        ethertype = struct.pack('!H', 0x0800)
+        if kind == 'vlan':
+            ethertype = struct.pack('!HHH', 0x8100, (5 << 13) | 10, 0x0800)
+        frames.append(eth + ethertype + ip + l4)
+    return frames
+
+
+class ControllerBenchmark:
+    def __init__(self, iterations=2000):
+        self.iterations = iterations
+        self.results = {}
+
+    def _time_per_op(self, func, iterations):
+        """Bir işlemin ortalama süresini mikro saniye olarak döndür"""
+        start = time.perf_counter()
+        for i in range(iterations):
+            func(i)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    def benchmark_host_lookup(self, host_counts=(10, 100, 1000, 5000), num_switches=8):
+        """
+        Packet-In hedef arama maliyeti: eski MAC taraması vs. host indeksi
+
+        Eski yöntem her pakette tüm switch'lerin MAC tablolarını tarar,
+        indeks ise O(1) sözlük erişimi yapar.
+        """
+        print(f"\n[HOST LOOKUP] {num_switches} switches, host counts: {list(host_counts)}")
+        results = []
+
+        for num_hosts in host_counts:
+            macs = [_mac(i + 1) for i in range(num_hosts)]
+
+            # Eski yapı: dpid -> {mac: port}
+            mac_to_port = {}
+            index = HostLocationIndex()
+            for i, mac in enumerate(macs):
+                dpid = i % num_switches + 1
+                mac_to_port.setdefault(dpid, {})[mac] = 1
+                index.learn(mac, dpid, 1)
+
+            def legacy(i):
+                src = macs[i % num_hosts]
+                dst = macs[(i * 7 + 3) % num_hosts]
+                dpid = i % num_switches + 1
+                mac_to_port.setdefault(dpid, {})
+                mac_to_port[dpid][src] = 1
+                if dst in [mac for switch in mac_to_port.values() for mac in switch]:
+                    for switch_id, mac_table in mac_to_port.items():
+                        if dst in mac_table:
+                            return switch_id, mac_table[dst]
+                return None
+
+            def indexed(i):
+                src = macs[i % num_hosts]
+                dst = macs[(i * 7 + 3) % num_hosts]
+                index.learn(src, i % num_switches + 1, 1)
+                return index.lookup(dst)
+
+            iterations = max(50, min(self.iterations, 200000 // num_hosts))
+            legacy_us = self._time_per_op(legacy, iterations)
+            indexed_us = self._time_per_op(indexed, self.iterations)
+
+            results.append({
+                'hosts': num_hosts,
+                'legacy_us': legacy_us,
+                'indexed_us': indexed_us,
+                'speedup': legacy_us / indexed_us if indexed_us > 0 else 0
+            })
+            print(f"  {num_hosts:>6} hosts: legacy {legacy_us:10.2f} us  "
+                  f"indexed {indexed_us:6.2f} us  ({results[-1]['speedup']:.0f}x)")
+
+        self.results['host_lookup'] = results
+        return results
+
+    def benchmark_path_cache(self, links=COMPLEX_LINKS):
+        """
+        ShortestPathController yol hesaplama: her pakette Dijkstra vs. yol önbelleği
+        """
+        net = build_graph(links)
+        nodes = sorted(net.nodes())
+        pairs = [(s, d) for s in nodes for d in nodes if s != d]
+        cache = PathCache()
+
+        print(f"\n[PATH CACHE] {len(nodes)} switches, {len(pairs)} switch pairs")
+
+        def uncached(i):
+            src, dst = pairs[i % len(pairs)]
+            return nx.shortest_path(net, src, dst, weight=None)
+
+        def cached(i):
+            src, dst = pairs[i % len(pairs)]
+            path = cache.get(src, dst)
+            if path is None:
+                path = nx.shortest_path(net, src, dst, weight=None)
+                cache.put(src, dst, path)
+            return path
+
+        uncached_us = self._time_per_op(uncached, self.iterations * 5)
+        cached_us = self._time_per_op(cached, self.iterations * 5)
+
+        # Tek link kesintisinde kaç kayıt tahliye ediliyor
+        size_before = len(cache)
+        cache.topology_changed(removed_links=[(1, 2), (2, 1)])
+        evicted = size_before - len(cache)
+
+        result = {
+            'uncached_us': uncached_us,
+            'cached_us': cached_us,
+            'hit_rate': cache.get_statistics()['hit_rate'],
+            'evicted_on_link_failure': evicted,
+            'entries_before_failure': size_before
+        }
+        print(f"  nx.shortest_path: {uncached_us:.2f} us  cached: {cached_us:.2f} us  "
+              f"hit rate: {result['hit_rate']:.3f}")
+        print(f"  Link s1-s2 failure evicted {evicted}/{size_before} cached paths")
+
+        self.results['path_cache'] = result
+        return result
+
+    def verify_routing_engine(self, topologies=None, trials=5, seed=7):
+        """
+        RoutingEngine seçimlerinin eski brute force ile aynı amaç değerini
+        verdiğini SimpleTopology/ComplexTopology üzerinde doğrula
+        """
+        topologies = topologies or {'simple': SIMPLE_LINKS, 'complex': COMPLEX_LINKS}
+        rng = random.Random(seed)
+        mismatches = 0
+        checks = 0
+
+        print(f"\n[ROUTING ENGINE VERIFY] {list(topologies)} x {trials} random load states")
+        for name, links in topologies.items():
+            net = build_graph(links)
+            engine = RoutingEngine(net, max_hops=5)
+            nodes = sorted(net.nodes())
+            for _ in range(trials):
+                for u, v in net.edges():
+                    net[u][v]['load'] = rng.choice([0, 0, 1, 2, 5])
+                for src in nodes:
+                    for dst in nodes:
+                        if src == dst:
+                            continue
+                        for mode in ROUTING_MODES:
+                            expected = brute_force_path(net, src, dst, mode)
+                            actual = engine_path(engine, src, dst, mode)
+                            checks += 1
+                            if path_objective(net, expected, mode) != path_objective(net, actual, mode):
+                                mismatches += 1
+                                print(f"  MISMATCH {name} {src}->{dst} {mode}: {expected} vs {actual}")
+
+        print(f"  {checks} path selections checked, {mismatches} mismatches")
+        self.results['routing_verify'] = {'checks': checks, 'mismatches': mismatches}
+        return mismatches == 0
+
+    def benchmark_routing_engine(self, pairs_per_graph=30, seed=3):
+        """all_simple_paths brute force vs. RoutingEngine (fat-tree ve mesh grafları)"""
+        graphs = {
+            'complex': COMPLEX_LINKS,
+            'fat-tree k=4': fat_tree_links(4),
+            'mesh 6x6': mesh_links(6, chords=40),
+        }
+        rng = random.Random(seed)
+        results = {}
+
+        print(f"\n[ROUTING ENGINE] brute force vs. engine, {pairs_per_graph} pairs per graph")
+        for name, links in graphs.items():
+            net = build_graph(links)
+            for u, v in net.edges():
+                net[u][v]['load'] = rng.randint(0, 5)
+            engine = RoutingEngine(net, max_hops=5)
+            nodes = sorted(net.nodes())
+            pairs = [tuple(rng.sample(nodes, 2)) for _ in range(pairs_per_graph)]
+            num_paths = sum(len(list(nx.all_simple_paths(net, s, d, cutoff=5))) for s, d in pairs)
+
+            results[name] = {'avg_simple_paths': num_paths / len(pairs)}
+            for mode in ROUTING_MODES:
+                start = time.perf_counter()
+                for src, dst in pairs:
+                    brute_force_path(net, src, dst, mode)
+                brute_ms = (time.perf_counter() - start) / len(pairs) * 1000
+
+                start = time.perf_counter()
+                for src, dst in pairs:
+                    engine_path(engine, src, dst, mode)
+                engine_ms = (time.perf_counter() - start) / len(pairs) * 1000
+
+                results[name][mode] = {'brute_force_ms': brute_ms, 'engine_ms': engine_ms}
+
+            print(f"  {name} ({net.number_of_nodes()} switches, "
+                  f"~{results[name]['avg_simple_paths']:.0f} paths/pair):")
+            for mode in ROUTING_MODES:
+                r = results[name][mode]
+                print(f"    {mode:<15} brute force {r['brute_force_ms']:8.3f} ms  "
+                      f"engine {r['engine_ms']:7.3f} ms")
+
+        self.results['routing_engine'] = results
+        return results
+
+    def benchmark_packet_parser(self, frames=None):
+        """
+        Packet-In başlık çözme: ryu packet.Packet vs. PacketView
+
+        Her iki taraf da controller'ın okuduğu alanları okur: ethertype,
+        MAC adresleri ve (QoS için) IPv4 protokol baytı.
+        """
+        frames = frames or sample_frames()
+        print(f"\n[PACKET PARSER] {len(frames)} frames")
+
+        def lazy(i):
+            pkt = PacketView(frames[i % len(frames)])
+            return pkt.ethertype, pkt.eth_dst, pkt.eth_src, pkt.ip_proto
+
+        lazy_us = self._time_per_op(lazy, self.iterations * 10)
+        result = {'frames': len(frames), 'packet_view_us': lazy_us}
+
+        try:
+            from ryu.lib.packet import packet, ethernet, ipv4
+        except ImportError:
+            print(f"  PacketView: {lazy_us:.2f} us/frame ({1e6 / lazy_us:,.0f} Packet-In/s)")
+            print("  ryu not installed, packet.Packet comparison skipped")
+            self.results['packet_parser'] = result
+            return result
+
+        def full(i):
+            pkt = packet.Packet(frames[i % len(frames)])
+            eth = pkt.get_protocols(ethernet.ethernet)[0]
+            ip = pkt.get_protocol(ipv4.ipv4)
+            return eth.ethertype, eth.dst, eth.src, ip.proto if ip else None
+
+        # Aynı frame'lerde iki çözücü aynı alanları vermeli (VLAN hariç:
+        # ryu dış ethertype'ı, PacketView etiket arkasındakini döndürür)
+        mismatches = sum(1 for i in range(len(frames))
+                         if PacketView(frames[i]).vlan_id is None and lazy(i) != full(i))
+
+        full_us = self._time_per_op(full, self.iterations * 2)
+        result.update({
+            'ryu_packet_us': full_us,
+            'speedup': full_us / lazy_us if lazy_us > 0 else 0,
+            'mismatches': mismatches
+        })
+        print(f"  ryu packet.Packet: {full_us:.2f} us/frame ({1e6 / full_us:,.0f} Packet-In/s)")
+        print(f"  PacketView:        {lazy_us:.2f} us/frame ({1e6 / lazy_us:,.0f} Packet-In/s)  "
+              f"({result['speedup']:.1f}x, {mismatches} mismatches)")
+
+        self.results['packet_parser'] = result
+        return result
+
+    def simulate_broadcast(self, net, src_switch, use_tree, max_generations=8):
+        """
+        Bir host'un yayın frame'inin ürettiği Packet-In sayısı
+
+        Her switch'in 1 numaralı portunda bir host vardır. Frame her
+        switch'te table-miss ile controller'a gelir ve controller'ın
+        yayın kararına göre kopyalanır. OFPP_FLOOD döngülü topolojide
+        sönmediğinden kopyalar max_generations tur ile sınırlanır.
+        """
+        tree = None
+        if use_tree:
+            tree = BroadcastTree(net)
+            tree.rebuild()
+        peer = {(u, data['port']): (v, net[v][u]['port']) for u, v, data in net.edges(data=True)}
+
+        packet_ins = host_copies = 0
+        queue = [(src_switch, 1, 0)]
+        while queue:
+            dpid, in_port, generation = queue.pop()
+            packet_ins += 1
+            link_ports = {data['port'] for data in net[dpid].values()}
+            if use_tree:
+                tree_ports = tree.tree_ports(dpid)
+                if in_port in link_ports and in_port not in tree_ports:
+                    continue
+                out_ports = tree_ports | {1}
+            else:
+                out_ports = link_ports | {1}
+            for port in out_ports - {in_port}:
+                if port == 1:
+                    host_copies += 1
+                elif generation < max_generations:
+                    queue.append(peer[(dpid, port)] + (generation + 1,))
+        return packet_ins, host_copies
+
+    def benchmark_broadcast(self, links=COMPLEX_LINKS, max_generations=8):
+        """Host başına bir ARP yayını: OFPP_FLOOD vs. yayın ağacı Packet-In hacmi"""
+        net = build_graph(links)
+        switches = sorted(net.nodes())
+        print(f"\n[BROADCAST] {len(switches)} switches, one broadcast per host "
+              f"(flood copies cut after {max_generations} hops)")
+
+        result = {}
+        for name, use_tree in (('flood', False), ('tree', True)):
+            packet_ins = host_copies = 0
+            for dpid in switches:
+                p, h = self.simulate_broadcast(net, dpid, use_tree, max_generations)
+                packet_ins += p
+                host_copies += h
+            result[name] = {'packet_ins': packet_ins, 'host_copies': host_copies}
+            print(f"  {name:<6} Packet-In: {packet_ins:>10,}  host copies: {host_copies:>10,}")
+
+        result['reduction'] = result['flood']['packet_ins'] / result['tree']['packet_ins']
+        print(f"  Packet-In reduction: {result['reduction']:.0f}x")
+
+        self.results['broadcast'] = result
+        return result
+
+    def simulate_uniform_traffic(self, net, use_proxy, duration=60, packets_per_second=10,
+                                 arp_timeout=30, idle_timeout=10, seed=11):
+        """
+        TrafficGenerator.generate_uniform_traffic akışının Packet-In sayısı
+
+        Her switch'in 1 numaralı portunda 10.0.0.<dpid> adresli bir host
+        vardır. Host ARP önbelleği arp_timeout, controller'ın kurduğu
+        kurallar idle_timeout saniye yaşar. Yayınlar BroadcastTree
+        üzerinden (controller'ın varsayılan davranışı) gider.
+        """
+        rng = random.Random(seed)
+        hosts = sorted(net.nodes())
+        broadcast_cost = {dpid: self.simulate_broadcast(net, dpid, True)[0] for dpid in hosts}
+        proxy = ArpProxy()
+        host_arp = {h: {} for h in hosts}  # host -> {hedef host: geçerlilik sonu}
+        rules = {}  # (ingress switch, hedef host) -> son kullanım
+
+        packet_ins = 0
+
+        def unicast(now, ingress, dst):
+            nonlocal packet_ins
+            last = rules.get((ingress, dst))
+            if last is None or now - last > idle_timeout:
+                packet_ins += 1  # Table-miss, yol kurulumu
+            rules[(ingress, dst)] = now
+
+        events = int(duration * packets_per_second)
+        for i in range(events):
+            now = i / packets_per_second
+            src = rng.choice(hosts)
+            dst = rng.choice([h for h in hosts if h != src])
+
+            if host_arp[src].get(dst, -1) < now:
+                # ARP isteği (yayın)
+                src_ip, dst_ip = f'10.0.0.{src}', f'10.0.0.{dst}'
+                if use_proxy:
+                    packet_ins += 1
+                    proxy.learn(src_ip, _mac(src), now)
+                    if proxy.lookup(dst_ip, now) is None:
+                        # Miss: istek sadece edge portlara gider, hedef cevaplar
+                        host_arp[dst][src] = now + arp_timeout
+                        unicast(now, dst, src)
+                        proxy.learn(dst_ip, _mac(dst), now)
+                else:
+                    packet_ins += broadcast_cost[src]
+                    host_arp[dst][src] = now + arp_timeout
+                    unicast(now, dst, src)
+                host_arp[src][dst] = now + arp_timeout
+
+            unicast(now, src, dst)
+
+        return packet_ins
+
+    def benchmark_arp_proxy(self, links=COMPLEX_LINKS, duration=60, packets_per_second=10):
+        """generate_uniform_traffic sırasında ARP proxy ile/proxy olmadan Packet-In hızı"""
+        net = build_graph(links)
+        print(f"\n[ARP PROXY] {net.number_of_nodes()} hosts, uniform traffic "
+              f"{packets_per_second} pps for {duration}s")
+
+        result = {}
+        for name, use_proxy in (('broadcast', False), ('proxy', True)):
+            packet_ins = self.simulate_uniform_traffic(net, use_proxy, duration, packets_per_second)
+            result[name] = {'packet_ins': packet_ins, 'packet_in_rate': packet_ins / duration}
+            print(f"  {name:<10} Packet-In: {packet_ins:>6}  ({packet_ins / duration:.2f}/s)")
+
+        result['reduction'] = 1 - result['proxy']['packet_ins'] / result['broadcast']['packet_ins']
+        print(f"  Packet-In reduction: {result['reduction'] * 100:.1f}%")
+
+        self.results['arp_proxy'] = result
+        return result
+
+    def count_path_rules(self, net, hosts_per_switch, mode):
+        """
+        Tüm host çiftleri arasında yol kurulduğunda switch başına kural sayısı
+
+        install_path'in eşleşme alanlarını izler: 'mac' modunda ingress
+        (in_port, eth_dst), transit ve egress eth_dst ile; 'label' modunda
+        ingress eth_dst, transit egress etiketi, egress (etiket, eth_dst) ile
+        eşleşir.
+        """
+        hosts = [(dpid, port) for dpid in sorted(net.nodes())
+                 for port in range(1, hosts_per_switch + 1)]
+        paths = dict(nx.all_pairs_shortest_path(net))
+        rules = {dpid: set() for dpid in net.nodes()}
+
+        for src_dpid, in_port in hosts:
+            for dst in hosts:
+                dst_dpid = dst[0]
+                if dst_dpid == src_dpid:
+                    continue
+                path = paths[src_dpid][dst_dpid]
+                if mode == 'mac':
+                    rules[path[0]].add(('ingress', in_port, dst))
+                    for dpid in path[1:]:
+                        rules[dpid].add(('eth_dst', dst))
+                else:
+                    rules[path[0]].add(('eth_dst', dst))
+                    for dpid in path[1:-1]:
+                        rules[dpid].add(('label', dst_dpid))
+                    rules[dst_dpid].add(('egress', dst_dpid, dst))
+
+        counts = [len(r) for r in rules.values()]
+        return sum(counts), max(counts)
+
+    def benchmark_rule_aggregation(self, links=COMPLEX_LINKS, host_counts=(1, 4, 16, 64)):
+        """Hedef MAC kuralları vs. egress etiketli kurallar: tablo boyutu"""
+        net = build_graph(links)
+        print(f"\n[RULE AGGREGATION] {net.number_of_nodes()} switches, all host pairs active")
+
+        result = {}
+        for hosts_per_switch in host_counts:
+            mac_total, mac_max = self.count_path_rules(net, hosts_per_switch, 'mac')
+            label_total, label_max = self.count_path_rules(net, hosts_per_switch, 'label')
+            result[hosts_per_switch] = {
+                'mac_rules': mac_total, 'mac_max_per_switch': mac_max,
+                'label_rules': label_total, 'label_max_per_switch': label_max
+            }
+            print(f"  {hosts_per_switch * net.number_of_nodes():>4} hosts  "
+                  f"mac: {mac_total:>7,} (max {mac_max:>6,}/switch)  "
+                  f"label: {label_total:>6,} (max {label_max:>5,}/switch)  "
+                  f"{mac_total / label_total:.1f}x fewer")
+
+        self.results['rule_aggregation'] = result
+        return result
+
+    def benchmark_proactive(self, topologies=(('simple', SIMPLE_LINKS), ('complex', COMPLEX_LINKS))):
+        """
+        Reaktif vs. proaktif kurulum: ilk paket maliyeti ve link kopmasında güncelleme
+
+        Her switch'in 1 numaralı portunda bir host vardır ve tüm host
+        çiftleri konuşur. Reaktif modda her (kaynak, hedef) akışının ilk
+        paketi bir Packet-In, bir yol hesabı ve yol boyunca FlowMod'lar
+        ister; proaktif modda kurallar önceden kuruludur.
+        """
+        print("\n[PROACTIVE] all host pairs, one host per switch")
+        result = {}
+        for name, links in topologies:
+            net = build_graph(links)
+            hosts = {_mac(dpid): (dpid, 1) for dpid in net.nodes()}
+
+            def shortest(src, dst):
+                return nx.shortest_path(net, src, dst)
+
+            # Reaktif: akış başına Packet-In + yol hesabı + yol boyunca FlowMod
+            start = time.perf_counter()
+            reactive_flow_mods = 0
+            for src_dpid, _ in hosts.values():
+                for dst_dpid, _ in hosts.values():
+                    if src_dpid != dst_dpid:
+                        reactive_flow_mods += len(shortest(src_dpid, dst_dpid))
+            reactive_time = time.perf_counter() - start
+            flows = len(hosts) * (len(hosts) - 1)
+
+            # Proaktif: hedef başına tüm switch'lerden yol, switch başına tek kural
+            routes = ProactiveRoutes()
+            start = time.perf_counter()
+            proactive_flow_mods = 0
+            for mac, location in hosts.items():
+                paths = {src: shortest(src, location[0]) for src in net.nodes() if src != location[0]}
+                changed, _ = routes.set_paths(mac, location, paths)
+                proactive_flow_mods += len(changed) + 1
+            proactive_time = time.perf_counter() - start
+
+            # Link kopması: sadece etkilenen çiftler yeniden hesaplanır
+            updates = []
+            for u, v in list(net.edges()):
+                if u > v:
+                    continue
+                attrs = dict(net[u][v]), dict(net[v][u])
+                net.remove_edge(u, v)
+                net.remove_edge(v, u)
+                before = routes.path_computations
+                rules = 0
+                for a, b in ((u, v), (v, u)):
+                    for mac, sources in routes.affected_by_link(a, b).items():
+                        location = routes.hosts[mac]
+                        paths = {src: shortest(src, location[0]) for src in sources}
+                        changed, removed = routes.set_paths(mac, location, paths)
+                        rules += len(changed) + len(removed)
+                updates.append((routes.path_computations - before, rules))
+                net.add_edge(u, v, **attrs[0])
+                net.add_edge(v, u, **attrs[1])
+                for mac, location in hosts.items():
+                    paths = {src: shortest(src, location[0]) for src in net.nodes() if src != location[0]}
+                    routes.set_paths(mac, location, paths)
+
+            full = len(hosts) * (net.number_of_nodes() - 1)
+            avg_paths = sum(u[0] for u in updates) / len(updates)
+            avg_rules = sum(u[1] for u in updates) / len(updates)
+            result[name] = {
+                'reactive_packet_ins': flows,
+                'reactive_flow_mods': reactive_flow_mods,
+                'reactive_compute_ms': reactive_time * 1000,
+                'proactive_packet_ins': 0,
+                'proactive_flow_mods': proactive_flow_mods,
+                'proactive_compute_ms': proactive_time * 1000,
+                'link_down_paths_recomputed': avg_paths,
+                'link_down_full_recompute': full,
+                'link_down_rules_updated': avg_rules
+            }
+            print(f"  {name:<8} reactive: {flows:>3} first-packet Packet-Ins, {reactive_flow_mods:>4} FlowMods  "
+                  f"proactive: 0 Packet-Ins, {proactive_flow_mods:>3} FlowMods ({proactive_time * 1000:.2f} ms)")
+            print(f"  {'':<8} link down: {avg_paths:.1f}/{full} paths recomputed, "
+                  f"{avg_rules:.1f} rules updated on average")
+
+        self.results['proactive'] = result
+        return result
+
+    def benchmark_multipath(self, links=COMPLEX_LINKS, flows=400, elephant_ratio=0.1,
+                            elephant_mbps=8.0, mouse_mbps=0.3, seeds=(1, 2, 3)):
+        """
+        Tek yol (en az yüklü) vs. multipath (ağırlıklı select grupları): link kullanımı
+
+        Her switch'te bir host vardır; akışlar rastgele host çiftleri arasında
+        sırayla gelir, %10'u elephant, kalanı mouse akışıdır. Controller'ın
+        gördüğü link yükü her akıştan sonra güncellenir (ölçüm gecikmesi yok).
+        Select grubu akış başına hash'lediği için multipath'te de her akış
+        split noktasında tek bir bucket'a düşer.
+        """
+        print(f"\n[MULTIPATH] {flows} flows ({elephant_ratio:.0%} elephants x {elephant_mbps} Mbps, "
+              f"mice x {mouse_mbps} Mbps), {len(seeds)} seeds")
+
+        def place(strategy, rng, multipath):
+            nodes = sorted(strategy.net.nodes())
+            for _ in range(flows):
+                src, dst = rng.sample(nodes, 2)
+                rate = elephant_mbps if rng.random() < elephant_ratio else mouse_mbps
+                dag = strategy.get_multipath(src, dst) if multipath else None
+                if dag:
+                    node = src
+                    while node != dst:
+                        next_hops = dag[node]
+                        weights = bucket_weights({v: strategy.link_headroom(node, v) for v in next_hops})
+                        next_hop = rng.choices(next_hops, [weights[v] for v in next_hops])[0]
+                        strategy.link_load[(node, next_hop)] += rate
+                        node = next_hop
+                else:
+                    path = strategy.get_least_loaded_path(src, dst)
+                    for i in range(len(path) - 1):
+                        strategy.link_load[(path[i], path[i+1])] += rate
+
+            utilization = [strategy.link_load.get(link, 0) / capacity
+                           for link, capacity in strategy.link_capacity.items()]
+            return max(utilization), sum(u > 1 for u in utilization), sum(utilization) / len(utilization)
+
+        result = {}
+        for mode, multipath in (('single_path', False), ('multipath', True)):
+            runs = []
+            start = time.perf_counter()
+            for seed in seeds:
+                net = build_graph(links)
+                strategy = LoadBalancingStrategy(net)
+                for u, v, data in net.edges(data=True):
+                    strategy.link_capacity[(u, v)] = data['bandwidth']
+                runs.append(place(strategy, random.Random(seed), multipath))
+            elapsed = (time.perf_counter() - start) / (len(seeds) * flows)
+
+            result[mode] = {
+                'max_utilization': sum(r[0] for r in runs) / len(runs),
+                'overloaded_links': sum(r[1] for r in runs) / len(runs),
+                'avg_utilization': sum(r[2] for r in runs) / len(runs),
+                'placement_us': elapsed * 1e6
+            }
+            r = result[mode]
+            print(f"  {mode:<12} max link utilization {r['max_utilization']:6.1%}  "
+                  f"overloaded links {r['overloaded_links']:4.1f}  "
+                  f"avg {r['avg_utilization']:5.1%}  ({r['placement_us']:.0f} us/flow)")
+
+        self.results['multipath'] = result
+        return result
+
+    def benchmark_elephant_detection(self, flow_counts=(1000, 5000, 20000), elephant_ratio=0.02,
+                                     rounds=10, threshold_mbps=10.0, seed=5):
+        """
+        Saniyede bir flow stats turu: flow başına Python döngüsü vs. vektörel tespit
+
+        Referans, TrafficMonitor.flow_stats_reply ile her flow'un hızını
+        hesaplayıp eşiği tek tek kontrol eder. Akışların %2'si elephant
+        (~20-50 Mbps), kalanı mouse'tur (< 1 Mbps).
+        """
+        print(f"\n[ELEPHANT DETECTION] {rounds} rounds of 1 s, {elephant_ratio:.0%} elephants")
+        rng = random.Random(seed)
+        result = {}
+        for count in flow_counts:
+            keys = [(1, (('in_port', 1 + i % 4), ('tcp_src', 1024 + i))) for i in range(count)]
+            rates = [rng.uniform(20, 50) if rng.random() < elephant_ratio else rng.uniform(0, 1)
+                     for _ in range(count)]
+            bytes_per_round = [int(r * 1e6 / 8) for r in rates]
+
+            def rounds_of(handle):
+                counters = [0] * count
+                elapsed = 0.0
+                found = set()
+                for n in range(rounds + 1):
+                    stats = list(zip(keys, counters))
+                    start = time.perf_counter()
+                    found.update(handle(stats, float(n + 1)))
+                    if n:
+                        elapsed += time.perf_counter() - start
+                    counters = [c + b for c, b in zip(counters, bytes_per_round)]
+                return elapsed / rounds * 1000, found
+
+            monitor = TrafficMonitor(alpha=1.0)
+
+            def scalar(stats, now):
+                monitor.flow_stats_reply(1, stats, now)
+                return [key for key, _ in stats
+                        if monitor.flow_rates.get((1, key), 0) >= threshold_mbps * 1e6]
+
+            detector = ElephantDetector(threshold_mbps=threshold_mbps)
+
+            def vectorized(stats, now):
+                new, _ = detector.update(1, stats, now)
+                return [key for key, _ in new]
+
+            scalar_ms, scalar_found = rounds_of(scalar)
+            vector_ms, vector_found = rounds_of(vectorized)
+            assert scalar_found == vector_found
+            result[count] = {'scalar_ms': scalar_ms, 'vectorized_ms': vector_ms,
+                             'elephants': len(vector_found)}
+            print(f"  {count:>6,} flows ({len(vector_found):>3} elephants)  "
+                  f"per-flow loop {scalar_ms:7.2f} ms/round  vectorized {vector_ms:6.2f} ms/round  "
+                  f"{scalar_ms / vector_ms:.1f}x")
+
+        self.results['elephant_detection'] = result
+        return result
+
+    def benchmark_async_paths(self, links=None, packet_ins=300, workers=2, seed=9):
+        """
+        Packet-In döngüsünün yol hesabıyla bloklandığı süre: senkron vs. worker havuzu
+
+        QoS 'balanced' seçimi (en pahalı strateji) mesh grafında; aynı switch
+        çiftine giden eşzamanlı istekler havuzda tek hesaba bağlanır. Toplam
+        süre çekirdek sayısına bağlıdır, bloklanma süresi bağlı değildir.
+        """
+        net = build_graph(links or mesh_links(8, 20))
+        strategy = QoSStrategy(net)
+        for u, v, data in net.edges(data=True):
+            strategy.link_delay[(u, v)] = data['delay']
+            strategy.link_bandwidth[(u, v)] = data['bandwidth']
+            strategy.link_loss[(u, v)] = data['loss']
+
+        rng = random.Random(seed)
+        nodes = sorted(net.nodes())
+        flow = {'priority': 1, 'qos_requirement': 'balanced'}
+        requests = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(packet_ins)]
+        requests = [(src, dst) for src, dst in requests if src != dst]
+        print(f"\n[ASYNC PATHS] {len(requests)} Packet-Ins, QoS balanced, "
+              f"{net.number_of_nodes()} switches, {workers} worker processes on {os.cpu_count()} CPUs")
+
+        # Senkron: handler yol hesabı bitene kadar döngüyü bloklar
+        blocked = []
+        start = time.perf_counter()
+        for src, dst in requests:
+            t = time.perf_counter()
+            strategy.select_path(src, dst, flow)
+            blocked.append(time.perf_counter() - t)
+        sync_total = time.perf_counter() - start
+
+        # Asenkron: handler sadece isteği bırakır (Packet-In'ler bursty gelir)
+        pool = PathComputePool(workers=workers)
+        pool.submit(strategy, 0, nodes[0], nodes[1], flow, lambda path: None)
+        while pool.poll() == 0:
+            time.sleep(0.001)  # Worker process'leri ısınır
+        pool.requests = pool.computations = pool.deduplicated = 0
+        pool.latencies = []
+
+        delivered = []
+        submit = []
+        start = time.perf_counter()
+        for src, dst in requests:
+            t = time.perf_counter()
+            pool.submit(strategy, 0, src, dst, flow, delivered.append)
+            submit.append(time.perf_counter() - t)
+        while len(delivered) < len(requests):
+            pool.poll()
+            time.sleep(0.0005)
+        async_total = time.perf_counter() - start
+        stats = pool.get_statistics()
+        pool.shutdown()
+
+        result = {
+            'sync_blocked_avg_ms': sum(blocked) / len(blocked) * 1000,
+            'sync_blocked_max_ms': max(blocked) * 1000,
+            'sync_total_ms': sync_total * 1000,
+            'async_blocked_avg_ms': sum(submit) / len(submit) * 1000,
+            'async_blocked_max_ms': max(submit) * 1000,
+            'async_total_ms': async_total * 1000,
+            'computations': stats['async_path_computations'],
+            'deduplicated': stats['async_path_deduplicated'],
+            'snapshots': stats['async_path_snapshots']
+        }
+        print(f"  sync   handler blocked {result['sync_blocked_avg_ms']:6.3f} ms avg, "
+              f"{result['sync_blocked_max_ms']:6.3f} ms max, all paths in {sync_total * 1000:7.1f} ms")
+        print(f"  async  handler blocked {result['async_blocked_avg_ms']:6.3f} ms avg, "
+              f"{result['async_blocked_max_ms']:6.3f} ms max, all paths in {async_total * 1000:7.1f} ms "
+              f"({result['computations']} computed, {result['deduplicated']} deduplicated)")
+
+        self.results['async_paths'] = result
+        return result
+
+    def benchmark_link_table(self, k=8, pairs=200, seed=11):
+        """
+        nx.DiGraph + tuple anahtarlı metrik sözlükleri vs. LinkTable (CSR + NumPy)
+
+        fat-tree k grafında bellek, yük ağırlıklı Dijkstra, yol boyunca port
+        okuma ve yol QoS skorlaması karşılaştırılır. dijkstra_near iki hop
+        uzaklıktaki çiftlerdir: arama erken biter, sorgu başına sabit
+        maliyet (metrik sütununun kopyası) öne çıkar.
+        """
+        links = fat_tree_links(k)
+        rng = random.Random(seed)
+
+        # Bellek: controller'ın eski tuttuğu yapı vs. tablo
+        tracemalloc.start()
+        net = build_graph(links)
+        metrics = {name: {(u, v): data[name] for u, v, data in net.edges(data=True)}
+                   for name in ('delay', 'bandwidth', 'loss')}
+        metrics['load'] = {(u, v): rng.random() * 10 for u, v in net.edges()}
+        metrics['capacity'] = {(u, v): 100 for u, v in net.edges()}
+        dict_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        table = LinkTable.from_graph(net)
+        for (u, v), load in metrics['load'].items():
+            table.set(u, v, load=load)
+        table.csr()
+        table_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f"\n[LINK TABLE] fat-tree k={k}: {net.number_of_nodes()} switches, "
+              f"{net.number_of_edges()} links, {pairs} pairs")
+
+        nodes = sorted(net.nodes())
+        pair_list = [tuple(rng.sample(nodes, 2)) for _ in range(pairs)]
+        near_list = []
+        while len(near_list) < pairs:
+            src = rng.choice(nodes)
+            dst = rng.choice(sorted(net[rng.choice(sorted(net[src]))]))
+            if dst != src:
+                near_list.append((src, dst))
+        load = metrics['load']
+        dict_engine = RoutingEngine(net, max_hops=5)
+        table_engine = RoutingEngine(net, max_hops=5, links=table)
+        paths = [dict_engine.dijkstra_path(s, d, lambda u, v, data: load.get((u, v), 0))
+                 for s, d in pair_list]
+
+        def timed(fn, repeat):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                fn()
+            return (time.perf_counter() - start) / repeat * 1000
+
+        def dict_qos(path):
+            delay, bandwidth, loss = 0, float('inf'), 0
+            for i in range(len(path) - 1):
+                link = (path[i], path[i+1])
+                delay += metrics['delay'].get(link, 10)
+                bandwidth = min(bandwidth, metrics['bandwidth'].get(link, 100))
+                loss += metrics['loss'].get(link, 0.1)
+            return delay, bandwidth, loss
+
+        result = {
+            'dict_kb': dict_bytes / 1024,
+            'table_kb': table_bytes / 1024,
+            'dijkstra': (timed(lambda: [dict_engine.dijkstra_path(
+                             s, d, lambda u, v, data: load.get((u, v), 0)) for s, d in pair_list], 3),
+                         timed(lambda: [table_engine.dijkstra_path(s, d, 'load') for s, d in pair_list], 3)),
+            'dijkstra_near': (timed(lambda: [dict_engine.dijkstra_path(
+                                  s, d, lambda u, v, data: load.get((u, v), 0)) for s, d in near_list], 20),
+                              timed(lambda: [table_engine.dijkstra_path(s, d, 'load') for s, d in near_list], 20)),
+            'ports': (timed(lambda: [[net[p[i]][p[i+1]]['port'] for i in range(len(p) - 1)]
+                                     for p in paths], 20),
+                      timed(lambda: [[table.port(p[i], p[i+1]) for i in range(len(p) - 1)]
+                                     for p in paths], 20)),
+            'path_qos': (timed(lambda: [dict_qos(p) for p in paths], 20),
+                         timed(lambda: [table.path_metrics(p) for p in paths], 20))
+        }
+        print(f"  memory        graph + dicts {result['dict_kb']:8.1f} KB   table {result['table_kb']:7.1f} KB")
+        for name in ('dijkstra', 'dijkstra_near', 'ports', 'path_qos'):
+            before, after = result[name]
+            print(f"  {name:<13} dict {before:8.3f} ms   table {after:8.3f} ms   ({before / after:.2f}x)")
+
+        self.results['link_table'] = result
+        return result
+
+    def run_all(self, frames=None):
+        """Tüm benchmarkları çalıştır"""
+        self.benchmark_host_lookup()
+        self.benchmark_path_cache()
+        self.verify_routing_engine()
+        self.benchmark_routing_engine()
+        self.benchmark_packet_parser(frames)
+        self.benchmark_broadcast()
+        self.benchmark_arp_proxy()
+        self.benchmark_rule_aggregation()
+        self.benchmark_proactive()
+        self.benchmark_multipath()
+        self.benchmark_elephant_detection()
+        self.benchmark_async_paths()
+        self.benchmark_link_table()
+        return self.results
+
+
+def main():
+    """Ana benchmark fonksiyonu"""
+    print("""
+    ╔════════════════════════════════════════════════════════╗
+    ║   SDN CONTROLLER MICRO BENCHMARKS                     ║
+    ╚════════════════════════════════════════════════════════╝
+    """)
+
+    # İsteğe bağlı: kayıtlı Packet-In trafiği (pcap) ile parser benchmark'ı
+    frames = read_pcap(sys.argv[1]) if len(sys.argv) > 1 else None
+
+    benchmark = ControllerBenchmark()
+    benchmark.run_all(frames)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1074 @@
+#!/usr/bin/env python3
+"""
+Controller Simulator - Ryu/Mininet olmadan Packet-In replay
+Controller'lar sahte datapath/parser/ofproto nesneleriyle bir topolojiye
+bağlanır; sentetik veya kayıtlı (pcap) Packet-In akışı controller'ın gerçek
+packet_in_handler'ından geçirilir. Gönderilen tüm OpenFlow mesajları
+kaydedilir; Packet-In/s, olay başı gecikme yüzdelikleri ve FlowMod sayıları
+raporlanır. Ryu kurulu değilse controller modüllerinin ihtiyaç duyduğu
+ryu API'si için yerine geçen modüller yüklenir.
+"""
+
+import argparse
+import ast
+import importlib
+import json
+import logging
+import os
+import random
+import struct
+import sys
+import time
+import types
+import zlib
+from collections import Counter, deque, namedtuple
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'controllers'))
+
+from fixtures import COMPLEX_LINKS, SIMPLE_LINKS, fat_tree_links, mesh_links, read_pcap  # noqa: E402
+
+CONTROLLERS = {
+    'shortest_path': ('shortest_path_controller', 'ShortestPathController'),
+    'load_balancing': ('load_balancing_controller', 'LoadBalancingController'),
+    'qos': ('qos_controller', 'QoSController'),
+}
+
+
+class OFProto:
+    """OpenFlow 1.3 sabitleri (ryu.ofproto.ofproto_v1_3 ile aynı değerler)"""
+
+    OFP_VERSION = 0x04
+    OFP_NO_BUFFER = 0xffffffff
+    OFPCML_NO_BUFFER = 0xffff
+
+    OFPP_MAX = 0xffffff00
+    OFPP_IN_PORT = 0xfffffff8
+    OFPP_TABLE = 0xfffffff9
+    OFPP_NORMAL = 0xfffffffa
+    OFPP_FLOOD = 0xfffffffb
+    OFPP_ALL = 0xfffffffc
+    OFPP_CONTROLLER = 0xfffffffd
+    OFPP_LOCAL = 0xfffffffe
+    OFPP_ANY = 0xffffffff
+
+    OFPIT_GOTO_TABLE = 1
+    OFPIT_WRITE_METADATA = 2
+    OFPIT_WRITE_ACTIONS = 3
+    OFPIT_APPLY_ACTIONS = 4
+    OFPIT_CLEAR_ACTIONS = 5
+    OFPIT_METER = 6
+
+    OFPFC_ADD = 0
+    OFPFC_MODIFY = 1
+    OFPFC_MODIFY_STRICT = 2
+    OFPFC_DELETE = 3
+    OFPFC_DELETE_STRICT = 4
+
+    OFPFF_SEND_FLOW_REM = 1 << 0
+    OFPFF_CHECK_OVERLAP = 1 << 1
+    OFPFF_RESET_COUNTS = 1 << 2
+
+    OFPRR_IDLE_TIMEOUT = 0
+    OFPRR_HARD_TIMEOUT = 1
+    OFPRR_DELETE = 2
+    OFPRR_GROUP_DELETE = 3
+
+    OFPR_NO_MATCH = 0
+    OFPR_ACTION = 1
+
+    OFPGC_ADD = 0
+    OFPGC_MODIFY = 1
+    OFPGC_DELETE = 2
+    OFPGT_ALL = 0
+    OFPGT_SELECT = 1
+    OFPGT_INDIRECT = 2
+    OFPGT_FF = 3
+    OFPG_MAX = 0xffffff00
+    OFPG_ALL = 0xfffffffc
+    OFPG_ANY = 0xffffffff
+
+    OFPMC_ADD = 0
+    OFPMC_MODIFY = 1
+    OFPMC_DELETE = 2
+    OFPMF_KBPS = 1 << 0
+    OFPMF_PKTPS = 1 << 1
+    OFPMF_BURST = 1 << 2
+    OFPMF_STATS = 1 << 3
+    OFPM_MAX = 0xffff0000
+    OFPM_ALL = 0xffffffff
+
+    OFPVID_NONE = 0x0000
+    OFPVID_PRESENT = 0x1000
+    OFPTT_ALL = 0xff
+    OFPMPF_REQ_MORE = 1 << 0
+    OFPMPF_REPLY_MORE = 1 << 0
+    OFPPR_ADD = 0
+    OFPPR_DELETE = 1
+    OFPPR_MODIFY = 2
+    OFPPS_LINK_DOWN = 1 << 0
+    OFPPC_PORT_DOWN = 1 << 0
+
+
+class OFPMatch(dict):
+    """OFPMatch: alanlara match['in_port'], get() ve items() ile erişilir"""
+
+    def __init__(self, **fields):
+        super().__init__(fields)
+
+
+class OFPMessage:
+    """
+    Parser'ın ürettiği mesaj/aksiyon/instruction
+
+    Konumsal argümanlar args'ta, isimli argümanlar hem kwargs'ta hem de
+    öznitelik olarak tutulur (mod.match, out.actions).
+    """
+
+    def __init__(self, name, args, kwargs):
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+        self.xid = None
+        self.__dict__.update(kwargs)
+
+    def __repr__(self):
+        fields = [repr(arg) for arg in self.args if not isinstance(arg, SimDatapath)]
+        fields += [f'{k}={v!r}' for k, v in self.kwargs.items() if k != 'datapath']
+        return f"{self.name}({', '.join(fields)})"
+
+
+class OFPParser:
+    """ofproto_v1_3_parser yerine: her OFP* sınıfı kaydedilen bir OFPMessage üretir"""
+
+    OFPMatch = OFPMatch
+
+    def __getattr__(self, name):
+        if not name.startswith('OFP'):
+            raise AttributeError(name)
+
+        def build(*args, **kwargs):
+            return OFPMessage(name, args, kwargs)
+        build.__name__ = name
+        setattr(self, name, build)
+        return build
+
+
+OFPROTO = OFProto()
+PARSER = OFPParser()
+
+
+class SimDatapath:
+    """Gönderilen mesajları sayan (istenirse saklayan) sahte datapath"""
+
+    def __init__(self, dpid, keep_messages=False):
+        self.id = dpid
+        self.ofproto = OFPROTO
+        self.ofproto_parser = PARSER
+        self.is_active = True
+        self.keep_messages = keep_messages
+        self.xid = 0
+        self.sent = []
+        self.counts = Counter()  # mesaj adı -> adet
+        self.flow_mod_commands = Counter()  # OFPFC_* -> adet
+        self.barriers = []  # Cevap bekleyen barrier xid'leri
+
+    def set_xid(self, msg):
+        self.xid += 1
+        msg.xid = self.xid
+        return self.xid
+
+    def send_msg(self, msg):
+        if msg.xid is None:
+            self.set_xid(msg)
+        self.counts[msg.name] += 1
+        if msg.name == 'OFPFlowMod':
+            self.flow_mod_commands[msg.kwargs.get('command', OFPROTO.OFPFC_ADD)] += 1
+        elif msg.name == 'OFPBarrierRequest':
+            self.barriers.append(msg.xid)
+        if self.keep_messages:
+            self.sent.append(msg)
+
+    def reset_counters(self):
+        self.sent = []
+        self.counts.clear()
+        self.flow_mod_commands.clear()
+
+
+class _Yield(BaseException):
+    """SimHub.sleep: döngü task'ı bu tick'teki turunu bitirdi (controller'ın except Exception'ı yakalamaz)"""
+
+
+class SimHub:
+    """
+    ryu.lib.hub.spawn/sleep yerine deterministik task yürütücü
+
+    spawn() edilen fonksiyonlar run_pending() ile sırayla çalıştırılır.
+    İkinci hub.sleep çağrısına ulaşan task (while True döngüsü) bir tur
+    çalışmış sayılır ve durdurulur; tick() her döngüyü bir tur daha
+    çalıştırır. Uyumadan biten task'lar (ör. reroute_flows) tek seferliktir.
+    time() sanal saattir: sadece tick() ile ilerler (controller.clock).
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.loops = []
+        self._running = None
+        self._sleeps = 0
+        self.now = 0.0
+
+    def install(self, hub):
+        """hub modülünün spawn/sleep/kill fonksiyonlarını bu yürütücüye bağla"""
+        hub.spawn = self.spawn
+        hub.spawn_after = self.spawn_after
+        hub.sleep = self.sleep
+        hub.kill = self.kill
+
+    def spawn(self, func, *args, **kwargs):
+        task = (func, args, kwargs)
+        self.pending.append(task)
+        return task
+
+    def spawn_after(self, seconds, func, *args, **kwargs):
+        return self.spawn(func, *args, **kwargs)
+
+    def sleep(self, seconds=0):
+        if self._running is None:
+            return
+        self._sleeps += 1
+        if self._sleeps > 1:
+            raise _Yield()
+
+    def time(self):
+        return self.now
+
+    def kill(self, task):
+        for tasks in (self.pending, self.loops):
+            if task in tasks:
+                tasks.remove(task)
+
+    def run_pending(self):
+        while self.pending:
+            task = self.pending.pop(0)
+            if self._run(task):
+                self.loops.append(task)
+
+    def tick(self, seconds=1.0):
+        """Sanal saati seconds ilerlet ve her döngüyü bir tur çalıştır"""
+        self.now += seconds
+        for task in list(self.loops):
+            self._run(task)
+        self.run_pending()
+
+    def _run(self, task):
+        """Task'ı çalıştır; döngüyse (sleep'te durdurulduysa) True"""
+        func, args, kwargs = task
+        self._running, self._sleeps = task, 0
+        try:
+            func(*args, **kwargs)
+        except _Yield:
+            return True
+        finally:
+            self._running = None
+        return False
+
+
+class _EventModule(types.ModuleType):
+    """ofp_event / topology.event yerine: Event* sınıfları ilk erişimde üretilir"""
+
+    def __getattr__(self, name):
+        if not name.startswith('Event'):
+            raise AttributeError(name)
+        cls = type(name, (), {})
+        setattr(self, name, cls)
+        return cls
+
+
+class _RyuApp:
+    """app_manager.RyuApp yerine"""
+
+    OFP_VERSIONS = None
+    _CONTEXTS = {}
+
+    def __init__(self, *args, **kwargs):
+        self.name = type(self).__name__
+        self.logger = logging.getLogger(self.name)
+
+    def send_event_to_observers(self, ev, state=None):
+        pass
+
+
+def _set_ev_cls(ev_cls, dispatchers=None):
+    def register(handler):
+        handler.callers = dict(getattr(handler, 'callers', {}), **{ev_cls.__name__: dispatchers})
+        return handler
+    return register
+
+
+def install_ryu_standins():
+    """
+    Ryu kurulu değilse controller'ların import ettiği ryu modüllerini kaydet
+
+    Returns:
+        bool: Gerçek ryu kullanılıyorsa True
+    """
+    try:
+        importlib.import_module('ryu.topology.api')
+        return True
+    except ImportError:
+        pass
+
+    def module(name, cls=types.ModuleType, **attrs):
+        mod = cls(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        parent, _, child = name.rpartition('.')
+        if parent:
+            setattr(sys.modules[parent], child, mod)
+        return mod
+
+    ofproto_v1_3 = {name: getattr(OFProto, name) for name in dir(OFProto) if name.startswith('OFP')}
+    module('ryu')
+    module('ryu.base')
+    module('ryu.base.app_manager', RyuApp=_RyuApp, require_app=lambda *args, **kwargs: None)
+    module('ryu.controller')
+    module('ryu.controller.ofp_event', _EventModule)
+    module('ryu.controller.handler', set_ev_cls=_set_ev_cls, HANDSHAKE_DISPATCHER='handshake',
+           CONFIG_DISPATCHER='config', MAIN_DISPATCHER='main', DEAD_DISPATCHER='dead')
+    module('ryu.ofproto')
+    module('ryu.ofproto.ofproto_v1_3', **ofproto_v1_3)
+    module('ryu.ofproto.ofproto_v1_3_parser', **{name: getattr(PARSER, name) for name in
+                                                 ('OFPMatch', 'OFPFlowMod', 'OFPPacketOut')})
+    module('ryu.lib')
+    SimHub().install(module('ryu.lib.hub'))
+    module('ryu.lib.packet')
+    module('ryu.lib.packet.ether_types', ETH_TYPE_IP=0x0800, ETH_TYPE_ARP=0x0806,
+           ETH_TYPE_8021Q=0x8100, ETH_TYPE_IPV6=0x86dd, ETH_TYPE_LLDP=0x88cc)
+    module('ryu.topology')
+    module('ryu.topology.event', _EventModule)
+    module('ryu.topology.api', get_switch=lambda *args, **kwargs: [],
+           get_link=lambda *args, **kwargs: [])
+    return False
+
+
+def load_controller(name):
+    """CONTROLLERS adından controller sınıfı (gerekirse ryu yerine geçen modüllerle)"""
+    install_ryu_standins()
+    module, cls = CONTROLLERS[name]
+    return getattr(importlib.import_module(module), cls)
+
+
+# Topoloji
+
+Port = namedtuple('Port', 'dpid port_no')
+Switch = namedtuple('Switch', 'dp ports')
+Link = namedtuple('Link', 'src dst')
+Host = namedtuple('Host', 'mac ip dpid port')
+
+
+def host_mac(i):
+    return ':'.join(f'{b:02x}' for b in i.to_bytes(6, 'big'))
+
+
+class SimTopology:
+    """
+    Switch linkleri (s1, s2, bw, delay, loss) ve host'lar
+
+    Host'lar switch'lerin ilk portlarına (Mininet topolojilerindeki gibi
+    h1 -> s1 port 1) bağlanır, switch linkleri sonraki portları alır.
+    """
+
+    def __init__(self, links, hosts_per_switch=1, host_switches=None, name='custom'):
+        self.name = name
+        self.switches = sorted({l[0] for l in links} | {l[1] for l in links})
+        host_switches = self.switches if host_switches is None else sorted(host_switches)
+
+        next_port = {dpid: 1 for dpid in self.switches}
+        self.hosts = []
+        for dpid in host_switches:
+            for _ in range(hosts_per_switch):
+                i = len(self.hosts) + 1
+                self.hosts.append(Host(host_mac(i), f'10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}',
+                                       dpid, next_port[dpid]))
+                next_port[dpid] += 1
+
+        self.links = []  # (s1, port1, s2, port2, bw, delay, loss)
+        for src, dst, bw, delay, loss in links:
+            self.links.append((src, next_port[src], dst, next_port[dst], bw, delay, loss))
+            next_port[src] += 1
+            next_port[dst] += 1
+        self.ports = {dpid: list(range(1, next_port[dpid])) for dpid in self.switches}
+
+    @classmethod
+    def load(cls, spec):
+        """
+        Hazır topoloji adı (TOPOLOGIES) veya JSON dosyası
+
+        JSON: {"links": [[s1, s2, bw, delay, loss], ...],
+               "hosts_per_switch": 1, "host_switches": [dpid, ...]}
+        """
+        if spec in TOPOLOGIES:
+            return TOPOLOGIES[spec]()
+        with open(spec) as f:
+            data = json.load(f)
+        return cls([tuple(link) for link in data['links']], data.get('hosts_per_switch', 1),
+                   data.get('host_switches'), name=os.path.basename(spec))
+
+
+def _fat_tree(k=4):
+    """Host'lar sadece edge switch'lerde (en az linki olan katman)"""
+    links = fat_tree_links(k)
+    degree = Counter(dpid for link in links for dpid in link[:2])
+    edges = [dpid for dpid, d in degree.items() if d == min(degree.values())]
+    return SimTopology(links, hosts_per_switch=k // 2, host_switches=edges, name=f'fat-tree-{k}')
+
+
+TOPOLOGIES = {
+    'simple': lambda: SimTopology(SIMPLE_LINKS, name='simple'),
+    'complex': lambda: SimTopology(COMPLEX_LINKS, name='complex'),
+    'fat-tree': _fat_tree,
+    'mesh': lambda: SimTopology(mesh_links(), name='mesh'),
+}
+
+
+# Packet-In akışları: [(dpid, in_port, frame)]
+
+def _ip(address):
+    return bytes(int(x) for x in address.split('.'))
+
+
+def _mac_bytes(mac):
+    return bytes.fromhex(mac.replace(':', ''))
+
+
+def arp_request(src, dst):
+    """src host'unun dst IP'si için ARP isteği"""
+    return (b'\xff' * 6 + _mac_bytes(src.mac) + struct.pack('!HHHBBH', 0x0806, 1, 0x0800, 6, 4, 1)
+            + _mac_bytes(src.mac) + _ip(src.ip) + bytes(6) + _ip(dst.ip))
+
+
+def ip_frame(src, dst, proto, sport=0, dport=0, ident=0):
+    """src -> dst IPv4 frame'i (proto: 1 ICMP echo, 6 TCP SYN, 17 UDP)"""
+    if proto == 6:
+        l4 = struct.pack('!HHIIBBHHH', sport, dport, ident, 0, 0x50, 0x02, 65535, 0, 0)
+    elif proto == 17:
+        l4 = struct.pack('!HHHH', sport, dport, 8 + 64, 0) + bytes(64)
+    else:
+        l4 = struct.pack('!BBHHH', 8, 0, 0, 1, ident & 0xffff) + bytes(56)
+    ip = struct.pack('!BBHHHBBH4s4s', 0x45, 0, 20 + len(l4), ident & 0xffff, 0, 64, proto, 0,
+                     _ip(src.ip), _ip(dst.ip))
+    return _mac_bytes(dst.mac) + _mac_bytes(src.mac) + struct.pack('!H', 0x0800) + ip + l4
+
+
+def synthetic_trace(topology, count=5000, seed=1, mix=(('tcp', 0.5), ('udp', 0.3), ('icmp', 0.1),
+                                                     ('arp', 0.1))):
+    """
+    Reaktif controller'ın göreceği Packet-In akışı
+
+    Önce her host bir ARP isteği gönderir (konumlar ve IP'ler öğrenilir);
+    ardından rastgele host çiftleri arasında yeni akışların ilk paketleri
+    (her TCP/UDP paketi yeni bir 5-tuple) ve ARP istekleri gelir.
+    """
+    rng = random.Random(seed)
+    hosts = topology.hosts
+    trace = [(h.dpid, h.port, arp_request(h, hosts[(i + 1) % len(hosts)])) for i, h in enumerate(hosts)]
+    kinds, weights = zip(*mix)
+    for i in range(count):
+        src, dst = rng.sample(hosts, 2)
+        kind = rng.choices(kinds, weights)[0]
+        if kind == 'arp':
+            frame = arp_request(src, dst)
+        else:
+            proto = {'tcp': 6, 'udp': 17, 'icmp': 1}[kind]
+            frame = ip_frame(src, dst, proto, rng.randint(1024, 65535), rng.choice((80, 443, 5001)), i)
+        trace.append((src.dpid, src.port, frame))
+    return trace
+
+
+def trace_from_frames(topology, frames):
+    """Kayıtlı frame'ler: ingress noktası kaynak MAC'in host'undan bulunur (bilinmeyenler atlanır)"""
+    locations = {_mac_bytes(h.mac): (h.dpid, h.port) for h in topology.hosts}
+    trace = []
+    for frame in frames:
+        location = locations.get(bytes(frame[6:12]))
+        if location is not None:
+            trace.append(location + (bytes(frame),))
+    return trace
+
+
+def percentile(values, q):
+    """Sıralı listede en yakın sıra yüzdeliği"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+
+class Simulator:
+    """
+    Bir controller'ı sahte switch'lerle topolojiye bağlayıp Packet-In oynatır
+
+    Barrier istekleri olay bitmeden cevaplanır (switch'ler kuralı anında
+    onaylar), async_paths açıksa worker sonuçları da olay bitmeden teslim
+    edilir; bir Packet-In'in gecikmesi handler'ı, yol hesabını ve tetiklediği
+    barrier cevaplarının işlenmesini kapsar. Replay gerçek zamandan hızlı
+    olduğundan admission=False iken Packet-In token bucket'ları gevşetilir.
+    settings controller attribute'larıdır; controller'da olmayan ayar
+    ignore_unknown=False iken hata verir, True iken ignored_settings'e yazılır.
+    """
+
+    def __init__(self, controller_cls, topology, admission=False, keep_messages=False, ignore_unknown=False,
+                 **settings):
+        self.topology = topology
+        self.hub = SimHub()
+        self.hub.install(importlib.import_module('ryu.lib.hub'))
+
+        self.app = controller_cls()
+        self.app.logger.setLevel(logging.WARNING)
+        self.app.clock = self.hub.time  # Proaktif durulma tick'lerle ilerleyen sanal saatle ölçülür
+        self.ignored_settings = []
+        for name, value in settings.items():
+            if not hasattr(self.app, name):
+                if not ignore_unknown:
+                    raise AttributeError(f"{controller_cls.__name__} has no setting '{name}'")
+                self.ignored_settings.append(name)
+                continue
+            setattr(self.app, name, value)
+        if not admission:
+            guard = self.app.packet_guard
+            guard.switch_rate = guard.switch_burst = guard.source_rate = guard.source_burst = 1e12
+        self.hub.run_pending()
+
+        self.datapaths = {dpid: SimDatapath(dpid, keep_messages) for dpid in topology.switches}
+        for dpid, datapath in self.datapaths.items():
+            self.app.switch_features_handler(types.SimpleNamespace(msg=types.SimpleNamespace(datapath=datapath)))
+            ports = [Port(dpid, port_no) for port_no in topology.ports[dpid]]
+            self.app.get_topology_data(types.SimpleNamespace(switch=Switch(datapath, ports)))
+        for src, src_port, dst, dst_port, bw, delay, loss in topology.links:
+            for link in (Link(Port(src, src_port), Port(dst, dst_port)),
+                         Link(Port(dst, dst_port), Port(src, src_port))):
+                self.app.link_add_handler(types.SimpleNamespace(link=link))
+                self.app.links.set(link.src.dpid, link.dst.dpid, bandwidth=bw, capacity=bw,
+                                   delay=delay, loss=loss)
+        self.flush()
+        self.setup_messages = self.message_counts()
+        for datapath in self.datapaths.values():
+            datapath.reset_counters()
+
+    def packet_in(self, dpid, in_port, data, flush=True):
+        """
+        Tek Packet-In'i işle
+
+        flush=False ise barrier'lar cevaplanmaz; kurulum flush() çağrılana kadar
+        yarıda kalır (ilk paket henüz gönderilmemiştir).
+
+        Returns:
+            float: Handler + tetiklenen barrier cevapları süresi (s)
+        """
+        datapath = self.datapaths[dpid]
+        msg = types.SimpleNamespace(datapath=datapath, match=OFPMatch(in_port=in_port), data=data,
+                                    buffer_id=OFPROTO.OFP_NO_BUFFER, reason=OFPROTO.OFPR_NO_MATCH,
+                                    total_len=len(data), table_id=0, cookie=0)
+        start = time.perf_counter()
+        self.app.packet_in_handler(types.SimpleNamespace(msg=msg))
+        if flush:
+            self.flush()
+        return time.perf_counter() - start
+
+    def link_down(self, src, dst):
+        """src <-> dst linkini iki yönde kopar (EventLinkDelete); süreyi döndür"""
+        start = time.perf_counter()
+        for src_port, dst_port, a, b in [(l[1], l[3], l[0], l[2]) for l in self.topology.links
+                                         if {l[0], l[2]} == {src, dst}]:
+            for link in (Link(Port(a, src_port), Port(b, dst_port)), Link(Port(b, dst_port), Port(a, src_port))):
+                self.app.link_delete_handler(types.SimpleNamespace(link=link))
+        self.flush()
+        return time.perf_counter() - start
+
+    def link_up(self, src, dst):
+        """src <-> dst linkini iki yönde yeniden ekle (EventLinkAdd; metrikler controller'a bırakılır)"""
+        for src_port, dst_port, a, b in [(l[1], l[3], l[0], l[2]) for l in self.topology.links
+                                         if {l[0], l[2]} == {src, dst}]:
+            for link in (Link(Port(a, src_port), Port(b, dst_port)), Link(Port(b, dst_port), Port(a, src_port))):
+                self.app.link_add_handler(types.SimpleNamespace(link=link))
+        self.flush()
+
+    def switch_leave(self, dpid):
+        """Switch bağlantısı koptu (EventSwitchLeave)"""
+        ports = [Port(dpid, port_no) for port_no in self.topology.ports[dpid]]
+        self.app.switch_leave_handler(types.SimpleNamespace(switch=Switch(self.datapaths[dpid], ports)))
+        self.flush()
+
+    def port_down(self, dpid, port_no):
+        """Switch portunun linki düştü (OFPPortStatus, OFPPS_LINK_DOWN)"""
+        desc = types.SimpleNamespace(port_no=port_no, state=OFPROTO.OFPPS_LINK_DOWN)
+        msg = types.SimpleNamespace(datapath=self.datapaths[dpid], reason=OFPROTO.OFPPR_MODIFY, desc=desc)
+        self.app.port_status_handler(types.SimpleNamespace(msg=msg))
+        self.flush()
+
+    def expire(self, dpid, priority, match, reason=OFPROTO.OFPRR_IDLE_TIMEOUT):
+        """
+        Switch kuralı zaman aşımıyla kalktı (EventOFPFlowRemoved)
+
+        Simulator(keep_messages=True) gerektirir: cookie kuralı kuran son
+        FlowMod'dan alınır ve kaldırma DataPlane tablolarına da yansır.
+        """
+        datapath = self.datapaths[dpid]
+        key = (priority, frozenset(match.items()))
+        mod = next(msg for msg in reversed(datapath.sent) if msg.name == 'OFPFlowMod'
+                   and (msg.priority, frozenset(msg.match.items())) == key)
+        removed = PARSER.OFPFlowRemoved(datapath=datapath, priority=priority, match=OFPMatch(**match),
+                                        cookie=mod.kwargs.get('cookie', 0), reason=reason)
+        datapath.sent.append(removed)
+        self.app.flow_removed_handler(types.SimpleNamespace(msg=removed))
+        self.flush()
+
+    def flush(self):
+        """Bekleyen barrier'ları cevapla, asenkron yol sonuçlarını teslim et ve spawn edilen task'ları çalıştır"""
+        while True:
+            self.hub.run_pending()
+            pool = self.app.path_pool
+            if pool is not None and len(pool):
+                pool.drain()
+                continue
+            replies = [(datapath, xid) for datapath in self.datapaths.values() for xid in datapath.barriers]
+            if not replies:
+                return
+            for datapath in self.datapaths.values():
+                datapath.barriers = []
+            for datapath, xid in replies:
+                msg = types.SimpleNamespace(datapath=datapath, xid=xid)
+                self.app.barrier_reply_handler(types.SimpleNamespace(msg=msg))
+
+    def follow(self, dpid, in_port, data, down=()):
+        """
+        Paketi controller'ın PacketOut'larını izleyerek hop hop yay
+
+        Switch linkinden çıkan kopya karşı switch'e Packet-In olarak girer
+        (yayın ve bilinmeyen hedef gibi kural kurulmayan paketler için);
+        host portundan çıkan kopya teslim edilir, down'daki (u, v) linklerine
+        çıkan kopyalar kaybolur. Simulator(keep_messages=True) gerektirir.
+
+        Returns:
+            tuple: (kopya alan host'lar, switch başına Packet-In sayısı)
+        """
+        peers = {}
+        for s1, p1, s2, p2, *_ in self.topology.links:
+            peers[(s1, p1)], peers[(s2, p2)] = (s2, p2), (s1, p1)
+        hosts = {(host.dpid, host.port): host for host in self.topology.hosts}
+        down = [set(link) for link in down]
+
+        delivered, packet_ins = [], Counter()
+        queue = deque([(dpid, in_port)])
+        while queue:
+            dpid, in_port = queue.popleft()
+            packet_ins[dpid] += 1
+            if sum(packet_ins.values()) > 4 * len(self.topology.links) + 1:
+                raise RuntimeError(f"Broadcast loop: {dict(packet_ins)}")
+            datapath = self.datapaths[dpid]
+            sent = len(datapath.sent)
+            self.packet_in(dpid, in_port, data)
+            for msg in datapath.sent[sent:]:
+                if msg.name != 'OFPPacketOut':
+                    continue
+                for action in msg.kwargs['actions']:
+                    port = action.args[0]
+                    if (dpid, port) in hosts:
+                        delivered.append(hosts[(dpid, port)])
+                    elif {dpid, peers[(dpid, port)][0]} not in down:
+                        queue.append(peers[(dpid, port)])
+        return delivered, packet_ins
+
+    def learn_hosts(self):
+        """Her host bir ARP isteği gönderir (controller konumları öğrenir)"""
+        hosts = self.topology.hosts
+        for i, host in enumerate(hosts):
+            self.packet_in(host.dpid, host.port, arp_request(host, hosts[(i + 1) % len(hosts)]))
+
+    def advance(self, seconds):
+        """Sanal saati saniye saniye ilerletip controller döngülerini çalıştır"""
+        for _ in range(int(seconds)):
+            self.hub.tick()
+            self.flush()
+
+    def first_packets(self, pairs):
+        """
+        Her (src, dst) host çiftinin ilk paketini veri düzleminde gönder
+
+        Simulator(keep_messages=True) gerektirir. Paket kaynağın switch'inde
+        table-miss'e düşerse Packet-In işlenir (kural kurulur) ve paket
+        yeniden yürütülür; ilk paket gecikmesi Packet-In işleme süresidir.
+
+        Returns:
+            dict: Packet-In sayısı, ilk paket gecikmesi (ms) ve teslim edilemeyen çiftler
+        """
+        data_plane = DataPlane(self)
+        packet_ins = 0
+        latencies = []
+        undelivered = []
+        for n, (src, dst) in enumerate(pairs):
+            latency = 0.0
+            walk = data_plane.send(src, dst)
+            if walk.controller:
+                packet_ins += 1
+                latency = self.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, n))
+                walk = data_plane.send(src, dst)
+            if walk.controller or (dst, ()) not in walk.delivered:
+                undelivered.append((src, dst))
+            latencies.append(latency * 1000)
+        latencies.sort()
+        return {
+            'packet_ins': packet_ins,
+            'latency_ms': {
+                'mean': sum(latencies) / len(latencies) if latencies else 0,
+                'p50': percentile(latencies, 50),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else 0
+            },
+            'undelivered': undelivered
+        }
+
+    def message_counts(self):
+        counts = Counter()
+        for datapath in self.datapaths.values():
+            counts.update(datapath.counts)
+        return counts
+
+    def replay(self, trace, tick_every=0):
+        """
+        Packet-In akışını oynat
+
+        Args:
+            tick_every: > 0 ise her tick_every olayda hub döngüleri
+                        (monitor, probe, proaktif senkron) bir tur çalışır
+
+        Returns:
+            dict: Packet-In/s, gecikme yüzdelikleri (ms) ve gönderilen mesajlar
+        """
+        latencies = []
+        start = time.perf_counter()
+        for i, (dpid, in_port, data) in enumerate(trace):
+            latencies.append(self.packet_in(dpid, in_port, data))
+            if tick_every and (i + 1) % tick_every == 0:
+                self.hub.tick()
+                self.flush()
+        wall = time.perf_counter() - start
+
+        busy = sum(latencies)
+        latencies.sort()
+        counts = self.message_counts()
+        flow_mods = Counter()
+        for datapath in self.datapaths.values():
+            flow_mods.update(datapath.flow_mod_commands)
+        ms = [latency * 1000 for latency in latencies]
+        return {
+            'controller': type(self.app).__name__,
+            'topology': self.topology.name,
+            'packet_ins': len(trace),
+            'busy_time_s': busy,
+            'wall_time_s': wall,
+            'packet_in_per_sec': len(trace) / busy if busy > 0 else 0,
+            'latency_ms': {
+                'mean': sum(ms) / len(ms) if ms else 0,
+                'p50': percentile(ms, 50),
+                'p90': percentile(ms, 90),
+                'p99': percentile(ms, 99),
+                'max': ms[-1] if ms else 0
+            },
+            'flow_mods': counts['OFPFlowMod'],
+            'flow_mods_added': flow_mods[OFPROTO.OFPFC_ADD],
+            'flow_mods_deleted': flow_mods[OFPROTO.OFPFC_DELETE] + flow_mods[OFPROTO.OFPFC_DELETE_STRICT],
+            'flow_mods_per_packet_in': counts['OFPFlowMod'] / len(trace) if trace else 0,
+            'group_mods': counts['OFPGroupMod'],
+            'packet_outs': counts['OFPPacketOut'],
+            'barriers': counts['OFPBarrierRequest'],
+            'messages': dict(counts),
+            'controller_stats': self.app.get_statistics()
+        }
+
+
+Walk = namedtuple('Walk', 'delivered controller dropped ambiguous max_tags loop')
+
+
+class DataPlane:
+    """
+    Kaydedilen FlowMod/GroupMod'lardan switch tablolarını kurup paketi topolojide yürütür
+
+    Simulator(keep_messages=True) gerektirir. Her switch'te eşleşen en
+    yüksek öncelikli kural uygulanır; aynı öncelikte farklı aksiyonlu birden
+    fazla kural eşleşirse (OpenFlow'da seçim tanımsız) switch ambiguous'a
+    yazılır ve her aday ayrı kopya olarak izlenir. VLAN etiketleri yığın
+    olarak tutulur; max_tags paketin taşıdığı en fazla etiket sayısıdır.
+    """
+
+    MAX_HOPS = 64
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+        self.peers = {}  # (dpid, port) -> karşı uç (dpid, port)
+        for src, src_port, dst, dst_port, *_ in simulator.topology.links:
+            self.peers[(src, src_port)] = (dst, dst_port)
+            self.peers[(dst, dst_port)] = (src, src_port)
+        self.hosts = {(h.dpid, h.port): h for h in simulator.topology.hosts}
+        self.down = set()  # Kopmuş (dpid, port) uçları (FF grupları canlı bucket seçer)
+
+    def link_down(self, src, dst):
+        """Linki sadece veri düzleminde kopar (controller'a olay gönderilmez)"""
+        for (a, port), (b, _) in self.peers.items():
+            if {a, b} == {src, dst}:
+                self.down.add((a, port))
+
+    def tables(self):
+        """dpid -> (flow tablosu {(priority, match): actions}, grup tablosu {group_id: (tip, bucket'lar)})"""
+        tables = {}
+        for dpid, datapath in self.simulator.datapaths.items():
+            if not datapath.keep_messages:
+                raise ValueError("DataPlane needs a Simulator created with keep_messages=True")
+            flows, groups = {}, {}
+            for msg in datapath.sent:
+                if msg.name == 'OFPFlowMod':
+                    self._flow_mod(flows, msg)
+                elif msg.name == 'OFPFlowRemoved':
+                    flows.pop((msg.priority, frozenset(msg.match.items())), None)
+                elif msg.name == 'OFPGroupMod':
+                    self._group_mod(groups, msg)
+            tables[dpid] = (flows, groups)
+        return tables
+
+    @staticmethod
+    def _flow_mod(flows, msg):
+        command = msg.kwargs.get('command', OFPROTO.OFPFC_ADD)
+        if command == OFPROTO.OFPFC_DELETE:
+            # Non-strict silme önceliğe bakmaz, match'i kapsayan tüm kuralları siler
+            fields = set(msg.match.items())
+            for stale in [k for k in flows if fields <= k[1]]:
+                del flows[stale]
+            return
+        key = (msg.priority, frozenset(msg.match.items()))
+        if command == OFPROTO.OFPFC_DELETE_STRICT:
+            flows.pop(key, None)
+        else:
+            flows[key] = [action for inst in msg.instructions if inst.name == 'OFPInstructionActions'
+                          for action in inst.args[1]]
+
+    @staticmethod
+    def _group_mod(groups, msg):
+        command, group_type, group_id = msg.args[1:4]
+        if command == OFPROTO.OFPGC_DELETE:
+            if group_id == OFPROTO.OFPG_ALL:
+                groups.clear()
+            else:
+                groups.pop(group_id, None)
+        else:
+            groups[group_id] = (group_type, msg.args[4])
+
+    @staticmethod
+    def _matches(match, packet):
+        for name, value in match:
+            if name == 'vlan_vid':
+                tags = packet['vlan']
+                if value == OFPROTO.OFPVID_NONE:
+                    if tags:
+                        return False
+                elif not tags or tags[-1] | OFPROTO.OFPVID_PRESENT != value:
+                    return False
+            elif packet.get(name) != value:
+                return False
+        return True
+
+    def conflicts(self):
+        """
+        Aynı öncelikte çakışan (ortak alanları eşit) ama farklı aksiyonlu kural çiftleri
+
+        Returns:
+            list: [(dpid, priority, match, diğer match)]
+        """
+        found = []
+        for dpid, (flows, _) in self.tables().items():
+            rules = sorted(flows.items(), key=lambda item: item[0][0])
+            for i, ((priority, match), actions) in enumerate(rules):
+                for (other_priority, other), other_actions in rules[i + 1:]:
+                    if other_priority != priority or repr(actions) == repr(other_actions):
+                        continue
+                    fields, other_fields = dict(match), dict(other)
+                    if all(fields[name] == other_fields[name] for name in fields.keys() & other_fields.keys()):
+                        found.append((dpid, priority, fields, other_fields))
+        return found
+
+    def send(self, src, dst, **fields):
+        """src host'undan dst host'una (eth_src/eth_dst + fields) paketini yürüt"""
+        return self.forward(src.dpid, src.port, eth_src=src.mac, eth_dst=dst.mac, **fields)
+
+    def forward(self, dpid, in_port, **fields):
+        """
+        Paketi (dpid, in_port)'tan başlatıp kurallara göre ilerlet
+
+        Returns:
+            Walk: teslim edilen (host, etiketler), Packet-In üreten ve paketi
+                  düşüren switch'ler, belirsiz eşleşmeler, en fazla etiket
+                  sayısı ve döngü (MAX_HOPS aşıldı) bilgisi
+        """
+        tables = self.tables()
+        walk = {'delivered': [], 'controller': [], 'dropped': [], 'ambiguous': [], 'max_tags': 0,
+                'loop': False}
+        queue = [(dpid, in_port, dict(fields, vlan=[]), 0)]
+        while queue:
+            dpid, in_port, packet, hops = queue.pop(0)
+            if hops > self.MAX_HOPS:
+                walk['loop'] = True
+                continue
+            flows, groups = tables[dpid]
+            packet['in_port'] = in_port
+            matched = [(key[0], actions) for key, actions in flows.items() if self._matches(key[1], packet)]
+            if not matched:
+                walk['controller'].append(dpid)  # Table-miss
+                continue
+            top = max(priority for priority, _ in matched)
+            candidates = {repr(actions): actions for priority, actions in matched if priority == top}
+            if len(candidates) > 1:
+                walk['ambiguous'].append(dpid)
+            for actions in candidates.values():
+                copy = dict(packet, vlan=list(packet['vlan']))
+                for port, out in self._apply(actions, copy, groups, dpid, walk):
+                    if port == OFPROTO.OFPP_IN_PORT:
+                        port = in_port
+                    if port == OFPROTO.OFPP_CONTROLLER:
+                        walk['controller'].append(dpid)
+                    elif (dpid, port) in self.down:
+                        walk['dropped'].append(dpid)
+                    elif (dpid, port) in self.hosts:
+                        walk['delivered'].append((self.hosts[(dpid, port)], tuple(out['vlan'])))
+                    elif (dpid, port) in self.peers:
+                        queue.append(self.peers[(dpid, port)] + (out, hops + 1))
+                    else:
+                        walk['dropped'].append(dpid)
+        return Walk(**walk)
+
+    def _apply(self, actions, packet, groups, dpid, walk):
+        """Aksiyon listesini uygula; [(çıkış portu, paket kopyası)]"""
+        outputs = []
+        for action in actions:
+            if action.name == 'OFPActionPushVlan':
+                packet['vlan'].append(0)
+            elif action.name == 'OFPActionPopVlan':
+                packet['vlan'].pop()
+            elif action.name == 'OFPActionSetField':
+                for name, value in action.kwargs.items():
+                    if name == 'vlan_vid':
+                        packet['vlan'][-1] = value & ~OFPROTO.OFPVID_PRESENT
+                    else:
+                        packet[name] = value
+            elif action.name == 'OFPActionOutput':
+                outputs.append((action.args[0], dict(packet, vlan=list(packet['vlan']))))
+            elif action.name == 'OFPActionGroup':
+                for bucket in self._buckets(groups.get(action.args[0]), packet, dpid):
+                    copy = dict(packet, vlan=list(packet['vlan']))
+                    outputs.extend(self._apply(bucket.actions, copy, groups, dpid, walk))
+            walk['max_tags'] = max(walk['max_tags'], len(packet['vlan']))
+        return outputs
+
+    def _buckets(self, group, packet, dpid):
+        """Grup tipine göre uygulanacak bucket'lar (FF: ilk canlı, SELECT: akış hash'i, ALL: hepsi)"""
+        if group is None:
+            return []
+        group_type, buckets = group
+        live = [b for b in buckets if (dpid, b.kwargs.get('watch_port', OFPROTO.OFPP_ANY)) not in self.down]
+        if group_type == OFPROTO.OFPGT_FF:
+            return live[:1]
+        if group_type == OFPROTO.OFPGT_SELECT:
+            live = [b for b in live if b.kwargs.get('weight', 1) > 0]
+            key = repr(sorted((k, v) for k, v in packet.items() if k not in ('vlan', 'in_port')))
+            return [live[zlib.crc32(key.encode()) % len(live)]] if live else []
+        return live
+
+
+def print_result(result):
+    latency = result['latency_ms']
+    print(f"\n[{result['controller']}] {result['topology']}: {result['packet_ins']} Packet-Ins")
+    print(f"  Throughput:   {result['packet_in_per_sec']:10.0f} Packet-In/s "
+          f"(busy {result['busy_time_s'] * 1000:.1f} ms)")
+    print(f"  Latency (ms): p50 {latency['p50']:.3f}  p90 {latency['p90']:.3f}  "
+          f"p99 {latency['p99']:.3f}  max {latency['max']:.3f}")
+    print(f"  FlowMods:     {result['flow_mods']} ({result['flow_mods_per_packet_in']:.2f}/Packet-In), "
+          f"GroupMods {result['group_mods']}, PacketOuts {result['packet_outs']}, "
+          f"barriers {result['barriers']}")
+
+
+def print_first_packets(result, pairs):
+    latency = result['latency_ms']
+    print(f"\n[{result['controller']}] {result['topology']}: {result['packet_ins']} Packet-Ins "
+          f"for the first packets of {pairs} host pairs ({len(result['undelivered'])} undelivered)")
+    print(f"  First-packet latency (ms): mean {latency['mean']:.3f}  p50 {latency['p50']:.3f}  "
+          f"p99 {latency['p99']:.3f}  max {latency['max']:.3f}")
+
+
+def _setting(text):
+    """--set name=value (value Python literal'i veya düz metin)"""
+    name, _, value = text.partition('=')
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def main():
+    """Ana simülasyon fonksiyonu"""
+    parser = argparse.ArgumentParser(description='Replay Packet-In traces against SDN controllers offline')
+    parser.add_argument('--topology', default='complex',
+                        help=f"{', '.join(TOPOLOGIES)} or a JSON topology file")
+    parser.add_argument('--controllers', default=','.join(CONTROLLERS),
+                        help='comma separated controller names')
+    parser.add_argument('--packets', type=int, default=5000, help='synthetic Packet-In count')
+    parser.add_argument('--pcap', help='replay frames recorded on the hosts instead of synthetic traffic')
+    parser.add_argument('--workload', help='replay a compiled workload trace (workload_trace.py)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--tick-every', type=int, default=0,
+                        help='run controller loops (monitor/probe) every N Packet-Ins')
+    parser.add_argument('--set', action='append', default=[], type=_setting, metavar='NAME=VALUE',
+                        help='controller attribute, e.g. forwarding_mode=label or multipath=True')
+    parser.add_argument('--first-packets', action='store_true',
+                        help='send the first packet of every host pair through the installed rules '
+                             '(compare with --set proactive=True)')
+    parser.add_argument('--admission', action='store_true', help='keep Packet-In rate limiting enabled')
+    parser.add_argument('--output', help='write results as JSON')
+    args = parser.parse_args()
+
+    real_ryu = install_ryu_standins()
+    topology = SimTopology.load(args.topology)
+    if args.pcap:
+        trace = trace_from_frames(topology, read_pcap(args.pcap))
+    elif args.workload:
+        from workload_trace import WorkloadTrace
+        trace = trace_from_frames(topology, (frame for _, _, frame in WorkloadTrace(args.workload).frames()))
+    else:
+        trace = synthetic_trace(topology, args.packets, args.seed)
+    print(f"Topology {topology.name}: {len(topology.switches)} switches, {len(topology.links)} links, "
+          f"{len(topology.hosts)} hosts; {len(trace)} Packet-Ins "
+          f"({'ryu' if real_ryu else 'built-in ryu stand-ins'})")
+
+    results = []
+    for name in args.controllers.split(','):
+        # --set her controller'a ayrı uygulanır: ayarı olmayan controller (örn. multipath
+        # sadece load_balancing'de) uyarıyla ayarsız çalışır
+        simulator = Simulator(load_controller(name), topology, admission=args.admission,
+                              keep_messages=args.first_packets, ignore_unknown=True, **dict(args.set))
+        for setting in simulator.ignored_settings:
+            print(f"Warning: {type(simulator.app).__name__} has no setting '{setting}', running without it")
+        if args.first_packets:
+            simulator.learn_hosts()
+            simulator.advance(simulator.app.proactive_settle_time + 1)
+            pairs = [(src, dst) for src in topology.hosts for dst in topology.hosts if src != dst]
+            result = dict(simulator.first_packets(pairs), controller=name, topology=topology.name)
+            print_first_packets(result, len(pairs))
+        else:
+            result = simulator.replay(trace, args.tick_every)
+            print_result(result)
+        results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+"""
+Ortak test verileri - benchmark, simulator ve pytest testlerinin
+kullandığı topoloji link listeleri, graf kurucu, referans (brute force)
+yol seçimi ve pcap okuyucu
+"""
+
+import random
+import struct
+
+import networkx as nx
+
+
+# SimpleTopology switch'ler arası linkleri: (s1, s2, bw, delay, loss)
+SIMPLE_LINKS = [
+    (1, 2, 50, 10, 0), (1, 3, 30, 15, 0), (1, 4, 20, 20, 0),
+    (2, 4, 40, 12, 0), (3, 4, 35, 18, 0), (2, 3, 25, 25, 0),
+]
+
+# ComplexTopology switch'ler arası linkleri: (s1, s2, bw, delay, loss)
+COMPLEX_LINKS = [
+    (1, 2, 100, 5, 0), (3, 4, 100, 5, 0), (5, 6, 100, 5, 0), (7, 8, 100, 5, 0),
+    (1, 3, 50, 10, 0), (2, 4, 50, 10, 0), (3, 5, 50, 10, 0),
+    (4, 6, 50, 10, 0), (5, 7, 50, 10, 0), (6, 8, 50, 10, 0),
+    (1, 4, 30, 20, 1), (2, 3, 30, 20, 1), (3, 6, 30, 20, 1),
+    (4, 5, 30, 20, 1), (5, 8, 30, 20, 1), (6, 7, 30, 20, 1),
+]
+
+# 3x3 ızgara (eşit maliyetli yollar bol): s1 s2 s3 / s4 s5 s6 / s7 s8 s9
+GRID_LINKS = [(1, 2, 100, 1, 0), (2, 3, 100, 1, 0), (4, 5, 100, 1, 0), (5, 6, 100, 1, 0),
+              (7, 8, 100, 1, 0), (8, 9, 100, 1, 0), (1, 4, 100, 1, 0), (4, 7, 100, 1, 0),
+              (2, 5, 100, 1, 0), (5, 8, 100, 1, 0), (3, 6, 100, 1, 0), (6, 9, 100, 1, 0)]
+
+
+def build_graph(links):
+    """Link listesinden controller'ların kullandığı çift yönlü DiGraph üret"""
+    net = nx.DiGraph()
+    ports = {}
+    for src, dst, bw, delay, loss in links:
+        for u, v in ((src, dst), (dst, src)):
+            ports[u] = ports.get(u, 1) + 1
+            net.add_edge(u, v, port=ports[u], bandwidth=bw, delay=delay, loss=loss, weight=0)
+    return net
+
+
+def fat_tree_links(k=4, seed=1):
+    """k-ary fat-tree switch linkleri (core, aggregation, edge katmanları)"""
+    rng = random.Random(seed)
+    half = k // 2
+    core = list(range(1, half * half + 1))
+    links = []
+    next_id = len(core) + 1
+    for pod in range(k):
+        aggs = list(range(next_id, next_id + half))
+        edges = list(range(next_id + half, next_id + k))
+        next_id += k
+        for i, agg in enumerate(aggs):
+            for edge in edges:
+                links.append((agg, edge, rng.choice([50, 100]), rng.randint(1, 5), 0))
+            for j in range(half):
+                links.append((agg, core[i * half + j], rng.choice([40, 100]),
+                              rng.randint(2, 10), rng.choice([0, 0, 1])))
+    return links
+
+
+def mesh_links(n=6, chords=10, seed=1):
+    """n x n grid + rastgele kısayol linkleri içeren mesh topolojisi"""
+    rng = random.Random(seed)
+    node = lambda r, c: r * n + c + 1
+    pairs = set()
+    for r in range(n):
+        for c in range(n):
+            if c + 1 < n:
+                pairs.add((node(r, c), node(r, c + 1)))
+            if r + 1 < n:
+                pairs.add((node(r, c), node(r + 1, c)))
+    while chords > 0:
+        u, v = rng.sample(range(1, n * n + 1), 2)
+        if (u, v) not in pairs and (v, u) not in pairs:
+            pairs.add((u, v))
+            chords -= 1
+    return [(u, v, rng.choice([30, 50, 100]), rng.choice([5, 10, 20]), rng.choice([0, 0, 1]))
+            for u, v in sorted(pairs)]
+
+
+def path_qos(net, path):
+    """QoSController.calculate_path_qos eşdeğeri"""
+    qos = {'delay': 0, 'bandwidth': float('inf'), 'loss': 0}
+    for i in range(len(path) - 1):
+        data = net[path[i]][path[i+1]]
+        qos['delay'] += data['delay']
+        qos['bandwidth'] = min(qos['bandwidth'], data['bandwidth'])
+        qos['loss'] += data['loss']
+    return qos
+
+
+def qos_score(qos):
+    """QoSController.calculate_qos_score eşdeğeri"""
+    return (1 / (1 + qos['delay'] / 100) + qos['bandwidth'] / 100 + 1 / (1 + qos['loss'])) / 3
+
+
+def path_load(net, path):
+    return sum(net[path[i]][path[i+1]]['load'] for i in range(len(path) - 1))
+
+
+def brute_force_path(net, src, dst, mode, cutoff=5):
+    """Eski all_simple_paths tabanlı seçim (referans)"""
+    all_paths = list(nx.all_simple_paths(net, src, dst, cutoff=cutoff))
+    if not all_paths:
+        return None
+    if mode == 'load':
+        return min(all_paths, key=lambda p: path_load(net, p))
+    if mode == 'low_latency':
+        return min(all_paths, key=lambda p: path_qos(net, p)['delay'])
+    if mode == 'high_bandwidth':
+        return max(all_paths, key=lambda p: path_qos(net, p)['bandwidth'])
+    return max(all_paths, key=lambda p: qos_score(path_qos(net, p)))
+
+
+def engine_path(engine, src, dst, mode):
+    """Controller'ların RoutingEngine kullanımı ile aynı seçim"""
+    net = engine.net
+    if mode == 'load':
+        return engine.dijkstra_path(src, dst, 'load')
+    if mode == 'low_latency':
+        return engine.constrained_shortest_path(src, dst, 'delay')
+    if mode == 'high_bandwidth':
+        return engine.widest_path(src, dst, 'bandwidth')
+    return engine.best_scored_path(
+        src, dst, qos_score,
+        additive={'delay': 'delay', 'loss': 'loss'}, bottleneck={'bandwidth': 'bandwidth'})
+
+
+def path_objective(net, path, mode):
+    if mode == 'load':
+        return path_load(net, path)
+    qos = path_qos(net, path)
+    if mode == 'balanced':
+        return round(qos_score(qos), 9)
+    return qos['delay'] if mode == 'low_latency' else qos['bandwidth']
+
+
+ROUTING_MODES = ('load', 'low_latency', 'high_bandwidth', 'balanced')
+
+
+def read_pcap(path, limit=None):
+    """libpcap (Ethernet) dosyasından kayıtlı frame'leri oku"""
+    frames = []
+    with open(path, 'rb') as f:
+        header = f.read(24)
+        magic = header[:4]
+        if magic in (b'\xd4\xc3\xb2\xa1', b'\x4d\x3c\xb2\xa1'):
+            endian = '<'
+        elif magic in (b'\xa1\xb2\xc3\xd4', b'\xa1\xb2\x3c\x4d'):
+            endian = '>'
+        else:
+            raise ValueError(f"Not a pcap file: {path}")
+        record = struct.Struct(endian + 'IIII')
+        while limit is None or len(frames) < limit:
+            rec = f.read(record.size)
+            if len(rec) < record.size:
+                break
+            incl_len = record.unpack(rec)[2]
+            frames.append(f.read(incl_len))
+    return frames
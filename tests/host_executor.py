@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Host Executor - Test host'larında komut çalıştırma arka uçları
+PerformanceTest ölçüm komutlarını (ping, iperf3, probe_stream.py) host adı
+ile çalıştırır; host'lar çalışan bir Mininet ağındaki node'lar, yerel network
+namespace'leri veya (ikisi de yoksa) çıktıyı modelden üreten stub olabilir
+"""
+
+import json
+import random
+import re
+import subprocess
+import time
+
+
+class HostExecutor:
+    """
+    Arka uç arayüzü
+
+    popen() communicate(timeout)/returncode/terminate() sunan bir süreç
+    döndürür; çıktı metin (universal_newlines) olarak okunur.
+    """
+
+    name = 'base'
+
+    def popen(self, host, args):
+        raise NotImplementedError
+
+    def ip(self, host):
+        raise NotImplementedError
+
+    def set_link(self, node1, node2, status):
+        """node1-node2 linkini 'up' / 'down' yap"""
+        raise NotImplementedError
+
+
+class MininetExecutor(HostExecutor):
+    """Çalışan Mininet ağındaki host'lar (host.popen, net.configLinkStatus)"""
+
+    name = 'mininet'
+
+    def __init__(self, net):
+        self.net = net
+
+    def popen(self, host, args):
+        return self.net.get(host).popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                        universal_newlines=True)
+
+    def ip(self, host):
+        return self.net.get(host).IP()
+
+    def set_link(self, node1, node2, status):
+        self.net.configLinkStatus(node1, node2, status)
+
+
+class NamespaceExecutor(HostExecutor):
+    """
+    Yerel network namespace'leri (ip netns exec)
+
+    Args:
+        namespaces: {host: namespace} (verilmeyen host'un namespace'i kendi adıdır)
+        links: {'s1-s2': [arayüz, ...]} - linki kapatmak için root
+               namespace'te down/up yapılacak arayüzler
+    """
+
+    name = 'netns'
+
+    def __init__(self, namespaces=None, links=None):
+        self.namespaces = namespaces or {}
+        self.links = links or {}
+        self.addresses = {}
+
+    @staticmethod
+    def available(hosts):
+        """Tüm host'lar için namespace tanımlı mı"""
+        try:
+            output = subprocess.run(['ip', 'netns', 'list'], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, universal_newlines=True).stdout
+        except OSError:
+            return False
+        existing = {line.split()[0] for line in output.splitlines() if line.strip()}
+        return bool(hosts) and set(hosts) <= existing
+
+    def popen(self, host, args):
+        return subprocess.Popen(['ip', 'netns', 'exec', self.namespaces.get(host, host)] + list(args),
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True)
+
+    def ip(self, host):
+        if host not in self.addresses:
+            output = subprocess.run(['ip', '-n', self.namespaces.get(host, host), '-4', '-o', 'addr', 'show'],
+                                    stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+            addresses = [a for a in re.findall(r'inet (\d+\.\d+\.\d+\.\d+)', output)
+                         if not a.startswith('127.')]
+            if not addresses:
+                raise ValueError(f"No IPv4 address in namespace of {host}")
+            self.addresses[host] = addresses[0]
+        return self.addresses[host]
+
+    def set_link(self, node1, node2, status):
+        interfaces = self.links.get(f'{node1}-{node2}') or self.links.get(f'{node2}-{node1}')
+        if not interfaces:
+            raise ValueError(f"No interfaces configured for link {node1}-{node2}")
+        for interface in interfaces:
+            subprocess.run(['ip', 'link', 'set', 'dev', interface, status], check=True)
+
+
+class StubProcess:
+    """Çıktısı communicate() anında üretilen süreç"""
+
+    def __init__(self, produce):
+        self.produce = produce
+        self.returncode = None
+
+    def communicate(self, timeout=None):
+        self.returncode = 0
+        return self.produce(), ''
+
+    def wait(self, timeout=None):
+        self.returncode = 0
+        return 0
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+
+    kill = terminate
+
+
+def _options(args):
+    """'-c 10 -i 0.2 -u' gibi argümanlardan {bayrak: değer veya True}"""
+    options = {}
+    args = list(args)
+    for i, arg in enumerate(args):
+        if arg.startswith('-'):
+            value = args[i + 1] if i + 1 < len(args) and not args[i + 1].startswith('-') else True
+            options[arg] = value
+    return options
+
+
+def _rate(text):
+    """iperf3 -b değeri (100M, 1G, 500K) -> bit/s"""
+    units = {'K': 1e3, 'M': 1e6, 'G': 1e9}
+    text = str(text)
+    if text[-1:].upper() in units:
+        return float(text[:-1]) * units[text[-1].upper()]
+    return float(text)
+
+
+class StubExecutor(HostExecutor):
+    """
+    Mininet/namespace olmadan ölçüm hattını çalıştırmak için model
+
+    ping, iperf3 ve probe_stream.py komutlarına gerçek araçlarla aynı
+    formatta çıktı üretir (ping metni, iperf3 -J JSON'u, alım kaydı);
+    böylece ayrıştırma ve raporlama aynı kod yolundan geçer. Değerler
+    sentetiktir. Kapatılan link, probe'larda outage saniyelik bir kayıp
+    aralığı oluşturur.
+    """
+
+    name = 'stub'
+
+    def __init__(self, rtt_ms=10.0, jitter_ms=1.0, loss=0.0, bandwidth_mbps=100.0, outage=0.05, seed=None):
+        self.rtt_ms = rtt_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss  # 0-1
+        self.bandwidth_mbps = bandwidth_mbps
+        self.outage = outage  # s
+        self.rng = random.Random(seed)
+        self.link_downs = []  # [link, kapatma zamanı, açılma zamanı veya None]
+        self.probe_streams = []  # (port, rate, count, başlangıç, başlangıç ns)
+
+    def ip(self, host):
+        index = int(re.sub(r'\D', '', host) or 0)
+        return f'10.0.0.{index}'
+
+    def set_link(self, node1, node2, status):
+        now = time.monotonic()
+        if status == 'down':
+            self.link_downs.append([(node1, node2), now, None])
+            return
+        for down in self.link_downs:
+            if down[0] == (node1, node2) and down[2] is None:
+                down[2] = now
+
+    def popen(self, host, args):
+        started = time.monotonic()
+        if args[0] == 'ping':
+            return StubProcess(lambda: self._ping(args, started))
+        if args[0] == 'iperf3':
+            return StubProcess(lambda: self._iperf3(args))
+        if len(args) > 2 and args[1].endswith('probe_stream.py'):
+            return StubProcess(lambda: self._probe_stream(args, started))
+        raise ValueError(f"Stub executor cannot run {args[0]}")
+
+    def _lost(self, sent, started):
+        """sent anında gönderilen paket kapatılan linkte kayboldu mu"""
+        # Link açıldıktan sonra başlayan akış o kesintiden etkilenmez
+        return any(down <= sent < down + self.outage and (up is None or started < up)
+                   for _, down, up in self.link_downs)
+
+    def _probe_stream(self, args, started):
+        """probe_stream.py send/recv: alıcı, kendi portuna başlatılan akışların kaydını üretir"""
+        options = _options(args[3:])
+        port = int(options.get('--port', 9000))
+        if args[2] == 'send':
+            rate, count = float(options['--rate']), int(options['--count'])
+            start_ns = time.time_ns() - int((time.monotonic() - started) * 1e9)
+            self.probe_streams.append((port, rate, count, started, start_ns))
+            return f'sent {count} {start_ns} {start_ns + int((count - 1) * 1e9 / rate)}\n'
+
+        lines = []
+        for stream_port, rate, count, stream_started, start_ns in self.probe_streams:
+            if stream_port != port:
+                continue
+            interval = 1 / rate
+            for seq in range(count):
+                if self._lost(stream_started + seq * interval, stream_started) or self.rng.random() < self.loss:
+                    continue
+                send_ns = start_ns + int(seq * interval * 1e9)
+                delay = max(0.01, self.rng.gauss(self.rtt_ms / 2, self.jitter_ms / 2))
+                lines.append(f'{seq} {send_ns} {send_ns + int(delay * 1e6)}\n')
+        self.probe_streams = [s for s in self.probe_streams if s[0] != port]
+        return ''.join(lines)
+
+    def _ping(self, args, started):
+        options = _options(args)
+        count = int(options.get('-c', 4))
+        interval = float(options.get('-i', 1))
+        target = args[-1]
+
+        lines = [f'PING {target} ({target}) 56(84) bytes of data.']
+        rtts = []
+        for seq in range(1, count + 1):
+            sent = started + (seq - 1) * interval
+            if self._lost(sent, started):
+                continue
+            if self.rng.random() < self.loss:
+                continue
+            rtt = max(0.01, self.rng.gauss(self.rtt_ms, self.jitter_ms))
+            rtts.append(rtt)
+            lines.append(f'64 bytes from {target}: icmp_seq={seq} ttl=64 time={rtt:.3f} ms')
+
+        lines += ['', f'--- {target} ping statistics ---',
+                  f'{count} packets transmitted, {len(rtts)} received, '
+                  f'{100 * (count - len(rtts)) / count:g}% packet loss, time {int(count * interval * 1000)}ms']
+        if rtts:
+            avg = sum(rtts) / len(rtts)
+            mdev = (sum((r - avg) ** 2 for r in rtts) / len(rtts)) ** 0.5
+            lines.append(f'rtt min/avg/max/mdev = {min(rtts):.3f}/{avg:.3f}/{max(rtts):.3f}/{mdev:.3f} ms')
+        return '\n'.join(lines) + '\n'
+
+    def _iperf3(self, args):
+        options = _options(args)
+        if '-s' in options:
+            return ''
+        duration = float(options.get('-t', 10))
+        if '-u' in options:
+            offered = _rate(options.get('-b', '1M'))
+            rate = min(offered, self.bandwidth_mbps * 1e6)
+            packets = int(offered * duration / (8 * 1470))
+            lost = int(packets * max(self.loss, 1 - rate / offered))
+            summary = {'sum': {'seconds': duration, 'bytes': int(rate * duration / 8),
+                               'bits_per_second': rate, 'jitter_ms': self.jitter_ms / 10,
+                               'lost_packets': lost, 'packets': packets,
+                               'lost_percent': 100 * lost / packets if packets else 0}}
+        else:
+            rate = self.bandwidth_mbps * 1e6 * self.rng.uniform(0.9, 0.97)
+            summary = {'sum_sent': {'seconds': duration, 'bytes': int(rate * duration / 8),
+                                    'bits_per_second': rate, 'retransmits': 0},
+                       'sum_received': {'seconds': duration, 'bytes': int(rate * duration / 8),
+                                        'bits_per_second': rate}}
+        return json.dumps({'start': {'test_start': {'protocol': 'UDP' if '-u' in options else 'TCP',
+                                                    'duration': duration}},
+                           'intervals': [], 'end': summary})
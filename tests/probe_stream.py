@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Probe Stream - Sıra numaralı UDP probe akışı ve kesinti (gap) analizi
+Gönderici sabit hızda (varsayılan 1 kpps) sıra numarası ve gönderim zamanı
+taşıyan paketler yollar; alıcı her paketi kernel zaman damgasıyla
+(SO_TIMESTAMPNS) kaydeder. Alım kaydından kesinti penceresi, kayıp sıra
+numaraları ve sıra bozulması hesaplanır. Mininet host'ları aynı saati
+paylaştığından zaman damgaları controller olaylarıyla karşılaştırılabilir.
+
+Kullanım (host üzerinde):
+    python3 probe_stream.py recv --port 9000 --duration 5
+    python3 probe_stream.py send --dst 10.0.0.2 --port 9000 --rate 1000 --count 4000
+"""
+
+import argparse
+import select
+import socket
+import struct
+import sys
+import time
+
+PROBE_PORT = 9000
+MAGIC = 0x50524f42  # 'PROB'
+HEADER = struct.Struct('!IIQQ')  # magic, stream, seq, gönderim zamanı (ns, CLOCK_REALTIME)
+SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
+TIMESPEC = struct.Struct('qq')
+SPIN_NS = 200000  # Son 200 µs meşgul beklenir (time.sleep çözünürlüğü)
+
+
+def send(dst, port=PROBE_PORT, rate=1000, count=4000, size=64, stream=0):
+    """
+    count paketi rate pps ile gönder
+
+    Gönderim zamanları mutlak takvime göre hesaplanır (gecikme birikmez).
+
+    Returns:
+        tuple: (ilk paket zamanı ns, son paket zamanı ns)
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    padding = bytes(max(0, size - HEADER.size))
+    interval = 1e9 / rate
+    start = time.monotonic_ns()
+    first = last = None
+    for seq in range(count):
+        deadline = start + int(seq * interval)
+        wait = deadline - time.monotonic_ns()
+        if wait > SPIN_NS:
+            time.sleep((wait - SPIN_NS) / 1e9)
+        while time.monotonic_ns() < deadline:
+            pass
+        last = time.time_ns()
+        first = first or last
+        try:
+            sock.sendto(HEADER.pack(MAGIC, stream, seq, last) + padding, (dst, port))
+        except OSError:
+            # Rota yokken (ENETUNREACH) gönderim hatası kayıp sayılır
+            pass
+    sock.close()
+    return first, last
+
+
+def receive(port=PROBE_PORT, duration=5.0, idle=1.0, stream=None):
+    """
+    Probe'ları duration saniye (veya ilk paketten sonra idle saniye sessizlik) boyunca al
+
+    Returns:
+        list: Varış sırasıyla [(seq, send_ns, recv_ns)]
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPNS, 1)
+        kernel_stamps = True
+    except OSError:
+        kernel_stamps = False
+    sock.bind(('', port))
+
+    records = []
+    end = time.monotonic() + duration
+    last_rx = None
+    while True:
+        now = time.monotonic()
+        timeout = end - now
+        if last_rx is not None:
+            timeout = min(timeout, last_rx + idle - now)
+        if timeout <= 0 or not select.select([sock], [], [], timeout)[0]:
+            if timeout <= 0 or last_rx is not None:
+                break
+            continue
+        data, ancdata, _, _ = sock.recvmsg(2048, socket.CMSG_SPACE(TIMESPEC.size))
+        recv_ns = time.time_ns()
+        if kernel_stamps:
+            for level, kind, value in ancdata:
+                if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPNS:
+                    sec, nsec = TIMESPEC.unpack(value[:TIMESPEC.size])
+                    recv_ns = sec * 1000000000 + nsec
+        last_rx = time.monotonic()
+        if len(data) < HEADER.size:
+            continue
+        magic, probe_stream, seq, send_ns = HEADER.unpack_from(data)
+        if magic == MAGIC and (stream is None or probe_stream == stream):
+            records.append((seq, send_ns, recv_ns))
+    sock.close()
+    return records
+
+
+def parse_records(output):
+    """recv çıktısı ('seq send_ns recv_ns' satırları) -> [(seq, send_ns, recv_ns)]"""
+    records = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 3 and fields[0].isdigit():
+            records.append(tuple(int(field) for field in fields))
+    return records
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(q / 100 * len(values)))] if values else None
+
+
+def analyze(records, sent, rate):
+    """
+    Alım kaydından kesinti analizi
+
+    Kesinti, en uzun kayıp aralığının ilk kayıp paketinin (planlanan)
+    gönderim zamanından kesintiden sonra teslim edilen ilk paketin gönderim
+    zamanına kadardır; çözünürlük 1/rate'tir. Sıra bozulması, o ana
+    kadar görülen en büyük sıra numarasından küçük numarayla gelen
+    paketlerdir.
+
+    Args:
+        records: Varış sırasıyla [(seq, send_ns, recv_ns)]
+        sent: Gönderilen paket sayısı
+
+    Returns:
+        dict: Kayıp/sıra bozulması sayıları, kayıp aralıkları ve kesinti penceresi
+    """
+    interval_ns = 1e9 / rate
+    send_times = {}
+    duplicates = reordered = max_displacement = 0
+    highest = -1
+    for seq, send_ns, _ in records:
+        if seq in send_times:
+            duplicates += 1
+            continue
+        send_times[seq] = send_ns
+        if seq < highest:
+            reordered += 1
+            max_displacement = max(max_displacement, highest - seq)
+        highest = max(highest, seq)
+
+    # Kayıp aralıkları: teslim edilen ardışık sıra numaraları arasındaki boşluklar
+    delivered = sorted(send_times)
+    runs = []  # (ilk kayıp, son kayıp, önceki teslim, sonraki teslim)
+    previous = None
+    for seq in delivered + [sent]:
+        start = 0 if previous is None else previous + 1
+        if seq > start:
+            runs.append((start, seq - 1, previous, seq if seq < sent else None))
+        previous = seq
+
+    # Akışın başındaki kayıp (ilk paketlerin yol kurulumu) kesinti sayılmaz
+    outage = None
+    for run in runs:
+        before, after = run[2], run[3]
+        if before is None:
+            continue
+        start = send_times[before]
+        if after is not None:
+            end = send_times[after]
+        else:
+            # Akış sonuna kadar düzelmedi
+            end = start + (run[1] - before + 1) * interval_ns
+        if outage is None or end - start > outage[1] - outage[0]:
+            outage = (start, end, run)
+
+    delays = sorted(recv_ns - send_ns for _, send_ns, recv_ns in records)
+    arrivals = [recv_ns for _, _, recv_ns in records]
+    rx_gap = max((b - a for a, b in zip(arrivals, arrivals[1:])), default=0)
+    return {
+        'sent': sent,
+        'received': len(send_times),
+        'lost': sent - len(send_times),
+        'lost_ranges': [(run[0], run[1]) for run in runs],
+        'duplicates': duplicates,
+        'reordered': reordered,
+        'max_reorder_distance': max_displacement,
+        'outage_ms': (outage[1] - outage[0] - interval_ns) / 1e6 if outage else 0.0,
+        'outage_start_ns': int(outage[0] + interval_ns) if outage else None,
+        'outage_end_ns': int(outage[1]) if outage else None,
+        'outage_lost': outage[2][1] - outage[2][0] + 1 if outage else 0,
+        'setup_lost': runs[0][1] + 1 if runs and runs[0][2] is None else 0,
+        'recovered': not runs or runs[-1][3] is not None,
+        'resolution_ms': interval_ns / 1e6,
+        'rx_gap_ms': rx_gap / 1e6,
+        'one_way_delay_ms': {
+            'p50': _percentile(delays, 50) / 1e6 if delays else None,
+            'p99': _percentile(delays, 99) / 1e6 if delays else None,
+            'max': delays[-1] / 1e6 if delays else None
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sequence-numbered UDP probe stream')
+    sub = parser.add_subparsers(dest='mode', required=True)
+    sender = sub.add_parser('send')
+    sender.add_argument('--dst', required=True)
+    sender.add_argument('--port', type=int, default=PROBE_PORT)
+    sender.add_argument('--rate', type=float, default=1000, help='packets per second')
+    sender.add_argument('--count', type=int, default=4000)
+    sender.add_argument('--size', type=int, default=64)
+    receiver = sub.add_parser('recv')
+    receiver.add_argument('--port', type=int, default=PROBE_PORT)
+    receiver.add_argument('--duration', type=float, default=5.0)
+    receiver.add_argument('--idle', type=float, default=1.0)
+    args = parser.parse_args()
+
+    if args.mode == 'send':
+        first, last = send(args.dst, args.port, args.rate, args.count, args.size)
+        print(f'sent {args.count} {first} {last}')
+    else:
+        records = receive(args.port, args.duration, args.idle)
+        sys.stdout.write(''.join(f'{seq} {send_ns} {recv_ns}\n' for seq, send_ns, recv_ns in records))
+
+
+if __name__ == '__main__':
+    main()
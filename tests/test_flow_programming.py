@@ -0,0 +1,83 @@
+"""Yol kurulumu: datapath başına toplu FlowMod, barrier onayı, ilk paketin gönderimi ve FlowRemoved ile kayıt eşitleme"""
+
+from controller_simulator import OFPROTO, ip_frame
+from fixtures import COMPLEX_LINKS
+
+
+def record_sends(sim):
+    """Tüm datapath'lere gönderilen mesajları gönderim sırasıyla [(dpid, mesaj adı)] listesine yaz"""
+    sent = []
+    for datapath in sim.datapaths.values():
+        def send_msg(msg, datapath=datapath, send=datapath.send_msg):
+            sent.append((datapath.id, msg.name))
+            send(msg)
+        datapath.send_msg = send_msg
+    return sent
+
+
+def test_path_is_installed_egress_first_and_first_packet_waits_for_barriers(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, *_, h8 = sim.topology.hosts
+    sent = record_sends(sim)
+
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 6, 1000, 80, 1), flush=False)
+    path = sim.app.route_registry.get((h1.dpid, h1.port, h8.mac))['path']
+    assert len(path) > 2
+
+    # Her switch'in FlowMod'ları art arda gider, arkasından tek barrier; sıra egress'ten ingress'e
+    per_switch = []
+    for dpid, name in sent:
+        if not per_switch or per_switch[-1][0] != dpid:
+            per_switch.append((dpid, []))
+        per_switch[-1][1].append(name)
+    assert [dpid for dpid, _ in per_switch] == path[::-1]
+    for _, names in per_switch:
+        assert names[-1] == 'OFPBarrierRequest'
+        assert set(names[:-1]) == {'OFPFlowMod'}
+    assert sim.app.flow_programmer.get_statistics()['pending_installs'] == 1
+
+    # İlk paket ancak tüm barrier cevaplarından sonra gönderilir
+    sim.flush()
+    assert sent[-1] == (h1.dpid, 'OFPPacketOut')
+    assert sent.count((h1.dpid, 'OFPPacketOut')) == 1
+    assert sim.app.flow_programmer.get_statistics()['pending_installs'] == 0
+
+    # Kurallar hazır olduğundan sonraki paketler hiçbir switch'te Packet-In üretmez
+    walk = sim.data_plane.send(h1, h8)
+    assert walk.controller == []
+    assert walk.delivered == [(h8, ())]
+
+
+
+def test_flow_removed_reconciles_the_registry_and_table_occupancy(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, *_, h8 = sim.topology.hosts
+    registry = sim.app.flow_registry
+    before = {dpid: count for dpid, (count, _, _) in registry.table_occupancy().items()}
+
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 6, 1000, 80, 1))
+    key = (h1.dpid, h1.port, h8.mac)
+    route = sim.app.route_registry.get(key)
+    path, cookie = route['path'], route['cookie']
+    rules = sorted(k for k, rule in registry.rules.items() if rule['cookie'] == cookie)
+    assert sorted(dpid for dpid, _, _ in rules) == sorted(path)
+    ingress = registry.paths[cookie]['ingress']
+    for dpid in path:
+        assert registry.table_occupancy()[dpid][0] == before.get(dpid, 0) + 1
+
+    # Transit/egress kuralları zaman aşımına uğrar: yol ingress kuralı durdukça yaşar
+    for dpid, priority, match in rules:
+        if (dpid, priority, match) != ingress:
+            sim.expire(dpid, priority, dict(match))
+            assert registry.table_occupancy().get(dpid, (0,))[0] == before.get(dpid, 0)
+    assert sim.app.route_registry.get(key) is not None
+    assert registry.removed['idle'] == len(path) - 1
+
+    # Ingress kuralı kalkınca yol biter ve veri düzleminde paket yine controller'a düşer
+    dpid, priority, match = ingress
+    sim.expire(dpid, priority, dict(match), reason=OFPROTO.OFPRR_HARD_TIMEOUT)
+    assert sim.app.route_registry.get(key) is None
+    assert cookie not in registry.paths
+    assert registry.removed['hard'] == 1
+    assert {dpid: count for dpid, (count, _, _) in registry.table_occupancy().items()} == before
+    assert sim.data_plane.send(h1, h8).controller == [h1.dpid]
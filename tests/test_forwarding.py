@@ -0,0 +1,97 @@
+"""Kurulan kuralların veri düzlemi davranışı (DataPlane ile paket yürütme)"""
+
+import itertools
+
+import pytest
+
+from controller_simulator import ip_frame
+from fixtures import GRID_LINKS
+
+# s1 - s2 - s3 hattı; s2 hem s1 -> s3 yolunun transit'i hem h2'nin ingress'i
+LINE_LINKS = [(1, 2, 100, 1, 0), (2, 3, 100, 1, 0)]
+
+
+def test_label_ingress_and_transit_switch_pushes_one_tag(simulate):
+    sim = simulate('shortest_path', LINE_LINKS, forwarding_mode='label')
+    h1, h2, h3 = sim.topology.hosts
+    # h1 -> h3: s2 etiket transit'i; h2 -> h3: s2 aynı etiketin ingress'i
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h3, 6, 1000, 80, 1))
+    sim.packet_in(h2.dpid, h2.port, ip_frame(h2, h3, 6, 1000, 80, 2))
+
+    assert sim.data_plane.conflicts() == []
+    for src in (h1, h2):
+        walk = sim.data_plane.send(src, h3)
+        assert walk.ambiguous == []
+        assert walk.max_tags == 1
+        assert walk.delivered == [(h3, ())]
+
+
+@pytest.mark.parametrize('mode', ['mac', 'label'])
+def test_fast_failover_survives_every_single_link_failure_without_loops(simulate, mode):
+    sim = simulate('shortest_path', GRID_LINKS, forwarding_mode=mode, fast_failover=True)
+    hosts = sim.topology.hosts
+    for n, (src, dst) in enumerate(itertools.permutations(hosts, 2)):
+        sim.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, n))
+
+    # Yedek kesimler diğer yolların kurallarını ezmez: switch'in hedef için tek çıkışı var
+    assert sim.data_plane.conflicts() == []
+    for src, dst in itertools.permutations(hosts, 2):
+        path = sim.app.route_registry.get((src.dpid, src.port, dst.mac))['path']
+        for hop in zip(path, path[1:]):
+            sim.data_plane.down = set()
+            sim.data_plane.link_down(*hop)
+            walk = sim.data_plane.send(src, dst)
+            assert not walk.loop, (path, hop)
+            assert walk.ambiguous == []
+            assert walk.max_tags <= 1
+            assert walk.delivered == [(dst, ())], (path, hop)
+
+
+def test_elephant_detection_narrows_ingress_from_the_first_packet(simulate):
+    # Çalışma sırasında açılan ayar bir sonraki monitor turunu (tick) beklemeden geçerli
+    sim = simulate('load_balancing', LINE_LINKS)
+    sim.app.elephant_detection = True
+    h1, _, h3 = sim.topology.hosts
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h3, 6, 1000, 80, 1))
+
+    flows, _ = sim.data_plane.tables()[h1.dpid]
+    ingress = [dict(match) for _, match in flows if dict(match).get('in_port') == h1.port]
+    assert [(m['tcp_src'], m['tcp_dst']) for m in ingress] == [(1000, 80)]
+    assert sim.data_plane.send(h1, h3, eth_type=0x0800, ip_proto=6, ipv4_src=h1.ip, ipv4_dst=h3.ip,
+                               tcp_src=1000, tcp_dst=80).delivered == [(h3, ())]
+
+
+def test_failover_groups_and_detour_labels_are_released_with_their_last_path(simulate):
+    sim = simulate('shortest_path', GRID_LINKS, fast_failover=True)
+    hosts = sim.topology.hosts
+    groups, registry = sim.app.failover_groups, sim.app.flow_registry
+    pairs = [(hosts[0], hosts[8]), (hosts[3], hosts[8])]
+    cookies = []
+    for n, (src, dst) in enumerate(pairs):
+        sim.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, n))
+        cookies.append(sim.app.route_registry.get((src.dpid, src.port, dst.mac))['cookie'])
+    shared = groups.used_by[cookies[0]] & groups.used_by[cookies[1]]
+    own = groups.used_by[cookies[0]] - shared
+    assert shared and own and len(sim.app.egress_labels) > 0
+
+    def detour_rules():
+        return [(dpid, match) for dpid, (flows, _) in sim.data_plane.tables().items()
+                for priority, match in flows if priority == sim.app.DETOUR_PRIORITY]
+
+    # Sadece h1'in yolunun kullandığı gruplar silinir, ortak gruplar h4'ün yolu için kalır
+    dpid, priority, match = registry.paths[cookies[0]]['ingress']
+    sim.expire(dpid, priority, dict(match))
+    tables = sim.data_plane.tables()
+    assert not own & set(groups.groups)
+    assert shared <= set(groups.groups)
+    for dpid, _ in own:
+        assert len(tables[dpid][1]) == sum(key[0] == dpid for key in groups.groups)
+    assert sim.data_plane.send(*pairs[1]).delivered == [(pairs[1][1], ())]
+
+    # Son yol da bitince grup, detour etiketi ve detour kuralı kalmaz
+    dpid, priority, match = registry.paths[cookies[1]]['ingress']
+    sim.expire(dpid, priority, dict(match))
+    assert len(groups) == 0 and len(sim.app.egress_labels) == 0
+    assert all(not group_table for _, group_table in sim.data_plane.tables().values())
+    assert detour_rules() == []
+    assert groups.released == len(own) + len(shared)
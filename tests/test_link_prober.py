@@ -0,0 +1,80 @@
+"""Aktif link ölçümü: probe/echo turları strateji gecikme ve kayıp değerlerini günceller"""
+
+import time
+import types
+
+import pytest
+
+from fixtures import SIMPLE_LINKS
+from link_prober import ETH_TYPE_PROBE
+from packet_view import PacketView
+
+ECHO_RTT = 0.002
+LINK_DELAY = 0.011
+
+
+def manual_clock(monkeypatch):
+    """Prober ve QoS controller'ın time.monotonic'ini elle ilerleyen saate bağla (controller yüklendikten sonra)"""
+    now = [time.monotonic() + 1]
+    fake = types.SimpleNamespace(monotonic=lambda: now[0])
+    monkeypatch.setattr('link_prober.time', fake)
+    monkeypatch.setattr('qos_controller.time', fake)
+    return now
+
+
+def probe_round(sim, clock, lost=()):
+    """
+    Probe döngüsünü bir tur çalıştır, echo'ları ECHO_RTT, probe'ları LINK_DELAY sonra cevapla
+
+    lost'taki (src, dst) linklerinin probe'ları dönmez.
+    """
+    peers = {}
+    for s1, p1, s2, p2, *_ in sim.topology.links:
+        peers[(s1, p1)], peers[(s2, p2)] = (s2, p2), (s1, p1)
+    sent = {dpid: len(datapath.sent) for dpid, datapath in sim.datapaths.items()}
+    sim.hub.tick()
+    start = clock[0]
+
+    clock[0] = start + ECHO_RTT
+    for dpid, datapath in sim.datapaths.items():
+        for msg in datapath.sent[sent[dpid]:]:
+            if msg.name == 'OFPEchoRequest':
+                reply = types.SimpleNamespace(datapath=datapath, data=msg.kwargs['data'])
+                sim.app.echo_reply_handler(types.SimpleNamespace(msg=reply))
+
+    # Probe switch'ten çıkar, karşı switch'in probe kuralıyla controller'a döner
+    clock[0] = start + LINK_DELAY
+    probes = 0
+    for dpid, datapath in sim.datapaths.items():
+        for msg in datapath.sent[sent[dpid]:]:
+            if msg.name != 'OFPPacketOut' or PacketView(msg.kwargs['data']).ethertype != ETH_TYPE_PROBE:
+                continue
+            probes += 1
+            peer, peer_port = peers[(dpid, msg.kwargs['actions'][0].args[0])]
+            if (dpid, peer) not in lost:
+                sim.packet_in(peer, peer_port, msg.kwargs['data'])
+    return probes
+
+
+def test_probes_measure_one_way_delay_and_loss(simulate, monkeypatch):
+    sim = simulate('qos', SIMPLE_LINKS)
+    clock = manual_clock(monkeypatch)
+    strategy, prober = sim.app.strategy, sim.app.prober
+    links = {(s1, s2) for s1, s2, *_ in SIMPLE_LINKS} | {(s2, s1) for s1, s2, *_ in SIMPLE_LINKS}
+
+    assert probe_round(sim, clock) == len(links)
+    # Gecikme = varış - gönderim - (RTT_src + RTT_dst) / 2
+    for link in links:
+        assert strategy.link_delay[link] == pytest.approx((LINK_DELAY - ECHO_RTT) * 1000)
+        assert strategy.net[link[0]][link[1]]['delay'] == strategy.link_delay[link]
+        assert strategy.link_loss[link] == 0
+
+    # Bir link bir tur probe kaybeder: süre dolunca son iki probe'un yarısı kayıp
+    clock[0] += 1.5
+    probe_round(sim, clock, lost={(1, 2)})
+    clock[0] += 1.5
+    probe_round(sim, clock)
+    assert prober.probes_lost == 1
+    assert strategy.link_loss[(1, 2)] == prober.loss(1, 2) == pytest.approx(100 / 3)
+    assert strategy.net[1][2]['loss'] == strategy.link_loss[(1, 2)]
+    assert strategy.link_loss[(2, 1)] == 0
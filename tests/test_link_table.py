@@ -0,0 +1,39 @@
+"""LinkTable: sütun liste önbelleğinin metrik yazımlarıyla tazelenmesi"""
+
+from link_table import LinkTable
+
+
+def square():
+    # 1 -> 2 -> 4 ve 1 -> 3 -> 4; başta ikisi de eşit maliyetli
+    table = LinkTable(capacity=2)
+    for src, dst in ((1, 2), (2, 4), (1, 3), (3, 4)):
+        table.add_link(src, dst, load=1.0)
+    return table
+
+
+def test_cached_column_list_is_refreshed_by_every_metric_write():
+    table = square()
+    assert table.values('load') is table.values('load')
+    assert table.shortest_path(1, 4, 'load')[0] == [1, 2, 4]
+
+    table.set(1, 2, load=5.0)
+    assert table.shortest_path(1, 4, 'load')[0] == [1, 3, 4]
+
+    loads = table.metric_view('load')
+    loads[(1, 3)] = 9.0
+    assert table.shortest_path(1, 4, 'load')[0] == [1, 2, 4]
+    loads.pop((1, 2))
+    assert table.cost_function('load')(1, 2, None) == 0.0
+
+
+def test_cost_function_keeps_the_values_of_its_call():
+    table = square()
+    cost = table.cost_function('load')
+    table.set(1, 2, load=7.0)
+    assert cost(1, 2, None) == 1.0
+    assert table.cost_function('load')(1, 2, None) == 7.0
+
+    # Dizi büyümesi ve yeni link varsayılanları da önbelleği düşürür
+    table.add_link(4, 5)
+    assert table.cost_function('load')(4, 5, None) == 0.0
+    assert table.cost_function('load')(1, 2, None) == 7.0
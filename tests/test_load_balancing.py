@@ -0,0 +1,66 @@
+"""Load balancing: link kapasitesi, kurulan akışların rezervasyonları ve multipath select grupları"""
+
+from controller_simulator import ip_frame
+from fixtures import COMPLEX_LINKS, GRID_LINKS, SIMPLE_LINKS
+
+
+def test_relinked_port_keeps_its_measured_capacity(simulate):
+    sim = simulate('load_balancing', SIMPLE_LINKS)
+    strategy = sim.app.strategy
+    # Port açıklamasından ölçülen hız sadece 1 -> 2 yönünde bilinir
+    sim.app.port_speed[(1, sim.app.links.port(1, 2))] = 40.0
+
+    sim.link_down(1, 2)
+    sim.link_up(1, 2)
+    assert strategy.link_capacity[(1, 2)] == 40.0
+    assert strategy.link_capacity[(2, 1)] == 100.0
+    assert sim.app.net[1][2]['weight'] == sim.app.net[2][1]['weight'] == 1.0
+
+
+def test_flow_reservations_are_kept_apart_from_measured_load(simulate):
+    sim = simulate('load_balancing', COMPLEX_LINKS)
+    strategy, registry = sim.app.strategy, sim.app.flow_registry
+    h1, *_, h8 = sim.topology.hosts
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 6, 1000, 80, 1))
+    route = sim.app.route_registry.get((h1.dpid, h1.port, h8.mac))
+    links = list(zip(route['path'], route['path'][1:]))
+    assert len(links) > 1
+
+    # Ölçüm gelene kadar akış flow_rate (Mbps) ayırır
+    for link in links:
+        assert strategy.link_reserved[link] == strategy.link_load[link] == strategy.flow_rate
+
+    # Ölçüm rezervasyonun yerine geçer; biten akış ölçülmüş yükten düşülmez
+    strategy.link_measured(*links[0], 20.0)
+    assert (strategy.link_reserved[links[0]], strategy.link_load[links[0]]) == (0, 20.0)
+    dpid, priority, match = registry.paths[route['cookie']]['ingress']
+    sim.expire(dpid, priority, dict(match))
+    assert strategy.link_load[links[0]] == 20.0
+    for link in links[1:]:
+        assert strategy.link_reserved[link] == strategy.link_load[link] == 0
+    assert strategy.active_flows == 0
+
+
+def test_select_groups_are_deleted_with_their_last_path(simulate):
+    sim = simulate('load_balancing', GRID_LINKS, multipath=True)
+    hosts = sim.topology.hosts
+    groups, registry = sim.app.select_groups, sim.app.flow_registry
+    pairs = [(hosts[0], hosts[8]), (hosts[3], hosts[8])]
+    cookies = []
+    for n, (src, dst) in enumerate(pairs):
+        sim.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, n))
+        cookies.append(sim.app.route_registry.get((src.dpid, src.port, dst.mac))['cookie'])
+    shared = groups.used_by[cookies[0]] & groups.used_by[cookies[1]]
+    own = groups.used_by[cookies[0]] - shared
+    assert shared and own
+
+    # h1'in yolu bitince sadece onun grupları silinir; ortak gruplar h4'ün yolu için kalır
+    dpid, priority, match = registry.paths[cookies[0]]['ingress']
+    sim.expire(dpid, priority, dict(match))
+    assert not own & set(groups.groups) and shared <= set(groups.groups)
+    assert sim.data_plane.send(*pairs[1]).delivered == [(pairs[1][1], ())]
+
+    dpid, priority, match = registry.paths[cookies[1]]['ingress']
+    sim.expire(dpid, priority, dict(match))
+    assert len(groups) == 0 and groups.released == len(own) + len(shared)
+    assert all(not group_table for _, group_table in sim.data_plane.tables().values())
@@ -0,0 +1,158 @@
+"""Packet-In hattının girişi: başlık çözme, admission control ve ARP proxy"""
+
+import random
+import struct
+
+from controller_simulator import arp_request, ip_frame
+from fixtures import COMPLEX_LINKS, SIMPLE_LINKS
+from packet_view import PacketView
+
+
+def packet_outs(sim):
+    """Switch'lere gönderilen PacketOut'lar: [(dpid, msg)]"""
+    return [(dpid, msg) for dpid, datapath in sim.datapaths.items()
+            for msg in datapath.sent if msg.name == 'OFPPacketOut']
+
+
+def test_lldp_is_ignored_and_qos_classes_come_from_the_ip_protocol_byte(simulate):
+    sim = simulate('qos', SIMPLE_LINKS)
+    h1, h2, *_ = sim.topology.hosts
+    packets = sim.app.packet_count
+    sent = sum(len(datapath.sent) for datapath in sim.datapaths.values())
+
+    lldp = bytes.fromhex('0180c200000e') + bytes.fromhex(h1.mac.replace(':', '')) + struct.pack('!H', 0x88cc)
+    sim.packet_in(h1.dpid, h1.port, lldp + bytes(32))
+    assert sim.app.packet_count == packets
+    assert sum(len(datapath.sent) for datapath in sim.datapaths.values()) == sent
+
+    # TCP -> high_bandwidth, UDP -> low_latency (öncelik 2), ICMP -> balanced (öncelik 1)
+    for n, (proto, requirement, priority) in enumerate([(6, 'high_bandwidth', 2), (17, 'low_latency', 2),
+                                                        (1, 'balanced', 1)]):
+        sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h2, proto, 1000, 80, n))
+        route = sim.app.route_registry.get((h1.dpid, h1.port, h2.mac))
+        assert route['flow'] == {'priority': priority, 'qos_requirement': requirement}
+
+
+def test_vlan_tagged_frame_is_parsed_behind_the_tag(simulate):
+    sim = simulate('shortest_path', SIMPLE_LINKS)
+    h1, h2, *_ = sim.topology.hosts
+    frame = ip_frame(h1, h2, 17, 5060, 5060, 1)
+    tagged = frame[:12] + struct.pack('!HH', 0x8100, (5 << 13) | 10) + frame[12:]
+
+    view = PacketView(tagged)
+    assert (view.eth_dst, view.eth_src, view.ethertype) == (h2.mac, h1.mac, 0x0800)
+    assert (view.vlan_id, view.vlan_pcp, view.ip_proto) == (10, 5, 17)
+    assert (view.ipv4_src, view.ipv4_dst, view.src_port, view.dst_port) == (h1.ip, h2.ip, 5060, 5060)
+
+    # Etiketli ilk paket de hedefe yol kurar
+    sim.packet_in(h1.dpid, h1.port, tagged)
+    assert sim.app.route_registry.get((h1.dpid, h1.port, h2.mac)) is not None
+
+
+def test_packet_in_storm_is_dropped_then_blocked_on_the_switch(simulate):
+    sim = simulate('shortest_path', SIMPLE_LINKS, admission=True, learn=False)
+    guard = sim.app.packet_guard
+    # Kova sadece burst kadar token tutar ve test süresince dolmaz
+    guard.source_burst, guard.source_rate, guard.block_after = 5, 1e-6, 3
+    sim.learn_hosts()
+    h1, h2, h3, _ = sim.topology.hosts
+    for n in range(10):
+        sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h3, 6, 1000, 80, n))
+
+    # ARP + 4 paket kabul, 3 red (üçüncüsü engel), engelliyken gelen 3 paket düşer
+    assert (guard.admitted, guard.dropped_source, guard.blocks, guard.dropped_blocked) == (8, 3, 1, 3)
+    flows, _ = sim.data_plane.tables()[h1.dpid]
+    storm = (sim.app.STORM_PRIORITY, frozenset({'in_port': h1.port, 'eth_src': h1.mac}.items()))
+    assert flows[storm] == []
+    # Engel kuralı kaynağın paketlerini switch'te düşürür, diğer host'lar etkilenmez
+    assert sim.data_plane.send(h1, h3).delivered == []
+    sim.packet_in(h2.dpid, h2.port, ip_frame(h2, h3, 6, 1000, 80, 1))
+    assert sim.data_plane.send(h2, h3).delivered == [(h3, ())]
+
+
+def test_arp_proxy_answers_known_targets_and_floods_unknown_to_edges(simulate):
+    sim = simulate('shortest_path', SIMPLE_LINKS, learn=False)
+    h1, h2, h3, h4 = sim.topology.hosts
+
+    # h3 henüz bilinmiyor: istek sadece host edge portlarına gider
+    sim.packet_in(h1.dpid, h1.port, arp_request(h1, h3))
+    flooded = sorted((dpid, action.args[0]) for dpid, msg in packet_outs(sim)
+                     for action in msg.kwargs['actions'])
+    assert flooded == sorted((h.dpid, h.port) for h in (h2, h3, h4))
+
+    # h3'ün kendi isteği onu öğretir; h1'in sonraki isteğini controller cevaplar
+    sim.packet_in(h3.dpid, h3.port, arp_request(h3, h1))
+    for datapath in sim.datapaths.values():
+        datapath.sent = []
+    sim.packet_in(h1.dpid, h1.port, arp_request(h1, h3))
+
+    [(dpid, msg)] = packet_outs(sim)
+    assert (dpid, [action.args[0] for action in msg.kwargs['actions']]) == (h1.dpid, [h1.port])
+    reply = PacketView(msg.kwargs['data'])
+    assert (reply.eth_dst, reply.eth_src, reply.arp_opcode) == (h1.mac, h3.mac, 2)
+    assert (reply.arp_src_mac, reply.arp_src_ip) == (h3.mac, h3.ip)
+    assert (reply.arp_dst_mac, reply.arp_dst_ip) == (h1.mac, h1.ip)
+    proxy = sim.app.arp_proxy
+    assert (proxy.requests, proxy.replies, proxy.misses) == (3, 2, 1)
+
+
+def test_duplicates_wait_for_the_install_and_follow_the_first_packet(simulate):
+    sim = simulate('shortest_path', SIMPLE_LINKS)
+    h1, h2, h3, _ = sim.topology.hosts
+    guard = sim.app.packet_guard
+    for datapath in sim.datapaths.values():
+        datapath.sent = []
+
+    # Barrier cevapları gelmeden aynı yola dört paket, başka hedefe bir paket
+    frames = [ip_frame(h1, h3, 6, 1000 + n, 80, n) for n in range(4)]
+    for frame in frames:
+        sim.packet_in(h1.dpid, h1.port, frame, flush=False)
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h2, 6, 1000, 80, 9), flush=False)
+    assert guard.deduplicated == 3
+    assert sim.app.flow_programmer.get_statistics()['pending_installs'] == 2
+    assert packet_outs(sim) == []
+
+    sim.flush()
+    path = sim.app.route_registry.get((h1.dpid, h1.port, h3.mac))['path']
+    out_port = sim.app.links.port(path[0], path[1])
+    released = [msg for dpid, msg in packet_outs(sim) if msg.kwargs['data'] in frames]
+    assert [msg.kwargs['data'] for msg in released] == frames
+    assert all([action.args[0] for action in msg.kwargs['actions']] == [out_port] for msg in released)
+    assert len(packet_outs(sim)) == 5
+    assert (guard.released, guard.dropped_held, guard.inflight) == (3, 0, {})
+
+
+def test_arp_proxy_cuts_packet_ins_under_uniform_traffic(simulate):
+    packet_ins = {}
+    for enabled in (True, False):
+        sim = simulate('shortest_path', COMPLEX_LINKS, arp_proxy_enabled=enabled)
+        hosts = sim.topology.hosts
+        rng = random.Random(5)
+        packet_ins[enabled] = 0
+        for _ in range(40):
+            src, dst = rng.sample(hosts, 2)
+            delivered, counts = sim.follow(src.dpid, src.port, arp_request(src, dst))
+            packet_ins[enabled] += sum(counts.values())
+            # Proxy cevabı isteyene döner; proxy yoksa istek yayın ağacıyla herkese gider
+            assert sorted(delivered) == ([src] if enabled else sorted(h for h in hosts if h != src))
+    # Proxy açıkken istek başına tek Packet-In, kapalıyken her switch'te bir tane
+    assert packet_ins[True] == 40
+    assert packet_ins[False] == 40 * len(sim.topology.switches)
+
+
+def test_arp_bindings_are_forgotten_with_their_port_or_switch(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, h2, h3, *_ = sim.topology.hosts
+    proxy = sim.app.arp_proxy
+    assert proxy.lookup(h2.ip) == h2.mac and proxy.lookup(h3.ip) == h3.mac
+
+    sim.port_down(h2.dpid, h2.port)
+    sim.switch_leave(h3.dpid)
+    assert proxy.lookup(h2.ip) is None and proxy.lookup(h3.ip) is None
+    assert proxy.lookup(h1.ip) == h1.mac
+
+    # Kopuk host adına cevap verilmez; istek edge portlarına yayılır
+    misses = proxy.misses
+    delivered, _ = sim.follow(h1.dpid, h1.port, arp_request(h1, h2))
+    assert proxy.misses == misses + 1
+    assert h1 not in delivered
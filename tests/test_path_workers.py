@@ -0,0 +1,60 @@
+"""Asenkron yol hesabı: simülatörde kurulum, worker sayaçlarının birleşmesi, snapshot ve teslimde hedef konumu"""
+
+import os
+
+from controller_simulator import ip_frame
+
+SQUARE_LINKS = [(1, 2, 100, 1, 0), (2, 3, 100, 1, 0), (3, 4, 100, 1, 0), (4, 1, 100, 1, 0)]
+
+
+def test_pool_is_created_only_for_async_paths(simulate):
+    sim = simulate('load_balancing', SQUARE_LINKS)
+    h1, _, h3, _ = sim.topology.hosts
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h3, 6, 1000, 80, 1))
+    assert sim.app.path_pool is None
+    assert 'async_path_requests' not in sim.app.get_statistics()
+
+
+def test_async_paths_install_flows_and_merge_strategy_counters(simulate):
+    sim = simulate('load_balancing', SQUARE_LINKS, async_paths=True)
+    h1, h2, h3, h4 = sim.topology.hosts
+    for i, (src, dst) in enumerate(((h1, h3), (h2, h4), (h3, h1))):
+        sim.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, i))
+
+    stats = sim.app.get_statistics()
+    assert stats['async_path_computations'] == 3
+    assert stats['path_calculations'] == 3
+    for src, dst in ((h1, h3), (h2, h4), (h3, h1)):
+        assert sim.data_plane.send(src, dst).delivered == [(dst, ())]
+
+    pool = sim.app.path_pool
+    sources = list(pool.sources.values())
+    assert sources and all(os.path.exists(source) for source in sources)
+    pool.shutdown()
+    assert not any(os.path.exists(source) for source in sources)
+
+
+def test_snapshot_is_taken_only_when_the_topology_changes(simulate):
+    sim = simulate('load_balancing', SQUARE_LINKS, async_paths=True)
+    h1, h2, h3, h4 = sim.topology.hosts
+    for i, (src, dst) in enumerate(((h1, h3), (h2, h4))):
+        sim.packet_in(src.dpid, src.port, ip_frame(src, dst, 6, 1000, 80, i))
+        sim.advance(5)
+    assert sim.app.path_pool.snapshots == 1
+
+    sim.link_down(1, 2)
+    sim.packet_in(h3.dpid, h3.port, ip_frame(h3, h1, 6, 1000, 80, 3))
+    assert sim.app.path_pool.snapshots == 2
+
+
+def test_async_path_follows_a_destination_that_moved_during_the_computation(simulate):
+    sim = simulate('load_balancing', SQUARE_LINKS, async_paths=True)
+    h1, _, h3, h4 = sim.topology.hosts
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h3, 6, 1000, 80, 1), flush=False)
+
+    # Hesap sürerken h3 s4'ün boş bir portunda görünür
+    moved = h3._replace(dpid=h4.dpid, port=99)
+    sim.app.host_index.learn(moved.mac, moved.dpid, moved.port)
+    sim.flush()
+    route = sim.app.route_registry.get((h1.dpid, h1.port, h3.mac))
+    assert route['path'][-1] == moved.dpid and route['out_port'] == moved.port
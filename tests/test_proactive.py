@@ -0,0 +1,68 @@
+"""Proaktif mod: sanal saatle durulma, reaktif kurallardan ayrım ve ilk paketlerin Packet-In'siz iletimi"""
+
+import itertools
+
+from controller_simulator import OFPROTO, ip_frame
+from fixtures import COMPLEX_LINKS
+
+
+def test_proactive_mode_waits_for_topology_to_settle(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS, proactive=True)
+    sim.advance(sim.app.proactive_settle_time - 1)
+    assert len(sim.app.proactive_routes) == 0
+
+    sim.advance(1)
+    assert len(sim.app.proactive_routes) > 0
+
+    # Link kopması sadece etkilenen çiftleri onarır; onarılan tablo eşit sayılır, tam hesap yapılmaz
+    routes = sim.app.proactive_routes
+    sim.link_down(1, 2)
+    assert sim.app.proactive_synced_version == sim.app.topology_version
+    computations = routes.path_computations
+    sim.advance(sim.app.proactive_settle_time + 1)
+    assert routes.path_computations == computations
+
+    # Yeni link yolları kısaltabilir: durulma süresi yeniden başlar, tam eşitleme süre dolunca yapılır
+    sim.link_up(1, 2)
+    sim.advance(1)
+    assert sim.app.proactive_synced_version != sim.app.topology_version
+    sim.advance(sim.app.proactive_settle_time)
+    assert sim.app.proactive_synced_version == sim.app.topology_version
+    assert routes.path_computations > computations
+
+
+def test_proactive_first_packets_skip_the_controller(simulate):
+    results = {}
+    for proactive in (False, True):
+        sim = simulate('shortest_path', COMPLEX_LINKS, proactive=proactive)
+        sim.advance(sim.app.proactive_settle_time + 1)
+        results[proactive] = sim.first_packets(list(itertools.permutations(sim.topology.hosts, 2)))
+
+    reactive, proactive = results[False], results[True]
+    assert reactive['undelivered'] == proactive['undelivered'] == []
+    assert reactive['packet_ins'] > 0
+    assert proactive['packet_ins'] == 0
+    assert proactive['latency_ms']['max'] == 0 < reactive['latency_ms']['max']
+
+
+def test_reactive_rules_do_not_replace_proactive_rules_and_lost_rules_are_restored(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS, proactive=True)
+    sim.advance(sim.app.proactive_settle_time + 1)
+    h1, *_, h8 = sim.topology.hosts
+    priority = sim.app.PROACTIVE_PRIORITY
+    proactive = (priority, frozenset({'eth_dst': h8.mac}.items()))
+    before = {dpid: flows[proactive] for dpid, (flows, _) in sim.data_plane.tables().items()}
+
+    # Reaktif yol (öncelik 1) aynı eth_dst match'iyle kurulur ama proaktif kuralın yerine geçmez
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 17, 1000, 53, 1))
+    path = sim.app.route_registry.get((h1.dpid, h1.port, h8.mac))['path']
+    tables = sim.data_plane.tables()
+    assert (1, frozenset({'eth_dst': h8.mac}.items())) in tables[path[-1]][0]
+    assert {dpid: flows[proactive] for dpid, (flows, _) in tables.items()} == before
+
+    # Switch'ten dışarıdan silinen proaktif kural FlowRemoved ile geri kurulur
+    transit = next(dpid for dpid in before if dpid != h8.dpid)
+    sim.expire(transit, priority, {'eth_dst': h8.mac}, reason=OFPROTO.OFPRR_DELETE)
+    restored = sim.data_plane.tables()[transit][0][proactive]
+    assert [action.args for action in restored] == [action.args for action in before[transit]]
+    assert sim.app.proactive_routes.rules_restored == 1
@@ -0,0 +1,69 @@
+"""
+RoutingEngine seçimleri eski all_simple_paths brute force'u ile aynı amaç
+değerini vermeli; stratejiler ulaşılamayan hedefte None döndürmeli
+"""
+
+import random
+
+import pytest
+
+from fixtures import (COMPLEX_LINKS, ROUTING_MODES, SIMPLE_LINKS, brute_force_path, build_graph, engine_path,
+                      fat_tree_links, path_load, path_objective)
+from routing_engine import RoutingEngine
+from strategies import LoadBalancingStrategy, QoSStrategy, ShortestPathStrategy
+
+TOPOLOGIES = {'simple': SIMPLE_LINKS, 'complex': COMPLEX_LINKS, 'fat-tree': fat_tree_links(4)}
+
+
+def loaded_graph(links, seed):
+    """Rastgele link yükleriyle graf (eşit maliyetli yollar bol olsun diye küçük değerler)"""
+    rng = random.Random(seed)
+    net = build_graph(links)
+    for u, v in net.edges():
+        net[u][v]['load'] = rng.choice([0, 0, 1, 2, 5])
+    return net
+
+
+def sample_pairs(net, limit=60, seed=0):
+    pairs = [(src, dst) for src in sorted(net) for dst in sorted(net) if src != dst]
+    return pairs if len(pairs) <= limit else random.Random(seed).sample(pairs, limit)
+
+
+@pytest.mark.parametrize('mode', ROUTING_MODES)
+@pytest.mark.parametrize('topology', TOPOLOGIES)
+def test_engine_matches_brute_force(topology, mode):
+    for seed in range(3):
+        net = loaded_graph(TOPOLOGIES[topology], seed)
+        engine = RoutingEngine(net, max_hops=5)
+        for src, dst in sample_pairs(net, seed=seed):
+            expected = brute_force_path(net, src, dst, mode)
+            actual = engine_path(engine, src, dst, mode)
+            assert len(actual) - 1 <= 5
+            assert path_objective(net, actual, mode) == path_objective(net, expected, mode), (src, dst)
+
+
+@pytest.mark.parametrize('max_hops', [2, 3])
+@pytest.mark.parametrize('topology', TOPOLOGIES)
+def test_hop_bounded_path_matches_brute_force_under_the_hop_limit(topology, max_hops):
+    # Dar hop limiti Dijkstra'nın en ucuz yolunu eler; seçim Bellman-Ford katmanlarına düşer
+    net = loaded_graph(TOPOLOGIES[topology], seed=1)
+    engine = RoutingEngine(net, max_hops=max_hops)
+    for src, dst in sample_pairs(net):
+        expected = brute_force_path(net, src, dst, 'load', cutoff=max_hops)
+        for actual in (engine.hop_bounded_path(src, dst, 'load'), engine.dijkstra_path(src, dst, 'load')):
+            if expected is None:
+                assert actual is None
+                continue
+            assert len(actual) - 1 <= max_hops
+            assert path_load(net, actual) == path_load(net, expected), (src, dst)
+
+
+@pytest.mark.parametrize('strategy', [ShortestPathStrategy, LoadBalancingStrategy, QoSStrategy])
+def test_strategies_return_none_for_unreachable_or_unknown_switches(strategy):
+    net = build_graph(SIMPLE_LINKS)
+    net.add_node(9)
+    selector = strategy(net)
+    flow = {'priority': 1, 'qos_requirement': 'balanced'}
+    assert selector.select_path(1, 9, flow) is None
+    assert selector.select_path(1, 42, flow) is None
+    assert selector.select_path(1, 4, flow)[-1] == 4
@@ -0,0 +1,18 @@
+"""Simulator'ın kendi davranışı (controller ayarları)"""
+
+import pytest
+
+from controller_simulator import SimTopology, Simulator, load_controller
+from test_forwarding import LINE_LINKS
+
+
+def test_settings_missing_on_a_controller_raise_or_are_skipped():
+    topology = SimTopology(LINE_LINKS, name='line')
+    with pytest.raises(AttributeError, match="no setting 'multipath'"):
+        Simulator(load_controller('shortest_path'), topology, multipath=True)
+
+    simulator = Simulator(load_controller('shortest_path'), topology, ignore_unknown=True,
+                          multipath=True, forwarding_mode='label')
+    assert simulator.ignored_settings == ['multipath']
+    assert simulator.app.forwarding_mode == 'label'
+    assert not hasattr(simulator.app, 'multipath')
@@ -0,0 +1,102 @@
+"""Topoloji olayları: port/link kopması, yayın ağacı ve bunların controller durumuna etkisi"""
+
+from controller_simulator import Host, ip_frame
+from fixtures import COMPLEX_LINKS, SIMPLE_LINKS
+
+UNKNOWN = Host('02:00:00:00:ff:ff', '10.0.255.255', None, None)
+
+
+def flood(sim, src, down=()):
+    """Bilinmeyen hedefe giden paketi yay: (kopya alan host'lar, switch başına Packet-In)"""
+    return sim.follow(src.dpid, src.port, ip_frame(src, UNKNOWN, 17, 1000, 53, 1), down)
+
+
+def test_port_down_forgets_the_hosts_behind_it(simulate):
+    sim = simulate('shortest_path', SIMPLE_LINKS)
+    h1, h2, *_ = sim.topology.hosts
+    assert sim.app.host_index.lookup(h1.mac) == (h1.dpid, h1.port)
+
+    sim.port_down(h1.dpid, h1.port)
+    assert sim.app.host_index.lookup(h1.mac) is None
+    assert sim.app.host_index.lookup(h2.mac) == (h2.dpid, h2.port)
+
+    # Bilinmeyen hedefe yol kurulmaz; paket yayın ağacıyla gönderilir
+    sim.packet_in(h2.dpid, h2.port, ip_frame(h2, h1, 6, 1000, 80, 1))
+    assert sim.app.route_registry.get((h2.dpid, h2.port, h1.mac)) is None
+
+
+def test_link_failure_updates_the_graph_and_reroutes_crossing_flows(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, *_, h8 = sim.topology.hosts
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 6, 1000, 80, 1))
+    key = (h1.dpid, h1.port, h8.mac)
+    path = sim.app.route_registry.get(key)['path']
+    hop = (path[0], path[1])
+    edges = sim.app.net.number_of_edges()
+
+    sim.link_down(*hop)
+    sim.data_plane.link_down(*hop)
+    # Sadece kopan link (iki yönü) graftan düşer; yol Packet-In beklemeden yeniden kurulur
+    assert sim.app.net.number_of_edges() == edges - 2
+    assert not sim.app.net.has_edge(*hop) and not sim.app.net.has_edge(*reversed(hop))
+    rerouted = sim.app.route_registry.get(key)['path']
+    assert hop not in zip(rerouted, rerouted[1:])
+    assert sim.app.reroute_count == 1
+    assert sim.data_plane.send(h1, h8).delivered == [(h8, ())]
+
+
+def test_switch_leave_removes_its_links_hosts_and_routes(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    hosts = sim.topology.hosts
+    h1, h8 = hosts[0], hosts[-1]
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, h8, 6, 1000, 80, 1))
+    transit = sim.app.route_registry.get((h1.dpid, h1.port, h8.mac))['path'][1]
+    local = next(h for h in hosts if h.dpid == transit)
+    sim.packet_in(h1.dpid, h1.port, ip_frame(h1, local, 6, 1000, 80, 2))
+
+    sim.switch_leave(transit)
+    assert transit not in sim.app.net
+    assert sim.app.host_index.lookup(local.mac) is None
+    # Switch'teki host'a giden yol silinir; switch'ten geçen yol onsuz yeniden kurulur
+    assert sim.app.route_registry.get((h1.dpid, h1.port, local.mac)) is None
+    assert transit not in sim.app.route_registry.get((h1.dpid, h1.port, h8.mac))['path']
+    assert sim.app.route_registry.routes_on_node(transit) == []
+
+
+def test_flood_to_unknown_destination_follows_the_broadcast_tree(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, *others = sim.topology.hosts
+    tree = sim.app.broadcast_tree
+    assert len(tree) == len(sim.topology.switches) - 1 < len(COMPLEX_LINKS)
+
+    delivered, packet_ins = flood(sim, h1)
+    # Her host bir kopya alır; ağaç dışı linklerden gelen kopyalar yayılmaz
+    assert sorted(delivered) == sorted(others)
+    assert set(packet_ins) == set(sim.topology.switches)
+    assert sim.app.flood_suppressed == 0
+    for dpid in sim.topology.switches:
+        edge = {h.port for h in sim.topology.hosts if h.dpid == dpid}
+        for msg in sim.datapaths[dpid].sent:
+            if msg.name == 'OFPPacketOut':
+                assert {action.args[0] for action in msg.kwargs['actions']} <= tree.tree_ports(dpid) | edge
+
+    # Ağaç dışı linkten gelen kopya switch'te kesilir
+    s1, p1, s2, p2, *_ = next(link for link in sim.topology.links if not tree.is_tree_link(link[0], link[2]))
+    sent = len(sim.datapaths[s2].sent)
+    sim.packet_in(s2, p2, ip_frame(h1, UNKNOWN, 17, 1000, 53, 2))
+    assert sim.app.flood_suppressed == 1
+    assert sim.datapaths[s2].sent[sent:] == []
+
+
+def test_broadcast_tree_is_repaired_when_a_tree_link_fails(simulate):
+    sim = simulate('shortest_path', COMPLEX_LINKS)
+    h1, *others = sim.topology.hosts
+    tree = sim.app.broadcast_tree
+    u, v = next((link[0], link[2]) for link in sim.topology.links if tree.is_tree_link(link[0], link[2]))
+
+    sim.link_down(u, v)
+    assert not tree.is_tree_link(u, v)
+    assert (tree.repairs, tree.rebuilds) == (1, 0)
+    assert len(tree) == len(sim.topology.switches) - 1
+    delivered, _ = flood(sim, h1, down=[(u, v)])
+    assert sorted(delivered) == sorted(others)
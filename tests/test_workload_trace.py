@@ -0,0 +1,29 @@
+"""Trace derleme: fazların zaman sırası ve süresi"""
+
+import numpy as np
+
+from workload_trace import WorkloadTrace, compile_scenario
+
+
+def test_phases_do_not_overlap_when_mouse_tail_spills(tmp_path):
+    # seed 73'te elephant_mouse'un son mouse akışı faz süresini aşıyor
+    phases = [{'pattern': 'elephant_mouse', 'duration': 2},
+              {'pattern': 'uniform', 'duration': 2, 'rate': 50}]
+    path = tmp_path / 'spill.trace'
+    compile_scenario(phases, str(path), seed=73)
+    trace = WorkloadTrace(str(path))
+
+    times = trace.records['time_ns'].astype(np.int64)
+    assert (np.diff(times) >= 0).all()
+    assert trace.duration == times.max() / 1e9
+    assert trace.duration < 4.0
+
+
+def test_same_seed_compiles_byte_identical_trace(tmp_path):
+    paths = [tmp_path / name for name in ('a.trace', 'b.trace', 'c.trace')]
+    for path, seed in zip(paths, (7, 7, 8)):
+        compile_scenario('mixed', str(path), seed=seed)
+
+    a, b, c = (path.read_bytes() for path in paths)
+    assert a == b
+    assert a != c
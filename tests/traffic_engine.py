@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Traffic Engine - asyncio tabanlı yüksek hızlı trafik motoru
+Binlerce eşzamanlı akış tek bir zamanlayıcıda (heap) akış başına sabit
+takvimle ve toplam hız için token bucket ile hızlandırılır; hazır frame'ler
+toplu halde takılabilir bir sender'a verilir: raw socket (AF_PACKET), scapy,
+UDP soketi veya controller'ı doğrudan besleyen Packet-In simülatörü
+
+Kullanım:
+    python3 traffic_engine.py --sender sim --controller qos --sweep 2000,5000,10000,20000
+    python3 traffic_engine.py --sender raw --interface h1-eth0 --src h1 --rate 20000
+"""
+
+import argparse
+import asyncio
+import heapq
+import random
+import socket
+import struct
+import time
+
+PROTOCOLS = {'icmp': 1, 'tcp': 6, 'udp': 17}
+ETH_P_ALL = 0x0003
+TIMER_SLACK = 0.002  # asyncio.sleep ~1 ms geç uyanır; bundan kısa beklemeler döngüye verilerek (spin) yapılır
+
+
+def host_address(host):
+    """'h5' -> ('00:00:00:00:00:05', '10.0.0.5') (Mininet autoSetMacs / controller_simulator adresleri)"""
+    i = int(host.lstrip('h'))
+    return ':'.join(f'{b:02x}' for b in i.to_bytes(6, 'big')), f'10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}'
+
+
+def _checksum(header):
+    total = sum(struct.unpack(f'!{len(header) // 2}H', header))
+    while total >> 16:
+        total = (total & 0xffff) + (total >> 16)
+    return ~total & 0xffff
+
+
+def build_frame(src, dst, proto='udp', sport=0, dport=0, size=64):
+    """
+    src -> dst Ethernet/IPv4 frame'i (UDP, TCP SYN veya ICMP echo), size bayta doldurulur
+
+    IP başlık sağlaması hesaplanır (raw socket ile gönderilen frame'ler
+    host'larda kabul edilir); UDP sağlaması 0'dır.
+    """
+    src_mac, src_ip = host_address(src)
+    dst_mac, dst_ip = host_address(dst)
+    number = PROTOCOLS[proto]
+    if number == 6:
+        l4 = struct.pack('!HHIIBBHHH', sport, dport, 0, 0, 0x50, 0x02, 65535, 0, 0)
+    elif number == 17:
+        l4 = struct.pack('!HHHH', sport, dport, 0, 0)
+    else:
+        l4 = struct.pack('!BBHHH', 8, 0, 0, sport, 0)
+    payload = bytes(max(0, size - 14 - 20 - len(l4)))
+    if number == 17:
+        l4 = struct.pack('!HHHH', sport, dport, 8 + len(payload), 0)
+    elif number == 1:
+        l4 = struct.pack('!BBHHH', 8, 0, _checksum(l4 + payload + bytes(len(payload) % 2)), sport, 0)
+    ip = struct.pack('!BBHHHBBH4s4s', 0x45, 0, 20 + len(l4) + len(payload), 0, 0x4000, 64, number, 0,
+                     socket.inet_aton(src_ip), socket.inet_aton(dst_ip))
+    ip = ip[:10] + struct.pack('!H', _checksum(ip)) + ip[12:]
+    return (bytes.fromhex(dst_mac.replace(':', '')) + bytes.fromhex(src_mac.replace(':', ''))
+            + struct.pack('!H', 0x0800) + ip + l4 + payload)
+
+
+class Flow:
+    """
+    Tek akış: src -> dst 5-tuple, rate pps, count paket (None: süre bitene kadar)
+
+    Frame bir kez kurulur ve her gönderimde aynı bayt dizisi kullanılır.
+    """
+
+    __slots__ = ('src', 'dst', 'proto', 'sport', 'dport', 'rate', 'size', 'count', 'start',
+                 'interval', 'frame', 'sent')
+
+    def __init__(self, src, dst, proto='udp', sport=0, dport=0, rate=10.0, size=64, count=None, start=0.0):
+        self.src = src
+        self.dst = dst
+        self.proto = proto
+        self.sport = sport
+        self.dport = dport
+        self.rate = rate
+        self.size = size
+        self.count = count
+        self.start = start  # Motor başlangıcına göre (s)
+        self.interval = 1.0 / rate
+        self.frame = build_frame(src, dst, proto, sport, dport, size)
+        self.sent = 0
+
+    def __repr__(self):
+        return f'Flow({self.src}->{self.dst} {self.proto} {self.sport}->{self.dport} {self.rate:g}pps)'
+
+
+def make_flows(hosts, count=1000, rate=10.0, size=64, proto='udp', sources=None, seed=1, spread=None):
+    """
+    count akış: rastgele (kaynak, hedef) çiftleri, her biri ayrı kaynak portuyla
+
+    Args:
+        sources: Kaynak host'lar (raw socket tek arayüzden gönderir); None ise hosts
+        spread: Akış başlangıçlarının dağıtıldığı süre (s); None ise akışlar kendi
+                periyotları içinde rastgele fazla başlar (toplam hız hemen oturur)
+    """
+    rng = random.Random(seed)
+    sources = list(sources or hosts)
+    flows = []
+    for i in range(count):
+        src = sources[i % len(sources)]
+        dst = rng.choice([h for h in hosts if h != src])
+        flows.append(Flow(src, dst, proto, 10000 + i % 50000, 5001 + i // 50000, rate, size,
+                          start=rng.uniform(0, spread or 1.0 / rate)))
+    return flows
+
+
+class TokenBucket:
+    """
+    rate token/s dolan, en fazla burst token tutan kova
+
+    Zaman monotonic saatten ölçülür; take() verilebilen token sayısını
+    döndürür, wait() n token için beklenecek süreyi verir.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, n, now=None):
+        self._refill(time.monotonic() if now is None else now)
+        granted = min(n, int(self.tokens))
+        self.tokens -= granted
+        return granted
+
+    def wait(self, n=1):
+        return max(0.0, (n - self.tokens) / self.rate)
+
+
+class Sender:
+    """
+    Sender arayüzü
+
+    send(batch) [(flow, frame)] listesini gönderir ve gönderilen sayıyı
+    döndürür; gönderilemeyenler motor tarafından 'dropped' sayılır.
+    """
+
+    name = 'base'
+
+    def send(self, batch):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def get_statistics(self):
+        return {}
+
+
+class NullSender(Sender):
+    """Frame'leri atar (motorun kendi tavanını ölçmek için)"""
+
+    name = 'null'
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    def send(self, batch):
+        self.frames += len(batch)
+        self.bytes += sum(len(frame) for _, frame in batch)
+        return len(batch)
+
+
+class RawSocketSender(Sender):
+    """
+    AF_PACKET raw socket (root gerekir)
+
+    Mininet host'unun arayüzünde (h1-eth0) veya testlerde lo / veth
+    çiftinde çalışır; frame'ler switch'e olduğu gibi gider.
+    """
+
+    name = 'raw'
+
+    def __init__(self, interface):
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 << 20)
+        self.sock.bind((interface, 0))
+        self.errors = 0
+
+    def send(self, batch):
+        sent = 0
+        send = self.sock.send
+        for _, frame in batch:
+            try:
+                send(frame)
+                sent += 1
+            except OSError:
+                # ENOBUFS: kuyruk dolu, paket düşer
+                self.errors += 1
+        return sent
+
+    def close(self):
+        self.sock.close()
+
+    def get_statistics(self):
+        return {'socket_errors': self.errors}
+
+
+class ScapySender(RawSocketSender):
+    """scapy L2 soketi (scapy kuruluysa); frame'ler baytlardan Ether olarak çözülür"""
+
+    name = 'scapy'
+
+    def __init__(self, interface):
+        from scapy.all import Ether, conf
+        self.ether = Ether
+        self.sock = conf.L2socket(iface=interface)
+        self.errors = 0
+
+    def send(self, batch):
+        sent = 0
+        for _, frame in batch:
+            try:
+                self.sock.send(self.ether(frame))
+                sent += 1
+            except OSError:
+                self.errors += 1
+        return sent
+
+
+class UDPSender(Sender):
+    """
+    Normal UDP soketi (root gerektirmez)
+
+    Yalnızca UDP akışları; kernel kendi başlıklarını kurar, bu yüzden
+    kaynak adres çalışılan host'unkidir.
+    """
+
+    name = 'udp'
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.errors = 0
+
+    def send(self, batch):
+        sent = 0
+        for flow, frame in batch:
+            try:
+                self.sock.sendto(frame[42:], (host_address(flow.dst)[1], flow.dport))
+                sent += 1
+            except OSError:
+                self.errors += 1
+        return sent
+
+    def close(self):
+        self.sock.close()
+
+    def get_statistics(self):
+        return {'socket_errors': self.errors}
+
+
+class SimulatorSender(Sender):
+    """
+    Her frame'i controller_simulator üzerinden controller'a Packet-In olarak verir
+
+    Ryu/Mininet olmadan controller'ı doyuma kadar yüklemek için: gönderim
+    handler bitene kadar sürdüğünden ulaşılan hız controller'ın Packet-In
+    tavanıdır. Frame, kaynak host'un bağlı olduğu switch portundan girer.
+    """
+
+    name = 'sim'
+
+    def __init__(self, simulator):
+        from controller_simulator import arp_request
+        self.simulator = simulator
+        self.hosts = {f'h{i + 1}': host for i, host in enumerate(simulator.topology.hosts)}
+        self.latencies = []
+        # Host konumları ve IP'leri öğrenilsin
+        hosts = simulator.topology.hosts
+        for i, host in enumerate(hosts):
+            simulator.packet_in(host.dpid, host.port, arp_request(host, hosts[(i + 1) % len(hosts)]))
+
+    def send(self, batch):
+        packet_in = self.simulator.packet_in
+        for flow, frame in batch:
+            host = self.hosts[flow.src]
+            self.latencies.append(packet_in(host.dpid, host.port, frame))
+        return len(batch)
+
+    def get_statistics(self):
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {}
+        return {
+            'packet_ins': len(latencies),
+            'handler_busy_s': sum(latencies),
+            'handler_p50_ms': latencies[len(latencies) // 2] * 1000,
+            'handler_p99_ms': latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1000
+        }
+
+
+class TrafficEngine:
+    """
+    Akışları asyncio döngüsünde hızlandırarak gönder
+
+    Her akışın gönderim zamanları mutlak takvimdir (start + k / rate);
+    zamanı gelen akışlar heap'ten batch'ler halinde alınır. rate verilirse
+    toplam hız token bucket ile sınırlanır.
+    Takvimin gerisinde kalma (lag) pacing doğruluğunu ve sender'ın
+    yetişemediğini gösterir.
+
+    Args:
+        sender: Sender
+        rate: Toplam hız sınırı (pps); None ise sadece akış hızları
+        batch: Bir send() çağrısındaki en fazla frame
+    """
+
+    def __init__(self, sender, rate=None, batch=64):
+        self.sender = sender
+        self.rate = rate
+        self.batch = batch
+
+    async def run(self, flows, duration=None):
+        """
+        Akışları duration saniye (veya hepsi count'a ulaşana kadar) çalıştır
+
+        Returns:
+            dict: Gönderim istatistikleri
+        """
+        heap = [(flow.start, i) for i, flow in enumerate(flows)]
+        heapq.heapify(heap)
+        # Kova en az 2 ms'lik token tutar; zamanlayıcı gecikmesinde token kaybolmaz
+        bucket = TokenBucket(self.rate, max(self.batch, int(self.rate * 0.002))) if self.rate else None
+        send = self.sender.send
+        sent = dropped = batches = 0
+        max_lag = lag_total = 0.0
+
+        start = time.monotonic()
+        while heap:
+            now = time.monotonic() - start
+            if duration is not None and (now >= duration or heap[0][0] >= duration):
+                break
+            wait = heap[0][0] - now
+            if wait <= 0 and bucket is not None:
+                limit = bucket.take(self.batch, now + start)
+                wait = 0 if limit else bucket.wait()
+            else:
+                limit = self.batch
+            if wait > 0:
+                await asyncio.sleep(wait - TIMER_SLACK if wait > TIMER_SLACK else 0)
+                continue
+
+            batch = []
+            while heap and heap[0][0] <= now and len(batch) < limit:
+                at, i = heapq.heappop(heap)
+                flow = flows[i]
+                batch.append((flow, flow.frame))
+                lag = now - at
+                lag_total += lag
+                max_lag = max(max_lag, lag)
+                flow.sent += 1
+                if flow.count is None or flow.sent < flow.count:
+                    heapq.heappush(heap, (at + flow.interval, i))
+            if bucket is not None and len(batch) < limit:
+                bucket.tokens += limit - len(batch)
+
+            delivered = send(batch)
+            sent += delivered
+            dropped += len(batch) - delivered
+            batches += 1
+            # Aynı döngüdeki diğer task'lar (alıcılar, başka motorlar) da çalışsın
+            await asyncio.sleep(0)
+
+        elapsed = time.monotonic() - start
+        offered = sum(flow.rate for flow in flows)
+        return {
+            'flows': len(flows),
+            'sent': sent,
+            'dropped': dropped,
+            'batches': batches,
+            'elapsed_s': elapsed,
+            'offered_pps': min(offered, self.rate) if self.rate else offered,
+            'achieved_pps': sent / elapsed if elapsed else 0,
+            'mean_lag_ms': lag_total / (sent + dropped) * 1000 if sent + dropped else 0,
+            'max_lag_ms': max_lag * 1000,
+            'sender': self.sender.name,
+            'sender_stats': self.sender.get_statistics()
+        }
+
+    def start(self, flows, duration=None):
+        """Senkron çağıranlar için run()"""
+        return asyncio.run(self.run(flows, duration))
+
+
+def simulator_sender(controller='qos', topology='complex', admission=False):
+    """Verilen controller ve topoloji için SimulatorSender"""
+    from controller_simulator import CONTROLLERS, SimTopology, Simulator, load_controller
+    if controller not in CONTROLLERS:
+        raise ValueError(f"Unknown controller {controller}")
+    simulator = Simulator(load_controller(controller), SimTopology.load(topology), admission=admission)
+    return SimulatorSender(simulator)
+
+
+def packet_in_ceiling(controller='qos', topology='complex', rates=(1000, 2000, 5000, 10000, 20000),
+                      flows=1000, duration=3.0, size=64, proto='udp'):
+    """
+    Artan hızlarla controller'ı yükle; ulaşılan Packet-In hızı doyumda tavanı verir
+
+    Her hız için yeni bir simülatör kurulur (öğrenilmiş durum taşınmaz).
+
+    Returns:
+        list: Her hız için motor istatistikleri
+    """
+    results = []
+    for rate in rates:
+        sender = simulator_sender(controller, topology)
+        hosts = list(sender.hosts)
+        result = TrafficEngine(sender, rate=rate).start(
+            make_flows(hosts, flows, rate=rate / flows, size=size, proto=proto), duration)
+        results.append(result)
+        print(f"  offered {rate:>8} pps  achieved {result['achieved_pps']:>9.0f} pps  "
+              f"max lag {result['max_lag_ms']:8.1f} ms  "
+              f"handler p99 {result['sender_stats'].get('handler_p99_ms', 0):.3f} ms")
+    return results
+
+
+def print_result(result):
+    if 'records' in result:
+        print(f"\n  Records: {result['records']}, sender: {result['sender']}")
+    else:
+        print(f"\n  Flows: {result['flows']}, sender: {result['sender']}")
+    print(f"  Sent: {result['sent']} ({result['dropped']} dropped) in {result['elapsed_s']:.2f}s")
+    print(f"  Offered: {result['offered_pps']:.0f} pps, achieved: {result['achieved_pps']:.0f} pps")
+    print(f"  Lag: mean {result['mean_lag_ms']:.3f} ms, max {result['max_lag_ms']:.3f} ms")
+    for name, value in result['sender_stats'].items():
+        print(f"  {name}: {value:.3f}" if isinstance(value, float) else f"  {name}: {value}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='High-rate asyncio traffic engine')
+    parser.add_argument('--sender', choices=['sim', 'raw', 'scapy', 'udp', 'null'], default='sim')
+    parser.add_argument('--interface', default='lo', help='raw/scapy interface')
+    parser.add_argument('--hosts', type=int, default=8, help='destination hosts h1..hN (raw/udp/null)')
+    parser.add_argument('--src', action='append', help='source host(s) for raw/udp senders')
+    parser.add_argument('--flows', type=int, default=1000)
+    parser.add_argument('--rate', type=float, default=10000, help='aggregate pps')
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--size', type=int, default=64)
+    parser.add_argument('--proto', choices=sorted(PROTOCOLS), default='udp')
+    parser.add_argument('--batch', type=int, default=64)
+    parser.add_argument('--controller', default='qos', help='sim sender controller')
+    parser.add_argument('--topology', default='complex', help='sim sender topology')
+    parser.add_argument('--sweep', help='comma separated rates: find the Packet-In ceiling (sim sender)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if args.sweep:
+        print(f"\n[PACKET-IN CEILING] {args.controller} on {args.topology}, {args.flows} flows")
+        packet_in_ceiling(args.controller, args.topology, [float(r) for r in args.sweep.split(',')],
+                          args.flows, args.duration, args.size, args.proto)
+        return
+
+    if args.sender == 'sim':
+        sender = simulator_sender(args.controller, args.topology)
+        hosts = list(sender.hosts)
+    else:
+        hosts = [f'h{i}' for i in range(1, args.hosts + 1)]
+        sender = {'raw': lambda: RawSocketSender(args.interface),
+                  'scapy': lambda: ScapySender(args.interface),
+                  'udp': UDPSender,
+                  'null': NullSender}[args.sender]()
+
+    flows = make_flows(hosts, args.flows, args.rate / args.flows, args.size, args.proto, args.src, args.seed)
+    print(f"\n[TRAFFIC ENGINE] {args.flows} flows, {args.rate:g} pps for {args.duration}s via {sender.name}")
+    try:
+        print_result(TrafficEngine(sender, rate=args.rate, batch=args.batch).start(flows, args.duration))
+    finally:
+        sender.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,16 +7,80 @@ import random
 import time
 from datetime import datetime
 
+from traffic_engine import Flow, TrafficEngine, make_flows, print_result, simulator_sender
+
 
 class TrafficGenerator:
-    def __init__(self, hosts):
+    def __init__(self, hosts, sender=None, seed=None):
         """
         Args:
             hosts: list - Host listesi ['h1', 'h2', 'h3', 'h4']
+            sender: traffic_engine.Sender - Verilirse paketler gerçekten gönderilir
+                    (raw socket, scapy, UDP veya controller simülatörü); yoksa
+                    desenler sadece ekrana yazılır
+            seed: int - Verilirse rastgele seçimler tekrarlanabilir
         """
         self.hosts = hosts
+        self.sender = sender
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Her host için diğer host'lar (her seçimde liste yeniden kurulmaz)
+        self.peers = {h: [p for p in hosts if p != h] for h in hosts}
         self.traffic_patterns = []
     
+    def compile_trace(self, scenario, path):
+        """
+        Senaryoyu tekrarlanabilir ikili trace'e derle (workload_trace)
+        
+        Aynı senaryo ve seed her controller için aynı yükü verir.
+        
+        Returns:
+            int: Kayıt sayısı
+        """
+        from workload_trace import compile_scenario  # NumPy sadece trace komutlarında gerekir
+        count = compile_scenario(scenario, path, hosts=len(self.hosts), seed=self.seed or 0)
+        print(f"\n[TRACE] Compiled {scenario} ({count} records, seed {self.seed or 0}) to {path}")
+        return count
+    
+    def play_trace(self, path, speed=1.0):
+        """
+        Derlenmiş trace'i sender üzerinden oynat
+        
+        Args:
+            speed: float - Zaman ölçeği (None: olabildiğince hızlı)
+        """
+        if self.sender is None:
+            raise ValueError("A sender is required to emit packets")
+        from workload_trace import TracePlayer
+        print(f"\n[TRACE] Playing {path}")
+        result = TracePlayer(path, self.sender, speed).start()
+        print_result(result)
+        return result
+    
+    def generate_flow_load(self, num_flows=1000, rate=10000, duration=10, size=64, proto='udp'):
+        """
+        Çok sayıda eşzamanlı akışla sabit hızda yük oluştur (traffic_engine)
+        
+        Args:
+            num_flows: int - Eşzamanlı akış sayısı
+            rate: float - Toplam hız (pps)
+            duration: float - Süre (saniye)
+        
+        Returns:
+            dict: Motor istatistikleri (gönderilen, ulaşılan pps, pacing gecikmesi)
+        """
+        print(f"\n[FLOW LOAD] {num_flows} flows, {rate} pps for {duration}s")
+        flows = make_flows(self.hosts, num_flows, rate / num_flows, size, proto,
+                           seed=self.rng.getrandbits(32))
+        return self._run_engine(flows, duration, rate)
+    
+    def _run_engine(self, flows, duration, rate=None):
+        if self.sender is None:
+            raise ValueError("A sender is required to emit packets")
+        result = TrafficEngine(self.sender, rate=rate).start(flows, duration)
+        print_result(result)
+        return result
+    
     def generate_uniform_traffic(self, duration=60, packets_per_second=10):
         """
         Düzgün dağılımlı trafik oluştur
@@ -27,13 +91,20 @@ class TrafficGenerator:
         """
         print(f"\n[UNIFORM TRAFFIC] Generating {packets_per_second} pps for {duration}s")
         
+        if self.sender is not None:
+            pairs = [(src, dst) for src in self.hosts for dst in self.hosts if src != dst]
+            flows = [Flow(src, dst, rate=packets_per_second / len(pairs), sport=10000 + i,
+                          start=i / packets_per_second)
+                     for i, (src, dst) in enumerate(pairs)]
+            return self._run_engine(flows, duration)['sent']
+        
         start_time = time.time()
         packet_count = 0
         
         while time.time() - start_time < duration:
             # Rastgele kaynak ve hedef seç
-            src = random.choice(self.hosts)
-            dst = random.choice([h for h in self.hosts if h != src])
+            src = self.rng.choice(self.hosts)
+            dst = self.rng.choice(self.peers[src])
             
             # Ping gönder (simüle)
             print(f"  [{packet_count}] {src} -> {dst}", end='\r')
@@ -44,7 +115,7 @@ class TrafficGenerator:
         print(f"\n  Generated {packet_count} packets")
         return packet_count
     
-    def generate_burst_traffic(self, num_bursts=5, burst_size=100, interval=10):
+    def generate_burst_traffic(self, num_bursts=5, burst_size=100, interval=10, burst_pps=100):
         """
         Patlamalı (burst) trafik oluştur
         
@@ -52,17 +123,29 @@ class TrafficGenerator:
             num_bursts: int - Burst sayısı
             burst_size: int - Her burst'teki paket sayısı
             interval: int - Burst'ler arası süre (saniye)
+            burst_pps: float - Burst içindeki gönderim hızı
         """
         print(f"\n[BURST TRAFFIC] {num_bursts} bursts of {burst_size} packets")
         
+        if self.sender is not None:
+            # Her paket rastgele çift arasında tek paketlik akış; burst'ler takvimde interval ile ayrılır
+            period = burst_size / burst_pps + interval
+            flows = []
+            for burst_num in range(num_bursts):
+                for i in range(burst_size):
+                    src = self.rng.choice(self.hosts)
+                    flows.append(Flow(src, self.rng.choice(self.peers[src]), sport=10000 + len(flows) % 50000,
+                                      rate=burst_pps, count=1, start=burst_num * period + i / burst_pps))
+            return self._run_engine(flows, None)['sent']
+        
         total_packets = 0
         
         for burst_num in range(num_bursts):
             print(f"\n  Burst {burst_num + 1}/{num_bursts}")
             
             for i in range(burst_size):
-                src = random.choice(self.hosts)
-                dst = random.choice([h for h in self.hosts if h != src])
+                src = self.rng.choice(self.hosts)
+                dst = self.rng.choice(self.peers[src])
                 
                 print(f"    [{i+1}/{burst_size}] {src} -> {dst}", end='\r')
                 total_packets += 1
@@ -75,7 +158,8 @@ class TrafficGenerator:
         print(f"\n  Total packets: {total_packets}")
         return total_packets
     
-    def generate_elephant_mouse_traffic(self, duration=60, elephant_ratio=0.2):
+    def generate_elephant_mouse_traffic(self, duration=60, elephant_ratio=0.2, elephant_pps=1000,
+                                        mouse_pps=100):
         """
         Elephant-Mouse trafik paterni
         Elephant flows: Büyük, uzun süreli akışlar
@@ -84,15 +168,35 @@ class TrafficGenerator:
         Args:
             duration: int - Test süresi (saniye)
             elephant_ratio: float - Elephant flow oranı (0-1)
+            elephant_pps: float - Elephant akışı başına hız (1500 baytlık paketler)
+            mouse_pps: float - Mouse burst'lerinin gönderim hızı
+        
+        Returns:
+            tuple: (elephant akış sayısı, mouse paket sayısı)
         """
         print(f"\n[ELEPHANT-MOUSE TRAFFIC] Duration: {duration}s, Elephant ratio: {elephant_ratio}")
         
+        num_elephants = int(len(self.hosts) * elephant_ratio)
+        if self.sender is not None:
+            elephants = [Flow(self.hosts[i % len(self.hosts)], self.hosts[(i + 1) % len(self.hosts)],
+                              sport=30000 + i, dport=5001, rate=elephant_pps, size=1500)
+                         for i in range(num_elephants)]
+            # Mouse: rastgele çift, 1-10 paketlik burst, burst'ler arası 0.1-0.5 s
+            mice = []
+            start = 0.0
+            while start < duration:
+                src = self.rng.choice(self.hosts)
+                mice.append(Flow(src, self.rng.choice(self.peers[src]), sport=10000 + len(mice) % 20000,
+                                 rate=mouse_pps, count=self.rng.randint(1, 10), start=start))
+                start += self.rng.uniform(0.1, 0.5)
+            self._run_engine(elephants + mice, duration)
+            return num_elephants, sum(flow.sent for flow in mice)
+        
         start_time = time.time()
         elephant_count = 0
         mouse_count = 0
         
         # Elephant flow'ları başlat (iPerf benzeri)
-        num_elephants = int(len(self.hosts) * elephant_ratio)
         print(f"\n  Starting {num_elephants} elephant flows...")
         
         for i in range(num_elephants):
@@ -104,15 +208,15 @@ class TrafficGenerator:
         # Mouse flow'ları oluştur
         print(f"\n  Generating mouse flows...")
         while time.time() - start_time < duration:
-            src = random.choice(self.hosts)
-            dst = random.choice([h for h in self.hosts if h != src])
+            src = self.rng.choice(self.hosts)
+            dst = self.rng.choice(self.peers[src])
             
             # Küçük paket burst'ü (1-10 paket)
-            burst_size = random.randint(1, 10)
+            burst_size = self.rng.randint(1, 10)
             print(f"    Mouse Flow: {src} -> {dst} ({burst_size} packets)", end='\r')
             mouse_count += burst_size
             
-            time.sleep(random.uniform(0.1, 0.5))
+            time.sleep(self.rng.uniform(0.1, 0.5))
         
         print(f"\n\n  Elephant flows: {elephant_count}")
         print(f"  Mouse flows: {mouse_count} packets")
@@ -136,8 +240,15 @@ class TrafficGenerator:
         
         attackers = [h for h in self.hosts if h != target]
         
+        if self.sender is not None:
+            # Her saldırgandan çok sayıda kaynak portu: hepsi yeni akış (Packet-In)
+            flows = [Flow(attacker, target, sport=10000 + i, rate=attack_rate / (len(attackers) * 64),
+                          start=(i * len(attackers) + n) / attack_rate)
+                     for n, attacker in enumerate(attackers) for i in range(64)]
+            return self._run_engine(flows, duration)['sent']
+        
         while time.time() - start_time < duration:
-            attacker = random.choice(attackers)
+            attacker = self.rng.choice(attackers)
             print(f"  [{packet_count}] {attacker} -> {target} (Attack)", end='\r')
             
             packet_count += 1
@@ -151,7 +262,7 @@ class TrafficGenerator:
         Önceden tanımlanmış senaryoları çalıştır
         
         Args:
-            scenario_name: str - 'light', 'medium', 'heavy', 'mixed'
+            scenario_name: str - 'light', 'medium', 'heavy', 'mixed', 'saturation' (sender gerekir)
         """
         print(f"\n{'='*60}")
         print(f"RUNNING SCENARIO: {scenario_name.upper()}")
@@ -180,6 +291,11 @@ class TrafficGenerator:
             print("\n  Phase 3: Elephant-Mouse traffic (30s)")
             self.generate_elephant_mouse_traffic(duration=30, elephant_ratio=0.3)
         
+        elif scenario_name == 'saturation':
+            # Controller'ın Packet-In tavanı: binlerce yeni akış, artan hız
+            for rate in (1000, 5000, 20000):
+                self.generate_flow_load(num_flows=5000, rate=rate, duration=10)
+        
         else:
             print(f"  Unknown scenario: {scenario_name}")
 
@@ -216,8 +332,9 @@ def main():
     print("3. Heavy")
     print("4. Mixed")
     print("5. Custom")
+    print("6. Saturation (controller simulator, no Mininet)")
     
-    choice = input("\nEnter choice (1-5): ").strip()
+    choice = input("\nEnter choice (1-6): ").strip()
     
     scenario_map = {
         '1': 'light',
@@ -229,6 +346,11 @@ def main():
     if choice in scenario_map:
         generator.run_scenario(scenario_map[choice])
     
+    elif choice == '6':
+        controller = input("Controller (shortest_path/load_balancing/qos): ").strip() or 'qos'
+        sender = simulator_sender(controller, 'complex')
+        TrafficGenerator(list(sender.hosts), sender).run_scenario('saturation')
+    
     elif choice == '5':
         print("\nCustom traffic generation:")
         print("1. Uniform")
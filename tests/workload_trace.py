@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Workload Trace - Tohumlanabilir (seed) iş yükü derleyici ve akışlı oynatıcı
+Bir senaryo (TrafficGenerator desenleri: uniform, burst, elephant-mouse, DDoS)
+sabit genişlikli kayıtlardan oluşan ikili bir trace dosyasına derlenir; aynı
+senaryo + seed her zaman bayt bayt aynı dosyayı üretir. Oynatıcı dosyayı
+memory-map ile açar ve kayıtları zaman damgalarına göre bir traffic_engine
+sender'ına akıtır; böylece her controller'a birebir aynı yük verilebilir
+
+Kullanım:
+    python3 workload_trace.py compile mixed --hosts 8 --seed 7 -o ../results/mixed.trace
+    python3 workload_trace.py info ../results/mixed.trace
+    python3 workload_trace.py play ../results/mixed.trace --sender sim --controller qos --speed 10
+"""
+
+import argparse
+import asyncio
+import json
+import struct
+import time
+
+import numpy as np
+
+from traffic_engine import TIMER_SLACK, build_frame
+
+MAGIC = b'SDNTRACE'
+VERSION = 1
+# magic, sürüm, kayıt boyutu, host sayısı, kayıt sayısı, seed, meta (JSON) uzunluğu
+HEADER = struct.Struct('<8sHHIQQI')
+ALIGN = 64  # Kayıtlar 64 bayt hizalı başlar
+
+# 24 baytlık kayıt; time_ns trace başlangıcına göre, src/dst host numarası (h1 -> 1)
+RECORD = np.dtype([('time_ns', '<u8'), ('src', '<u4'), ('dst', '<u4'), ('sport', '<u2'),
+                   ('dport', '<u2'), ('size', '<u2'), ('proto', 'u1'), ('kind', 'u1')])
+
+PROTOCOLS = {'icmp': 1, 'tcp': 6, 'udp': 17}
+PROTOCOL_NAMES = {number: name for name, number in PROTOCOLS.items()}
+KINDS = {'uniform': 0, 'burst': 1, 'elephant': 2, 'mouse': 3, 'ddos': 4}
+KIND_NAMES = {number: name for name, number in KINDS.items()}
+DPORTS = np.array([80, 443, 5001], dtype=np.uint16)
+
+# TrafficGenerator.run_scenario senaryolarının aynıları
+SCENARIOS = {
+    'light': [{'pattern': 'uniform', 'duration': 30, 'rate': 5}],
+    'medium': [{'pattern': 'uniform', 'duration': 60, 'rate': 20}],
+    'heavy': [{'pattern': 'uniform', 'duration': 60, 'rate': 50}],
+    'mixed': [{'pattern': 'uniform', 'duration': 30, 'rate': 10},
+              {'pattern': 'burst', 'num_bursts': 3, 'burst_size': 50, 'interval': 5},
+              {'pattern': 'elephant_mouse', 'duration': 30, 'elephant_ratio': 0.3}],
+    'ddos': [{'pattern': 'ddos', 'target': 1, 'duration': 30, 'rate': 100}],
+    'saturation': [{'pattern': 'uniform', 'duration': 10, 'rate': rate} for rate in (1000, 5000, 20000)],
+}
+
+
+def _peers(rng, src, hosts):
+    """src'den farklı rastgele hedef (liste kurmadan: src + [1, hosts) mod hosts)"""
+    return (src - 1 + rng.integers(1, hosts, len(src))) % hosts + 1
+
+
+def _records(times, src, dst, sport, dport, size, proto, kind):
+    records = np.empty(len(times), dtype=RECORD)
+    records['time_ns'] = times
+    records['src'] = src
+    records['dst'] = dst
+    records['sport'] = sport
+    records['dport'] = dport
+    records['size'] = size
+    records['proto'] = proto
+    records['kind'] = kind
+    return records
+
+
+def _protocols(rng, count, mix):
+    names = sorted(mix)
+    weights = np.array([mix[name] for name in names], dtype=float)
+    numbers = np.array([PROTOCOLS[name] for name in names], dtype=np.uint8)
+    return numbers[rng.choice(len(names), count, p=weights / weights.sum())]
+
+
+def _uniform(rng, hosts, duration, rate, size=64, mix=None, window=1.0):
+    """Sabit aralıklı paketler, her biri rastgele çift ve yeni 5-tuple"""
+    mix = mix or {'udp': 1}
+    interval = 1e9 / rate
+    total = int(duration * rate)
+    per_window = max(1, int(window * rate))
+    for first in range(0, total, per_window):
+        count = min(per_window, total - first)
+        times = (np.arange(first, first + count) * interval).astype(np.uint64)
+        src = rng.integers(1, hosts + 1, count)
+        yield _records(times, src, _peers(rng, src, hosts), rng.integers(1024, 65536, count),
+                       DPORTS[rng.integers(0, len(DPORTS), count)], size,
+                       _protocols(rng, count, mix), KINDS['uniform'])
+
+
+def _burst(rng, hosts, num_bursts=5, burst_size=100, interval=10, gap=0.01, size=64):
+    """burst_size paketlik patlamalar (paketler arası gap), patlamalar arası interval saniye"""
+    for burst in range(num_bursts):
+        start = burst * (burst_size * gap + interval) * 1e9
+        times = (start + np.arange(burst_size) * gap * 1e9).astype(np.uint64)
+        src = rng.integers(1, hosts + 1, burst_size)
+        yield _records(times, src, _peers(rng, src, hosts), rng.integers(1024, 65536, burst_size),
+                       5001, size, PROTOCOLS['udp'], KINDS['burst'])
+
+
+def _elephant_mouse(rng, hosts, duration=60, elephant_ratio=0.2, elephant_rate=100, elephant_size=1500,
+                    mouse_size=64, window=1.0):
+    """
+    Elephant: h(i) -> h(i+1) sabit hızlı uzun akışlar (tek 5-tuple)
+    Mouse: 0.1-0.5 s aralıklarla rastgele çiftler arasında 1-10 paketlik kısa akışlar
+    """
+    elephants = int(hosts * elephant_ratio)
+    mouse_at = 0.0
+    pending = np.empty(0, dtype=RECORD)  # Pencere sonunu aşan mouse paketleri
+    for start in np.arange(0, duration, window):
+        end = min(start + window, duration)
+        parts = [pending]
+        for i in range(elephants):
+            times = np.arange(int(np.ceil(start * elephant_rate)), int(np.ceil(end * elephant_rate)))
+            parts.append(_records((times * 1e9 / elephant_rate).astype(np.uint64), i % hosts + 1,
+                                  (i + 1) % hosts + 1, 20000 + i, 5001, elephant_size, PROTOCOLS['tcp'],
+                                  KINDS['elephant']))
+        while mouse_at < end:
+            burst = int(rng.integers(1, 11))
+            src = rng.integers(1, hosts + 1, 1)
+            times = ((mouse_at + np.arange(burst) * 0.001) * 1e9).astype(np.uint64)
+            parts.append(_records(times, src[0], _peers(rng, src, hosts)[0], rng.integers(1024, 65536),
+                                  80, mouse_size, PROTOCOLS['tcp'], KINDS['mouse']))
+            mouse_at += rng.uniform(0.1, 0.5)
+        records = np.concatenate(parts)
+        records = records[np.argsort(records['time_ns'], kind='stable')]
+        split = np.searchsorted(records['time_ns'], np.uint64(end * 1e9))
+        pending = records[split:]
+        yield records[:split]
+    yield pending
+
+
+def _ddos(rng, hosts, target=1, duration=30, rate=100, size=64):
+    """Hedef dışındaki host'lardan hedefe, her paket yeni kaynak portuyla"""
+    interval = 1e9 / rate
+    total = int(duration * rate)
+    per_window = max(1, int(rate))
+    for first in range(0, total, per_window):
+        count = min(per_window, total - first)
+        times = (np.arange(first, first + count) * interval).astype(np.uint64)
+        # Hedef hariç host'lardan seç: [1, hosts-1] aralığı hedefin üstündekileri bir kaydırır
+        src = rng.integers(1, hosts, count)
+        src = src + (src >= target)
+        yield _records(times, src, target, rng.integers(1024, 65536, count), 80, size,
+                       PROTOCOLS['udp'], KINDS['ddos'])
+
+
+PATTERNS = {'uniform': _uniform, 'burst': _burst, 'elephant_mouse': _elephant_mouse, 'ddos': _ddos}
+
+
+def _phase_duration(phase):
+    if phase['pattern'] == 'burst':
+        bursts = phase.get('num_bursts', 5)
+        return (bursts * phase.get('burst_size', 100) * phase.get('gap', 0.01)
+                + (bursts - 1) * phase.get('interval', 10))
+    return phase.get('duration', 60 if phase['pattern'] != 'ddos' else 30)
+
+
+def compile_scenario(scenario, path, hosts=4, seed=0):
+    """
+    Senaryoyu trace dosyasına derle
+
+    Fazlar arka arkaya (zaman olarak) yazılır; her faz seed'den türetilen
+    kendi üretecini kullanır, kayıtlar pencere pencere üretilip diske
+    yazıldığından bellek kullanımı trace boyutundan bağımsızdır. Faz
+    süresini aşan kayıtlar (örn. son pencereden taşan mouse akışları)
+    kırpılır; böylece fazlar çakışmaz ve dosya zamana göre sıralı kalır.
+
+    Args:
+        scenario: SCENARIOS adı veya faz listesi [{'pattern': ..., parametreler}]
+        hosts: Host sayısı (h1..hN)
+
+    Returns:
+        int: Kayıt sayısı
+    """
+    if isinstance(scenario, str):
+        name, phases = scenario, SCENARIOS[scenario]
+    else:
+        name, phases = 'custom', list(scenario)
+    if hosts < 2:
+        raise ValueError("A workload needs at least two hosts")
+
+    meta = json.dumps({'scenario': name, 'phases': phases}, sort_keys=True).encode()
+    offset = -(-(HEADER.size + len(meta)) // ALIGN) * ALIGN
+    streams = np.random.SeedSequence(seed).spawn(len(phases))
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(bytes(offset))
+        start_ns = 0
+        for phase, stream in zip(phases, streams):
+            params = {k: v for k, v in phase.items() if k != 'pattern'}
+            duration_ns = int(_phase_duration(phase) * 1e9)
+            for records in PATTERNS[phase['pattern']](np.random.default_rng(stream), hosts, **params):
+                records = records[records['time_ns'] < np.uint64(duration_ns)]
+                records['time_ns'] += np.uint64(start_ns)
+                records.tofile(f)
+                count += len(records)
+            start_ns += duration_ns
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.itemsize, hosts, count, seed, len(meta)) + meta)
+    return count
+
+
+class WorkloadTrace:
+    """
+    Trace dosyası (memory-mapped, salt okunur)
+
+    records NumPy yapılandırılmış dizisidir; dosyanın tamamı belleğe
+    okunmaz, sayfa sayfa erişilir.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is not a workload trace")
+            magic, version, record_size, self.hosts, count, self.seed, meta_len = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION or record_size != RECORD.itemsize:
+                raise ValueError(f"{path} is not a version {VERSION} workload trace")
+            self.meta = json.loads(f.read(meta_len))
+        self.path = path
+        offset = -(-(HEADER.size + meta_len) // ALIGN) * ALIGN
+        self.records = np.memmap(path, dtype=RECORD, mode='r', offset=offset, shape=(count,)) if count else \
+            np.empty(0, dtype=RECORD)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def duration(self):
+        return self.records[-1]['time_ns'] / 1e9 if len(self.records) else 0.0
+
+    def summary(self):
+        records = self.records
+        return {
+            'scenario': self.meta['scenario'],
+            'seed': self.seed,
+            'hosts': self.hosts,
+            'records': len(records),
+            'duration_s': self.duration,
+            'bytes': int(records['size'].sum(dtype=np.uint64)),
+            'protocols': {PROTOCOL_NAMES.get(int(p), str(p)): int(n)
+                          for p, n in zip(*np.unique(records['proto'], return_counts=True))},
+            'kinds': {KIND_NAMES.get(int(k), str(k)): int(n)
+                      for k, n in zip(*np.unique(records['kind'], return_counts=True))}
+        }
+
+    def chunks(self, size=65536):
+        """Kayıtları size'lık dilimler halinde (memmap görünümleri) üret"""
+        for start in range(0, len(self.records), size):
+            yield self.records[start:start + size]
+
+    def frames(self, cache=65536):
+        """
+        Her kayıt için (time_ns, src host, frame) üret
+
+        Aynı (src, dst, 5-tuple, boyut) için frame bir kez kurulur.
+        """
+        frames = {}
+        for chunk in self.chunks():
+            for time_ns, src, dst, sport, dport, size, proto, _ in chunk.tolist():
+                key = (src, dst, sport, dport, size, proto)
+                frame = frames.get(key)
+                if frame is None:
+                    if len(frames) >= cache:
+                        frames.clear()
+                    frame = frames[key] = build_frame(f'h{src}', f'h{dst}', PROTOCOL_NAMES[proto],
+                                                      sport, dport, size)
+                yield time_ns, f'h{src}', frame
+
+
+class _Source:
+    """Sender'ların beklediği (flow, frame) çiftindeki flow yerine geçen kayıt kaynağı"""
+
+    __slots__ = ('src',)
+
+    def __init__(self, src):
+        self.src = src
+
+
+class TracePlayer:
+    """
+    Trace'i zaman damgalarına göre bir traffic_engine sender'ına oynat
+
+    speed > 1 trace'i hızlandırır; speed=None zamanlamayı yok sayıp
+    kayıtları olabildiğince hızlı gönderir (controller tavanı için).
+    """
+
+    def __init__(self, trace, sender, speed=1.0, batch=64):
+        self.trace = trace if isinstance(trace, WorkloadTrace) else WorkloadTrace(trace)
+        self.sender = sender
+        self.speed = speed
+        self.batch = batch
+
+    async def play(self, duration=None):
+        """
+        Returns:
+            dict: Gönderim istatistikleri (traffic_engine ile aynı alanlar)
+        """
+        sources = {}
+        send = self.sender.send
+        sent = dropped = batches = 0
+        max_lag = lag_total = 0.0
+        batch = []
+        limit_ns = None if duration is None else duration * 1e9 * (self.speed or 1)
+
+        start = time.monotonic()
+        for time_ns, src, frame in self.trace.frames():
+            if limit_ns is not None and time_ns >= limit_ns:
+                break
+            if self.speed:
+                due = time_ns / 1e9 / self.speed
+                wait = due - (time.monotonic() - start)
+                if wait > 0 and batch:
+                    # Zamanı gelmemiş kayıttan önce birikenleri gönder
+                    delivered = send(batch)
+                    sent += delivered
+                    dropped += len(batch) - delivered
+                    batches += 1
+                    batch = []
+                while wait > 0:
+                    await asyncio.sleep(wait - TIMER_SLACK if wait > TIMER_SLACK else 0)
+                    wait = due - (time.monotonic() - start)
+                lag_total -= wait
+                max_lag = max(max_lag, -wait)
+            source = sources.get(src)
+            if source is None:
+                source = sources[src] = _Source(src)
+            batch.append((source, frame))
+            if len(batch) >= self.batch:
+                delivered = send(batch)
+                sent += delivered
+                dropped += len(batch) - delivered
+                batches += 1
+                batch = []
+                await asyncio.sleep(0)
+        if batch:
+            delivered = send(batch)
+            sent += delivered
+            dropped += len(batch) - delivered
+            batches += 1
+
+        elapsed = time.monotonic() - start
+        return {
+            'records': len(self.trace),
+            'sent': sent,
+            'dropped': dropped,
+            'batches': batches,
+            'elapsed_s': elapsed,
+            'offered_pps': len(self.trace) / self.trace.duration * self.speed
+            if self.speed and self.trace.duration else 0,
+            'achieved_pps': sent / elapsed if elapsed else 0,
+            'mean_lag_ms': lag_total / (sent + dropped) * 1000 if sent + dropped else 0,
+            'max_lag_ms': max_lag * 1000,
+            'sender': self.sender.name,
+            'sender_stats': self.sender.get_statistics()
+        }
+
+    def start(self, duration=None):
+        """Senkron çağıranlar için play()"""
+        return asyncio.run(self.play(duration))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile and replay deterministic workload traces')
+    sub = parser.add_subparsers(dest='command', required=True)
+    compiler = sub.add_parser('compile')
+    compiler.add_argument('scenario', help=f"{', '.join(SCENARIOS)} or a JSON file with a phase list")
+    compiler.add_argument('-o', '--output', required=True)
+    compiler.add_argument('--hosts', type=int, default=4)
+    compiler.add_argument('--seed', type=int, default=0)
+    info = sub.add_parser('info')
+    info.add_argument('trace')
+    player = sub.add_parser('play')
+    player.add_argument('trace')
+    player.add_argument('--sender', choices=['sim', 'raw', 'scapy', 'udp', 'null'], default='sim')
+    player.add_argument('--interface', default='lo')
+    player.add_argument('--controller', default='qos')
+    player.add_argument('--topology', default='complex')
+    player.add_argument('--speed', type=float, default=1.0, help='time scale; 0 sends as fast as possible')
+    player.add_argument('--duration', type=float)
+    args = parser.parse_args()
+
+    if args.command == 'compile':
+        scenario = args.scenario
+        if scenario not in SCENARIOS:
+            with open(scenario) as f:
+                scenario = json.load(f)
+        started = time.perf_counter()
+        count = compile_scenario(scenario, args.output, args.hosts, args.seed)
+        print(f"Compiled {count} records to {args.output} in {time.perf_counter() - started:.2f}s")
+        return
+
+    trace = WorkloadTrace(args.trace)
+    if args.command == 'info':
+        print(json.dumps(trace.summary(), indent=2))
+        return
+
+    from traffic_engine import (NullSender, RawSocketSender, ScapySender, UDPSender, print_result,
+                                simulator_sender)
+    if args.sender == 'sim':
+        sender = simulator_sender(args.controller, args.topology)
+    else:
+        sender = {'raw': lambda: RawSocketSender(args.interface),
+                  'scapy': lambda: ScapySender(args.interface),
+                  'udp': UDPSender,
+                  'null': NullSender}[args.sender]()
+    print(f"\n[TRACE PLAYER] {trace.meta['scenario']} (seed {trace.seed}): {len(trace)} records, "
+          f"{trace.duration:.1f}s at speed {args.speed or 'max'} via {sender.name}")
+    try:
+        print_result(TracePlayer(trace, sender, args.speed or None).start(args.duration))
+    finally:
+        sender.close()
+
+
+if __name__ == '__main__':
+    main()
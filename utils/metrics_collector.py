@@ -45,6 +45,9 @@ class MetricsCollector:
             'events': []
         }
         
+        # Zaman damgalı olaylar (ns) test araçlarının okuyabilmesi için JSON satırları olarak eklenir
+        self.event_log = os.path.join(output_dir, f'{controller_name}_events.jsonl')
+        
         os.makedirs(output_dir, exist_ok=True)
     
     def record_packet(self):
@@ -87,6 +90,20 @@ class MetricsCollector:
             'description': description
         })
     
+    def record_timed_event(self, event_type, time_ns=None, **fields):
+        """
+        Olayı ns zaman damgasıyla kaydet ve event_log dosyasına ekle
+        
+        Zaman CLOCK_REALTIME'dır; aynı makinedeki Mininet host'larının
+        paket zaman damgalarıyla karşılaştırılabilir.
+        """
+        entry = {'time_ns': time.time_ns() if time_ns is None else time_ns, 'type': event_type}
+        entry.update(fields)
+        self.metrics['events'].append(dict(entry, timestamp=datetime.now().isoformat()))
+        with open(self.event_log, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+        return entry
+    
     def calculate_rates(self):
         """Saniye başına oranları hesapla"""
         elapsed = time.time() - self.start_time